@@ -13,6 +13,7 @@ Usage:
     formatted_task = tasks.get(task_id, detail_level="summary")
 """
 
+import importlib
 import warnings
 
 # Keep CLI/library output clean when the local environment has a known
@@ -42,21 +43,77 @@ __author__ = "ClickUp Skills Development Team"
 
 from .client import ClickUpClient
 from .context import ContextManager, get_context_manager
+from .response_cache import ResponseCache, DiskResponseCache
+from .batch import WriteBatch, BatchReport
+from .retry import RetryPolicy, request_deadline
 from .exceptions import (
     ClickUpError,
     ClickUpAPIError,
     ClickUpAuthError,
     ClickUpRateLimitError,
     ClickUpNotFoundError,
+    ClickUpCircuitOpenError,
+    ClickUpCassetteError,
+    ClickUpOfflineError,
 )
 
 __all__ = [
     "ClickUpClient",
+    "AsyncClickUpClient",
     "ContextManager",
     "get_context_manager",
+    "ResponseCache",
+    "DiskResponseCache",
+    "MetadataCache",
+    "get_metadata_cache",
+    "get_comment_cache",
+    "WriteBatch",
+    "BatchReport",
+    "RetryPolicy",
+    "request_deadline",
+    "ApiTelemetry",
+    "Cassette",
+    "HttpSettings",
+    "Task",
+    "WorkspaceMirror",
+    "SearchIndex",
+    "IdIndex",
+    "WebhookProcessor",
+    "WebhookServer",
     "ClickUpError",
     "ClickUpAPIError",
     "ClickUpAuthError",
     "ClickUpRateLimitError",
     "ClickUpNotFoundError",
+    "ClickUpCircuitOpenError",
+    "ClickUpCassetteError",
+    "ClickUpOfflineError",
 ]
+
+
+# Exports loaded on first access so `import clickup_framework` stays cheap for
+# short-lived callers; aiohttp and http.server in particular are slow to import
+_LAZY_EXPORTS = {
+    "AsyncClickUpClient": "async_client",
+    "MetadataCache": "metadata_cache",
+    "get_metadata_cache": "metadata_cache",
+    "get_comment_cache": "metadata_cache",
+    "ApiTelemetry": "telemetry",
+    "Cassette": "cassette",
+    "HttpSettings": "transport",
+    "Task": "models",
+    "WorkspaceMirror": "mirror",
+    "SearchIndex": "search_index",
+    "IdIndex": "id_index",
+    "WebhookProcessor": "webhook_server",
+    "WebhookServer": "webhook_server",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
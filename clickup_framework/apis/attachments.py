@@ -6,11 +6,6 @@ import os
 from pathlib import Path
 from typing import Dict, Any
 from .base import BaseAPI
-from ..exceptions import (
-    ClickUpAPIError,
-    ClickUpAuthError,
-    ClickUpNotFoundError,
-)
 
 
 class AttachmentsAPI(BaseAPI):
@@ -35,44 +30,16 @@ class AttachmentsAPI(BaseAPI):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         file_name = Path(file_path).name
-
-        # Temporarily remove Content-Type header for multipart/form-data
-        original_headers = self.client.session.headers.copy()
-        self.client.session.headers.pop('Content-Type', None)
-
-        try:
-            url = f"{self.client.BASE_URL}/task/{task_id}/attachment"
-            self.client.rate_limiter.acquire()
-
-            with open(file_path, 'rb') as f:
-                files = {'attachment': (file_name, f)}
-                response = self.client.session.post(
-                    url,
-                    files=files,
-                    params=params,
-                    timeout=self.client.timeout
-                )
-
-            if response.status_code in [200, 201]:
-                return response.json()
-            elif response.status_code == 401:
-                # Extract actual error message from API response
-                try:
-                    error_data = response.json()
-                    message = error_data.get("err", error_data.get("error", "Invalid or expired API token"))
-                except:
-                    message = response.text or "Invalid or expired API token"
-                raise ClickUpAuthError(message)
-            elif response.status_code == 404:
-                raise ClickUpNotFoundError("task", task_id)
-            else:
-                try:
-                    error_data = response.json()
-                    message = error_data.get("err", error_data.get("error", "Unknown error"))
-                except:
-                    message = response.text or "Unknown error"
-                raise ClickUpAPIError(response.status_code, message)
-        finally:
-            # Restore Content-Type header
-            self.client.session.headers.update(original_headers)
-
+        with open(file_path, 'rb') as f:
+            # Read up front so a retried attempt (after a 429) sends the whole file again
+            content = f.read()
+
+        # Through _request for rate limiting, retries, telemetry and read invalidation.
+        # A None Content-Type drops the session's JSON default so requests sets the multipart boundary.
+        return self._request(
+            "POST",
+            f"task/{task_id}/attachment",
+            params=params,
+            files={'attachment': (file_name, content)},
+            headers={'Content-Type': None},
+        )
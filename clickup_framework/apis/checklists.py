@@ -12,8 +12,7 @@ class ChecklistsAPI(BaseAPI):
     def create_checklist(self, task_id: str, name: str) -> Dict[str, Any]:
         """Create a checklist on a task."""
         response = self._request("POST", f"task/{task_id}/checklist", json={"name": name})
-        # API returns {'checklist': {...}}, unwrap it
-        return response.get('checklist', response)
+        return self._unwrap_checklist(response)
 
     def update_checklist(self, checklist_id: str, **updates) -> Dict[str, Any]:
         """Update a checklist."""
@@ -27,7 +26,25 @@ class ChecklistsAPI(BaseAPI):
         """Create a checklist item."""
         data = {"name": name, **item_data}
         response = self._request("POST", f"checklist/{checklist_id}/checklist_item", json=data)
-        # API returns {'checklist': {...}} with items array, extract the newly created item
+        return self._extract_created_item(response)
+
+    def update_checklist_item(self, checklist_id: str, checklist_item_id: str, **updates) -> Dict[str, Any]:
+        """Update a checklist item."""
+        response = self._request("PUT", f"checklist/{checklist_id}/checklist_item/{checklist_item_id}", json=updates)
+        return self._extract_updated_item(response, checklist_item_id)
+
+    def delete_checklist_item(self, checklist_id: str, checklist_item_id: str) -> Dict[str, Any]:
+        """Delete a checklist item."""
+        return self._request("DELETE", f"checklist/{checklist_id}/checklist_item/{checklist_item_id}")
+
+    @staticmethod
+    def _unwrap_checklist(response: Dict[str, Any]) -> Dict[str, Any]:
+        """API returns {'checklist': {...}}, unwrap it."""
+        return response.get('checklist', response)
+
+    @staticmethod
+    def _extract_created_item(response: Dict[str, Any]) -> Dict[str, Any]:
+        """API returns {'checklist': {...}} with items array, extract the newly created item."""
         if 'checklist' in response and 'items' in response['checklist']:
             items = response['checklist']['items']
             # Return the last (newest) item which should be the one we just created
@@ -35,10 +52,9 @@ class ChecklistsAPI(BaseAPI):
                 return items[-1]
         return response
 
-    def update_checklist_item(self, checklist_id: str, checklist_item_id: str, **updates) -> Dict[str, Any]:
-        """Update a checklist item."""
-        response = self._request("PUT", f"checklist/{checklist_id}/checklist_item/{checklist_item_id}", json=updates)
-        # API returns {'checklist': {...}} with items array, extract the updated item
+    @staticmethod
+    def _extract_updated_item(response: Dict[str, Any], checklist_item_id: str) -> Dict[str, Any]:
+        """API returns {'checklist': {...}} with items array, extract the updated item."""
         if 'checklist' in response and 'items' in response['checklist']:
             items = response['checklist']['items']
             # Find and return the specific item that was updated
@@ -46,8 +62,3 @@ class ChecklistsAPI(BaseAPI):
                 if item.get('id') == checklist_item_id:
                     return item
         return response
-
-    def delete_checklist_item(self, checklist_id: str, checklist_item_id: str) -> Dict[str, Any]:
-        """Delete a checklist item."""
-        return self._request("DELETE", f"checklist/{checklist_id}/checklist_item/{checklist_item_id}")
-
@@ -22,53 +22,11 @@ class CommentsAPI(BaseAPI):
         Returns:
             Created comment
         """
-        # Determine payload format
-        if comment_data:
-            payload = comment_data
-        elif comment_text is not None:
-            payload = {"comment_text": comment_text}
-        else:
-            raise ValueError("Either comment_text or comment_data must be provided")
-
-        # If attachment URLs are provided, include them in the comment for preview
-        # ClickUp displays image previews when images are referenced in the comment body
-        # Based on ClickUp's behavior, we need to include the image URL directly in the comment
-        # The GUI automatically embeds images when they're attached, so we replicate that behavior
-        if attachment_urls:
-            # For both comment_text and rich text formats, we'll append image references
-            # ClickUp may render these as previews if the URLs point to ClickUp attachments
-            images_text = "\n\n" + "\n".join([f"![image]({url})" for url in attachment_urls])
-            
-            if "comment_text" in payload:
-                # Simple: append markdown image syntax to comment text
-                payload["comment_text"] = f"{payload['comment_text']}{images_text}"
-            elif "comment" in payload:
-                # For rich text format, we need to add image segments
-                if isinstance(payload["comment"], list):
-                    # Add newline separator
-                    payload["comment"].append({"text": "\n\n"})
-                    # Add each image as a link (ClickUp may render as preview)
-                    for url in attachment_urls:
-                        # Try multiple formats that ClickUp might recognize
-                        # Format 1: Plain URL (ClickUp might auto-detect as image)
-                        payload["comment"].append({
-                            "text": url,
-                            "attributes": {"link": url}
-                        })
-                        # Format 2: Add newline after each image
-                        payload["comment"].append({"text": "\n"})
-                else:
-                    # Fallback: convert to comment_text format with markdown
-                    original = str(payload.get("comment", ""))
-                    payload = {"comment_text": f"{original}{images_text}"}
-
+        payload = self._build_task_comment_payload(comment_text, comment_data, attachment_urls)
         response = self._request(
             "POST", f"task/{task_id}/comment", json=payload
         )
-        # API response doesn't include comment_text, add it for convenience
-        if 'comment_text' not in response and comment_text:
-            response['comment_text'] = comment_text
-        return response
+        return self._finalize_task_comment(response, comment_text)
 
     def get_task_comments(self, task_id: str) -> Dict[str, Any]:
         """Get all comments on a task."""
@@ -134,3 +92,54 @@ class CommentsAPI(BaseAPI):
             "notify_all": notify_all
         })
 
+    @staticmethod
+    def _build_task_comment_payload(comment_text: str = None, comment_data: Dict[str, Any] = None, attachment_urls: list = None) -> Dict[str, Any]:
+        """Build the create-comment request body, appending attachment previews if given."""
+        # Determine payload format
+        if comment_data:
+            payload = comment_data
+        elif comment_text is not None:
+            payload = {"comment_text": comment_text}
+        else:
+            raise ValueError("Either comment_text or comment_data must be provided")
+
+        # If attachment URLs are provided, include them in the comment for preview
+        # ClickUp displays image previews when images are referenced in the comment body
+        # Based on ClickUp's behavior, we need to include the image URL directly in the comment
+        # The GUI automatically embeds images when they're attached, so we replicate that behavior
+        if attachment_urls:
+            # For both comment_text and rich text formats, we'll append image references
+            # ClickUp may render these as previews if the URLs point to ClickUp attachments
+            images_text = "\n\n" + "\n".join([f"![image]({url})" for url in attachment_urls])
+            
+            if "comment_text" in payload:
+                # Simple: append markdown image syntax to comment text
+                payload["comment_text"] = f"{payload['comment_text']}{images_text}"
+            elif "comment" in payload:
+                # For rich text format, we need to add image segments
+                if isinstance(payload["comment"], list):
+                    # Add newline separator
+                    payload["comment"].append({"text": "\n\n"})
+                    # Add each image as a link (ClickUp may render as preview)
+                    for url in attachment_urls:
+                        # Try multiple formats that ClickUp might recognize
+                        # Format 1: Plain URL (ClickUp might auto-detect as image)
+                        payload["comment"].append({
+                            "text": url,
+                            "attributes": {"link": url}
+                        })
+                        # Format 2: Add newline after each image
+                        payload["comment"].append({"text": "\n"})
+                else:
+                    # Fallback: convert to comment_text format with markdown
+                    original = str(payload.get("comment", ""))
+                    payload = {"comment_text": f"{original}{images_text}"}
+
+        return payload
+
+    @staticmethod
+    def _finalize_task_comment(response: Dict[str, Any], comment_text: str = None) -> Dict[str, Any]:
+        """API response doesn't include comment_text, add it for convenience."""
+        if 'comment_text' not in response and comment_text:
+            response['comment_text'] = comment_text
+        return response
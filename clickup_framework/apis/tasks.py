@@ -13,17 +13,27 @@ class TasksAPI(BaseAPI):
         """Get task by ID."""
         return self._request("GET", f"task/{task_id}", params=params)
 
-    def get_list_tasks(self, list_id: str, **params) -> Dict[str, Any]:
+    def get_list_tasks(self, list_id: str, stream: bool = False, **params) -> Dict[str, Any]:
         """
         Get tasks in a list.
 
         Supports ClickUp list pagination via ``page`` and returns the API payload,
-        including ``last_page`` when provided by the endpoint.
+        including ``last_page`` when provided by the endpoint. With ``stream=True``
+        the payload is a StreamedPage whose ``tasks`` are decoded as they arrive.
         """
+        if stream:
+            return self.client._send_request("GET", f"list/{list_id}/task", params=params, stream_items="tasks")
         return self._request("GET", f"list/{list_id}/task", params=params)
 
-    def get_team_tasks(self, team_id: str, **params) -> Dict[str, Any]:
-        """Get all tasks in a team/workspace."""
+    def get_team_tasks(self, team_id: str, stream: bool = False, **params) -> Dict[str, Any]:
+        """
+        Get all tasks in a team/workspace.
+
+        With ``stream=True`` the payload is a StreamedPage whose ``tasks`` are
+        decoded as they arrive.
+        """
+        if stream:
+            return self.client._send_request("GET", f"team/{team_id}/task", params=params, stream_items="tasks")
         return self._request("GET", f"team/{team_id}/task", params=params)
 
     def create_task(self, list_id: str, **task_data) -> Dict[str, Any]:
@@ -0,0 +1,462 @@
+"""
+Async ClickUp API Client
+
+asyncio counterpart of ClickUpClient backed by an aiohttp connection pool.
+Exposes the same surface (client.tasks, client.lists, ..., client.get_task(), ...)
+but every API call returns an awaitable, so many requests can be in flight
+from one event loop while sharing the same retry, token-fallback and
+rate-limit semantics as the sync client.
+
+Usage:
+    async with AsyncClickUpClient() as client:
+        tasks = await asyncio.gather(*(client.get_task(t) for t in task_ids))
+
+Requires the optional ``aiohttp`` dependency:
+    pip install "clickup-framework[async]"
+"""
+
+import asyncio
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+import requests
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+from .client import ACCEPT_ENCODING, ClickUpClient, _LazyAPI
+from . import serialization
+from .pagination import DEFAULT_PREFETCH, aiter_pages
+from .response_cache import ResponseCache
+from .search_index import SearchIndex
+from .id_index import IdIndex
+from .coalescing import DEFAULT_MEMO_TTL
+from .retry import RetryPolicy, route_of
+from .telemetry import ApiTelemetry
+from .cassette import Cassette
+from .transport import HttpSettings
+from .exceptions import ClickUpAPIError, ClickUpNotFoundError, ClickUpTimeoutError
+from .apis import AttachmentsAPI, ChecklistsAPI, CommentsAPI
+
+
+logger = logging.getLogger(__name__)
+
+# aiohttp decodes the same gzip/deflate/br set as urllib3, but not zstd
+_ACCEPT_ENCODING = ",".join(e for e in ACCEPT_ENCODING.split(",") if e.strip() != "zstd")
+
+
+def _query_pairs(params: Optional[Dict[str, Any]]) -> Optional[List[Tuple[str, str]]]:
+    """
+    Encode query parameters the same way requests does.
+
+    List values become repeated keys and None values are dropped. aiohttp only
+    accepts str/int/float values, so everything is stringified like requests does.
+    """
+    if not params:
+        return None
+    pairs = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            pairs.append((key, str(item)))
+    return pairs
+
+
+def _decode_json(body: bytes) -> Any:
+    """Decode a JSON response body, returning None for empty or malformed bodies."""
+    if not body:
+        return None
+    try:
+        return serialization.loads(body)
+    except ValueError:
+        return None
+
+
+class _AsyncChecklistsAPI(ChecklistsAPI):
+    """ChecklistsAPI whose response post-processing awaits the async request."""
+
+    async def create_checklist(self, task_id: str, name: str) -> Dict[str, Any]:
+        """Create a checklist on a task."""
+        response = await self._request("POST", f"task/{task_id}/checklist", json={"name": name})
+        return self._unwrap_checklist(response)
+
+    async def create_checklist_item(self, checklist_id: str, name: str, **item_data) -> Dict[str, Any]:
+        """Create a checklist item."""
+        data = {"name": name, **item_data}
+        response = await self._request("POST", f"checklist/{checklist_id}/checklist_item", json=data)
+        return self._extract_created_item(response)
+
+    async def update_checklist_item(self, checklist_id: str, checklist_item_id: str, **updates) -> Dict[str, Any]:
+        """Update a checklist item."""
+        response = await self._request("PUT", f"checklist/{checklist_id}/checklist_item/{checklist_item_id}", json=updates)
+        return self._extract_updated_item(response, checklist_item_id)
+
+
+class _AsyncCommentsAPI(CommentsAPI):
+    """CommentsAPI whose response post-processing awaits the async request."""
+
+    async def create_task_comment(self, task_id: str, comment_text: str = None, comment_data: Dict[str, Any] = None, attachment_urls: list = None) -> Dict[str, Any]:
+        """Add comment to a task."""
+        payload = self._build_task_comment_payload(comment_text, comment_data, attachment_urls)
+        response = await self._request("POST", f"task/{task_id}/comment", json=payload)
+        return self._finalize_task_comment(response, comment_text)
+
+
+class _AsyncAttachmentsAPI(AttachmentsAPI):
+    """AttachmentsAPI that uploads through the aiohttp session."""
+
+    async def create_task_attachment(self, task_id: str, file_path: str, **params) -> Dict[str, Any]:
+        """Create task attachment by uploading a file."""
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        form = aiohttp.FormData()
+        form.add_field("attachment", Path(file_path).read_bytes(), filename=Path(file_path).name)
+
+        endpoint = f"task/{task_id}/attachment"
+        await self.client.rate_limiter.acquire_async()
+        status, headers, body = await self.client._send("POST", self.client._build_url(endpoint), params, data=form)
+        self.client.rate_limiter.update_from_headers(headers)
+        self.client.invalidate_reads()
+
+        if status in (200, 201):
+            return _decode_json(body) or {}
+        raise self.client._error_for_response(
+            status, endpoint, _decode_json(body), body.decode("utf-8", errors="replace"), headers
+        )
+
+
+class AsyncClickUpClient(ClickUpClient):
+    """
+    asyncio ClickUp API client.
+
+    Same constructor, token resolution and API namespaces as ClickUpClient;
+    every API method returns a coroutine. Requests share one aiohttp
+    connection pool (``max_connections`` sockets) and one token bucket.
+
+    Usage:
+        async with AsyncClickUpClient() as client:
+            task = await client.get_task("task_id")
+            lists = await client.lists.get_folder_lists("folder_id")
+    """
+
+    DEFAULT_MAX_CONNECTIONS = 100
+
+    # API classes that post-process responses need awaiting variants
+    checklists = _LazyAPI(_AsyncChecklistsAPI)
+    comments = _LazyAPI(_AsyncCommentsAPI)
+    attachments = _LazyAPI(_AsyncAttachmentsAPI)
+
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        rate_limit: int = 100,
+        timeout: int = ClickUpClient.DEFAULT_TIMEOUT,
+        max_retries: int = ClickUpClient.MAX_RETRIES,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        shared_rate_limit: Optional[bool] = None,
+        response_cache: Union[ResponseCache, bool, None] = None,
+        memo_ttl: float = DEFAULT_MEMO_TTL,
+        retry_policy: Optional[RetryPolicy] = None,
+        telemetry: Optional[ApiTelemetry] = None,
+        api_root: Optional[str] = None,
+        cassette: Union[Cassette, str, None] = None,
+        http_settings: Optional[HttpSettings] = None,
+        search_index: Union[SearchIndex, bool, None] = None,
+        id_index: Union[IdIndex, bool, None] = None,
+        offline: Optional[bool] = None,
+        max_staleness: Optional[float] = None,
+    ):
+        """
+        Initialize async ClickUp client.
+
+        Args:
+            api_token: ClickUp API token (defaults to CLICKUP_API_TOKEN env var or stored context)
+            rate_limit: Requests per minute (default: 100)
+            timeout: Request timeout in seconds (default: 30)
+            max_retries: Maximum retry attempts (default: 3)
+            max_connections: Size of the aiohttp connection pool (default: 100)
+            shared_rate_limit: Share one rate-limit budget with other local processes
+                (defaults to the CLICKUP_SHARED_RATE_LIMIT env var)
+            response_cache: ResponseCache for GET responses, True for the default disk cache,
+                or False to disable (defaults to the CLICKUP_RESPONSE_CACHE env var)
+            memo_ttl: Seconds to reuse identical GET results within this client (default: 0 = off;
+                concurrent identical GETs are always shared)
+            retry_policy: Backoff, retry budget and circuit breaker settings
+                (default: RetryPolicy(max_attempts=max_retries))
+            telemetry: ApiTelemetry receiving per-endpoint statistics
+                (default: the installed default, or a new one per client)
+            api_root: API root serving /v2 and /v3 (defaults to the CLICKUP_API_ROOT env var)
+            cassette: Cassette (or cassette file path) to record to or replay from
+                (defaults to the CLICKUP_CASSETTE env var)
+            http_settings: Per-host connection limit (applied when pool_block is set)
+                (defaults to CLICKUP_HTTP_* env vars, then the context file)
+            search_index: SearchIndex fed with every task and comment fetched, True for the
+                API token's default index, or False to disable (defaults to the CLICKUP_SEARCH_INDEX env var)
+            id_index: IdIndex fed with every space, folder, list and task fetched
+                (defaults to the CLICKUP_ID_INDEX env var, then the installed default)
+            offline: Serve every GET from the response cache and never send requests
+                (defaults to the CLICKUP_OFFLINE env var)
+            max_staleness: Seconds a cached GET may be old and still be served
+                (defaults to the CLICKUP_MAX_STALENESS env var)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError(
+                "AsyncClickUpClient requires aiohttp. "
+                "Install it with: pip install \"clickup-framework[async]\""
+            )
+
+        super().__init__(
+            api_token=api_token,
+            rate_limit=rate_limit,
+            timeout=timeout,
+            max_retries=max_retries,
+            shared_rate_limit=shared_rate_limit,
+            response_cache=response_cache,
+            memo_ttl=memo_ttl,
+            retry_policy=retry_policy,
+            telemetry=telemetry,
+            api_root=api_root,
+            cassette=cassette,
+            http_settings=http_settings,
+            search_index=search_index,
+            id_index=id_index,
+            offline=offline,
+            max_staleness=max_staleness,
+        )
+        self.max_connections = max_connections
+        self._http: Optional["aiohttp.ClientSession"] = None
+
+    def _get_http_session(self) -> "aiohttp.ClientSession":
+        """Return the shared aiohttp session, creating it inside the running loop on first use."""
+        if self._http is None or self._http.closed:
+            settings = self.http_settings
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                # pool_block makes pool_maxsize a hard per-host cap, as on the sync transport
+                limit_per_host=settings.pool_maxsize if settings.pool_block else 0,
+            )
+            self._http = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                json_serialize=serialization.dumps,
+                headers={"Accept-Encoding": _ACCEPT_ENCODING},
+            )
+        return self._http
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        **kwargs,
+    ) -> Tuple[int, Any, bytes]:
+        """
+        Send one HTTP request over the pooled session.
+
+        Returns:
+            Tuple of (status code, response headers, raw body)
+        """
+        if self.cassette is not None:
+            prepared = requests.models.PreparedRequest()
+            prepared.prepare_url(url, _query_pairs(params))
+            if not self.cassette.recording:
+                return self.cassette.play(method, prepared.url)
+
+        headers = {"Authorization": self.api_token, **kwargs.pop("headers", {})}
+        session = self._get_http_session()
+        async with session.request(
+            method,
+            url,
+            params=_query_pairs(params),
+            headers=headers,
+            **kwargs,
+        ) as response:
+            body = await response.read()
+            if self.cassette is not None:
+                self.cassette.record(method, prepared.url, response.status, response.headers, body)
+            return response.status, response.headers, body
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Make authenticated API request, coalescing identical GETs.
+
+        Mirrors ClickUpClient._request on the event loop.
+        """
+        if method.upper() != "GET" or json is not None or kwargs:
+            try:
+                return await self._send_request(method, endpoint, params, json, **kwargs)
+            finally:
+                if method.upper() != "GET":
+                    self.invalidate_reads()
+
+        key = ResponseCache.make_key(self.api_token, method, self._build_url(endpoint), params)
+        return await self._coalescer.run_async(key, lambda: self._send_request(method, endpoint, params))
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        stream_items: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Send one authenticated API request with rate limiting and retries.
+
+        Mirrors ClickUpClient._send_request, but waits on the rate limiter, retries
+        and backoff with asyncio.sleep so other requests keep flowing.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            json: JSON body
+            stream_items: Accepted for API compatibility; the body is decoded whole
+            **kwargs: Additional arguments for aiohttp
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            ClickUpAuthError: Authentication failed
+            ClickUpRateLimitError: Rate limit exceeded
+            ClickUpNotFoundError: Resource not found
+            ClickUpAPIError: Other API errors
+            ClickUpTimeoutError: Request timeout or request_deadline exceeded
+            ClickUpCircuitOpenError: Endpoint circuit breaker is open
+        """
+        url = self._build_url(endpoint)
+        params = self._normalize_params(params)
+
+        cache_key, cached = self._cache_lookup(method, endpoint, url, params)
+        if cached is not None:
+            logger.debug(f"{method} {url} (cached)")
+            self.telemetry.record_cache_hit()
+            return cached
+
+        bytes_out = len(serialization.dumps_bytes(json)) if json is not None else 0
+
+        policy = self.retry_policy
+        route = route_of(endpoint)
+
+        # Track if we've already tried fallback to prevent infinite loop
+        fallback_attempted = False
+
+        attempt = 0
+        while True:
+            policy.before_attempt(route)
+            timeout = policy.attempt_timeout(self.timeout)
+            # Every attempt, retries included, spends a rate-limit token
+            waited_from = time.perf_counter()
+            await self.rate_limiter.acquire_async()
+            sent_at = time.perf_counter()
+            self.telemetry.record_rate_limit_wait(sent_at - waited_from)
+            try:
+                logger.debug(f"{method} {url} (attempt {attempt + 1}/{policy.max_attempts})")
+
+                status, headers, body = await self._send(
+                    method, url, params, json=json, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs
+                )
+                self.rate_limiter.update_from_headers(headers)
+                self.telemetry.record_request(
+                    method, route, status, time.perf_counter() - sent_at,
+                    bytes_in=len(body), bytes_out=bytes_out, attempt=attempt,
+                )
+
+                # Success codes: 200 OK, 201 Created, 204 No Content
+                if status in (200, 201, 204):
+                    policy.record_success(route)
+                    data = _decode_json(body) if status != 204 else None
+                    if data is None:
+                        data = {}
+                    self._cache_store(method, endpoint, cache_key, data)
+                    self._index_store(method, endpoint, data)
+                    return data
+
+                if status == 401 and not fallback_attempted and self._switch_to_fallback_token():
+                    fallback_attempted = True
+                    logger.info("Retrying request with fallback token...")
+                    # Retry immediately with new token (don't count as an attempt)
+                    continue
+
+                raise self._error_for_response(
+                    status, endpoint, _decode_json(body), body.decode("utf-8", errors="replace"), headers
+                )
+
+            except asyncio.TimeoutError:
+                error = ClickUpTimeoutError(f"Request timed out after {timeout}s")
+                self.telemetry.record_request(method, route, None, time.perf_counter() - sent_at,
+                                              bytes_out=bytes_out, attempt=attempt, error=str(error))
+            except aiohttp.ClientConnectionError as e:
+                error = ClickUpAPIError(0, f"Connection error: {str(e)}")
+                self.telemetry.record_request(method, route, None, time.perf_counter() - sent_at,
+                                              bytes_out=bytes_out, attempt=attempt, error=str(error))
+            except ClickUpNotFoundError as e:
+                self._index_missing(endpoint)
+                error = e
+            except ClickUpAPIError as e:
+                error = e
+
+            policy.record_failure(route, error)
+            delay = policy.next_delay(route, method, error, attempt)
+            if delay is None:
+                raise error
+            self.telemetry.record_retry(route)
+            logger.warning(f"{error}; retrying in {delay:.1f}s ({attempt + 1}/{policy.max_attempts})")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def iter_list_tasks(self, list_id: str, prefetch: int = DEFAULT_PREFETCH, **params) -> AsyncIterator[Dict[str, Any]]:
+        """Async-iterate over every task in a list, fetching pages concurrently."""
+        return aiter_pages(lambda **p: self.get_list_tasks(list_id, **p), prefetch=prefetch, **params)
+
+    def iter_team_tasks(self, team_id: str, prefetch: int = DEFAULT_PREFETCH, **params) -> AsyncIterator[Dict[str, Any]]:
+        """Async-iterate over every task in a team/workspace, fetching pages concurrently."""
+        return aiter_pages(lambda **p: self.get_team_tasks(team_id, **p), prefetch=prefetch, **params)
+
+    def batch(self, *args, **kwargs):
+        """WriteBatch drives the sync client; with the async client, use asyncio.gather instead."""
+        raise NotImplementedError("AsyncClickUpClient does not support batch(); await the calls with asyncio.gather")
+
+    async def aclose(self) -> None:
+        """Close the aiohttp connection pool."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        self._http = None
+        if "session" in self.__dict__:
+            self.session.close()
+        if self.id_index is not None:
+            self.id_index.flush()
+
+    async def __aenter__(self):
+        """Async context manager support."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the connection pool on exit."""
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        token_preview = self.api_token[:20] if self.api_token else "None"
+        return f"AsyncClickUpClient(token={token_preview}..., source={self.token_source})"
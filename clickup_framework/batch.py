@@ -0,0 +1,309 @@
+"""
+Write Batches
+
+Bulk operations used to issue one blocking call after another. WriteBatch
+queues task writes (updates, tag changes, custom-field values, comments,
+creates, deletes), runs them on a small thread pool under the client's rate
+limiter and returns a report with one result per queued operation.
+
+Idempotent operations (updates, custom-field values, tag changes, deletes)
+are retried per item after rate limits, timeouts, connection failures and
+5xx responses, on top of the client's own attempts. Creates and comments are
+never resent by the batch: a failed POST may still have been applied, so it
+is recorded as failed for the caller to check.
+
+Operations on the same task run in the order they were queued, on one
+worker; different tasks run in parallel.
+
+Usage:
+    with client.batch(max_workers=4) as batch:
+        for task_id in task_ids:
+            batch.update_task(task_id, status="done")
+            batch.add_tag(task_id, "shipped")
+    print(batch.report.summary())
+"""
+
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from .exceptions import (
+    ClickUpAPIError,
+    ClickUpCircuitOpenError,
+    ClickUpRateLimitError,
+    ClickUpTimeoutError,
+)
+from .retry import deadline_remaining
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limits, timeouts, connection failures and 5xx responses are worth another attempt."""
+    if isinstance(error, ClickUpCircuitOpenError):
+        # The endpoint is known to be down; fail fast instead of stalling the worker
+        return False
+    if isinstance(error, (ClickUpRateLimitError, ClickUpTimeoutError)):
+        return True
+    if isinstance(error, ClickUpAPIError):
+        return error.status_code == 0 or error.status_code >= 500
+    return False
+
+
+@dataclass
+class BatchItemResult:
+    """
+    Outcome of one queued operation.
+
+    Attributes:
+        index: Position in the queue
+        operation: Operation name (e.g. "update_task")
+        key: Task the operation targets (None for creates)
+        description: Human-readable summary of the operation
+        success: Whether the operation eventually succeeded
+        result: API response on success
+        error: Last exception on failure
+        attempts: Number of attempts made
+    """
+
+    index: int
+    operation: str
+    key: Optional[str]
+    description: str
+    success: bool = False
+    result: Any = None
+    error: Optional[Exception] = None
+    attempts: int = 0
+
+
+@dataclass
+class BatchReport:
+    """Per-item results of an executed WriteBatch, in queue order."""
+
+    items: List[BatchItemResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[BatchItemResult]:
+        return [item for item in self.items if item.success]
+
+    @property
+    def failed(self) -> List[BatchItemResult]:
+        return [item for item in self.items if not item.success]
+
+    @property
+    def ok(self) -> bool:
+        """True when every operation succeeded."""
+        return not self.failed
+
+    def by_key(self) -> Dict[Optional[str], List[BatchItemResult]]:
+        """Group results by target task, preserving queue order."""
+        groups: Dict[Optional[str], List[BatchItemResult]] = {}
+        for item in self.items:
+            groups.setdefault(item.key, []).append(item)
+        return groups
+
+    def summary(self) -> str:
+        """One-line summary, e.g. '9/10 succeeded, 1 failed'."""
+        return f"{len(self.succeeded)}/{len(self.items)} succeeded, {len(self.failed)} failed"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the report."""
+        return {
+            "total": len(self.items),
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "items": [
+                {
+                    "index": item.index,
+                    "operation": item.operation,
+                    "key": item.key,
+                    "description": item.description,
+                    "success": item.success,
+                    "attempts": item.attempts,
+                    "error": str(item.error) if item.error else None,
+                }
+                for item in self.items
+            ],
+        }
+
+
+@dataclass
+class _BatchOperation:
+    """A queued call, whether it is safe to resend, and its result slot."""
+
+    call: Callable[[], Any]
+    outcome: BatchItemResult
+    retryable: bool = False
+
+
+class WriteBatch:
+    """
+    Queue of task writes executed with bounded concurrency.
+
+    Queue methods return the batch so calls can be chained. execute() runs
+    everything once and returns a BatchReport; using the batch as a context
+    manager executes it on a clean exit and stores the report on ``report``.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_backoff: float = 1.0,
+    ):
+        """
+        Initialize batch.
+
+        Args:
+            client: ClickUpClient used for every operation
+            max_workers: Tasks processed in parallel (default: 4)
+            max_attempts: Attempts per idempotent operation for transient errors (default: 3)
+            retry_backoff: Base delay in seconds between attempts, doubled each retry
+        """
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+        self.report: Optional[BatchReport] = None
+        self._operations: List[_BatchOperation] = []
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add(
+        self,
+        operation: str,
+        key: Optional[str],
+        description: str,
+        call: Callable[[], Any],
+        retryable: bool = False,
+    ) -> "WriteBatch":
+        """
+        Queue an arbitrary call.
+
+        Args:
+            operation: Operation name for the report
+            key: Task ID the call writes to; calls with the same key run in order
+            description: Human-readable summary for the report
+            call: Zero-argument callable performing the write
+            retryable: Whether the call is idempotent and may be resent after a transient error
+        """
+        if self.report is not None:
+            raise RuntimeError("WriteBatch has already been executed")
+        outcome = BatchItemResult(len(self._operations), operation, key, description)
+        self._operations.append(_BatchOperation(call, outcome, retryable))
+        return self
+
+    def update_task(self, task_id: str, **updates) -> "WriteBatch":
+        """Queue a task update."""
+        fields = ", ".join(updates) or "no fields"
+        return self.add("update_task", task_id, f"Update {task_id} ({fields})",
+                        lambda: self.client.update_task(task_id, **updates), retryable=True)
+
+    def add_tag(self, task_id: str, tag_name: str) -> "WriteBatch":
+        """Queue adding a tag to a task."""
+        return self.add("add_tag", task_id, f"Add tag '{tag_name}' to {task_id}",
+                        lambda: self.client.add_task_tag(task_id, tag_name), retryable=True)
+
+    def remove_tag(self, task_id: str, tag_name: str) -> "WriteBatch":
+        """Queue removing a tag from a task."""
+        return self.add("remove_tag", task_id, f"Remove tag '{tag_name}' from {task_id}",
+                        lambda: self.client.remove_task_tag(task_id, tag_name), retryable=True)
+
+    def set_custom_field(self, task_id: str, field_id: str, value: Any) -> "WriteBatch":
+        """Queue setting a custom field value."""
+        return self.add("set_custom_field", task_id, f"Set field {field_id} on {task_id}",
+                        lambda: self.client.set_custom_field_value(task_id, field_id, value), retryable=True)
+
+    def add_comment(self, task_id: str, comment_text: str) -> "WriteBatch":
+        """Queue a task comment."""
+        return self.add("add_comment", task_id, f"Comment on {task_id} ({len(comment_text)} chars)",
+                        lambda: self.client.create_task_comment(task_id, comment_text))
+
+    def create_task(self, list_id: str, name: str, **task_data) -> "WriteBatch":
+        """Queue creating a task in a list."""
+        return self.add("create_task", None, f"Create '{name}' in list {list_id}",
+                        lambda: self.client.create_task(list_id, name=name, **task_data))
+
+    def delete_task(self, task_id: str) -> "WriteBatch":
+        """Queue deleting a task."""
+        return self.add("delete_task", task_id, f"Delete {task_id}",
+                        lambda: self.client.delete_task(task_id), retryable=True)
+
+    def _run_one(self, operation: _BatchOperation) -> None:
+        """Run one operation, retrying transient failures if it is idempotent."""
+        outcome = operation.outcome
+        max_attempts = self.max_attempts if operation.retryable else 1
+        for attempt in range(1, max_attempts + 1):
+            outcome.attempts = attempt
+            try:
+                outcome.result = operation.call()
+                outcome.success = True
+                outcome.error = None
+                return
+            except Exception as e:
+                outcome.error = e
+                if attempt == max_attempts or not _is_retryable(e):
+                    logger.warning(f"{outcome.description} failed: {e}")
+                    return
+                delay = self.retry_backoff * (2 ** (attempt - 1))
+                if isinstance(e, ClickUpRateLimitError) and e.retry_after:
+                    delay = max(delay, e.retry_after)
+                remaining = deadline_remaining()
+                if remaining is not None and delay >= remaining:
+                    logger.warning(f"{outcome.description} failed: {e} (no time left before the deadline)")
+                    return
+                logger.info(f"{outcome.description} failed ({e}), retrying in {delay}s...")
+                time.sleep(delay)
+
+    def _run_group(self, operations: List[_BatchOperation]) -> None:
+        """Run the operations for one task in queue order."""
+        for operation in operations:
+            self._run_one(operation)
+
+    def execute(self) -> BatchReport:
+        """
+        Run every queued operation and return the per-item report.
+
+        Failures never raise; inspect ``report.failed`` instead.
+        """
+        if self.report is not None:
+            return self.report
+
+        groups: Dict[Any, List[_BatchOperation]] = {}
+        for operation in self._operations:
+            key = operation.outcome.key
+            # Operations without a target task are independent of each other
+            group_key = key if key is not None else ("item", operation.outcome.index)
+            groups.setdefault(group_key, []).append(operation)
+
+        if self.max_workers == 1 or len(groups) <= 1:
+            for group in groups.values():
+                self._run_group(group)
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="clickup-batch") as pool:
+                # Each worker runs in a copy of the caller's context so request_deadline applies there too
+                futures = [
+                    pool.submit(contextvars.copy_context().run, self._run_group, group)
+                    for group in groups.values()
+                ]
+                for future in futures:
+                    future.result()
+
+        self.report = BatchReport([operation.outcome for operation in self._operations])
+        return self.report
+
+    def __enter__(self) -> "WriteBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Execute on a clean exit; discard the queue if the block raised."""
+        if exc_type is None:
+            self.execute()
@@ -0,0 +1,178 @@
+"""
+Record/Replay Cassettes
+
+A cassette stores every HTTP exchange a client makes in a JSON-lines file
+and plays them back later without network access, so benchmarks and tests
+run reproducibly against a real workspace's responses.
+
+Exchanges are matched by method and URL (query parameters in any order).
+Repeated requests replay their recordings in order; once those run out the
+last one is repeated. Request headers (including the API token) are never
+written, and response bodies are stored decoded.
+
+Modes:
+    record  - send requests and (re)write the cassette
+    replay  - answer from the cassette only; unknown requests raise ClickUpCassetteError
+    auto    - replay if the file exists, otherwise record (default)
+
+Usage:
+    client = ClickUpClient(cassette="tests/cassettes/hierarchy.jsonl")
+    client = ClickUpClient(cassette=Cassette("hierarchy.jsonl", mode="record"))
+
+Or set ``CLICKUP_CASSETTE=<path>`` (and optionally ``CLICKUP_CASSETTE_MODE``)
+to apply a cassette to every client, including the CLI's.
+"""
+
+import base64
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from . import serialization
+from .exceptions import ClickUpCassetteError
+from .transport import HttpSettings, PooledHTTPAdapter, build_response
+
+MODES = ("record", "replay", "auto")
+
+# Response headers worth keeping; the body is stored decoded, so encoding and length are dropped
+_KEPT_HEADERS = ("content-type", "retry-after", "x-ratelimit-limit", "x-ratelimit-remaining", "x-ratelimit-reset")
+
+
+def _normalize_url(url: str) -> str:
+    """Sort query parameters so equivalent URLs match."""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+class Cassette:
+    """
+    JSON-lines file of recorded HTTP exchanges.
+
+    Thread-safe; one cassette may back several clients.
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = "auto"):
+        """
+        Initialize cassette.
+
+        Args:
+            path: Cassette file (JSON lines)
+            mode: "record", "replay" or "auto" (replay if the file exists, else record)
+
+        Raises:
+            ValueError: If mode is unknown
+            ClickUpCassetteError: If mode is "replay" and the file does not exist
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r}; expected one of {', '.join(MODES)}")
+        self.path = Path(path)
+        if mode == "auto":
+            mode = "replay" if self.path.exists() else "record"
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._queues: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        self._last: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        if mode == "replay":
+            if not self.path.exists():
+                raise ClickUpCassetteError(f"Cassette not found: {self.path}")
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        exchange = serialization.loads(line)
+                        key = (exchange["method"], exchange["url"])
+                        self._queues.setdefault(key, deque()).append(exchange)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    def play(self, method: str, url: str) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Return the recorded (status, headers, body) for a request.
+
+        Raises:
+            ClickUpCassetteError: If the cassette has no recording for the request
+        """
+        key = (method.upper(), _normalize_url(url))
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                exchange = self._last[key] = queue.popleft()
+            else:
+                exchange = self._last.get(key)
+        if exchange is None:
+            raise ClickUpCassetteError(f"No recording for {method.upper()} {url} in {self.path}")
+        if "body_b64" in exchange:
+            body = base64.b64decode(exchange["body_b64"])
+        else:
+            body = exchange["body"].encode("utf-8")
+        return exchange["status"], dict(exchange["headers"]), body
+
+    def record(self, method: str, url: str, status: int, headers: Mapping[str, str], body: bytes) -> None:
+        """Append one exchange to the cassette."""
+        exchange: Dict[str, Any] = {
+            "method": method.upper(),
+            "url": _normalize_url(url),
+            "status": status,
+            "headers": {name: value for name, value in headers.items() if name.lower() in _KEPT_HEADERS},
+        }
+        try:
+            exchange["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            exchange["body_b64"] = base64.b64encode(body).decode("ascii")
+        line = serialization.dumps(exchange) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def __repr__(self) -> str:
+        return f"Cassette(path={self.path}, mode={self.mode!r})"
+
+
+class CassetteAdapter(PooledHTTPAdapter):
+    """requests transport adapter that records to or replays from a Cassette."""
+
+    def __init__(self, cassette: Cassette, settings: Optional[HttpSettings] = None, **kwargs):
+        super().__init__(settings, **kwargs)
+        self.cassette = cassette
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if not self.cassette.recording:
+            status, headers, body = self.cassette.play(request.method, request.url)
+            response = build_response(request, status, headers, body, reason="Replayed")
+            response.connection = self
+            return response
+
+        # Read the whole body so it can be recorded; streaming callers iterate the buffered content
+        response = super().send(request, stream=False, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        self.cassette.record(request.method, request.url, response.status_code, response.headers, response.content)
+        return response
+
+
+_env_cassettes: Dict[Tuple[str, str], Cassette] = {}
+_env_lock = threading.Lock()
+
+
+def cassette_from_env() -> Optional[Cassette]:
+    """
+    Return the cassette named by CLICKUP_CASSETTE / CLICKUP_CASSETTE_MODE, if set.
+
+    Every client in the process shares one instance, so recording from several
+    clients appends to the same file instead of truncating it.
+    """
+    path = os.environ.get("CLICKUP_CASSETTE")
+    if not path:
+        return None
+    key = (str(Path(path).resolve()), os.environ.get("CLICKUP_CASSETTE_MODE", "auto").lower())
+    with _env_lock:
+        if key not in _env_cassettes:
+            _env_cassettes[key] = Cassette(path, mode=key[1])
+        return _env_cassettes[key]
@@ -564,6 +564,8 @@ ROOT_COMMAND_CATEGORIES = {
     "space": "🏗️  Workspace Hierarchy",
     "folder": "🏗️  Workspace Hierarchy",
     "list-mgmt": "🏗️  Workspace Hierarchy",
+    "sync": "🏗️  Workspace Hierarchy",
+    "webhook": "🏗️  Workspace Hierarchy",
     "overflow": "🔄 Git Workflow",
     "pull": "🔄 Git Workflow",
     "suck": "🔄 Git Workflow",
@@ -1059,6 +1061,16 @@ Examples:
         action='version',
         version=f'ClickUp Framework CLI (cum) version {__version__}'
     )
+    parser.add_argument(
+        '--api-stats',
+        action='store_true',
+        help='Print per-endpoint API request statistics when the command exits'
+    )
+    parser.add_argument(
+        '--api-trace',
+        metavar='FILE',
+        help='Append one JSON line per API request to FILE'
+    )
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
 
@@ -1443,6 +1455,22 @@ def main():
             "No runnable command selected. Run `cum <command> --help` for that command's usage."
         )
 
+    api_stats = None
+    if getattr(args, 'api_stats', False) or getattr(args, 'api_trace', None):
+        from clickup_framework import telemetry
+
+        # Every client the command creates records into this one instance
+        api_stats = telemetry.install(telemetry.ApiTelemetry(trace_path=args.api_trace))
+
+    ids = None
+    try:
+        from clickup_framework import id_index
+
+        # Every client the command creates learns what the IDs it fetches are
+        ids = id_index.install(id_index.IdIndex())
+    except Exception as e:
+        logger.debug(f"ID index unavailable: {e}")
+
     # Execute command
     try:
         args.func(args)
@@ -1454,6 +1482,14 @@ def main():
         if os.getenv('DEBUG'):
             raise
         handle_cli_error(e)
+    finally:
+        if ids is not None:
+            id_index.install(None)
+            ids.close()
+        if api_stats is not None:
+            api_stats.close()
+            if args.api_stats:
+                print("\nAPI statistics:\n" + api_stats.format_table(), file=sys.stderr)
 
 
 if __name__ == '__main__':
@@ -65,6 +65,8 @@ CLI_COMMAND_CATEGORIES = {
     "space": "ClickUp Space",
     "folder": "ClickUp Folder",
     "list_mgmt": "ClickUp List",
+    "sync": "Utility",
+    "webhook": "Utility",
     # Attachment Commands
     "attach": "ClickUp Attachment",
     "attachment": "ClickUp Attachment",
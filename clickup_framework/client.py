@@ -4,11 +4,16 @@ ClickUp API Client
 Core client for ClickUp API with authentication, rate limiting, and error handling.
 """
 
+import functools
+import importlib
+import math
 import os
 import time
 import logging
-from typing import Dict, Any, Optional, List
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Iterator, Tuple, Union
 import requests
+from urllib3.util.request import ACCEPT_ENCODING
 
 from .exceptions import (
     ClickUpAPIError,
@@ -16,39 +21,74 @@ from .exceptions import (
     ClickUpRateLimitError,
     ClickUpNotFoundError,
     ClickUpTimeoutError,
+    ClickUpOfflineError,
 )
-from .rate_limiter import RateLimiter
+from .rate_limiter import RateLimiter, SharedRateLimiter, rate_limit_reset_at
+from .pagination import DEFAULT_PREFETCH, iter_pages
+from .response_cache import ResponseCache, DiskResponseCache
+from .search_index import SearchIndex
+from . import id_index as id_index_module
+from .id_index import IdIndex
+from .coalescing import DEFAULT_MEMO_TTL, RequestCoalescer
+from .batch import DEFAULT_MAX_ATTEMPTS, DEFAULT_MAX_WORKERS, WriteBatch
+from .streaming import StreamedPage
+from .retry import RetryPolicy, route_of
+from . import telemetry as api_telemetry
+from .telemetry import ApiTelemetry
+from .cassette import Cassette, CassetteAdapter, cassette_from_env
+from .transport import HttpSettings, mount_adapters
+from . import serialization
 from .context import get_context_manager
-from .apis import (
-    TasksAPI,
-    ListsAPI,
-    FoldersAPI,
-    SpacesAPI,
-    WorkspacesAPI,
-    GoalsAPI,
-    GuestsAPI,
-    TagsAPI,
-    TimeTrackingAPI,
-    TimeTrackingLegacyAPI,
-    MembersAPI,
-    RolesAPI,
-    TemplatesAPI,
-    ChecklistsAPI,
-    CommentsAPI,
-    CustomFieldsAPI,
-    ViewsAPI,
-    WebhooksAPI,
-    DocsAPI,
-    AttachmentsAPI,
-    AuthAPI,
-    UsersAPI,
-    GroupsAPI,
-    SearchAPI,
-)
 
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for lazily resolved attributes that may legitimately be None
+_UNSET = object()
+
+# Items of a streamed page are fed to the search and ID indexes in groups of this size
+STREAM_INDEX_BATCH = 100
+
+
+def _body_size(response) -> int:
+    """Bytes received for a response: Content-Length when sent, else the decoded body size."""
+    length = response.headers.get("Content-Length") if response.headers else None
+    if isinstance(length, (str, bytes, int)):
+        try:
+            return int(length)
+        except ValueError:
+            pass
+    content = response.content
+    return len(content) if isinstance(content, (bytes, bytearray)) else 0
+
+
+class _LazyAPI:
+    """
+    API namespace built on first access.
+
+    Takes the API class, or its name in clickup_framework.apis so that the
+    module is not imported until a method on it is called. The instance is
+    then cached on the client and shadows this descriptor.
+    """
+
+    __slots__ = ("api_class", "name")
+
+    def __init__(self, api_class: Union[str, type]):
+        self.api_class = api_class
+        self.name = None
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, client, owner=None):
+        if client is None:
+            return self
+        api_class = self.api_class
+        if isinstance(api_class, str):
+            api_class = getattr(importlib.import_module(".apis", __package__), api_class)
+        api = client.__dict__[self.name] = api_class(client)
+        return api
+
 
 class ClickUpClient:
     """
@@ -61,16 +101,55 @@ class ClickUpClient:
         task = client.get_task("task_id")
     """
 
-    BASE_URL = "https://api.clickup.com/api/v2"
+    API_ROOT = "https://api.clickup.com/api"
+    BASE_URL = f"{API_ROOT}/v2"
     DEFAULT_TIMEOUT = 30  # seconds
     MAX_RETRIES = 3
 
+    # API namespaces (see _LazyAPI)
+    tasks = _LazyAPI("TasksAPI")
+    lists = _LazyAPI("ListsAPI")
+    folders = _LazyAPI("FoldersAPI")
+    spaces = _LazyAPI("SpacesAPI")
+    workspaces = _LazyAPI("WorkspacesAPI")
+    goals = _LazyAPI("GoalsAPI")
+    guests = _LazyAPI("GuestsAPI")
+    tags = _LazyAPI("TagsAPI")
+    time_tracking = _LazyAPI("TimeTrackingAPI")
+    time_tracking_legacy = _LazyAPI("TimeTrackingLegacyAPI")
+    members = _LazyAPI("MembersAPI")
+    roles = _LazyAPI("RolesAPI")
+    templates = _LazyAPI("TemplatesAPI")
+    checklists = _LazyAPI("ChecklistsAPI")
+    comments = _LazyAPI("CommentsAPI")
+    custom_fields = _LazyAPI("CustomFieldsAPI")
+    views = _LazyAPI("ViewsAPI")
+    webhooks = _LazyAPI("WebhooksAPI")
+    docs = _LazyAPI("DocsAPI")
+    attachments = _LazyAPI("AttachmentsAPI")
+    auth = _LazyAPI("AuthAPI")
+    users = _LazyAPI("UsersAPI")
+    groups = _LazyAPI("GroupsAPI")
+    search_api = _LazyAPI("SearchAPI")
+
     def __init__(
         self,
         api_token: Optional[str] = None,
         rate_limit: int = 100,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = MAX_RETRIES,
+        shared_rate_limit: Optional[bool] = None,
+        response_cache: Union[ResponseCache, bool, None] = None,
+        memo_ttl: float = DEFAULT_MEMO_TTL,
+        retry_policy: Optional[RetryPolicy] = None,
+        telemetry: Optional[ApiTelemetry] = None,
+        api_root: Optional[str] = None,
+        cassette: Union[Cassette, str, None] = None,
+        http_settings: Optional[HttpSettings] = None,
+        search_index: Union[SearchIndex, bool, None] = None,
+        id_index: Union[IdIndex, bool, None] = None,
+        offline: Optional[bool] = None,
+        max_staleness: Optional[float] = None,
     ):
         """
         Initialize ClickUp client.
@@ -80,12 +159,36 @@ class ClickUpClient:
             rate_limit: Requests per minute (default: 100)
             timeout: Request timeout in seconds (default: 30)
             max_retries: Maximum retry attempts (default: 3)
+            shared_rate_limit: Share one rate-limit budget with other local processes using
+                the same token (defaults to the CLICKUP_SHARED_RATE_LIMIT env var)
+            response_cache: ResponseCache for GET responses, True for the default disk cache,
+                or False to disable (defaults to the CLICKUP_RESPONSE_CACHE env var)
+            memo_ttl: Seconds to reuse identical GET results within this client (default: 0 = off;
+                concurrent identical GETs are always shared)
+            retry_policy: Backoff, retry budget and circuit breaker settings
+                (default: RetryPolicy(max_attempts=max_retries))
+            telemetry: ApiTelemetry receiving per-endpoint statistics
+                (default: the installed default, or a new one per client)
+            api_root: API root serving /v2 and /v3, e.g. a FakeClickUpServer's
+                (defaults to the CLICKUP_API_ROOT env var, then https://api.clickup.com/api)
+            cassette: Cassette (or cassette file path) to record to or replay from
+                (defaults to the CLICKUP_CASSETTE env var)
+            http_settings: Connection pool size, keep-alive and HTTP/2 settings
+                (defaults to CLICKUP_HTTP_* env vars, then the context file)
+            search_index: SearchIndex fed with every task and comment fetched, True for the
+                API token's default index, or False to disable (defaults to the CLICKUP_SEARCH_INDEX env var)
+            id_index: IdIndex fed with every space, folder, list and task fetched, True for the
+                default index, or False to disable (defaults to the CLICKUP_ID_INDEX env var,
+                then the installed default)
+            offline: Answer every GET from the response cache, whatever its age, and raise
+                ClickUpOfflineError instead of sending requests (defaults to the CLICKUP_OFFLINE env var)
+            max_staleness: Seconds a cached GET may be old and still be served; every GET is
+                cached (defaults to the CLICKUP_MAX_STALENESS env var, e.g. "10m")
         """
         # Store token sources for fallback functionality
         self.param_token = api_token
         self.env_token = os.environ.get("CLICKUP_API_TOKEN")
-        context = get_context_manager()
-        self.context_token = context.get_api_token()
+        self._context_token = _UNSET
 
         # Check for token in priority order: 1) parameter, 2) environment variable, 3) stored context
         self.api_token = self.param_token or self.env_token
@@ -105,44 +208,105 @@ class ClickUpClient:
         # Track which token sources have been tried (for preventing infinite fallback loops)
         self._tried_sources = {self.token_source}
 
-        self.rate_limiter = RateLimiter(requests_per_minute=rate_limit)
+        if shared_rate_limit is None:
+            shared_rate_limit = os.environ.get("CLICKUP_SHARED_RATE_LIMIT", "").lower() in ("1", "true", "yes")
+        if shared_rate_limit:
+            self.rate_limiter = SharedRateLimiter.for_token(self.api_token, requests_per_minute=rate_limit)
+        else:
+            self.rate_limiter = RateLimiter(requests_per_minute=rate_limit)
         self.timeout = timeout
         self.max_retries = max_retries
-
-        # Create session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=max_retries)
+        self.telemetry = telemetry or api_telemetry.get_default() or ApiTelemetry()
+
+        self.api_root = (api_root or os.environ.get("CLICKUP_API_ROOT") or self.API_ROOT).rstrip("/")
+        self.BASE_URL = f"{self.api_root}/v2"
+
+        if response_cache is None:
+            response_cache = os.environ.get("CLICKUP_RESPONSE_CACHE", "").lower() in ("1", "true", "yes")
+        if response_cache is True:
+            response_cache = DiskResponseCache()
+        self.response_cache: Optional[ResponseCache] = response_cache or None
+
+        if search_index is None:
+            search_index = os.environ.get("CLICKUP_SEARCH_INDEX", "").lower() in ("1", "true", "yes")
+        if search_index is True:
+            search_index = SearchIndex.for_token(self.api_token)
+        self.search_index: Optional[SearchIndex] = search_index or None
+
+        if id_index is None:
+            if os.environ.get("CLICKUP_ID_INDEX", "").lower() in ("1", "true", "yes"):
+                id_index = True
+            else:
+                id_index = id_index_module.get_default()
+        if id_index is True:
+            id_index = IdIndex()
+        # Compared with False explicitly: an empty IdIndex has len() 0
+        self.id_index: Optional[IdIndex] = None if id_index is False else id_index
+
+        if offline is None:
+            offline = os.environ.get("CLICKUP_OFFLINE", "").lower() in ("1", "true", "yes")
+        if max_staleness is None and os.environ.get("CLICKUP_MAX_STALENESS"):
+            from .utils.duration import parse_duration_to_ms
+
+            max_staleness = parse_duration_to_ms(os.environ["CLICKUP_MAX_STALENESS"]) / 1000
+        self.offline = False
+        self.max_staleness: Optional[float] = None
+        # Age in seconds of the oldest cached payload served in offline / max-staleness mode
+        self.cached_data_age: Optional[float] = None
+        self.set_read_policy(offline=offline, max_staleness=max_staleness)
+
+        # Coalesce duplicate GETs issued while rendering one command
+        self._coalescer = RequestCoalescer(memo_ttl=memo_ttl)
+
+        if isinstance(cassette, (str, Path)):
+            cassette = Cassette(cassette)
+        self.cassette: Optional[Cassette] = cassette or cassette_from_env()
+        self._http_settings = http_settings
+
+    @functools.cached_property
+    def session(self) -> requests.Session:
+        """HTTP session for connection pooling, created on the first request."""
+        session = requests.Session()
+        session.headers.update(
             {
                 "Authorization": self.api_token,
                 "Content-Type": "application/json",
             }
         )
+        # requests already negotiates gzip and deflate; add br/zstd when urllib3 can decode them
+        if set(ACCEPT_ENCODING.split(",")) - {"gzip", "deflate"}:
+            session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+        if self.cassette is not None:
+            adapter = CassetteAdapter(self.cassette, self.http_settings)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        else:
+            mount_adapters(session, self.http_settings)
+        return session
+
+    @functools.cached_property
+    def http_settings(self) -> HttpSettings:
+        """Connection settings, resolved from the environment and context file on first use."""
+        if self._http_settings is not None:
+            return self._http_settings
+        return HttpSettings.from_environment(get_context_manager().get_http_settings())
+
+    @property
+    def context_token(self) -> Optional[str]:
+        """Token stored with 'set_current token'; the context file is only read when this is needed."""
+        if self._context_token is _UNSET:
+            self._context_token = get_context_manager().get_api_token()
+        return self._context_token
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return request statistics for this client.
 
-        # Initialize API classes
-        self.tasks = TasksAPI(self)
-        self.lists = ListsAPI(self)
-        self.folders = FoldersAPI(self)
-        self.spaces = SpacesAPI(self)
-        self.workspaces = WorkspacesAPI(self)
-        self.goals = GoalsAPI(self)
-        self.guests = GuestsAPI(self)
-        self.tags = TagsAPI(self)
-        self.time_tracking = TimeTrackingAPI(self)
-        self.time_tracking_legacy = TimeTrackingLegacyAPI(self)
-        self.members = MembersAPI(self)
-        self.roles = RolesAPI(self)
-        self.templates = TemplatesAPI(self)
-        self.checklists = ChecklistsAPI(self)
-        self.comments = CommentsAPI(self)
-        self.custom_fields = CustomFieldsAPI(self)
-        self.views = ViewsAPI(self)
-        self.webhooks = WebhooksAPI(self)
-        self.docs = DocsAPI(self)
-        self.attachments = AttachmentsAPI(self)
-        self.auth = AuthAPI(self)
-        self.users = UsersAPI(self)
-        self.groups = GroupsAPI(self)
-        self.search_api = SearchAPI(self)
+        Per-endpoint counts, latency histograms, bytes in/out, retries and 429s,
+        plus time spent waiting on the rate limiter. See clickup_framework.telemetry.
+        """
+        return self.telemetry.snapshot()
 
     def _switch_to_fallback_token(self) -> bool:
         """
@@ -183,6 +347,234 @@ class ClickUpClient:
 
         return False
 
+    def _record_failed_attempt(
+        self, method: str, route: str, sent_at: float, body: Optional[bytes], attempt: int, error: Exception
+    ) -> None:
+        """Record an attempt that ended without a response (timeout or connection error)."""
+        self.telemetry.record_request(
+            method, route, None, time.perf_counter() - sent_at,
+            bytes_out=len(body or b""), attempt=attempt, error=str(error),
+        )
+
+    def set_read_policy(self, offline: bool = False, max_staleness: Optional[float] = None) -> None:
+        """
+        Serve GETs from cached data instead of the API.
+
+        Args:
+            offline: Never send requests; serve cached GETs of any age
+            max_staleness: Serve cached GETs up to this many seconds old, fetching older ones
+
+        Either setting enables the default disk response cache if none is configured.
+        """
+        self.offline = bool(offline)
+        self.max_staleness = max_staleness
+        if (self.offline or max_staleness is not None) and self.response_cache is None:
+            self.response_cache = DiskResponseCache()
+
+    @property
+    def reads_through_cache(self) -> bool:
+        """Whether offline or max-staleness mode is active."""
+        return self.offline or self.max_staleness is not None
+
+    def _cache_lookup(
+        self, method: str, endpoint: str, url: str, params: Optional[Dict]
+    ) -> Tuple[Optional[str], Any]:
+        """
+        Look up a cacheable GET in the response cache.
+
+        In offline / max-staleness mode every GET is cacheable and expired
+        entries are served while within the staleness bound.
+
+        Returns:
+            Tuple of (cache key, cached payload); the key is None when the request is not cacheable
+
+        Raises:
+            ClickUpOfflineError: Offline and nothing cached for the request
+        """
+        if self.offline and method.upper() != "GET":
+            raise ClickUpOfflineError(f"Cannot send {method.upper()} {endpoint} while offline")
+        if self.response_cache is None or method.upper() != "GET":
+            return None, None
+        read_through = self.reads_through_cache
+        key, hit, ttl = None, None, 0
+        try:
+            ttl = self.response_cache.ttl_for(endpoint)
+            if ttl <= 0 and not read_through:
+                return None, None
+            key = self.response_cache.make_key(self.api_token, method, url, params)
+            if not read_through:
+                return key, self.response_cache.get(key)
+            hit = self.response_cache.get_stale(key)
+        except Exception as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            if not read_through:
+                return None, None
+
+        if hit is not None:
+            payload, age = hit
+            if self.offline or age <= max(ttl, self.max_staleness):
+                if self.cached_data_age is None or age > self.cached_data_age:
+                    self.cached_data_age = age
+                return key, payload
+        if self.offline:
+            raise ClickUpOfflineError(
+                f"No cached response for GET {endpoint}; run the command online (e.g. with "
+                f"--max-staleness) to cache it"
+            )
+        return key, None
+
+    def _cache_store(self, method: str, endpoint: str, cache_key: Optional[str], data: Any) -> None:
+        """Remember a cacheable GET payload, or invalidate entries a successful write made stale."""
+        if self.response_cache is None:
+            return
+        try:
+            if cache_key is not None:
+                self.response_cache.set(cache_key, endpoint, data, self.response_cache.ttl_for(endpoint))
+            elif method.upper() != "GET":
+                self.response_cache.invalidate(endpoint)
+        except Exception as e:
+            logger.warning(f"Response cache update failed: {e}")
+
+    def _index_store(self, method: str, endpoint: str, data: Any) -> None:
+        """Feed a successful response to the search and ID indexes."""
+        if self.search_index is not None:
+            try:
+                self.search_index.observe(method, endpoint, data)
+            except Exception as e:
+                logger.warning(f"Search index update failed: {e}")
+        if self.id_index is not None:
+            try:
+                self.id_index.observe(method, endpoint, data)
+            except Exception as e:
+                logger.warning(f"ID index update failed: {e}")
+
+    def _index_missing(self, endpoint: str) -> None:
+        """Drop an ID the API answered 404 for from the ID index."""
+        if self.id_index is not None:
+            try:
+                self.id_index.observe_missing(endpoint)
+            except Exception as e:
+                logger.warning(f"ID index update failed: {e}")
+
+    def _streamed_page(
+        self, method: str, endpoint: str, route: str, cache_key: Optional[str], response, items_key: str
+    ) -> StreamedPage:
+        """
+        Wrap a streaming response so its items feed the indexes while they are decoded.
+
+        Once the body is fully decoded the page is stored in the response cache
+        (when cacheable) and the bytes read are added to the request's telemetry.
+        """
+        pending: List[Dict[str, Any]] = []
+        # The cache stores whole pages, so only a cacheable page keeps its items
+        kept: Optional[List[Any]] = [] if cache_key is not None else None
+
+        def flush() -> None:
+            if pending:
+                self._index_store(method, endpoint, {items_key: list(pending)})
+                pending.clear()
+
+        def on_item(item: Any) -> None:
+            if kept is not None:
+                kept.append(item)
+            if self.search_index is not None or self.id_index is not None:
+                pending.append(item)
+                if len(pending) >= STREAM_INDEX_BATCH:
+                    flush()
+
+        def on_done(meta: Optional[Dict[str, Any]], bytes_read: int) -> None:
+            flush()
+            self.telemetry.record_bytes_in(route, bytes_read)
+            if meta is not None and kept is not None:
+                self._cache_store(method, endpoint, cache_key, {items_key: kept, **meta})
+
+        return StreamedPage(response, items_key, on_item=on_item, on_done=on_done)
+
+    def _build_url(self, endpoint: str) -> str:
+        """Build the absolute URL for an endpoint, routing v3 endpoints (Docs API) to their own base path."""
+        endpoint_stripped = endpoint.lstrip('/')
+        if endpoint_stripped.startswith('v3/'):
+            return f"{self.api_root}/{endpoint_stripped}"
+        return f"{self.BASE_URL}/{endpoint_stripped}"
+
+    @staticmethod
+    def _normalize_params(params: Optional[Dict]) -> Optional[Dict]:
+        """
+        Convert list parameters to bracket notation for ClickUp API.
+
+        e.g., assignees=[1, 2] becomes assignees[]=[1, 2] for proper array handling
+        """
+        if not params:
+            return params
+        normalized_params = {}
+        for key, value in params.items():
+            if isinstance(value, list):
+                # Use bracket notation for array parameters
+                normalized_params[f"{key}[]"] = value
+            else:
+                normalized_params[key] = value
+        return normalized_params
+
+    @staticmethod
+    def _error_for_response(
+        status_code: int,
+        endpoint: str,
+        error_data: Any,
+        text: Optional[str],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> ClickUpAPIError:
+        """
+        Build the framework exception for a non-success API response.
+
+        Shared by the sync and async clients so both surface identical errors.
+
+        Args:
+            status_code: HTTP status code
+            endpoint: API endpoint that was requested
+            error_data: Decoded JSON error body, or None if the body was not JSON
+            text: Raw response text
+            headers: Response headers
+
+        Returns:
+            Exception instance to raise
+        """
+        if not isinstance(error_data, dict):
+            error_data = None
+
+        if status_code == 401:
+            # Extract actual error message from API response
+            if error_data is not None:
+                message = error_data.get("err", error_data.get("error", "Invalid or expired API token"))
+            else:
+                message = text or "Invalid or expired API token"
+            return ClickUpAuthError(message)
+
+        if status_code == 404:
+            # Try to extract resource info from endpoint
+            parts = endpoint.split("/")
+            resource = parts[0] if parts else "Resource"
+            resource_id = parts[1] if len(parts) > 1 else None
+            return ClickUpNotFoundError(resource, resource_id)
+
+        if status_code == 429:
+            # Prefer Retry-After, then the window reset, before the blind 60s default
+            retry_after = (headers or {}).get("Retry-After")
+            if retry_after is None:
+                reset_at = rate_limit_reset_at(headers)
+                retry_after = max(1, math.ceil(reset_at - time.time())) if reset_at else 60
+            return ClickUpRateLimitError(int(retry_after))
+
+        # Generic API error
+        if error_data is not None:
+            message = error_data.get("err", error_data.get("error", "Unknown error"))
+        else:
+            message = text or "Unknown error"
+        return ClickUpAPIError(status_code, message, error_data)
+
+    def invalidate_reads(self) -> None:
+        """Forget memoized and in-flight GET results so the next read goes to the API."""
+        self._coalescer.clear()
+
     def _request(
         self,
         method: str,
@@ -192,7 +584,10 @@ class ClickUpClient:
         **kwargs,
     ) -> Dict[str, Any]:
         """
-        Make authenticated API request with rate limiting and retries.
+        Make authenticated API request, coalescing identical GETs.
+
+        Concurrent identical GETs share one round trip and completed ones are
+        reused for ``memo_ttl`` seconds; any other method clears the memo.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -204,65 +599,124 @@ class ClickUpClient:
         Returns:
             API response as dictionary
 
+        Raises:
+            Same as _send_request
+        """
+        if method.upper() != "GET" or json is not None or kwargs:
+            try:
+                return self._send_request(method, endpoint, params, json, **kwargs)
+            finally:
+                if method.upper() != "GET":
+                    self.invalidate_reads()
+
+        key = ResponseCache.make_key(self.api_token, method, self._build_url(endpoint), params)
+        return self._coalescer.run(key, lambda: self._send_request(method, endpoint, params))
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        stream_items: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Send one authenticated API request with rate limiting and retries.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+            json: JSON body
+            stream_items: Top-level array key to decode incrementally from the response body
+            **kwargs: Additional arguments for requests
+
+        Returns:
+            API response as dictionary, or a StreamedPage when ``stream_items`` is set
+            and the page is not answered from the response cache
+
         Raises:
             ClickUpAuthError: Authentication failed
             ClickUpRateLimitError: Rate limit exceeded
             ClickUpNotFoundError: Resource not found
             ClickUpAPIError: Other API errors
-            ClickUpTimeoutError: Request timeout
+            ClickUpTimeoutError: Request timeout or request_deadline exceeded
+            ClickUpCircuitOpenError: Endpoint circuit breaker is open
         """
-        # Handle v3 endpoints (Docs API) - they use a different base path
-        endpoint_stripped = endpoint.lstrip('/')
-        if endpoint_stripped.startswith('v3/'):
-            url = f"https://api.clickup.com/api/{endpoint_stripped}"
-        else:
-            url = f"{self.BASE_URL}/{endpoint_stripped}"
-
-        # Convert list parameters to bracket notation for ClickUp API
-        # e.g., assignees=[1, 2] becomes assignees[]=[1, 2] for proper array handling
-        if params:
-            normalized_params = {}
-            for key, value in params.items():
-                if isinstance(value, list):
-                    # Use bracket notation for array parameters
-                    normalized_params[f"{key}[]"] = value
-                else:
-                    normalized_params[key] = value
-            params = normalized_params
-
-        # Acquire rate limit token
-        self.rate_limiter.acquire()
+        url = self._build_url(endpoint)
+        params = self._normalize_params(params)
+
+        if stream_items and self.reads_through_cache:
+            # Cached pages are stored whole
+            stream_items = None
+        if stream_items:
+            kwargs["stream"] = True
+        cache_key, cached = self._cache_lookup(method, endpoint, url, params)
+        if cached is not None:
+            logger.debug(f"{method} {url} (cached)")
+            self.telemetry.record_cache_hit()
+            return cached
+
+        body = serialization.dumps_bytes(json) if json is not None else None
+        policy = self.retry_policy
+        route = route_of(endpoint)
 
         # Track if we've already tried fallback to prevent infinite loop
         fallback_attempted = False
 
-        # Retry loop with exponential backoff
-        for attempt in range(self.max_retries):
+        attempt = 0
+        while True:
+            policy.before_attempt(route)
+            timeout = policy.attempt_timeout(self.timeout)
+            # Every attempt, retries included, spends a rate-limit token
+            waited_from = time.perf_counter()
+            self.rate_limiter.acquire()
+            sent_at = time.perf_counter()
+            self.telemetry.record_rate_limit_wait(sent_at - waited_from)
             try:
-                logger.debug(f"{method} {url} (attempt {attempt + 1}/{self.max_retries})")
+                logger.debug(f"{method} {url} (attempt {attempt + 1}/{policy.max_attempts})")
 
                 response = self.session.request(
                     method=method,
                     url=url,
                     params=params,
-                    json=json,
-                    timeout=self.timeout,
+                    data=body,
+                    timeout=timeout,
                     **kwargs,
                 )
+                self.rate_limiter.update_from_headers(response.headers)
+                streamed = bool(stream_items) and response.status_code == 200
+                self.telemetry.record_request(
+                    method, route, response.status_code, time.perf_counter() - sent_at,
+                    # A streamed body is counted as it is read
+                    bytes_in=0 if streamed else _body_size(response),
+                    bytes_out=len(body or b""), attempt=attempt,
+                )
 
                 # Handle different status codes
                 # Success codes: 200 OK, 201 Created, 204 No Content
+                if streamed:
+                    policy.record_success(route)
+                    # Items are decoded as the body arrives; the page owns the connection
+                    return self._streamed_page(method, endpoint, route, cache_key, response, stream_items)
+
                 if response.status_code in [200, 201, 204]:
+                    policy.record_success(route)
                     # 204 No Content - successful but no response body (DELETE operations)
                     if response.status_code == 204:
-                        return {}
-                    # 200 OK and 201 Created - return response body
-                    # Handle cases where API returns empty body with 200 (some PUT operations)
-                    try:
-                        return response.json()
-                    except (ValueError, requests.exceptions.JSONDecodeError):
-                        # Empty or malformed response body - return empty dict
-                        return {}
+                        data = {}
+                    else:
+                        # 200 OK and 201 Created - return response body
+                        # Handle cases where API returns empty body with 200 (some PUT operations)
+                        try:
+                            data = serialization.loads(response.content)
+                        except (ValueError, TypeError):
+                            # Empty or malformed response body - return empty dict
+                            data = {}
+                    self._cache_store(method, endpoint, cache_key, data)
+                    self._index_store(method, endpoint, data)
+                    return data
 
                 elif response.status_code == 401:
                     # Try fallback token if available and not already attempted
@@ -271,65 +725,35 @@ class ClickUpClient:
                         logger.info("Retrying request with fallback token...")
                         # Retry immediately with new token (don't count as an attempt)
                         continue
-                    # Extract actual error message from API response
-                    try:
-                        error_data = response.json()
-                        message = error_data.get("err", error_data.get("error", "Invalid or expired API token"))
-                    except:
-                        message = response.text or "Invalid or expired API token"
-                    raise ClickUpAuthError(message)
-
-                elif response.status_code == 404:
-                    # Try to extract resource info from endpoint
-                    parts = endpoint.split("/")
-                    resource = parts[0] if parts else "Resource"
-                    resource_id = parts[1] if len(parts) > 1 else None
-                    raise ClickUpNotFoundError(resource, resource_id)
-
-                elif response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    raise ClickUpRateLimitError(retry_after)
-
-                else:
-                    # Generic API error
-                    try:
-                        error_data = response.json()
-                        message = error_data.get("err", error_data.get("error", "Unknown error"))
-                    except:
-                        message = response.text or "Unknown error"
-
-                    raise ClickUpAPIError(response.status_code, message, error_data if 'error_data' in locals() else None)
 
-            except requests.exceptions.Timeout:
-                if attempt == self.max_retries - 1:
-                    raise ClickUpTimeoutError(f"Request timed out after {self.timeout}s")
-                logger.warning(f"Request timeout, retrying... ({attempt + 1}/{self.max_retries})")
+                try:
+                    error_data = serialization.loads(response.content)
+                except (ValueError, TypeError):
+                    error_data = None
+                raise self._error_for_response(
+                    response.status_code, endpoint, error_data, response.text, response.headers
+                )
 
+            except requests.exceptions.Timeout:
+                error = ClickUpTimeoutError(f"Request timed out after {timeout}s")
+                self._record_failed_attempt(method, route, sent_at, body, attempt, error)
             except requests.exceptions.ConnectionError as e:
-                if attempt == self.max_retries - 1:
-                    raise ClickUpAPIError(0, f"Connection error: {str(e)}")
-                logger.warning(f"Connection error, retrying... ({attempt + 1}/{self.max_retries})")
-
-            except ClickUpRateLimitError as e:
-                if attempt == self.max_retries - 1:
-                    raise
-                # Wait for rate limit reset
-                wait_time = e.retry_after if e.retry_after else 60
-                logger.warning(f"Rate limit hit, waiting {wait_time}s...")
-                time.sleep(wait_time)
-                continue
-
-            except (ClickUpAuthError, ClickUpNotFoundError):
-                # Don't retry auth or not found errors
-                raise
-
-            # Exponential backoff for retries
-            if attempt < self.max_retries - 1:
-                backoff = 2 ** attempt
-                logger.debug(f"Backing off for {backoff}s...")
-                time.sleep(backoff)
-
-        raise ClickUpAPIError(0, "Max retries exceeded")
+                error = ClickUpAPIError(0, f"Connection error: {str(e)}")
+                self._record_failed_attempt(method, route, sent_at, body, attempt, error)
+            except ClickUpNotFoundError as e:
+                self._index_missing(endpoint)
+                error = e
+            except ClickUpAPIError as e:
+                error = e
+
+            policy.record_failure(route, error)
+            delay = policy.next_delay(route, method, error, attempt)
+            if delay is None:
+                raise error
+            self.telemetry.record_retry(route)
+            logger.warning(f"{error}; retrying in {delay:.1f}s ({attempt + 1}/{policy.max_attempts})")
+            time.sleep(delay)
+            attempt += 1
 
     # Task endpoints - Delegated to TasksAPI
     def get_task(self, task_id: str, **params) -> Dict[str, Any]:
@@ -337,13 +761,47 @@ class ClickUpClient:
         return self.tasks.get_task(task_id, **params)
 
     def get_list_tasks(self, list_id: str, **params) -> Dict[str, Any]:
-        """Get all tasks in a list."""
+        """Get all tasks in a list (pass stream=True to decode the page incrementally)."""
         return self.tasks.get_list_tasks(list_id, **params)
 
     def get_team_tasks(self, team_id: str, **params) -> Dict[str, Any]:
-        """Get all tasks in a team/workspace."""
+        """Get all tasks in a team/workspace (pass stream=True to decode the page incrementally)."""
         return self.tasks.get_team_tasks(team_id, **params)
 
+    def iter_list_tasks(self, list_id: str, prefetch: int = DEFAULT_PREFETCH, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every task in a list across all pages.
+
+        Pages after the first are fetched ``prefetch`` at a time in parallel;
+        tasks are yielded in page order.
+        """
+        return iter_pages(lambda **p: self.get_list_tasks(list_id, **p), prefetch=prefetch, **params)
+
+    def iter_team_tasks(self, team_id: str, prefetch: int = DEFAULT_PREFETCH, **params) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every task in a team/workspace across all pages.
+
+        Pages after the first are fetched ``prefetch`` at a time in parallel;
+        tasks are yielded in page order.
+        """
+        return iter_pages(lambda **p: self.get_team_tasks(team_id, **p), prefetch=prefetch, **params)
+
+    def batch(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> WriteBatch:
+        """
+        Start a batch of task writes executed in parallel under the rate limiter.
+
+        Usage:
+            with client.batch() as batch:
+                batch.update_task("t1", status="done")
+                batch.add_tag("t1", "shipped")
+            print(batch.report.summary())
+        """
+        return WriteBatch(self, max_workers=max_workers, max_attempts=max_attempts)
+
     def create_task(self, list_id: str, **task_data) -> Dict[str, Any]:
         """Create a new task."""
         return self.tasks.create_task(list_id, **task_data)
@@ -989,4 +1447,7 @@ class ClickUpClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Clean up session on exit."""
-        self.session.close()
+        if "session" in self.__dict__:
+            self.session.close()
+        if self.id_index is not None:
+            self.id_index.flush()
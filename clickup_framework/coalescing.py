@@ -0,0 +1,194 @@
+"""
+Request Coalescing
+
+Rendering one command often asks for the same task, list or comment thread
+several times (detail view, orphan handling, dependency analysis). The
+RequestCoalescer makes identical GETs cost one round trip:
+
+- single-flight: while a request for a key is in flight, other callers wait
+  for its result instead of sending their own
+- memoization (opt-in, ``memo_ttl > 0``): completed results are reused for
+  ``memo_ttl`` seconds. CLI commands turn it on for the length of one run;
+  library clients leave it off, so polling callers never see stale data
+  and no page snapshots are kept.
+
+Callers that share a result receive their own deep copy, so formatters that
+annotate the returned dicts can't leak changes into each other. Without
+memoization a result is copied once per extra waiter and never when nobody
+else asked for it. Any write through the client clears the memo and keeps
+requests already in flight from being memoized, so reads after writes
+always hit the API.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict
+
+DEFAULT_MEMO_TTL = 0.0
+DEFAULT_MEMO_SIZE = 512
+
+# Memo lifetime CLI commands use: long enough for one run, short enough not to matter
+COMMAND_MEMO_TTL = 30.0
+
+
+class _Flight:
+    """One in-flight request: its outcome and the callers waiting for it."""
+
+    __slots__ = ("future", "generation", "waiters", "memoized")
+
+    def __init__(self, future: Any, generation: int):
+        self.future = future
+        self.generation = generation  # RequestCoalescer generation when the request started
+        self.waiters = 0
+        self.memoized = False
+
+
+class RequestCoalescer:
+    """Single-flight and short-term memoization for idempotent requests."""
+
+    def __init__(self, memo_ttl: float = DEFAULT_MEMO_TTL, memo_size: int = DEFAULT_MEMO_SIZE):
+        """
+        Initialize coalescer.
+
+        Args:
+            memo_ttl: Seconds to reuse a completed result (default: 0 = only coalesce in-flight requests)
+            memo_size: Maximum number of memoized results
+        """
+        self.memo_ttl = memo_ttl
+        self.memo_size = memo_size
+        self._lock = threading.Lock()
+        self._memo: "OrderedDict[str, tuple]" = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._async_inflight: Dict[str, _Flight] = {}
+        # Bumped by clear(); requests started before a clear are not memoized
+        self._generation = 0
+
+    def _memo_get(self, key: str) -> Any:
+        """Return a copy of a fresh memoized result, or None. Caller holds the lock."""
+        entry = self._memo.get(key)
+        if entry is None:
+            return None
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            del self._memo[key]
+            return None
+        self._memo.move_to_end(key)
+        return copy.deepcopy(snapshot)
+
+    def _memo_put(self, key: str, snapshot: Any) -> None:
+        """Remember a snapshot, evicting the oldest entries past memo_size. Caller holds the lock."""
+        if self.memo_ttl <= 0:
+            return
+        self._memo[key] = (time.monotonic() + self.memo_ttl, snapshot)
+        self._memo.move_to_end(key)
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+
+    def _settle(self, key: str, flight: _Flight, inflight: Dict[str, _Flight], result: Any) -> Any:
+        """
+        Finish a flight: memoize and share the leader's result when anyone needs it.
+
+        Returns:
+            The snapshot handed to waiters (None when nobody shares the result)
+        """
+        with self._lock:
+            inflight.pop(key, None)
+            # No caller can join this flight any more, so the waiter count is final
+            shared = flight.waiters > 0 or self.memo_ttl > 0
+        snapshot = copy.deepcopy(result) if shared else None
+        with self._lock:
+            if self.memo_ttl > 0 and flight.generation == self._generation:
+                self._memo_put(key, snapshot)
+                flight.memoized = True
+        return snapshot
+
+    def _take(self, flight: _Flight, snapshot: Any) -> Any:
+        """Hand a waiter the shared snapshot; the last waiter of an unmemoized result keeps it uncopied."""
+        with self._lock:
+            flight.waiters -= 1
+            last = flight.waiters == 0 and not flight.memoized
+        return snapshot if last else copy.deepcopy(snapshot)
+
+    def run(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Return fetch()'s result, sharing it with concurrent and recent callers of the same key.
+
+        Args:
+            key: Identity of the request
+            fetch: Performs the request when no shared result is available
+
+        Returns:
+            The result (a private copy when shared)
+
+        Raises:
+            Whatever fetch() raised; waiting callers see the same exception
+        """
+        with self._lock:
+            cached = self._memo_get(key)
+            if cached is not None:
+                return cached
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight(Future(), self._generation)
+            else:
+                flight.waiters += 1
+
+        if not leader:
+            return self._take(flight, flight.future.result())
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.future.set_exception(e)
+            raise
+
+        flight.future.set_result(self._settle(key, flight, self._inflight, result))
+        return result
+
+    async def run_async(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async counterpart of run() for coroutine fetchers on one event loop.
+
+        A caller that is cancelled while waiting does not cancel the shared request.
+        """
+        import asyncio
+
+        with self._lock:
+            cached = self._memo_get(key)
+            if cached is not None:
+                return cached
+            flight = self._async_inflight.get(key)
+            if flight is not None:
+                flight.waiters += 1
+
+        if flight is not None:
+            _, snapshot = await asyncio.shield(flight.future)
+            return self._take(flight, snapshot)
+
+        async def lead():
+            try:
+                result = await fetch()
+            except BaseException:
+                self._async_inflight.pop(key, None)
+                raise
+            return result, self._settle(key, flight, self._async_inflight, result)
+
+        with self._lock:
+            flight = self._async_inflight[key] = _Flight(None, self._generation)
+        flight.future = asyncio.ensure_future(lead())
+        # Mark failures as retrieved when the leader was cancelled and nobody waited
+        flight.future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        result, _ = await asyncio.shield(flight.future)
+        return result
+
+    def clear(self) -> None:
+        """Forget memoized results (called after writes); requests in flight are still shared but not memoized."""
+        with self._lock:
+            self._memo.clear()
+            self._generation += 1
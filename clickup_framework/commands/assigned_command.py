@@ -3,9 +3,10 @@
 import os
 from collections import defaultdict, deque
 from clickup_framework.commands.base_command import BaseCommand
+from clickup_framework.components.task_graph import TaskGraph
 from clickup_framework.utils.colors import colorize, TextColor, TextStyle
 from clickup_framework.utils.animations import ANSIAnimations
-from clickup_framework.commands.utils import add_common_args
+from clickup_framework.commands.utils import add_common_args, add_mirror_args, add_offline_args
 
 
 class AssignedTasksCommand(BaseCommand):
@@ -122,13 +123,15 @@ class AssignedTasksCommand(BaseCommand):
 
         # Fetch tasks assigned to user(s)
         try:
-            result = self.client.get_team_tasks(
-                team_id,
-                assignees=user_ids,
-                subtasks=True,
-                include_closed=include_closed
-            )
-            tasks = result.get('tasks', [])
+            if self.mirror is not None and self.mirror.is_synced(team_id):
+                tasks = self.mirror.get_tasks(team_id=team_id, assignees=user_ids, include_closed=include_closed)
+            else:
+                tasks = list(self.client.iter_team_tasks(
+                    team_id,
+                    assignees=user_ids,
+                    subtasks=True,
+                    include_closed=include_closed
+                ))
         except Exception as e:
             self.error(f"Error fetching tasks: {e}")
 
@@ -152,7 +155,8 @@ class AssignedTasksCommand(BaseCommand):
             return
 
         # Build dependency graph
-        task_map = {task['id']: task for task in tasks}
+        graph = TaskGraph(tasks)
+        task_map = graph.tasks
         task_info = {}
 
         for task in tasks:
@@ -206,11 +210,14 @@ class AssignedTasksCommand(BaseCommand):
             for task_id in task_info:
                 in_degree[task_id] = 0
 
-            # Build in-degree count
+            # Build in-degree count and the reverse (blocker -> waiting tasks) index
+            waiting_on = defaultdict(list)
             for task_id, info in task_info.items():
                 for blocker in info['blockers']:
                     if blocker in task_info:
                         in_degree[task_id] += 1
+                for blocker in dict.fromkeys(info['blockers']):
+                    waiting_on[blocker].append(task_id)
 
             # BFS to calculate depth
             queue = deque()
@@ -223,14 +230,13 @@ class AssignedTasksCommand(BaseCommand):
                 task_id, depth = queue.popleft()
 
                 # Find tasks that depend on this one
-                for tid, info in task_info.items():
-                    if task_id in info['blockers']:
-                        in_degree[tid] -= 1
-                        new_depth = depth + 1
-                        if tid not in depths or new_depth > depths[tid]:
-                            depths[tid] = new_depth
-                        if in_degree[tid] == 0:
-                            queue.append((tid, depths[tid]))
+                for tid in waiting_on.get(task_id, ()):
+                    in_degree[tid] -= 1
+                    new_depth = depth + 1
+                    if tid not in depths or new_depth > depths[tid]:
+                        depths[tid] = new_depth
+                    if in_degree[tid] == 0:
+                        queue.append((tid, depths[tid]))
 
             return depths
 
@@ -239,26 +245,9 @@ class AssignedTasksCommand(BaseCommand):
             task_info[task_id]['depth'] = depths.get(task_id, 0)
 
         # Separate parent tasks from subtasks
-        parent_tasks = []
-        subtasks_by_parent = defaultdict(list)
-        orphaned_subtasks = []  # Subtasks whose parent is not in the assigned list
-
-        for task in tasks:
-            task_id = task['id']
-            parent_id = task.get('parent')
-
-            if parent_id:
-                # This is a subtask
-                subtasks_by_parent[parent_id].append(task_id)
-            else:
-                # This is a parent task
-                parent_tasks.append(task_id)
-
-        # Identify orphaned subtasks (parent not in our task list)
-        for parent_id, subtask_ids in subtasks_by_parent.items():
-            if parent_id not in task_map:
-                # Parent is not assigned to user, these subtasks are "orphaned" in this view
-                orphaned_subtasks.extend(subtask_ids)
+        parent_tasks = [task['id'] for task in graph.roots(include_orphaned=False)]
+        # Subtasks whose parent is not assigned to the user are "orphaned" in this view
+        orphaned_subtasks = [task['id'] for task in graph.orphans()]
 
         # Sort tasks by difficulty (ascending) then by depth (ascending)
         sorted_task_ids = sorted(
@@ -349,10 +338,11 @@ class AssignedTasksCommand(BaseCommand):
             task_number += 1
 
             # Display subtasks for this parent (only those assigned to user)
-            if task_id in subtasks_by_parent:
+            subtask_ids = [subtask['id'] for subtask in graph.children(task_id)]
+            if subtask_ids:
                 # Sort subtasks by difficulty and depth
                 sorted_subtasks = sorted(
-                    subtasks_by_parent[task_id],
+                    subtask_ids,
                     key=lambda tid: (task_info[tid]['difficulty'], task_info[tid]['depth'])
                 )
                 for subtask_id in sorted_subtasks:
@@ -372,7 +362,7 @@ class AssignedTasksCommand(BaseCommand):
 
         self.print(f"{colorize('Summary:', TextColor.BRIGHT_WHITE, TextStyle.BOLD) if use_color else 'Summary:'}")
         self.print(f"  Parent tasks: {len(parent_tasks)}")
-        self.print(f"  Subtasks (under assigned parents): {sum(len(v) for k, v in subtasks_by_parent.items() if k in task_map)}")
+        self.print(f"  Subtasks (under assigned parents): {len(tasks) - len(parent_tasks) - len(orphaned_subtasks)}")
         if orphaned_subtasks:
             self.print(f"  Subtasks (parent not assigned): {len(orphaned_subtasks)}")
         self.print(f"  Ready to start: {ready_tasks} task(s)")
@@ -425,3 +415,5 @@ def register_command(subparsers):
                                 help='Show ONLY closed tasks')
     assigned_parser.set_defaults(func=assigned_tasks_command)
     add_common_args(assigned_parser)
+    add_mirror_args(assigned_parser)
+    add_offline_args(assigned_parser)
@@ -10,12 +10,15 @@ This base class provides common functionality that all commands need:
 - Command metadata storage
 """
 
+import functools
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Union
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.clickup_constants import (
     CLICKUP_FRAMEWORK_LIST_IDS,
     CLI_COMMAND_TASK_IDS,
@@ -27,6 +30,8 @@ from clickup_framework.commands.utils import (
     resolve_container_id,
     resolve_list_id,
     create_format_options,
+    mirror_requested,
+    read_policy,
 )
 from clickup_framework.utils.image_export import console_to_jpg, capture_command_output_to_jpg
 
@@ -74,14 +79,50 @@ class BaseCommand:
         else:
             self.format_options = None
 
+        # --offline / --max-staleness: serve reads from cached data
+        try:
+            self.offline, self.max_staleness = read_policy(args)
+        except ValueError as e:
+            self.error(f"Invalid --max-staleness: {e}")
+        if self.offline or self.max_staleness is not None:
+            self.client.set_read_policy(offline=self.offline, max_staleness=self.max_staleness)
+
     def _get_context_manager(self):
         """Return the active context manager instance."""
         return get_context_manager()
 
     def _create_client(self):
-        """Create the ClickUp client used by this command."""
-        return ClickUpClient()
+        """Create the ClickUp client used by this command (memoizing GETs for the run)."""
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
     
+    @functools.cached_property
+    def mirror(self):
+        """
+        WorkspaceMirror to read tasks from, or None.
+
+        Set when the command was run with --mirror (or CLICKUP_MIRROR=1) and
+        ``cum sync`` has created the mirror. With --offline any synced mirror
+        is used, and with --max-staleness one synced within the bound.
+        """
+        requested = mirror_requested(self.args)
+        if not (requested or self.offline or self.max_staleness is not None):
+            return None
+        from clickup_framework.mirror import WorkspaceMirror, format_age
+
+        mirror = WorkspaceMirror.open_existing()
+        if mirror is None:
+            if requested:
+                self.print_info("No workspace mirror found; run 'cum sync' first. Reading from the API.")
+            return None
+        state = mirror.sync_state(self.get_workspace_id()) if self.get_workspace_id() else None
+        age = time.time() - state['synced_at'] if state else None
+        if not requested and not self.offline and (age is None or age > self.max_staleness):
+            mirror.close()
+            return None
+        if age is not None:
+            self.print_info(f"Reading from workspace mirror (synced {format_age(age)} ago)")
+        return mirror
+
     def _detect_command_name(self) -> str:
         """Detect command name from args or class name."""
         if hasattr(self.args, 'command'):
@@ -130,6 +171,10 @@ class BaseCommand:
         Raises:
             ValueError: If container cannot be resolved
         """
+        if self.mirror is not None and id_or_current.lower() != "current":
+            container = self.mirror.resolve_container(id_or_current)
+            if container is not None:
+                return container
         try:
             return resolve_container_id(self.client, id_or_current, self.context)
         except ValueError as e:
@@ -149,6 +194,10 @@ class BaseCommand:
         Raises:
             ValueError: If list ID cannot be resolved
         """
+        if self.mirror is not None and id_or_current.lower() != "current":
+            container = self.mirror.resolve_container(id_or_current)
+            if container is not None and container["type"] in ("list", "task"):
+                return container.get("list_id", container["id"])
         try:
             return resolve_list_id(self.client, id_or_current, self.context)
         except ValueError as e:
@@ -218,14 +267,27 @@ class BaseCommand:
         """Return the generic output-file path supplied by add_common_args."""
         return getattr(self.args, "common_output_file", None)
 
-    def _write_text_output_file(self, path: str, content: str) -> None:
-        """Write command output text to a UTF-8 file."""
+    def _write_text_output_file(self, path: str, content: Union[str, Iterable[str]]) -> None:
+        """Write command output text to a UTF-8 file; an iterable of lines is written as it is produced."""
         output_path = Path(path)
         if output_path.parent and str(output_path.parent) != ".":
             output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content, encoding="utf-8")
+        if isinstance(content, str):
+            output_path.write_text(content, encoding="utf-8")
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                for i, line in enumerate(content):
+                    f.write(f"\n{line}" if i else line)
         self.print_info(f"Output written: {output_path.resolve()}")
 
+    def _print_text(self, content: Union[str, Iterable[str]]) -> None:
+        """Print command output; an iterable of lines is printed as it is produced."""
+        if isinstance(content, str):
+            self.print(content)
+            return
+        for line in content:
+            self.print(line)
+
     def _json_output_text(self, data: Any) -> str:
         """Serialize output data as stable, human-readable JSON."""
         import json
@@ -241,7 +303,7 @@ class BaseCommand:
             self.print_error(f"Failed to save JSON output: {e}")
 
     def handle_output(self, data: Any, formatter: Optional[Any] = None,
-                     detail_level: str = "summary", console_output: Optional[str] = None):
+                     detail_level: str = "summary", console_output: Optional[Union[str, Iterable[str]]] = None):
         """
         Handle command output based on the --output flag.
 
@@ -249,13 +311,21 @@ class BaseCommand:
             data: The raw data object (dict or list) to be formatted.
             formatter: A Formatter instance (BaseFormatter subclass).
             detail_level: Level of detail for markdown/console output.
-            console_output: Pre-formatted console string. If provided,
-                           used for "console" output instead of formatter.
+            console_output: Pre-formatted console string, or an iterable of
+                           lines to stream. If provided, used for "console"
+                           output instead of formatter.
         """
+        self._write_output(data, formatter, detail_level, console_output)
+        # Streamed output fetches while it renders, so the age is only final now
+        self.print_data_age()
+
+    def _write_output(self, data: Any, formatter: Optional[Any], detail_level: str,
+                      console_output: Optional[Union[str, Iterable[str]]]) -> None:
+        """Render and print or save the output for handle_output."""
         output_format = getattr(self.args, 'output', 'console')
         output_file = self._get_common_output_file()
 
-        def render_console() -> str:
+        def render_console() -> Union[str, Iterable[str]]:
             if console_output is not None:
                 return console_output
             if formatter:
@@ -267,7 +337,7 @@ class BaseCommand:
         if output_format == 'json':
             self.save_json_output(data)
             # Always print console output for JSON mode as requested
-            self.print(render_console())
+            self._print_text(render_console())
             return
 
         if output_format == 'markdown':
@@ -286,7 +356,20 @@ class BaseCommand:
         if output_file:
             self._write_text_output_file(output_file, rendered)
         else:
-            self.print(rendered)
+            self._print_text(rendered)
+
+    def print_data_age(self):
+        """Note on stderr how old the cached data behind the output is (--offline / --max-staleness)."""
+        if not (self.offline or self.max_staleness is not None):
+            return
+        age = getattr(self.client, 'cached_data_age', None)
+        if not isinstance(age, (int, float)):
+            return
+        from clickup_framework.mirror import format_age
+
+        mode = "offline" if self.offline else f"max staleness {format_age(self.max_staleness)}"
+        self.print_info(f"Showing cached data up to {format_age(age)} old ({mode})")
+
     # ==================== Workspace Methods ====================
     
     def get_default_assignee(self) -> Optional[str]:
@@ -551,7 +634,7 @@ class BaseCommand:
             raise ValueError("Could not determine the command to link this report to.")
 
         context = context or get_context_manager()
-        client = client or ClickUpClient()
+        client = client or ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
         cli_commands_list_id = cli_commands_list_id or cls.CLI_COMMANDS_LIST_ID
 
         details = cls._read_report_details(report_details, report_details_file)
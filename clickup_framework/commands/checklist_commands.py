@@ -3,6 +3,7 @@
 import sys
 import json
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.commands.base_command import BaseCommand
 from clickup_framework.resources.tasks import TasksAPI
 from clickup_framework.resources.checklist_template_manager import ChecklistTemplateManager
@@ -759,7 +760,7 @@ class ChecklistCommandBase(BaseCommand):
 
     def _create_client(self):
         """Use module-local factories so existing tests can patch them."""
-        return ClickUpClient()
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
 
 
 class ChecklistCreateCommand(ChecklistCommandBase):
@@ -12,6 +12,7 @@ import sys
 import subprocess
 from typing import Dict, List, Tuple, Optional
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.clickup_constants import (
     CLICKUP_FRAMEWORK_LIST_IDS,
     CLI_COMMAND_CATEGORIES,
@@ -593,7 +594,7 @@ def list_missing_commands(list_id: str = DEFAULT_CLI_COMMANDS_LIST_ID):
         print()
 
     try:
-        client = ClickUpClient()
+        client = ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
         list_tasks = _get_all_list_tasks(client, list_id)
         task_ids_in_list = {task.get("id") for task in list_tasks}
         task_names_in_list = {task.get("name") for task in list_tasks}
@@ -662,7 +663,7 @@ class CommandSyncCommand(BaseCommand):
 
     def _create_client(self):
         """Use the module-local client factory for compatibility."""
-        return ClickUpClient()
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
 
     def execute(self):
         """Execute the command-sync workflow."""
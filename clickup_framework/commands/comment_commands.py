@@ -3,6 +3,7 @@
 import sys
 import os
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.commands.base_command import BaseCommand
 from clickup_framework.utils.colors import colorize, TextColor, TextStyle
 from clickup_framework.utils.animations import ANSIAnimations
@@ -404,7 +405,7 @@ class CommentCommandBase(BaseCommand):
 
     def _create_client(self):
         """Use module-local factories so existing tests can patch them."""
-        return ClickUpClient()
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
 
 
 class CommentAddCommand(CommentCommandBase):
@@ -3,11 +3,13 @@
 import sys
 from typing import Dict, Any, List, Tuple
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.commands.base_command import BaseCommand
 from clickup_framework.resources.custom_fields import CustomFieldsAPI
 from clickup_framework.utils.colors import colorize, TextColor, TextStyle
 from clickup_framework.utils.animations import ANSIAnimations
 from clickup_framework.exceptions import ClickUpAPIError
+from clickup_framework.metadata_cache import get_metadata_cache
 from clickup_framework.commands.utils import add_common_args
 
 
@@ -57,7 +59,7 @@ def resolve_field_name_to_id(
 
     # Get custom fields for the list
     try:
-        fields_response = client.get_accessible_custom_fields(list_id)
+        fields_response = get_metadata_cache().custom_fields(client, list_id)
         fields = fields_response.get('fields', [])
     except Exception as e:
         raise ValueError(f"Could not get custom fields: {e}")
@@ -337,7 +339,7 @@ def _custom_field_list_impl(args, context, client, use_color):
             list_id = task['list']['id']
 
             # Get field definitions
-            fields_response = client.get_accessible_custom_fields(list_id)
+            fields_response = get_metadata_cache().custom_fields(client, list_id)
             field_defs = {f['id']: f for f in fields_response.get('fields', [])}
 
             # Get task custom field values
@@ -495,7 +497,7 @@ class CustomFieldCommandBase(BaseCommand):
 
     def _create_client(self):
         """Use module-local factories so existing tests can patch them."""
-        return ClickUpClient()
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
 
 
 class CustomFieldSetCommand(CustomFieldCommandBase):
@@ -1,47 +1,17 @@
 """Detail view command."""
 
-import sys
 import logging
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.components import DisplayManager
+from clickup_framework.components.detail_prefetch import prefetch_detail
 from clickup_framework.commands.base_command import BaseCommand
-from clickup_framework.commands.utils import create_format_options, add_common_args
+from clickup_framework.commands.utils import create_format_options, add_common_args, add_offline_args
 from clickup_framework.utils.argparse_helpers import raw_text_formatter
 
 logger = logging.getLogger(__name__)
 
 
-def _fetch_all_pages(fetch_func, **params):
-    """
-    Fetch all pages of results from a paginated API endpoint.
-
-    Args:
-        fetch_func: Function to call for fetching data
-        **params: Additional parameters (subtasks, include_closed, etc.)
-
-    Returns:
-        list: All tasks from all pages combined
-    """
-    all_tasks = []
-    page = 0
-
-    while True:
-        try:
-            result = fetch_func(page=page, **params)
-            tasks = result.get('tasks', [])
-            all_tasks.extend(tasks)
-
-            if result.get('last_page', True):
-                break
-
-            page += 1
-        except Exception as e:
-            logger.warning(f"Failed to fetch page {page}: {e}")
-            break
-
-    return all_tasks
-
-
 class DetailCommand(BaseCommand):
     """Display comprehensive details of a single task with relationships."""
 
@@ -51,11 +21,10 @@ class DetailCommand(BaseCommand):
 
     def _create_client(self):
         """Use module-local factories so existing tests can patch them."""
-        return ClickUpClient()
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
 
     def execute(self):
         """Execute the detail command."""
-        display = DisplayManager(self.client)
         task_id = self.resolve_id('task', self.args.task_id)
 
         # The get_task endpoint includes the full task payload used by the detail view.
@@ -71,37 +40,20 @@ class DetailCommand(BaseCommand):
             else:
                 list_id = None
 
-        # ClickUp API quirk: fetch root tasks and subtasks separately, then merge.
-        if list_id:
-            try:
-                root_tasks = _fetch_all_pages(
-                    lambda **p: self.client.get_list_tasks(list_id, **p),
-                    include_closed=True
-                )
-                subtask_list = _fetch_all_pages(
-                    lambda **p: self.client.get_list_tasks(list_id, **p),
-                    subtasks='true',
-                    include_closed=True
-                )
-
-                task_map = {}
-                for item in root_tasks + subtask_list:
-                    task_map[item['id']] = item
-                all_tasks = list(task_map.values())
-            except Exception as e:
-                print(f"Warning: Could not fetch list tasks: {e}", file=sys.stderr)
-                all_tasks = None
-        else:
-            all_tasks = None
+        # Fetch the list's tasks, comments and replies, docs, linked tasks,
+        # missing ancestors and blockers concurrently, up front...
+        all_tasks = prefetch_detail(self.client, task, list_id)
 
+        # ...so rendering needs no client and makes no requests
+        display = DisplayManager()
         options = self.format_options or create_format_options(self.args)
         detail_level = getattr(self.args, 'preset', 'full')
         output = display.detail_view(task, all_tasks, options)
-        
+
         self.handle_output(
-            data=task, 
-            formatter=display.detail_formatter, 
-            detail_level=detail_level, 
+            data=task,
+            formatter=display.detail_formatter,
+            detail_level=detail_level,
             console_output=output
         )
 
@@ -162,4 +114,5 @@ Tips:
     parser.add_argument('task_id', help='ClickUp task ID or "current"')
     parser.add_argument('list_id', nargs='?', help='List ID for relationship context (optional, auto-detected if not provided)')
     add_common_args(parser)
+    add_offline_args(parser)
     parser.set_defaults(func=detail_command, preset='full')
@@ -2,10 +2,10 @@
 
 import os
 import sys
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework import ClickUpClient, get_context_manager, serialization
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.commands.base_command import BaseCommand
 from clickup_framework.utils.colors import colorize, TextColor, TextStyle
 from clickup_framework.commands.utils import add_common_args
@@ -207,7 +207,7 @@ def dump_list_to_markdown(client: ClickUpClient, list_id: str, output_dir: Path)
         (list_dir / "README.md").write_text(list_info, encoding='utf-8')
 
         # Get all tasks in the list
-        tasks = client.get_tasks(list_id, include_closed=True, subtasks=False)
+        tasks = list(client.iter_list_tasks(list_id, include_closed=True, subtasks=False))
 
         print(f"Found {len(tasks)} top-level tasks")
 
@@ -248,7 +248,7 @@ def dump_list_to_json(client: ClickUpClient, list_id: str) -> Dict[str, Any]:
         Dictionary with list info and all tasks
     """
     list_data = client.get_list(list_id)
-    tasks = client.get_tasks(list_id, include_closed=True, subtasks=True)
+    tasks = list(client.iter_list_tasks(list_id, include_closed=True, subtasks=True))
 
     return {
         'list': list_data,
@@ -311,17 +311,17 @@ class DumpCommand(BaseCommand):
 
     def _create_client(self):
         """Use module-local factories so tests can patch them if needed."""
-        return ClickUpClient()
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
 
     def _write_json_or_print(self, filename: str, data: Dict[str, Any], output_dir: Path) -> None:
         """Write JSON to disk when an output dir is supplied, otherwise print it."""
         if hasattr(self.args, 'output_dir') and self.args.output_dir:
             output_file = output_dir / filename
             output_dir.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
+            output_file.write_text(serialization.dumps(data, indent=True), encoding='utf-8')
             self.print(f"✓ Saved to: {output_file}")
         else:
-            self.print(json.dumps(data, indent=2))
+            self.print(serialization.dumps(data, indent=True))
 
     def execute(self):
         """Main dump command handler."""
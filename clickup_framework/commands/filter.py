@@ -6,6 +6,7 @@ from clickup_framework.commands.utils import (
     create_format_options,
     get_list_statuses,
     add_common_args,
+    add_mirror_args,
     expand_cli_tag_list,
 )
 
@@ -30,8 +31,11 @@ class FilterCommand(BaseCommand):
         # We need closed tasks if either include_completed or show_closed_only is True
         include_closed = include_completed or show_closed_only
 
-        result = self.client.get_list_tasks(list_id, include_closed=include_closed)
-        tasks = result.get('tasks', [])
+        if self.mirror is not None and self.mirror.get_list(list_id) is not None:
+            tasks = self.mirror.get_tasks(list_ids=[list_id], include_closed=include_closed, subtasks=False)
+        else:
+            result = self.client.get_list_tasks(list_id, include_closed=include_closed)
+            tasks = result.get('tasks', [])
         options = create_format_options(self.args)
 
         # Show available statuses
@@ -99,4 +103,5 @@ def register_command(subparsers):
     parser.add_argument('--view-mode', choices=['hierarchy', 'container', 'flat'],
                         default='hierarchy', help='Display mode (default: hierarchy)')
     add_common_args(parser)
+    add_mirror_args(parser)
     parser.set_defaults(func=filter_command)
@@ -2,7 +2,7 @@
 
 from clickup_framework.commands.base_command import BaseCommand
 from clickup_framework.components import DisplayManager
-from clickup_framework.commands.utils import create_format_options, get_list_statuses, add_common_args
+from clickup_framework.commands.utils import create_format_options, get_list_statuses, add_common_args, add_mirror_args
 
 
 class FlatCommand(BaseCommand):
@@ -25,8 +25,11 @@ class FlatCommand(BaseCommand):
         # We need closed tasks if either include_completed or show_closed_only is True
         include_closed = include_completed or show_closed_only
 
-        result = self.client.get_list_tasks(list_id, include_closed=include_closed)
-        tasks = result.get('tasks', [])
+        if self.mirror is not None and self.mirror.get_list(list_id) is not None:
+            tasks = self.mirror.get_tasks(list_ids=[list_id], include_closed=include_closed, subtasks=False)
+        else:
+            result = self.client.get_list_tasks(list_id, include_closed=include_closed)
+            tasks = result.get('tasks', [])
         options = create_format_options(self.args)
 
         # Show available statuses
@@ -77,4 +80,5 @@ def register_command(subparsers):
     parser.add_argument('list_id', help='ClickUp list ID or task ID')
     parser.add_argument('--header', help='Custom header text')
     add_common_args(parser)
+    add_mirror_args(parser)
     parser.set_defaults(func=flat_command)
@@ -104,12 +104,14 @@ class FuseCommand(BaseCommand):
         # Delete source tasks unless --keep-sources
         if not self.args.keep_sources:
             self.print_color("\n🗑️  Deleting source tasks...", TextColor.BRIGHT_CYAN)
+            batch = self.client.batch()
             for source_task in source_tasks:
-                try:
-                    self.client.delete_task(source_task['id'])
+                batch.delete_task(source_task['id'])
+            for source_task, item in zip(source_tasks, batch.execute().items):
+                if item.success:
                     self.print_success(f"Deleted task {source_task['id']}: {source_task['name']}")
-                except Exception as e:
-                    self.print_warning(f"Failed to delete {source_task['id']}: {e}")
+                else:
+                    self.print_warning(f"Failed to delete {source_task['id']}: {item.error}")
 
         self.print_success(f"\n✨ Fused {len(source_tasks)} task(s) into {target_id}")
 
@@ -139,6 +141,9 @@ class FuseCommand(BaseCommand):
             except:
                 pass
 
+        # Subtasks without a match are moved to the target in one batch
+        moves = self.client.batch()
+
         # Process source subtasks
         for source in sources:
             source_subtasks = source.get('subtasks', [])
@@ -168,14 +173,14 @@ class FuseCommand(BaseCommand):
                     else:
                         # No match - move subtask to target parent
                         self.print(f"  Moving subtask: {source_subtask['name']}")
-                        try:
-                            self.client.update_task(subtask_id, parent=target['id'])
-                        except Exception as e:
-                            self.print_warning(f"    Failed to move subtask: {e}")
+                        moves.update_task(subtask_id, parent=target['id'])
 
                 except Exception as e:
                     self.print_warning(f"  Failed to process subtask {subtask_id}: {e}")
 
+        for item in moves.execute().failed:
+            self.print_warning(f"    Failed to move subtask {item.key}: {item.error}")
+
     def _build_merge_plan(self, target: Dict[str, Any], sources: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Build a plan for merging tasks."""
         plan = {
@@ -8,16 +8,25 @@ displays ClickUp tasks in a hierarchical tree structure showing parent-child rel
 import sys
 import logging
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.components import DisplayManager
+from clickup_framework.components.task_graph import TaskGraph
 from clickup_framework.commands.base_command import BaseCommand
-from clickup_framework.commands.utils import create_format_options, get_list_statuses, add_common_args, resolve_container_id
+from clickup_framework.commands.utils import (
+    create_format_options, get_list_statuses, add_common_args, add_mirror_args, add_offline_args, resolve_container_id,
+)
+from clickup_framework.pagination import collect_pages
 
 logger = logging.getLogger(__name__)
 
 
-def _hierarchy_impl(args, context, client, use_color):
+def _hierarchy_impl(args, context, client, use_color, mirror=None, stream=False):
     """
     Display tasks in hierarchical parent-child view with full pagination support.
+
+    With a WorkspaceMirror, containers and tasks are read from the mirror
+    instead of the API when it has them. With ``stream=True`` the output is an
+    iterator of lines rendered as they are consumed rather than one string.
     """
     display = DisplayManager(client)
 
@@ -52,16 +61,21 @@ def _hierarchy_impl(args, context, client, use_color):
             print("Error: No workspace ID set. Use 'cum set workspace <team_id>' first.", file=sys.stderr)
             sys.exit(1)
 
-        tasks = _fetch_all_pages(
-            lambda **p: client.get_team_tasks(team_id, **p),
-            subtasks=True,
-            include_closed=include_closed
-        )
+        if mirror is not None and mirror.is_synced(team_id):
+            tasks = mirror.get_tasks(team_id=team_id, include_closed=include_closed)
+        else:
+            # Workspace pages can be megabytes each: decode tasks as they arrive
+            tasks = _fetch_all_pages(
+                lambda **p: client.get_team_tasks(team_id, stream=True, **p),
+                subtasks=True,
+                include_closed=include_closed
+            )
         list_id = None
         container_name = None
     else:
+        container = mirror.resolve_container(args.list_id) if mirror is not None else None
         try:
-            container = resolve_container_id(client, args.list_id, context)
+            container = container or resolve_container_id(client, args.list_id, context)
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
@@ -72,7 +86,9 @@ def _hierarchy_impl(args, context, client, use_color):
         if container_type == 'space':
             space_data = container['data']
             container_name = space_data.get('name', 'Space')
-            tasks = _get_tasks_from_space(client, space_data, include_closed)
+            tasks = _get_mirror_tasks_from_lists(mirror, _container_lists(space_data), include_closed)
+            if tasks is None:
+                tasks = _get_tasks_from_space(client, space_data, include_closed)
             colorize_val = getattr(args, 'colorize', None)
             use_color_val = colorize_val if colorize_val is not None else context.get_ansi_output()
             tasks = _wrap_space_tasks_in_containers(tasks, space_data, use_color_val)
@@ -80,7 +96,9 @@ def _hierarchy_impl(args, context, client, use_color):
         elif container_type == 'folder':
             folder_data = container['data']
             container_name = folder_data.get('name', 'Folder')
-            tasks = _get_tasks_from_folder(client, folder_data, include_closed)
+            tasks = _get_mirror_tasks_from_lists(mirror, _container_lists(folder_data), include_closed)
+            if tasks is None:
+                tasks = _get_tasks_from_folder(client, folder_data, include_closed)
             colorize_val = getattr(args, 'colorize', None)
             use_color_val = colorize_val if colorize_val is not None else context.get_ansi_output()
             tasks = _wrap_folder_tasks_in_lists(tasks, folder_data, use_color_val)
@@ -89,39 +107,12 @@ def _hierarchy_impl(args, context, client, use_color):
             task_data = container['data']
             list_id_for_fetch = container['list_id']
             container_name = task_data.get('name', 'Task')
-
-            root_tasks = _fetch_all_pages(
-                lambda **p: client.get_list_tasks(list_id_for_fetch, **p),
-                include_closed=include_closed
-            )
-            subtask_list = _fetch_all_pages(
-                lambda **p: client.get_list_tasks(list_id_for_fetch, **p),
-                subtasks='true',
-                include_closed=include_closed
-            )
-
-            task_map = {}
-            for task in root_tasks + subtask_list:
-                task_map[task['id']] = task
-            all_tasks = list(task_map.values())
+            all_tasks = _get_list_tasks_with_subtasks(client, list_id_for_fetch, include_closed, mirror)
             tasks = _filter_task_and_descendants(all_tasks, container_id)
             list_id = None
         else:  # container_type == 'list'
             list_id = container_id
-            root_tasks = _fetch_all_pages(
-                lambda **p: client.get_list_tasks(list_id, **p),
-                include_closed=include_closed
-            )
-            subtask_list = _fetch_all_pages(
-                lambda **p: client.get_list_tasks(list_id, **p),
-                subtasks='true',
-                include_closed=include_closed
-            )
-
-            task_map = {}
-            for task in root_tasks + subtask_list:
-                task_map[task['id']] = task
-            tasks = list(task_map.values())
+            tasks = _get_list_tasks_with_subtasks(client, list_id, include_closed, mirror)
             container_name = None
 
     options = create_format_options(args)
@@ -151,7 +142,7 @@ def _hierarchy_impl(args, context, client, use_color):
             'use_color': context.get_ansi_output()
         }
 
-    output = display.hierarchy_view(tasks, options, header=header)
+    output = display.hierarchy_view(tasks, options, header=header, stream=stream)
     return tasks, output
 
 
@@ -266,17 +257,41 @@ def _wrap_folder_tasks_in_lists(tasks, folder_data, use_color=True):
 
 
 def _fetch_all_pages(fetch_func, **params):
-    all_tasks, page, last_page = [], 0, False
-    while not last_page:
-        try:
-            result = fetch_func(page=page, **params)
-            all_tasks.extend(result.get('tasks', []))
-            last_page = result.get('last_page', True)
-            page += 1
-        except Exception as e:
-            logger.warning(f"Pagination stopped at page {page}: {e}")
-            break
-    return all_tasks
+    return collect_pages(fetch_func, **params)
+
+
+def _get_list_tasks_with_subtasks(client, list_id, include_closed=False, mirror=None):
+    if mirror is not None and mirror.get_list(list_id) is not None:
+        return mirror.get_tasks(list_ids=[list_id], include_closed=include_closed)
+    root_tasks = _fetch_all_pages(
+        lambda **p: client.get_list_tasks(list_id, **p),
+        include_closed=include_closed
+    )
+    subtask_list = _fetch_all_pages(
+        lambda **p: client.get_list_tasks(list_id, **p),
+        subtasks='true',
+        include_closed=include_closed
+    )
+
+    task_map = {}
+    for task in root_tasks + subtask_list:
+        task_map[task['id']] = task
+    return list(task_map.values())
+
+
+def _container_lists(container_data):
+    lists = [lst for fld in container_data.get('folders', []) for lst in fld.get('lists', [])]
+    return lists + container_data.get('lists', [])
+
+
+def _get_mirror_tasks_from_lists(mirror, lists, include_closed=False):
+    """Top-level tasks of the given lists from the mirror, or None if it lacks any of them."""
+    if mirror is None:
+        return None
+    list_ids = [item.get('id') for item in lists if item.get('id')]
+    if any(mirror.get_list(l_id) is None for l_id in list_ids):
+        return None
+    return mirror.get_tasks(list_ids=list_ids, include_closed=include_closed, subtasks=False)
 
 
 def _get_tasks_from_lists(client, lists, include_closed=False):
@@ -305,23 +320,16 @@ def _get_tasks_from_folder(client, folder_data, include_closed=False):
 
 
 def _filter_task_and_descendants(all_tasks, root_task_id):
-    task_map = {task['id']: task for task in all_tasks}
-    if root_task_id not in task_map: return []
-    def collect(tid, coll):
-        if tid in task_map:
-            coll.append(task_map[tid])
-            for child in all_tasks:
-                if child.get('parent') == tid: collect(child['id'], coll)
-    res = []
-    collect(root_task_id, res)
-    return res
+    return TaskGraph(all_tasks).descendants(root_task_id)
 
 
 class HierarchyCommand(BaseCommand):
     def _get_context_manager(self): return get_context_manager()
-    def _create_client(self): return ClickUpClient()
+    def _create_client(self): return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
     def execute(self):
-        tasks, output = _hierarchy_impl(self.args, self.context, self.client, self.use_color)
+        # Stream the tree to stdout or --output-file line by line as it renders
+        tasks, output = _hierarchy_impl(self.args, self.context, self.client, self.use_color, mirror=self.mirror,
+                                        stream=True)
         from clickup_framework.components.display import DisplayManager
         display_mgr = DisplayManager(self.client)
         self.handle_output(data=tasks, formatter=display_mgr.hierarchy_formatter, detail_level=getattr(self.args, 'preset', 'full'), console_output=output)
@@ -352,5 +360,7 @@ def register_command(subparsers):
         p.add_argument('--space', dest='space_id', help='Show all in specific space')
         p.add_argument('--depth', type=int, help='Limit depth')
         add_common_args(p)
+        add_mirror_args(p)
+        add_offline_args(p)
         p.set_defaults(func=hierarchy_command, preset='full')
         parsers.append(p)
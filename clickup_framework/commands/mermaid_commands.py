@@ -4,6 +4,7 @@ import sys
 import os
 from pathlib import Path
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.commands.base_command import BaseCommand
 from clickup_framework.utils.colors import colorize, TextColor, TextStyle
 from clickup_framework.parsers import ContentProcessor, ParserContext
@@ -31,7 +32,7 @@ class MermaidCommand(BaseCommand):
 
     def _create_client(self):
         """Use module-local factories so tests can patch them if needed."""
-        return ClickUpClient()
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
 
     def execute(self):
         """Execute the mermaid command."""
@@ -1,23 +1,27 @@
 """
-Search command - find tasks and lists by keyword search.
+Search command - find tasks by keyword search.
 
 This module provides the `search` command which allows users to search for
-tasks and lists across the workspace using keyword matching. It renders the
-hierarchy view internally and filters the output in Python, avoiding external
-shell tool dependencies.
+tasks across the workspace. Queries run against the local full-text index
+(see clickup_framework.search_index), which is refreshed incrementally with
+tasks updated since the previous search. ``--regex`` keeps the older
+behaviour of rendering the hierarchy view and filtering its lines.
 
 Features:
-    - Workspace-wide search with intuitive syntax
-    - Case-insensitive search by default
-    - Regex pattern support
-    - Simple and familiar interface
+    - Ranked results from a persistent SQLite FTS5 index
+    - Searches names, descriptions, comments, tags and list paths
+    - Field filters (--in name,tags or name:word in the query)
+    - Regex pattern support over the rendered hierarchy (--regex)
 
 Examples:
     # Search for tasks containing "bug"
     cum search "bug"
 
+    # Only match task names and tags
+    cum search "login" --in name,tags
+
     # Search with regex pattern
-    cum search "bug.*fix"
+    cum search "bug.*fix" --regex
 
     # Search in specific container
     cum search "feature" --container <list_id>
@@ -33,11 +37,14 @@ from argparse import Namespace
 from contextlib import redirect_stdout
 import io
 import re
+import time
 
 from clickup_framework.commands.base_command import BaseCommand
 from clickup_framework.commands.hierarchy import hierarchy_command
+from clickup_framework.mirror import format_age
+from clickup_framework.search_index import FIELDS, SearchIndex
 from clickup_framework.utils.argparse_helpers import raw_description_formatter
-from clickup_framework.commands.utils import add_common_args
+from clickup_framework.commands.utils import add_common_args, resolve_container_id
 
 
 # Command metadata for help generation
@@ -46,12 +53,15 @@ COMMAND_METADATA = {
     "commands": [
         {
             "name": "search [s]",
-            "args": "<pattern> [--container ID] [--case-sensitive]",
-            "description": "Search for tasks and lists by keyword with internal hierarchy filtering"
+            "args": "<query> [--in FIELDS] [--container ID] [--include-closed] [--regex]",
+            "description": "Ranked full-text search over task names, descriptions, comments, tags and paths"
         }
     ]
 }
 
+# Refresh the index with tasks updated upstream when it is older than this
+REFRESH_AFTER = 600
+
 
 class SearchCommand(BaseCommand):
     """
@@ -82,10 +92,9 @@ class SearchCommand(BaseCommand):
         )
 
     def _compile_pattern(self):
-        """Compile the search pattern according to the selected flags."""
-        pattern = self.args.pattern if self.args.regex else re.escape(self.args.pattern)
+        """Compile the ``--regex`` search pattern according to the selected flags."""
         flags = 0 if self.args.case_sensitive else re.IGNORECASE
-        return re.compile(pattern, flags)
+        return re.compile(self.args.pattern, flags)
 
     def _render_hierarchy_output(self) -> str:
         """Render hierarchy output to a string for in-process filtering."""
@@ -100,46 +109,130 @@ class SearchCommand(BaseCommand):
         matcher = self._compile_pattern()
         return [line for line in hierarchy_output.splitlines() if matcher.search(line)]
 
+    def _open_index(self) -> SearchIndex:
+        """Open the full-text index of this command's API token."""
+        return SearchIndex.for_token(self.client.api_token)
+
+    def _refresh_index(self, index: SearchIndex, team_id: str) -> None:
+        """Pull tasks updated upstream into the index when it is missing or stale."""
+        if getattr(self.args, "no_refresh", False):
+            return
+        rebuild = getattr(self.args, "rebuild", False)
+        state = index.state(team_id)
+        stale = state is None or time.time() - state["refreshed_at"] > REFRESH_AFTER
+        if not (rebuild or stale or getattr(self.args, "refresh", False)):
+            return
+        if state is None or rebuild:
+            self.print_info("Building search index (first run reads every task once)...")
+        try:
+            index.refresh(self.client, team_id, full=rebuild)
+        except Exception as e:
+            if state is None:
+                raise
+            # A stale index still answers; only a missing one is fatal
+            self.print_warning(
+                f"Could not refresh the search index ({e}); results may be "
+                f"{format_age(time.time() - state['refreshed_at'])} out of date"
+            )
+
+    def _header(self, count: int) -> str:
+        use_color = self.context.get_ansi_output()
+        if use_color:
+            from clickup_framework.utils.colors import colorize, TextColor, TextStyle
+            pattern_colored = colorize(f'"{self.args.pattern}"', TextColor.BRIGHT_YELLOW, TextStyle.BOLD)
+            if not count:
+                return f"\n🔍 No tasks found matching {pattern_colored}\n"
+            count_colored = colorize(str(count), TextColor.BRIGHT_GREEN, TextStyle.BOLD)
+            return f"\n🔍 Found {count_colored} result(s) matching {pattern_colored}\n"
+        if not count:
+            return f'\n🔍 No tasks found matching "{self.args.pattern}"\n'
+        return f'\n🔍 Found {count} result(s) matching "{self.args.pattern}"\n'
+
+    def _format_hit(self, hit) -> str:
+        """Format one index hit as a name line plus a snippet line."""
+        use_color = self.context.get_ansi_output()
+        name, task_id = hit["name"], f"[{hit['id']}]"
+        status = f"({hit['status']})" if hit.get("status") else ""
+        path = hit.get("path") or ""
+        if use_color:
+            from clickup_framework.utils.colors import colorize, TextColor, TextStyle
+            name = colorize(name, TextColor.BRIGHT_WHITE, TextStyle.BOLD)
+            task_id = colorize(task_id, TextColor.BRIGHT_BLACK)
+            path = colorize(path, TextColor.BRIGHT_BLUE) if path else ""
+        line = "  ".join(part for part in (f"{name} {task_id}", status, path) if part)
+        snippet = (hit.get("snippet") or "").replace("\n", " ")
+        if snippet and snippet.strip("[]") != hit["name"]:
+            line += f"\n    {snippet}"
+        return line
+
+    def _search_hierarchy(self):
+        """Regex-filter the rendered hierarchy (``--regex``)."""
+        output = self._render_hierarchy_output()
+        matches = self._filter_matches(output)
+        if not matches:
+            self.print(self._header(0))
+            return
+        full_output = self._header(len(matches)) + "\n" + "\n".join(matches)
+        self.handle_output(
+            data={'matches': matches, 'count': len(matches), 'pattern': self.args.pattern},
+            console_output=full_output
+        )
+
+    def _search_index(self):
+        """Query the full-text index."""
+        fields = [f.strip() for f in self.args.fields.split(",") if f.strip()] if getattr(self.args, "fields", None) else None
+        team_id = self.get_workspace_id()
+        container_id = self.args.container_id
+        if container_id:
+            # Accept "current" and task IDs (searching the task's list) like the other container options
+            container = resolve_container_id(self.client, container_id, self.context, need_data=False)
+            container_id = container.get("list_id") or container["id"]
+        index = self._open_index()
+        try:
+            if team_id:
+                self._refresh_index(index, team_id)
+            started = time.perf_counter()
+            hits = index.search(
+                self.args.pattern,
+                fields=fields,
+                team_id=team_id,
+                container_id=container_id,
+                include_closed=getattr(self.args, "include_closed", False),
+                limit=getattr(self.args, "limit", 25) or 25,
+            )
+            elapsed = time.perf_counter() - started
+            state = index.state(team_id) if team_id else None
+        finally:
+            index.close()
+
+        if not hits:
+            self.print(self._header(0))
+            return
+        lines = [self._header(len(hits))]
+        lines.extend(self._format_hit(hit) for hit in hits)
+        footer = f"\n{len(hits)} result(s) in {elapsed * 1000:.0f} ms"
+        if state:
+            footer += f" (index refreshed {format_age(time.time() - state['refreshed_at'])} ago)"
+        lines.append(footer)
+        self.handle_output(
+            data={'results': hits, 'count': len(hits), 'pattern': self.args.pattern},
+            console_output="\n".join(lines)
+        )
+
     def execute(self):
         """
-        Search for tasks and lists matching a pattern.
+        Search for tasks matching a query.
 
-        This command provides an intuitive search interface by executing
-        the hierarchy command internally and filtering the rendered output.
+        Queries the full-text index, or with ``--regex`` executes the
+        hierarchy command internally and filters the rendered output.
         """
         try:
-            output = self._render_hierarchy_output()
-            matches = self._filter_matches(output)
-
-            if not matches:
-                use_color = self.context.get_ansi_output()
-
-                if use_color:
-                    from clickup_framework.utils.colors import colorize, TextColor
-                    pattern_colored = colorize(f'"{self.args.pattern}"', TextColor.BRIGHT_YELLOW)
-                    self.print(f"\n🔍 No tasks found matching {pattern_colored}\n")
-                else:
-                    self.print(f'\n🔍 No tasks found matching "{self.args.pattern}"\n')
-                return
-
-            # Print results with header
-            use_color = self.context.get_ansi_output()
-            result_count = len(matches)
-
-            if use_color:
-                from clickup_framework.utils.colors import colorize, TextColor, TextStyle
-                pattern_colored = colorize(f'"{self.args.pattern}"', TextColor.BRIGHT_YELLOW, TextStyle.BOLD)
-                count_colored = colorize(str(result_count), TextColor.BRIGHT_GREEN, TextStyle.BOLD)
-                header = f"\n🔍 Found {count_colored} result(s) matching {pattern_colored}\n"
+            if self.args.regex:
+                self._search_hierarchy()
             else:
-                header = f'\n🔍 Found {result_count} result(s) matching "{self.args.pattern}"\n'
-
-            # Print the filtered output
-            full_output = header + "\n" + "\n".join(matches)
-            self.handle_output(
-                data={'matches': matches, 'count': result_count, 'pattern': self.args.pattern},
-                console_output=full_output
-            )
+                self._search_index()
+        except ValueError as e:
+            self.error(str(e))
         except Exception as e:
             self.error(f"Error executing search: {e}")
 
@@ -168,41 +261,47 @@ def register_command(subparsers):
     parser = subparsers.add_parser(
         'search',
         aliases=['s'],
-        help='Search for tasks and lists by keyword or regex pattern',
+        help='Search for tasks by keyword (full-text index) or regex pattern',
         description="""
-Search for tasks and lists across the workspace using keyword or regex matching.
+Search for tasks across the workspace using the local full-text index.
 
-This command provides a simple, intuitive way to find tasks without remembering
-the exact hierarchy or container IDs. It searches task names, descriptions, tags,
-and IDs.
+The index covers task names, descriptions, comments, tags and list paths and
+is refreshed with tasks updated upstream when it is more than 10 minutes old.
+Results are ranked: a match in the name outranks one in a tag, path,
+description or comment.
 
 Examples:
   # Search for tasks about bugs
   cum search "bug"
   cum s "bug"  # Short alias
 
-  # Search with regex
-  cum search "bug.*fix"
+  # All words must match; the last one matches as a prefix
+  cum search "login timeout"
+
+  # Exact phrase, or limit a word to one field
+  cum search '"release notes" tags:docs'
 
-  # Case-sensitive search
-  cum search "BUG" --case-sensitive
+  # Only search names and tags
+  cum search "payment" --in name,tags
 
-  # Search in specific list
+  # Search in specific list, folder or space
   cum search "feature" --container <list_id>
 
+  # Regex over the rendered hierarchy (slow: fetches the whole workspace)
+  cum search "bug.*fix" --regex
+
 Tips:
-  - Searches are case-insensitive by default
-  - Pattern matching uses regex (escape special chars if needed)
-  - Use quotes around patterns with spaces
-  - Results show full task hierarchy for context
-  - Normal usage does not require external `cum` or `grep` binaries on PATH
+  - Fields: name, description, comments, tags, path
+  - Comments are indexed when a command fetches them (e.g. cum d, cum h -c 3)
+  - Set CLICKUP_SEARCH_INDEX=1 to index every task any command fetches
+  - Use --rebuild after large moves or deletions upstream
         """,
         formatter_class=raw_description_formatter(),
     )
 
     parser.add_argument(
         'pattern',
-        help='Search pattern (regex supported)'
+        help='Search query (words, "phrases", field:word), or a regex with --regex'
     )
 
     parser.add_argument(
@@ -212,24 +311,62 @@ Tips:
         help='Limit search to specific container (list, folder, space)'
     )
 
+    parser.add_argument(
+        '--in',
+        dest='fields',
+        metavar='FIELDS',
+        help=f'Comma-separated fields to search ({", ".join(FIELDS)}; default: all)'
+    )
+
+    parser.add_argument(
+        '--include-closed',
+        action='store_true',
+        help='Include closed tasks'
+    )
+
+    parser.add_argument(
+        '--limit',
+        type=int,
+        default=25,
+        help='Maximum number of results (default: 25)'
+    )
+
+    refresh_group = parser.add_mutually_exclusive_group()
+    refresh_group.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Fetch tasks updated upstream before searching, even if the index is fresh'
+    )
+    refresh_group.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Re-read every task into the index before searching'
+    )
+    refresh_group.add_argument(
+        '--no-refresh',
+        dest='no_refresh',
+        action='store_true',
+        help='Search the index as it is, without any API requests'
+    )
+
     parser.add_argument(
         '--case-sensitive',
         action='store_true',
-        help='Make search case-sensitive (default: case-insensitive)'
+        help='Make --regex search case-sensitive (default: case-insensitive)'
     )
 
     parser.add_argument(
         '--regex',
         action='store_true',
-        default=True,
-        help='Treat pattern as regex (default: True)'
+        default=False,
+        help='Regex-filter the rendered hierarchy instead of querying the index'
     )
 
     parser.add_argument(
         '--no-regex',
         dest='regex',
         action='store_false',
-        help='Treat pattern as literal string (escape regex)'
+        help='Query the full-text index (default)'
     )
 
     add_common_args(parser)
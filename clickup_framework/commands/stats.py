@@ -2,7 +2,7 @@
 
 from clickup_framework.commands.base_command import BaseCommand
 from clickup_framework.components import DisplayManager
-from clickup_framework.commands.utils import get_list_statuses, add_common_args
+from clickup_framework.commands.utils import get_list_statuses, add_common_args, add_mirror_args, add_offline_args
 
 
 def get_task_type_emoji(task_type):
@@ -133,8 +133,11 @@ class StatsCommand(BaseCommand):
         # Resolve list ID from either list ID, task ID, or "current" keyword
         list_id = self.resolve_list(self.args.list_id)
 
-        result = self.client.get_list_tasks(list_id, include_closed=self.args.include_closed)
-        tasks = result.get('tasks', [])
+        if self.mirror is not None and self.mirror.get_list(list_id) is not None:
+            tasks = self.mirror.get_tasks(list_ids=[list_id], include_closed=self.args.include_closed, subtasks=False)
+        else:
+            result = self.client.get_list_tasks(list_id, include_closed=self.args.include_closed)
+            tasks = result.get('tasks', [])
 
         # Filter by type if specified
         if self.args.type:
@@ -198,4 +201,6 @@ def register_command(subparsers, add_common_args_func=None):
                         help='Include closed/archived tasks in statistics')
     common_args = add_common_args_func or add_common_args
     common_args(parser)
+    add_mirror_args(parser)
+    add_offline_args(parser)
     parser.set_defaults(func=stats_command)
@@ -0,0 +1,94 @@
+"""Sync the local workspace mirror used by display commands' --mirror flag."""
+
+import time
+
+from clickup_framework.commands.base_command import BaseCommand
+from clickup_framework.mirror import WorkspaceMirror, format_age
+
+
+COMMAND_METADATA = {
+    "category": "🏗️  Workspace Hierarchy",
+    "commands": [
+        {
+            "name": "sync",
+            "args": "[--team-id ID] [--full] [--status] [--clear]",
+            "description": "Mirror spaces, folders, lists and tasks into a local database for --mirror reads",
+        }
+    ],
+}
+
+
+class SyncCommand(BaseCommand):
+    """
+    Sync Command using BaseCommand.
+    """
+
+    def execute(self):
+        """Refresh the workspace mirror, or report its state."""
+        team_id = self.resolve_id('workspace', self.args.team_id or 'current')
+        mirror = WorkspaceMirror()
+        try:
+            if self.args.clear:
+                mirror.clear()
+                self.print_success(f"Cleared workspace mirror {mirror.path}")
+                return
+
+            if self.args.status:
+                state = mirror.sync_state(team_id)
+                if state is None:
+                    self.print(f"Workspace {team_id} has not been synced. Run: cum sync")
+                    return
+                now = time.time()
+                self.print(f"Mirror:     {mirror.path}")
+                self.print(f"Workspace:  {team_id}")
+                self.print(f"Tasks:      {state['tasks']}")
+                self.print(f"Last sync:  {format_age(now - state['synced_at'])} ago")
+                self.print(f"Full sync:  {format_age(now - state['full_synced_at'])} ago")
+                return
+
+            report = mirror.sync(self.client, team_id, full=self.args.full)
+        finally:
+            mirror.close()
+
+        kind = "Full sync" if report["full"] else "Incremental sync"
+        self.print_success(
+            f"{kind} of workspace {team_id}: {report['tasks']} task(s) fetched, "
+            f"{report['removed']} removed, {report['spaces']} space(s), {report['folders']} folder(s), "
+            f"{report['lists']} list(s) in {report['seconds']:.1f}s"
+        )
+
+
+def sync_command(args):
+    """
+    Command function wrapper for backward compatibility.
+
+    This function maintains the existing function-based API while
+    using the BaseCommand class internally.
+    """
+    command = SyncCommand(args, command_name='sync')
+    command.execute()
+
+
+def register_command(subparsers):
+    """Register the sync command with argparse."""
+    parser = subparsers.add_parser(
+        'sync',
+        help='Sync the local workspace mirror',
+        description='Mirror spaces, folders, lists, tasks, tags and dependencies into a local '
+                    'SQLite database. Later syncs only fetch tasks updated since the last one.',
+        epilog='''Tips:
+  • First sync (full): cum sync
+  • Refresh changes only: cum sync
+  • Force a full resync (picks up deleted tasks): cum sync --full
+  • Read from the mirror: cum h --all --mirror, cum a --mirror, cum stats <list_id> --mirror
+  • Or set CLICKUP_MIRROR=1 to read from the mirror by default'''
+    )
+    parser.add_argument('--team-id', dest='team_id',
+                        help='Team/workspace ID (defaults to current workspace)')
+    parser.add_argument('--full', action='store_true',
+                        help='Replace every mirrored task instead of fetching changes only')
+    parser.add_argument('--status', action='store_true',
+                        help='Show when the mirror was last synced instead of syncing')
+    parser.add_argument('--clear', action='store_true',
+                        help='Delete all mirrored data')
+    parser.set_defaults(func=sync_command)
@@ -6,6 +6,7 @@ import json
 from typing import List, Dict, Any, Optional
 from collections import defaultdict
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework.coalescing import COMMAND_MEMO_TTL
 from clickup_framework.formatters.task import TaskFormatter
 from clickup_framework.formatters.base import BaseFormatter
 from clickup_framework.utils.colors import colorize, TextColor, TextStyle
@@ -1042,7 +1043,7 @@ class TaskCommandBase(BaseCommand):
 
     def _create_client(self):
         """Use module-local factories so existing tests can patch them."""
-        return ClickUpClient()
+        return ClickUpClient(memo_ttl=COMMAND_MEMO_TTL)
 
 
 class TaskCreateCommand(TaskCommandBase):
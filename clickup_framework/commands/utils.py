@@ -2,11 +2,18 @@
 
 import argparse
 import logging
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
 from clickup_framework import ClickUpClient, get_context_manager
+from clickup_framework import id_index
 from clickup_framework.components import FormatOptions
+from clickup_framework.id_index import IdIndex, entries_for
+from clickup_framework.metadata_cache import get_metadata_cache
 from clickup_framework.utils.colors import TextColor, TextStyle, colorize
 
 logger = logging.getLogger(__name__)
@@ -59,15 +66,8 @@ def get_list_statuses(client: ClickUpClient, list_id: str, use_color: bool = Tru
         if use_color is None:
             use_color = context.get_ansi_output()
 
-        # Try to get from cache first
-        cached_metadata = context.get_cached_list_metadata(list_id)
-
-        if cached_metadata:
-            list_data = cached_metadata
-        else:
-            # Fetch from API and cache
-            list_data = client.get_list(list_id)
-            context.cache_list_metadata(list_id, list_data)
+        # Served from the metadata cache, fetched from the API on a miss
+        list_data = get_metadata_cache().list_metadata(client, list_id)
 
         statuses = list_data.get("statuses", [])
 
@@ -349,7 +349,118 @@ def add_common_args(subparser):
     )
 
 
-def resolve_container_id(client: ClickUpClient, id_or_current: str, context=None) -> dict:
+def add_mirror_args(subparser):
+    """Add the --mirror flag to commands that can read tasks from the workspace mirror."""
+    _add_argument_if_available(
+        subparser,
+        "--mirror",
+        dest="use_mirror",
+        action="store_true",
+        help="Read tasks from the local workspace mirror (refresh it with 'cum sync'; "
+             "default: CLICKUP_MIRROR env var)",
+    )
+
+
+def mirror_requested(args) -> bool:
+    """Whether a command should read from the workspace mirror (--mirror or CLICKUP_MIRROR=1)."""
+    if getattr(args, "use_mirror", False) is True:
+        return True
+    return os.environ.get("CLICKUP_MIRROR", "").lower() in ("1", "true", "yes")
+
+
+def add_offline_args(subparser):
+    """Add --offline / --max-staleness to display commands that can read cached data."""
+    _add_argument_if_available(
+        subparser,
+        "--offline",
+        dest="offline",
+        action="store_true",
+        help="Read only cached data (response cache or workspace mirror); never call the API "
+             "(default: CLICKUP_OFFLINE env var)",
+    )
+    _add_argument_if_available(
+        subparser,
+        "--max-staleness",
+        dest="max_staleness",
+        metavar="DURATION",
+        help="Serve cached data up to this old (e.g. 30s, 10m, 2h) and only call the API for older "
+             "entries (default: CLICKUP_MAX_STALENESS env var)",
+    )
+
+
+def read_policy(args):
+    """
+    Return ``(offline, max_staleness_seconds)`` from --offline / --max-staleness or the environment.
+
+    Raises:
+        ValueError: If the staleness duration cannot be parsed
+    """
+    from clickup_framework.utils.duration import parse_duration_to_ms
+
+    offline = getattr(args, "offline", False) is True or \
+        os.environ.get("CLICKUP_OFFLINE", "").lower() in ("1", "true", "yes")
+    staleness = getattr(args, "max_staleness", None)
+    if not isinstance(staleness, str) or not staleness:
+        staleness = os.environ.get("CLICKUP_MAX_STALENESS")
+    return offline, parse_duration_to_ms(staleness) / 1000 if staleness else None
+
+
+# Container types probed for an unknown ID, in the order a match is taken
+_PROBE_ORDER = ("space", "folder", "list", "task")
+
+# ID index entries recorded this recently are used without fetching the container;
+# a stale one is dropped by the first request that gets a 404 for it
+INDEX_TRUST_SECONDS = 300
+
+
+def _id_index_for(client: ClickUpClient) -> Optional[IdIndex]:
+    """Return the client's ID index, else the installed default."""
+    index = getattr(client, "id_index", None)
+    return index if isinstance(index, IdIndex) else id_index.get_default()
+
+
+def _fetch_container(client: ClickUpClient, kind: str, item_id: str) -> dict:
+    """Fetch an ID as one container type, shaped like resolve_container_id's result."""
+    if kind == "space":
+        space_data = client.get_space(item_id)
+        # Enrich space_data with folders and lists (not returned by get_space API)
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="clickup-resolve") as pool:
+            folders = pool.submit(client.get_space_folders, item_id)
+            lists = pool.submit(client.get_space_lists, item_id)
+            space_data['folders'] = folders.result().get('folders', [])
+            space_data['lists'] = lists.result().get('lists', [])
+        return {"type": "space", "id": item_id, "data": space_data}
+    if kind == "folder":
+        return {"type": "folder", "id": item_id, "data": client.get_folder(item_id)}
+    if kind == "list":
+        client.get_list(item_id)
+        return {"type": "list", "id": item_id}
+    task = client.get_task(item_id)
+    list_id = task.get("list", {}).get("id")
+    if not list_id:
+        raise ValueError(f"Task {item_id} does not have a valid list ID")
+    return {"type": "task", "id": item_id, "data": task, "list_id": list_id}
+
+
+def _remember_container(index: IdIndex, container: dict) -> None:
+    """Record a resolved container, plus a space's folders and lists, in the ID index."""
+    kind, data = container["type"], container.get("data")
+    if not isinstance(data, dict):
+        entries = [{"id": container["id"], "type": kind}]
+    else:
+        entries = entries_for(kind, data)
+        if kind == "space":
+            for folder in data.get("folders") or []:
+                entries.extend(entries_for("folder", folder, "space", container["id"]))
+            for list_data in data.get("lists") or []:
+                entries.extend(entries_for("list", list_data, "space", container["id"]))
+    try:
+        index.record(entries)
+    except Exception as e:
+        logger.debug(f"ID index update failed: {e}")
+
+
+def resolve_container_id(client: ClickUpClient, id_or_current: str, context=None, need_data: bool = True) -> dict:
     """
     Resolve a container ID from space, folder, list, task ID, or "current" keyword.
 
@@ -360,10 +471,18 @@ def resolve_container_id(client: ClickUpClient, id_or_current: str, context=None
     - Task IDs: fetches the task and returns {'type': 'list', 'id': list_id}
     - "current": resolves from context
 
+    IDs already in the ID index (see clickup_framework.id_index) are only
+    fetched as their indexed type, and not at all when they were indexed in
+    the last INDEX_TRUST_SECONDS and no 'data' is needed (lists never carry
+    it). Unknown IDs, and indexed ones that no longer resolve, are probed as
+    every type concurrently.
+
     Args:
         client: ClickUpClient instance
         id_or_current: Either a space, folder, list, task ID, or "current"
         context: Context manager (optional, will be fetched if not provided)
+        need_data: Whether the caller uses 'data'; without it, recently indexed
+            IDs resolve with no request
 
     Returns:
         Dictionary with 'type' and 'id' keys, and optionally 'data' key
@@ -387,78 +506,52 @@ def resolve_container_id(client: ClickUpClient, id_or_current: str, context=None
                 "or provide a space/folder/list/task ID."
             ) from e
 
-    # Try each container type in order: space, folder, list, task
+    # Known IDs skip the probes; only the container itself is fetched to verify it
+    index = _id_index_for(client)
+    known = index.lookup(id_or_current) if index is not None else None
+    if known is not None and time.time() - (known.get("seen_at") or 0) < INDEX_TRUST_SECONDS:
+        if known["type"] == "list" or (not need_data and known["type"] != "task"):
+            return {"type": known["type"], "id": id_or_current}
+        if not need_data and known.get("list_id"):
+            return {"type": "task", "id": id_or_current, "list_id": known["list_id"]}
+    if known is not None:
+        try:
+            container = _fetch_container(client, known["type"], id_or_current)
+            _remember_container(index, container)
+            return container
+        except Exception as e:
+            # Deleted or moved since it was indexed; fall back to probing
+            logger.debug(f"Indexed {known['type']} '{id_or_current}' could not be fetched: {e}")
+            index.forget(id_or_current)
+
+    # Unknown ID: probe every container type at once and take the first
+    # match in order: space, folder, list, task
     last_error = None
     got_auth_error = False
 
-    # Try as space ID
-    try:
-        space_data = client.get_space(id_or_current)
-        # Enrich space_data with folders and lists (not returned by get_space API)
-        folders_response = client.get_space_folders(id_or_current)
-        space_data['folders'] = folders_response.get('folders', [])
-        lists_response = client.get_space_lists(id_or_current)
-        space_data['lists'] = lists_response.get('lists', [])
-        return {"type": "space", "id": id_or_current, "data": space_data}
-    except ClickUpAuthError as e:
-        last_error = e
-        got_auth_error = True
-    except ClickUpNotFoundError as e:
-        last_error = e
-    except Exception as e:
-        # Unexpected error trying to resolve as space - log and continue trying other types
-        logger.debug(f"Failed to resolve '{id_or_current}' as space ID: {e}")
-        if last_error is None:
-            last_error = e
-
-    # Try as folder ID
-    try:
-        folder_data = client.get_folder(id_or_current)
-        return {"type": "folder", "id": id_or_current, "data": folder_data}
-    except ClickUpAuthError as e:
-        last_error = e
-        got_auth_error = True
-    except ClickUpNotFoundError as e:
-        last_error = e
-    except Exception as e:
-        # Unexpected error trying to resolve as folder - log and continue trying other types
-        logger.debug(f"Failed to resolve '{id_or_current}' as folder ID: {e}")
-        if last_error is None:
-            last_error = e
-
-    # Try as list ID
-    try:
-        client.get_list(id_or_current)
-        return {"type": "list", "id": id_or_current}
-    except ClickUpAuthError as e:
-        last_error = e
-        got_auth_error = True
-    except ClickUpNotFoundError as e:
-        last_error = e
-    except Exception as e:
-        # Unexpected error trying to resolve as list - log and continue trying other types
-        logger.debug(f"Failed to resolve '{id_or_current}' as list ID: {e}")
-        if last_error is None:
-            last_error = e
-
-    # Try as task ID
-    try:
-        task = client.get_task(id_or_current)
-        list_id = task.get("list", {}).get("id")
-        if list_id:
-            return {"type": "task", "id": id_or_current, "data": task, "list_id": list_id}
-        else:
-            raise ValueError(f"Task {id_or_current} does not have a valid list ID")
-    except ClickUpAuthError as e:
-        last_error = e
-        got_auth_error = True
-    except ClickUpNotFoundError as e:
-        last_error = e
-    except Exception as e:
-        # Unexpected error trying to resolve as task - log and continue to error handling
-        logger.debug(f"Failed to resolve '{id_or_current}' as task ID: {e}")
-        if last_error is None:
-            last_error = e
+    # Leaving the block waits for probes still in flight, so none outlives the call
+    with ThreadPoolExecutor(max_workers=len(_PROBE_ORDER), thread_name_prefix="clickup-resolve") as pool:
+        probes = [(kind, pool.submit(_fetch_container, client, kind, id_or_current)) for kind in _PROBE_ORDER]
+        for kind, probe in probes:
+            try:
+                container = probe.result()
+            except ClickUpAuthError as e:
+                last_error = e
+                got_auth_error = True
+            except ClickUpNotFoundError as e:
+                last_error = e
+            except Exception as e:
+                # Unexpected error trying to resolve as this type - log and check the other probes
+                logger.debug(f"Failed to resolve '{id_or_current}' as {kind} ID: {e}")
+                if last_error is None:
+                    last_error = e
+            else:
+                # Lower-priority probes are not needed; drop any that have not started
+                for _, other in probes:
+                    other.cancel()
+                if index is not None:
+                    _remember_container(index, container)
+                return container
 
     # If we got an auth error, provide more diagnostic information
     if got_auth_error:
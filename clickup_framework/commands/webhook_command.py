@@ -0,0 +1,130 @@
+"""Receive ClickUp webhooks locally to keep the workspace mirror and response cache fresh."""
+
+import os
+
+from clickup_framework import ClickUpClient
+from clickup_framework.commands.base_command import BaseCommand
+from clickup_framework.mirror import WorkspaceMirror
+from clickup_framework.response_cache import DiskResponseCache
+from clickup_framework.webhook_server import WebhookProcessor, WebhookServer
+
+
+COMMAND_METADATA = {
+    "category": "🏗️  Workspace Hierarchy",
+    "commands": [
+        {
+            "name": "webhook serve",
+            "args": "[--secret S] [--host H] [--port N] [--path P] [--no-mirror] [--update-parents]",
+            "description": "Apply ClickUp webhook events to the local mirror and response cache",
+        }
+    ],
+}
+
+
+class WebhookServeCommand(BaseCommand):
+    """
+    Webhook Serve Command using BaseCommand.
+    """
+
+    def _create_client(self):
+        """Re-fetches after an event must never be answered from the in-process memo."""
+        return ClickUpClient(memo_ttl=0, search_index=True)
+
+    def execute(self):
+        """Run the webhook receiver until interrupted."""
+        secret = self.args.secret or os.environ.get("CLICKUP_WEBHOOK_SECRET")
+        if not secret:
+            if not self.args.insecure:
+                self.error("A webhook secret is required (--secret or CLICKUP_WEBHOOK_SECRET); "
+                           "pass --insecure to accept unsigned deliveries")
+            self.print_warning("Accepting unsigned deliveries (--insecure)")
+
+        mirror = None if self.args.no_mirror else WorkspaceMirror.open_existing()
+        automation = None
+        if self.args.update_parents:
+            from clickup_framework.automation.config import load_automation_config
+            from clickup_framework.automation.parent_updater import ParentTaskAutomationEngine
+
+            automation = ParentTaskAutomationEngine(load_automation_config(), self.client)
+
+        processor = WebhookProcessor(self.client, mirror=mirror, response_cache=DiskResponseCache(),
+                                     automation=automation)
+        server = WebhookServer(processor, secret, host=self.args.host, port=self.args.port,
+                               path=self.args.path, on_event=self._report)
+
+        self.print_success(f"Listening for ClickUp webhooks on {server.url}")
+        if mirror is None and not self.args.no_mirror:
+            self.print_info("No workspace mirror found; run 'cum sync' to have events update it.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if mirror is not None:
+                mirror.close()
+
+    def _report(self, result):
+        """Print one line per applied event."""
+        if not result.get("applied"):
+            return
+        details = []
+        if result.get("mirrored"):
+            details.append("mirrored")
+        if result.get("removed"):
+            details.append(f"{result['removed']} removed")
+        if result.get("automation"):
+            details.append("parent updated")
+        suffix = f" ({', '.join(details)})" if details else ""
+        self.print(f"{result['event']:<18} {result['task_id']}{suffix}", flush=True)
+
+
+def webhook_serve_command(args):
+    """
+    Command function wrapper for backward compatibility.
+
+    This function maintains the existing function-based API while
+    using the BaseCommand class internally.
+    """
+    command = WebhookServeCommand(args, command_name='webhook')
+    command.execute()
+
+
+def register_command(subparsers):
+    """Register the webhook command with argparse."""
+    webhook_parser = subparsers.add_parser(
+        'webhook',
+        help='Receive ClickUp webhooks locally',
+        description='Receive ClickUp webhook deliveries and apply them to local caches.'
+    )
+    webhook_subparsers = webhook_parser.add_subparsers(
+        dest='webhook_command',
+        help='Webhook subcommands'
+    )
+
+    serve_parser = webhook_subparsers.add_parser(
+        'serve',
+        help='Run the webhook receiver',
+        description='Verify signed ClickUp webhook deliveries and apply taskCreated, taskUpdated, '
+                    'taskStatusUpdated, taskDeleted and taskCommentPosted events to the workspace '
+                    'mirror and response cache.',
+        epilog='''Tips:
+  • Expose the receiver (e.g. via a tunnel) and register it with the webhooks API;
+    the secret returned on creation goes in --secret or CLICKUP_WEBHOOK_SECRET
+  • Run 'cum sync' first so events keep the mirror current for --mirror reads
+  • Add --update-parents to run parent task automation on subtask status changes'''
+    )
+    serve_parser.add_argument('--secret',
+                              help='Webhook secret used to verify X-Signature (default: $CLICKUP_WEBHOOK_SECRET)')
+    serve_parser.add_argument('--insecure', action='store_true',
+                              help='Accept unsigned deliveries when no secret is set')
+    serve_parser.add_argument('--host', default='127.0.0.1',
+                              help='Interface to bind (default: 127.0.0.1)')
+    serve_parser.add_argument('--port', type=int, default=8787,
+                              help='Port to bind (default: 8787)')
+    serve_parser.add_argument('--path', default='/',
+                              help='URL path deliveries are posted to (default: /)')
+    serve_parser.add_argument('--no-mirror', dest='no_mirror', action='store_true',
+                              help='Do not update the workspace mirror')
+    serve_parser.add_argument('--update-parents', dest='update_parents', action='store_true',
+                              help='Run parent task automation on taskStatusUpdated events')
+    serve_parser.set_defaults(func=webhook_serve_command)
@@ -8,6 +8,7 @@ Components:
     - FormatOptions: Dataclass for managing display options
     - TreeFormatter: Renders hierarchical tree structures with box-drawing characters
     - TaskHierarchyFormatter: Organizes tasks by parent-child relationships
+    - TaskGraph: Linear-time parent/child index shared by the hierarchy views
     - ContainerHierarchyFormatter: Organizes tasks by workspace/space/folder/list containers
     - TaskFilter: Filters tasks by various criteria
     - RichTaskFormatter: Enhanced task formatting with emojis, colors, and styling
@@ -39,6 +40,7 @@ Example Usage:
 
 from clickup_framework.components.options import FormatOptions
 from clickup_framework.components.tree import TreeFormatter
+from clickup_framework.components.task_graph import TaskGraph
 from clickup_framework.components.hierarchy import TaskHierarchyFormatter
 from clickup_framework.components.container import ContainerHierarchyFormatter
 from clickup_framework.components.filters import TaskFilter
@@ -51,6 +53,7 @@ from clickup_framework.components.display import DisplayManager
 __all__ = [
     'FormatOptions',
     'TreeFormatter',
+    'TaskGraph',
     'TaskHierarchyFormatter',
     'ContainerHierarchyFormatter',
     'TaskFilter',
@@ -8,6 +8,7 @@ from typing import List, Dict, Any, Optional, Set
 from collections import defaultdict
 from clickup_framework.components.options import FormatOptions
 from clickup_framework.components.task_formatter import RichTaskFormatter
+from clickup_framework.components.task_graph import TaskGraph
 from clickup_framework.utils.colors import colorize, container_color, completion_color, TextColor, TextStyle
 
 
@@ -227,23 +228,9 @@ class ContainerHierarchyFormatter:
         Returns:
             List of root tasks with nested children in _children attribute
         """
-        # Build task map
-        task_map = {task['id']: task for task in tasks if task.get('id')}
-
-        # Initialize children lists
-        for task in tasks:
-            task['_children'] = []
-
-        # Find root tasks and build children lists
-        root_tasks = []
-        for task in tasks:
-            parent_id = task.get('parent')
-            if not parent_id or parent_id not in task_map:
-                # This is a root task (no parent or parent not in list)
-                root_tasks.append(task)
-            else:
-                # Add as child to parent
-                task_map[parent_id]['_children'].append(task)
+        graph = TaskGraph(tasks)
+        # Tasks on a parent cycle become roots so they are neither lost nor rendered forever
+        circular_task_ids = graph.cycle_ids()
 
         # Sort children by priority and name
         def sort_tasks(task_list):
@@ -252,20 +239,18 @@ class ContainerHierarchyFormatter:
                 t.get('name', '').lower()
             ))
 
-        # Sort root tasks
-        root_tasks = sort_tasks(root_tasks)
-
-        # Recursively sort all children
-        def sort_children_recursive(task):
-            if '_children' in task and task['_children']:
-                task['_children'] = sort_tasks(task['_children'])
-                for child in task['_children']:
-                    sort_children_recursive(child)
-
-        for task in root_tasks:
-            sort_children_recursive(task)
+        root_tasks = []
+        for task in tasks:
+            task_id = task.get('id')
+            task['_children'] = sort_tasks([
+                child for child in graph.children(task_id) if str(child['id']) not in circular_task_ids
+            ]) if task_id else []
+            if not task_id or graph.is_root(task) or str(task_id) in circular_task_ids:
+                # This is a root task (no parent or parent not in list)
+                root_tasks.append(task)
 
-        return root_tasks
+        # Sort root tasks
+        return sort_tasks(root_tasks)
 
     def _format_task_with_subtasks(
         self,
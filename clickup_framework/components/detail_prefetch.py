@@ -0,0 +1,184 @@
+"""
+Detail View Prefetch
+
+Works out everything ``cum detail`` will show for a task - the list's tasks
+for the relationship tree, missing ancestors and blockers, comments and
+their replies, linked docs' pages and linked task names - and fetches it concurrently in a few rounds, each round only depending on
+the one before. The results are attached to the task dicts, so the detail
+formatter can then render without a client and without any requests.
+
+Usage:
+    task = client.get_task(task_id, include_subtasks=True)
+    all_tasks = prefetch_detail(client, task, list_id)
+    TaskDetailFormatter().format_with_context(task, all_tasks, options)
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from clickup_framework.components.task_graph import TaskGraph, parent_id_of
+from clickup_framework.pagination import collect_pages
+
+logger = logging.getLogger(__name__)
+
+# Requests in flight at once
+DEFAULT_MAX_WORKERS = 8
+
+# Ancestors outside the list are fetched one level per round; stop after this many
+MAX_ANCESTOR_ROUNDS = 10
+
+
+def _gather(pool: ThreadPoolExecutor, calls: Dict[Hashable, Callable[[], Any]]) -> Dict[Hashable, Any]:
+    """Run calls concurrently; returns key -> result, with failed calls omitted."""
+    futures = {key: pool.submit(call) for key, call in calls.items()}
+    results = {}
+    for key, future in futures.items():
+        try:
+            results[key] = future.result()
+        except Exception as e:
+            logger.debug(f"Detail prefetch of {key} failed: {e}")
+    return results
+
+
+def _items(payload: Any, key: str) -> Optional[List[Dict[str, Any]]]:
+    """Return ``payload[key]`` if it is a list, else None."""
+    items = payload.get(key) if isinstance(payload, dict) else None
+    return items if isinstance(items, list) else None
+
+
+def _linked_task_id(task: Dict[str, Any], link: Dict[str, Any]) -> Optional[str]:
+    """Return the ID at the other end of a linked_tasks entry."""
+    if link.get('task_id') and link.get('task_id') != task.get('id'):
+        return link['task_id']
+    return link.get('link_id')
+
+
+def _doc_id(doc_ref: Any) -> Optional[str]:
+    if isinstance(doc_ref, dict):
+        return doc_ref.get('doc_id')
+    return doc_ref if isinstance(doc_ref, str) else None
+
+
+def prefetch_detail(
+    client,
+    task: Dict[str, Any],
+    list_id: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Fetch everything the detail view of ``task`` needs, concurrently.
+
+    Attaches to ``task``: ``comments`` (each with ``_replies``), ``_doc_pages``
+    (doc ID -> pages, or None if they could not be fetched) and the ``name``
+    and ``custom_type`` of linked tasks that lack them. Failed requests are
+    skipped, as the lazy fetches they replace did.
+
+    Args:
+        client: ClickUpClient
+        task: The task, as returned by ``get_task``
+        list_id: List whose tasks give the relationship context (None = no context)
+        max_workers: Requests in flight at once (default: 8)
+
+    Returns:
+        All tasks of the list plus ancestors and blockers fetched from
+        elsewhere, or None without a list
+    """
+    task_id = task.get('id')
+    workspace_id = task.get('team_id', '')
+    linked_docs = [doc_id for doc_id in map(_doc_id, task.get('linked_docs') or []) if doc_id]
+    links = [link for link in task.get('linked_tasks') or [] if isinstance(link, dict) and not link.get('name')]
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="clickup-detail") as pool:
+        # Round 1: everything that only needs the task itself
+        calls: Dict[Hashable, Callable[[], Any]] = {'comments': lambda: client.get_task_comments(task_id)}
+        if list_id:
+            # ClickUp API quirk: fetch root tasks and subtasks separately, then merge
+            calls['roots'] = lambda: collect_pages(
+                lambda **p: client.get_list_tasks(list_id, **p),
+                include_closed=True
+            )
+            calls['subtasks'] = lambda: collect_pages(
+                lambda **p: client.get_list_tasks(list_id, **p),
+                subtasks='true',
+                include_closed=True
+            )
+        if workspace_id:
+            for doc_id in linked_docs:
+                calls[('doc', doc_id)] = lambda doc_id=doc_id: client.get_doc_pages(workspace_id, doc_id)
+        for link in links:
+            other_id = _linked_task_id(task, link)
+            if other_id:
+                calls[('link', other_id)] = lambda other_id=other_id: client.get_task(other_id)
+        results = _gather(pool, calls)
+
+        all_tasks = None
+        if list_id:
+            if 'roots' not in results or 'subtasks' not in results:
+                logger.warning(f"Could not fetch tasks of list {list_id}; showing the task without context")
+            else:
+                task_map = {}
+                for item in results['roots'] + results['subtasks']:
+                    task_map[item['id']] = item
+                all_tasks = list(task_map.values())
+
+        comments = _items(results.get('comments'), 'comments')
+        if comments is not None:
+            task['comments'] = comments
+        if workspace_id and linked_docs:
+            task['_doc_pages'] = {
+                doc_id: _items(results.get(('doc', doc_id)), 'pages') for doc_id in linked_docs
+            }
+        for link in links:
+            linked = results.get(('link', _linked_task_id(task, link)))
+            if isinstance(linked, dict):
+                link['name'] = linked.get('name')
+                link['custom_type'] = linked.get('custom_type')
+
+        # Round 2: replies and blockers outside the list
+        calls = {}
+        for comment in comments or []:
+            comment['_replies'] = []
+            reply_count = comment.get('reply_count', 0)
+            if reply_count and int(reply_count) > 0:
+                calls[('replies', comment['id'])] = lambda c=comment['id']: client.get_threaded_comments(c)
+        graph = TaskGraph(all_tasks or [])
+        if all_tasks is not None:
+            for dep in task.get('dependencies') or []:
+                if not isinstance(dep, dict):
+                    continue
+                blocker_id = dep.get('depends_on')
+                if dep.get('task_id') == task_id and blocker_id and blocker_id not in graph:
+                    calls[('task', blocker_id)] = lambda b=blocker_id: client.get_task(b)
+        results = _gather(pool, calls)
+
+        for comment in comments or []:
+            replies = _items(results.get(('replies', comment.get('id'))), 'comments')
+            if replies is not None:
+                comment['_replies'] = replies
+        for key, payload in results.items():
+            if key[0] == 'task' and isinstance(payload, dict):
+                all_tasks.append(payload)
+                graph.add(payload)
+
+    # Ancestors outside the list, one level at a time
+    if all_tasks is not None:
+        current = task
+        for _ in range(MAX_ANCESTOR_ROUNDS):
+            parent_id = parent_id_of(current)
+            if not parent_id or parent_id == task_id:
+                break
+            parent = graph.get(parent_id)
+            if parent is None:
+                try:
+                    parent = client.get_task(parent_id)
+                except Exception as e:
+                    logger.debug(f"Detail prefetch of parent {parent_id} failed: {e}")
+                    break
+                if not isinstance(parent, dict) or not parent.get('id'):
+                    break
+                all_tasks.append(parent)
+                graph.add(parent)
+            current = parent
+
+    return all_tasks
@@ -5,7 +5,7 @@ Provides comprehensive detailed view of a single task with hierarchical relation
 showing the task in context of its parent, children, and dependencies in a tree view.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from clickup_framework.utils.colors import (
     colorize, status_color, priority_color, TextColor, TextStyle,
     get_task_emoji, get_status_icon, TASK_TYPE_EMOJI, USE_COLORS
@@ -17,6 +17,7 @@ from clickup_framework.utils.datetime import format_timestamp
 from clickup_framework.components.options import FormatOptions
 from clickup_framework.components.tree import TreeFormatter
 from clickup_framework.components.task_formatter import RichTaskFormatter
+from clickup_framework.components.task_graph import TaskGraph
 from clickup_framework.components.dependency_analyzer import DependencyAnalyzer
 
 
@@ -43,6 +44,17 @@ class TaskDetailFormatter:
         self.client = client
         self.section_separator = "─" * 60
         self.task_formatter = RichTaskFormatter()
+        # (all_tasks list, its length, TaskGraph over it) for the list last formatted
+        self._graph_cache: Optional[Tuple[List[Dict[str, Any]], int, TaskGraph]] = None
+
+    def _task_graph(self, all_tasks: List[Dict[str, Any]]) -> TaskGraph:
+        """Return a TaskGraph over all_tasks, built once per list rather than per lookup."""
+        if isinstance(all_tasks, TaskGraph):
+            return all_tasks
+        cached = self._graph_cache
+        if cached is None or cached[0] is not all_tasks or cached[1] != len(all_tasks):
+            cached = self._graph_cache = (all_tasks, len(all_tasks), TaskGraph(all_tasks))
+        return cached[2]
 
     def _colorize(
         self,
@@ -581,7 +593,7 @@ class TaskDetailFormatter:
         parent_id = task.get('parent')
 
         # Build task lookup map
-        task_map = {t.get('id'): t for t in all_tasks if t.get('id')}
+        task_map = self._task_graph(all_tasks)
 
         # 1. Show parent chain if exists
         if parent_id:
@@ -639,9 +651,7 @@ class TaskDetailFormatter:
 
         # 3. Show siblings (other children of same parent)
         if parent_id:
-            siblings = [t for t in all_tasks
-                       if t.get('parent') == parent_id
-                       and t.get('id') != task_id]
+            siblings = [t for t in task_map.children(parent_id) if t.get('id') != task_id]
 
             if siblings:
                 sibling_header = f"  👥 Siblings ({len(siblings)}):"
@@ -675,7 +685,7 @@ class TaskDetailFormatter:
                 lines.append("")
 
         # 4. Show children (subtasks) in tree view
-        children = [t for t in all_tasks if t.get('parent') == task_id]
+        children = task_map.children(task_id)
 
         if children:
             children_header = f"  📂 Subtasks ({len(children)}):"
@@ -1016,7 +1026,7 @@ class TaskDetailFormatter:
             return []
 
         lines = []
-        children = [t for t in all_tasks if t.get('parent') == parent_id]
+        children = self._task_graph(all_tasks).children(parent_id)
 
         if not children:
             return lines
@@ -1351,9 +1361,10 @@ class TaskDetailFormatter:
             header = colorize(header, TextColor.BRIGHT_WHITE, TextStyle.BOLD)
         lines.append(header)
 
-        # Fetch and display each document with its pages
-        if self.client:
-            docs_api = DocsAPI(self.client)
+        # Display each document with its pages, prefetched (see detail_prefetch) or fetched here
+        prefetched_pages = task.get('_doc_pages')
+        if prefetched_pages is not None or self.client:
+            docs_api = DocsAPI(self.client) if self.client else None
             workspace_id = task.get('team_id', '')
 
             for doc_ref in linked_docs:
@@ -1376,8 +1387,13 @@ class TaskDetailFormatter:
                 # Fetch pages for this document
                 if workspace_id and doc_id:
                     try:
-                        pages_result = docs_api.get_doc_pages(workspace_id, doc_id)
-                        pages = pages_result.get('pages', [])
+                        if prefetched_pages is not None:
+                            pages = prefetched_pages.get(doc_id)
+                            if pages is None:
+                                raise LookupError(f"pages of doc {doc_id} were not fetched")
+                        else:
+                            pages_result = docs_api.get_doc_pages(workspace_id, doc_id)
+                            pages = pages_result.get('pages', [])
 
                         if pages:
                             # Build page tree
@@ -1419,7 +1435,6 @@ class TaskDetailFormatter:
     def _format_comments(self, task: Dict[str, Any], options: FormatOptions) -> str:
         """Format comments section in threaded treeview format - shows all comments by default."""
         from clickup_framework.components.tree import TreeFormatter
-        from clickup_framework.resources import CommentsAPI
 
         all_comments = task.get('comments', [])
         if not all_comments:
@@ -1438,9 +1453,8 @@ class TaskDetailFormatter:
             reverse=True
         )
 
-        # Fetch threaded replies for each comment if we have a client
-        if self.client:
-            comments_api = CommentsAPI(self.client)
+        # Fetch threaded replies for each comment if we have a client and they were not prefetched
+        if self.client and not all('_replies' in comment for comment in sorted_comments):
             comments_with_replies = []
 
             for comment in sorted_comments:
@@ -1452,7 +1466,7 @@ class TaskDetailFormatter:
                 if reply_count and int(reply_count) > 0:
                     try:
                         # Fetch threaded replies
-                        replies_result = comments_api.get_threaded_comments(comment['id'])
+                        replies_result = self.client.get_threaded_comments(comment['id'])
                         replies = replies_result.get('comments', [])
                         comment_copy['_replies'] = replies
                     except Exception:
@@ -1527,7 +1541,8 @@ class TaskDetailFormatter:
             return ""
 
         # Find all subtasks (tasks where parent is this task)
-        subtasks = [t for t in all_tasks if t.get('parent') == task_id]
+        graph = self._task_graph(all_tasks)
+        subtasks = graph.children(task_id)
 
         if not subtasks:
             return ""
@@ -1582,7 +1597,7 @@ class TaskDetailFormatter:
             subtask_id = subtask.get('id')
             if not subtask_id:
                 return []
-            return [t for t in all_tasks if t.get('parent') == subtask_id]
+            return graph.children(subtask_id)
 
         # Display using TreeFormatter
         lines.append("")
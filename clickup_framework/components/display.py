@@ -4,7 +4,7 @@ Display Manager Module
 Provides a high-level interface for displaying tasks in various formats.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Union
 from clickup_framework.client import ClickUpClient
 from clickup_framework.components.options import FormatOptions
 from clickup_framework.components.hierarchy import TaskHierarchyFormatter
@@ -56,8 +56,9 @@ class DisplayManager:
         self,
         tasks: List[Dict[str, Any]],
         options: Optional[FormatOptions] = None,
-        header: Optional[str] = None
-    ) -> str:
+        header: Optional[str] = None,
+        stream: bool = False
+    ) -> Union[str, Iterator[str]]:
         """
         Display tasks in hierarchical parent-child view.
 
@@ -65,10 +66,14 @@ class DisplayManager:
             tasks: List of tasks
             options: Format options
             header: Optional header text
+            stream: Return an iterator of lines rendered on demand instead of
+                one string, so large trees can be written as they are produced
 
         Returns:
-            Formatted hierarchy string
+            Formatted hierarchy string, or an iterator of its lines
         """
+        if stream:
+            return self.hierarchy_formatter.iter_hierarchy(tasks, options, header)
         return self.hierarchy_formatter.format_hierarchy(tasks, options, header)
 
     def container_view(
@@ -6,6 +6,10 @@ Provides utilities for filtering tasks by various criteria.
 
 from typing import List, Dict, Any, Optional, Callable
 
+from ..models import assignee_ids, status_name, tag_names
+
+_COMPLETED_STATUSES = ('complete', 'completed', 'closed', 'done')
+
 
 class TaskFilter:
     """
@@ -37,13 +41,7 @@ class TaskFilter:
         filtered = []
 
         for task in tasks:
-            task_status = task.get('status', {})
-            if isinstance(task_status, dict):
-                task_status_name = task_status.get('status', '')
-            else:
-                task_status_name = task_status
-
-            if str(task_status_name).lower() == status_lower:
+            if str(status_name(task) or '').lower() == status_lower:
                 filtered.append(task)
 
         return filtered
@@ -93,8 +91,7 @@ class TaskFilter:
         filtered = []
 
         for task in tasks:
-            task_tags = task.get('tags', [])
-            task_tag_names = [tag.get('name', '').lower() for tag in task_tags if tag.get('name')]
+            task_tag_names = [name.lower() for name in tag_names(task) if name]
 
             if any(tag in tags_lower for tag in task_tag_names):
                 filtered.append(task)
@@ -116,10 +113,7 @@ class TaskFilter:
         filtered = []
 
         for task in tasks:
-            assignees = task.get('assignees', [])
-            assignee_ids = [a.get('id') for a in assignees if a.get('id')]
-
-            if assignee_id in assignee_ids:
+            if assignee_id in assignee_ids(task):
                 filtered.append(task)
 
         return filtered
@@ -141,11 +135,7 @@ class TaskFilter:
         if show_closed_only:
             filtered = []
             for task in tasks:
-                status = task.get('status', {})
-                status_name = status.get('status') if isinstance(status, dict) else status
-                is_completed = str(status_name).lower() in ('complete', 'completed', 'closed', 'done')
-
-                if is_completed:
+                if str(status_name(task)).lower() in _COMPLETED_STATUSES:
                     filtered.append(task)
             return filtered
 
@@ -156,11 +146,7 @@ class TaskFilter:
         # Default: return only open tasks
         filtered = []
         for task in tasks:
-            status = task.get('status', {})
-            status_name = status.get('status') if isinstance(status, dict) else status
-            is_completed = str(status_name).lower() in ('complete', 'completed', 'closed', 'done')
-
-            if not is_completed:
+            if str(status_name(task)).lower() not in _COMPLETED_STATUSES:
                 filtered.append(task)
 
         return filtered
@@ -5,13 +5,21 @@ Provides utilities for organizing tasks by parent-child relationships.
 """
 
 import logging
-from typing import List, Dict, Any, Set, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Iterator, List, Dict, Any, Set, Optional, Union
 from clickup_framework.components.options import FormatOptions
 from clickup_framework.components.task_formatter import RichTaskFormatter
+from clickup_framework.components.task_graph import TaskGraph, parent_id_of
 from clickup_framework.components.tree import TreeFormatter
+from clickup_framework.metadata_cache import KIND_COMMENTS
 
 logger = logging.getLogger(__name__)
 
+# Comment enrichment: requests in flight at once, and cap on total fetch time (seconds)
+COMMENT_FETCH_WORKERS = 8
+COMMENT_FETCH_TIMEOUT = 30.0
+
 
 class TaskHierarchyFormatter:
     """
@@ -23,112 +31,71 @@ class TaskHierarchyFormatter:
         - Orphaned task detection
     """
 
-    def __init__(self, formatter: Optional[RichTaskFormatter] = None, client=None):
+    def __init__(self, formatter: Optional[RichTaskFormatter] = None, client=None, comment_cache=None):
         """
         Initialize the hierarchy formatter.
 
         Args:
             formatter: Task formatter to use (creates default if not provided)
-            client: Optional ClickUpClient for fetching missing parent tasks
+            client: Optional ClickUpClient for fetching missing parent tasks and comments
+            comment_cache: MetadataCache for fetched comments (default: the shared
+                comment cache; False disables caching)
         """
         self.formatter = formatter or RichTaskFormatter()
         self.client = client
+        self._comment_cache = comment_cache
         self.circular_refs_detected = []  # Track detected circular references
         self.orphaned_tasks_handled = []  # Track orphaned tasks that were resolved
+        self.graph: Optional[TaskGraph] = None  # Index built by the last organize_by_parent_child call
 
     def _detect_circular_references(
         self,
-        task_map: Dict[str, Dict[str, Any]]
+        task_map: Union[TaskGraph, Dict[str, Dict[str, Any]]]
     ) -> Set[str]:
         """
         Detect circular references in parent-child relationships.
 
         Args:
-            task_map: Dictionary mapping task IDs to task objects
+            task_map: TaskGraph, or dictionary mapping task IDs to task objects
 
         Returns:
             Set of task IDs that are part of circular references
         """
+        graph = task_map if isinstance(task_map, TaskGraph) else TaskGraph(task_map.values())
         circular_task_ids = set()
 
-        def has_cycle(task_id: str, visited: Set[str], path: List[str]) -> bool:
-            """
-            Check if following the parent chain from this task leads to a cycle.
-
-            Args:
-                task_id: Current task ID to check
-                visited: Set of task IDs already visited in this path
-                path: Current path of task IDs (for logging)
-
-            Returns:
-                True if a cycle is detected, False otherwise
-            """
-            if task_id in visited:
-                # Found a cycle!
-                cycle_start_idx = path.index(task_id)
-                cycle_path = path[cycle_start_idx:] + [task_id]
-                cycle_names = [task_map.get(tid, {}).get('name', tid) for tid in cycle_path]
-
-                logger.error(
-                    f"Circular reference detected in task hierarchy!\n"
-                    f"  Cycle: {' → '.join(cycle_names)}\n"
-                    f"  Task IDs: {' → '.join(cycle_path)}\n"
-                    f"  Breaking cycle by removing parent relationship."
-                )
-
-                # Add all tasks in the cycle to the set
-                for tid in cycle_path[:-1]:  # Exclude the duplicate at the end
-                    circular_task_ids.add(tid)
-
-                # Store for potential user notification
-                self.circular_refs_detected.append({
-                    'cycle_path': cycle_path,
-                    'cycle_names': cycle_names
-                })
-
-                return True
-
-            if task_id not in task_map:
-                # Task not in map, can't continue checking
-                return False
-
-            task = task_map[task_id]
-            parent_id = task.get('parent')
-
-            if not parent_id:
-                # No parent, no cycle possible
-                return False
+        for cycle in graph.find_cycles():
+            cycle_path = cycle + [cycle[0]]
+            cycle_names = [graph.tasks[tid].get('name', tid) for tid in cycle_path]
 
-            # Add to visited set and path
-            visited.add(task_id)
-            path.append(task_id)
+            logger.error(
+                f"Circular reference detected in task hierarchy!\n"
+                f"  Cycle: {' → '.join(cycle_names)}\n"
+                f"  Task IDs: {' → '.join(cycle_path)}\n"
+                f"  Breaking cycle by removing parent relationship."
+            )
 
-            # Check parent
-            cycle_found = has_cycle(parent_id, visited, path)
+            circular_task_ids.update(cycle)
 
-            # Remove from path (backtrack)
-            path.pop()
-
-            return cycle_found
-
-        # Check each task for cycles
-        for task_id in task_map:
-            if task_id not in circular_task_ids:
-                has_cycle(task_id, set(), [])
+            # Store for potential user notification
+            self.circular_refs_detected.append({
+                'cycle_path': cycle_path,
+                'cycle_names': cycle_names
+            })
 
         return circular_task_ids
 
     def _handle_orphaned_tasks(
         self,
         tasks: List[Dict[str, Any]],
-        task_map: Dict[str, Dict[str, Any]]
-    ) -> Dict[str, Dict[str, Any]]:
+        task_map: Union[TaskGraph, Dict[str, Dict[str, Any]]]
+    ) -> Union[TaskGraph, Dict[str, Dict[str, Any]]]:
         """
         Handle orphaned tasks by attempting to fetch missing parents.
 
         Args:
             tasks: List of all tasks
-            task_map: Current task map (will be modified if parents are fetched)
+            task_map: Current TaskGraph or task map (will be modified if parents are fetched)
 
         Returns:
             Updated task map with fetched parent tasks added
@@ -156,7 +123,10 @@ class TaskHierarchyFormatter:
                 if parent_task and parent_task.get('id'):
                     # Successfully fetched parent, add to task_map and initialize _children
                     parent_task['_children'] = []
-                    task_map[parent_id] = parent_task
+                    if isinstance(task_map, TaskGraph):
+                        task_map.add(parent_task)
+                    else:
+                        task_map[parent_id] = parent_task
                     logger.info(f"Successfully fetched parent: {parent_task.get('name', parent_id)}")
 
                     # Track that we resolved this orphaned task
@@ -185,14 +155,14 @@ class TaskHierarchyFormatter:
 
     def organize_by_parent_child(
         self,
-        tasks: List[Dict[str, Any]],
+        tasks: Union[TaskGraph, List[Dict[str, Any]]],
         include_orphaned: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Organize tasks into a parent-child hierarchy with circular reference detection.
 
         Args:
-            tasks: Flat list of tasks
+            tasks: Flat list of tasks, or a TaskGraph already built over them
             include_orphaned: Whether to include orphaned tasks
 
         Returns:
@@ -202,52 +172,44 @@ class TaskHierarchyFormatter:
             - Detects and breaks circular references in parent-child relationships
             - Tasks involved in circular references are treated as root tasks
             - Logs errors when circular references are detected
+            - The graph used is kept as ``self.graph``
         """
         # Reset tracking
         self.circular_refs_detected = []
         self.orphaned_tasks_handled = []
 
-        # Build task map
-        task_map = {task['id']: task for task in tasks if task.get('id')}
+        # Index tasks by ID and parent once
+        graph = tasks if isinstance(tasks, TaskGraph) else TaskGraph(tasks)
+        self.graph = graph
 
         # Handle orphaned tasks by fetching missing parents
-        task_map = self._handle_orphaned_tasks(tasks, task_map)
+        self._handle_orphaned_tasks(list(graph), graph)
 
         # Detect circular references
-        circular_task_ids = self._detect_circular_references(task_map)
+        circular_task_ids = self._detect_circular_references(graph)
 
         # Get all tasks including any fetched parents
-        all_tasks = list(task_map.values())
+        all_tasks = list(graph)
 
         # Initialize _children for all tasks (including fetched parents)
         for task in all_tasks:
             if '_children' not in task:
                 task['_children'] = []
 
-        # Find root tasks (no parent, parent not in list, or part of circular reference)
+        # Find root tasks (no parent, parent not in list, or part of circular
+        # reference) and build children relationships in one pass
         root_tasks = []
         for task in all_tasks:
-            parent_id = task.get('parent')
-            task_id = task.get('id')
+            parent_id = parent_id_of(task)
 
             # Treat tasks in circular references as root tasks (breaks the cycle)
-            if task_id in circular_task_ids:
+            if str(task['id']) in circular_task_ids:
                 root_tasks.append(task)
-            elif not parent_id or parent_id not in task_map:
+            elif not parent_id or parent_id not in graph:
                 if include_orphaned or not parent_id:
                     root_tasks.append(task)
-
-        # Build children relationships
-        for task in all_tasks:
-            parent_id = task.get('parent')
-            task_id = task.get('id')
-
-            # Only add as child if:
-            # 1. Has a parent
-            # 2. Parent exists in task_map
-            # 3. Not part of a circular reference (already promoted to root)
-            if parent_id and parent_id in task_map and task_id not in circular_task_ids:
-                task_map[parent_id]['_children'].append(task)
+            else:
+                graph.tasks[parent_id]['_children'].append(task)
 
         # Sort root tasks by priority and name
         root_tasks.sort(key=lambda t: (
@@ -319,57 +281,143 @@ class TaskHierarchyFormatter:
     def _enrich_tasks_with_comments(
         self,
         tasks: List[Dict[str, Any]],
-        show_comments: int
+        show_comments: int,
+        max_workers: int = COMMENT_FETCH_WORKERS,
+        timeout: float = COMMENT_FETCH_TIMEOUT
     ) -> None:
         """
         Enrich tasks with comments by fetching them from the API, including threaded replies.
 
-        This method recursively fetches comments for all tasks and their children,
-        updating each task dict in-place with a 'comments' field. For each comment,
-        it also fetches threaded replies if the comment has replies.
+        Collects every task in the tree (children included), then fetches
+        comments for all of them concurrently, followed by the replies of every
+        comment that has any. Each task dict is updated in-place with a
+        'comments' field; tree order is untouched.
+
+        Comments are cached per task (see ``comment_cache``) and reused while
+        the task's ``date_updated`` is unchanged. Fetching stops after
+        ``timeout`` seconds; tasks not fetched by then get no comments.
 
         Args:
             tasks: List of tasks to enrich (modified in-place)
             show_comments: Number of comments to fetch (if 0, does nothing)
+            max_workers: Requests in flight at once (default: 8)
+            timeout: Cap on total fetch time in seconds (default: 30)
         """
         if not self.client or show_comments <= 0:
             return
 
-        from clickup_framework.resources import CommentsAPI
-        comments_api = CommentsAPI(self.client)
+        # Every task in the tree, parents before children, each once
+        all_tasks = []
+        seen: Set[int] = set()
+        stack = list(reversed(tasks))
+        while stack:
+            task = stack.pop()
+            if id(task) in seen:
+                continue
+            seen.add(id(task))
+            all_tasks.append(task)
+            stack.extend(reversed(task.get('_children', [])))
+
+        to_fetch = []
+        for task in all_tasks:
+            if not task.get('id'):
+                continue
+            cached = self._cached_comments(task)
+            if cached is not None:
+                task['comments'] = cached
+            else:
+                to_fetch.append(task)
+        if not to_fetch:
+            return
 
-        for task in tasks:
-            task_id = task.get('id')
-            if task_id:
+        deadline = time.monotonic() + timeout
+        pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="clickup-comments")
+        try:
+            # Stage 1: comments for every task
+            comment_futures = {pool.submit(self.client.get_task_comments, task['id']): task for task in to_fetch}
+            finished = self._wait_until(comment_futures, deadline)
+            complete = []
+            for future, task in comment_futures.items():
+                task['comments'] = []
+                if future not in finished:
+                    continue
                 try:
-                    # Fetch comments for this task
-                    comments_response = self.client.get_task_comments(task_id)
                     # The API returns {"comments": [...]}
-                    comments = comments_response.get('comments', [])
-
-                    # Fetch threaded replies for each comment
-                    for comment in comments:
-                        comment['_replies'] = []
-                        reply_count = comment.get('reply_count', 0)
-                        if reply_count and int(reply_count) > 0:
-                            try:
-                                replies_result = comments_api.get_threaded_comments(comment['id'])
-                                replies = replies_result.get('comments', [])
-                                comment['_replies'] = replies
-                            except Exception:
-                                # If fetching replies fails, just skip them
-                                pass
-
-                    task['comments'] = comments
+                    task['comments'] = future.result().get('comments', [])
+                    complete.append(task)
                 except Exception as e:
                     # Log error but continue with other tasks
-                    logger.debug(f"Failed to fetch comments for task {task_id}: {e}")
-                    task['comments'] = []
+                    logger.debug(f"Failed to fetch comments for task {task['id']}: {e}")
+
+            # Stage 2: threaded replies for every comment that has some
+            reply_futures = {}
+            for task in complete:
+                for comment in task['comments']:
+                    comment['_replies'] = []
+                    reply_count = comment.get('reply_count', 0)
+                    if reply_count and int(reply_count) > 0:
+                        future = pool.submit(self.client.get_threaded_comments, comment['id'])
+                        reply_futures[future] = (task, comment)
+            finished = self._wait_until(reply_futures, deadline)
+            incomplete = set()
+            for future, (task, comment) in reply_futures.items():
+                try:
+                    if future not in finished:
+                        raise TimeoutError("comment fetch time cap reached")
+                    comment['_replies'] = future.result().get('comments', [])
+                except Exception:
+                    # If fetching replies fails, just skip them
+                    incomplete.add(id(task))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        skipped = len(to_fetch) - len(complete)
+        if skipped and time.monotonic() >= deadline:
+            logger.warning(f"Comment fetch stopped after {timeout:g}s; {skipped} task(s) shown without comments")
+        for task in complete:
+            if id(task) not in incomplete:
+                self._store_comments(task)
 
-            # Recursively enrich children
-            children = task.get('_children', [])
-            if children:
-                self._enrich_tasks_with_comments(children, show_comments)
+    @staticmethod
+    def _wait_until(futures, deadline: float) -> Set[Any]:
+        """Wait for futures until the deadline; returns the finished ones."""
+        if not futures:
+            return set()
+        done, _ = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        return done
+
+    @property
+    def comment_cache(self):
+        """MetadataCache holding fetched comments (the shared comment cache unless given)."""
+        if self._comment_cache is None:
+            from clickup_framework.metadata_cache import get_comment_cache
+            self._comment_cache = get_comment_cache()
+        return self._comment_cache
+
+    def _cached_comments(self, task: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Return cached comments for a task if cached at its current date_updated."""
+        updated = task.get('date_updated')
+        if not updated or self._comment_cache is False:
+            return None
+        try:
+            entry = self.comment_cache.get(KIND_COMMENTS, task['id'])
+        except Exception as e:
+            logger.debug(f"Comment cache unavailable: {e}")
+            return None
+        if isinstance(entry, dict) and entry.get('date_updated') == str(updated):
+            return entry.get('comments', [])
+        return None
+
+    def _store_comments(self, task: Dict[str, Any]) -> None:
+        """Cache a task's comments under its current date_updated."""
+        updated = task.get('date_updated')
+        if not updated or self._comment_cache is False:
+            return
+        try:
+            self.comment_cache.set(KIND_COMMENTS, task['id'],
+                                   {'date_updated': str(updated), 'comments': task['comments']})
+        except Exception as e:
+            logger.debug(f"Failed to cache comments for task {task['id']}: {e}")
 
     def format_hierarchy(
         self,
@@ -388,6 +436,29 @@ class TaskHierarchyFormatter:
         Returns:
             Formatted hierarchy string with circular reference warnings if detected
         """
+        return "\n".join(self.iter_hierarchy(tasks, options, header))
+
+    def iter_hierarchy(
+        self,
+        tasks: List[Dict[str, Any]],
+        options: Optional[FormatOptions] = None,
+        header: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Yield the lines of ``format_hierarchy`` as they are rendered.
+
+        Tasks are organized (and comments fetched) when iteration starts; each
+        tree line is then formatted only as it is consumed, so callers can
+        write a large hierarchy out incrementally.
+
+        Args:
+            tasks: List of tasks
+            options: Format options
+            header: Optional header text
+
+        Yields:
+            Output lines without trailing newlines
+        """
         if options is None:
             options = FormatOptions()
 
@@ -425,11 +496,12 @@ class TaskHierarchyFormatter:
         # Check if there are any tasks to display after filtering
         if not root_tasks:
             if options.show_closed_only:
-                return "No closed tasks found."
+                yield "No closed tasks found."
             elif not options.include_completed:
-                return "No open tasks found. Use --include-completed to show all tasks."
+                yield "No open tasks found. Use --include-completed to show all tasks."
             else:
-                return "No tasks found."
+                yield "No tasks found."
+            return
 
         # Define functions for tree building
         def format_fn(task):
@@ -449,31 +521,21 @@ class TaskHierarchyFormatter:
                 t.get('name', '').lower()
             ))
 
-        # Render the tree with optional depth limit and root connector
-        # Show root connector when viewing a specific highlighted task
-        show_root_connector = options.highlight_task_id is not None
+        # Warnings and info messages come before the tree
+        if circular_warning:
+            yield circular_warning
+        if orphaned_info:
+            yield orphaned_info
 
-        tree_output = TreeFormatter.render(
+        # Render the tree with optional depth limit
+        yield from TreeFormatter.iter_render(
             root_tasks,
             format_fn,
             get_children_fn,
             header,
-            max_depth=options.max_depth,
-            show_root_connector=show_root_connector
+            max_depth=options.max_depth
         )
 
-        # Prepend warnings and info messages
-        messages = []
-        if circular_warning:
-            messages.append(circular_warning)
-        if orphaned_info:
-            messages.append(orphaned_info)
-
-        if messages:
-            return "\n".join(messages) + "\n" + tree_output
-        else:
-            return tree_output
-
     def organize_by_dependencies(
         self,
         tasks: List[Dict[str, Any]],
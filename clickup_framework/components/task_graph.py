@@ -0,0 +1,184 @@
+"""
+Task Graph Module
+
+Indexes a flat task list by ID and by parent once, so hierarchy, container,
+detail and assigned views can look up children, descendants and ancestors
+without rescanning every task, and detects parent cycles in one linear pass.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+
+def parent_id_of(task: Dict[str, Any]) -> Optional[str]:
+    """Return a task's parent ID, accepting a bare ID or a ``{"id": ...}`` reference."""
+    parent = task.get('parent')
+    if isinstance(parent, dict):
+        parent = parent.get('id')
+    return str(parent) if parent not in (None, '') else None
+
+
+class TaskGraph:
+    """
+    Parent-child index over a list of task dicts.
+
+    Built in O(n); lookups by ID and children by parent are O(1), and
+    descendant / ancestor walks are iterative, so neither deep chains nor
+    cycles can exhaust the stack.
+
+    Example:
+        graph = TaskGraph(tasks)
+        graph.children("abc")                   # direct subtasks, in input order
+        graph.descendants("abc")                # abc and everything below it
+        graph.find_cycles()                     # [["a", "b"]] for a → b → a
+    """
+
+    def __init__(self, tasks: Iterable[Dict[str, Any]] = ()):
+        """
+        Initialize the graph.
+
+        Args:
+            tasks: Task dicts; tasks without an ID are ignored, and a repeated
+                ID keeps the last task seen
+        """
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self._children: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cycles: Optional[List[List[str]]] = None
+        for task in tasks:
+            self.add(task)
+
+    def add(self, task: Dict[str, Any]) -> None:
+        """Add (or replace) one task."""
+        task_id = task.get('id')
+        if not task_id:
+            return
+        task_id = str(task_id)
+        previous = self.tasks.get(task_id)
+        if previous is not None:
+            siblings = self._children.get(parent_id_of(previous) or '')
+            if siblings is not None:
+                siblings[:] = [t for t in siblings if t is not previous]
+        self.tasks[task_id] = task
+        self._children[parent_id_of(task) or ''].append(task)
+        self._cycles = None
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self.tasks
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.tasks.values())
+
+    def get(self, task_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the task with this ID, or None."""
+        return self.tasks.get(task_id) if task_id else None
+
+    def parent(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Return a task's parent if it is in the graph."""
+        task = self.tasks.get(task_id)
+        return self.get(parent_id_of(task)) if task is not None else None
+
+    def children(self, task_id: str) -> List[Dict[str, Any]]:
+        """Return a task's direct subtasks, in input order."""
+        return list(self._children.get(str(task_id), ()))
+
+    def siblings(self, task_id: str) -> List[Dict[str, Any]]:
+        """Return the other tasks sharing this task's parent (other roots for a root task)."""
+        task = self.tasks.get(task_id)
+        if task is None:
+            return []
+        return [t for t in self._children.get(parent_id_of(task) or '', ()) if t is not task]
+
+    def is_root(self, task: Dict[str, Any]) -> bool:
+        """True if the task has no parent, or its parent is not in the graph."""
+        parent_id = parent_id_of(task)
+        return not parent_id or parent_id not in self.tasks
+
+    def roots(self, include_orphaned: bool = True) -> List[Dict[str, Any]]:
+        """
+        Return top-level tasks, in input order.
+
+        Args:
+            include_orphaned: Include tasks whose parent is not in the graph
+        """
+        return [
+            task for task in self.tasks.values()
+            if not parent_id_of(task) or (include_orphaned and parent_id_of(task) not in self.tasks)
+        ]
+
+    def orphans(self) -> List[Dict[str, Any]]:
+        """Return tasks whose parent is set but not in the graph."""
+        return [task for task in self.tasks.values() if parent_id_of(task) and parent_id_of(task) not in self.tasks]
+
+    def descendants(self, task_id: str, include_self: bool = True) -> List[Dict[str, Any]]:
+        """
+        Return a task's subtree in depth-first pre-order.
+
+        Each task appears once even if the parent links contain a cycle.
+
+        Args:
+            task_id: Root of the subtree
+            include_self: Include the root task itself (default: True)
+        """
+        root = self.tasks.get(str(task_id))
+        if root is None:
+            return []
+        result: List[Dict[str, Any]] = []
+        seen: Set[str] = set()
+        stack = [root]
+        while stack:
+            task = stack.pop()
+            current_id = str(task['id'])
+            if current_id in seen:
+                continue
+            seen.add(current_id)
+            result.append(task)
+            stack.extend(reversed(self._children.get(current_id, ())))
+        return result if include_self else result[1:]
+
+    def ancestors(self, task_id: str) -> List[Dict[str, Any]]:
+        """Return a task's parent, grandparent, ... while they are in the graph, stopping at a cycle."""
+        result: List[Dict[str, Any]] = []
+        seen = {str(task_id)}
+        current = self.parent(str(task_id))
+        while current is not None and str(current['id']) not in seen:
+            seen.add(str(current['id']))
+            result.append(current)
+            current = self.parent(str(current['id']))
+        return result
+
+    def find_cycles(self) -> List[List[str]]:
+        """
+        Return every parent cycle as a list of task IDs, each cycle once.
+
+        Every task has at most one parent, so one coloring pass that follows
+        parent links from each unvisited task finds all cycles in O(n).
+        """
+        if self._cycles is not None:
+            return self._cycles
+        cycles: List[List[str]] = []
+        # 1 = on the current walk, 2 = finished
+        state: Dict[str, int] = {}
+        for start in self.tasks:
+            if start in state:
+                continue
+            walk: List[str] = []
+            position: Dict[str, int] = {}
+            node: Optional[str] = start
+            while node is not None and node in self.tasks and node not in state:
+                state[node] = 1
+                position[node] = len(walk)
+                walk.append(node)
+                node = parent_id_of(self.tasks[node])
+            if node is not None and state.get(node) == 1:
+                cycles.append(walk[position[node]:])
+            for visited in walk:
+                state[visited] = 2
+        self._cycles = cycles
+        return cycles
+
+    def cycle_ids(self) -> Set[str]:
+        """Return the IDs of every task on a parent cycle."""
+        return {task_id for cycle in self.find_cycles() for task_id in cycle}
@@ -4,7 +4,7 @@ Tree Formatting Module
 Provides utilities for rendering hierarchical data as tree structures with box-drawing characters.
 """
 
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional, Sequence
 
 
 class TreeFormatter:
@@ -31,7 +31,7 @@ class TreeFormatter:
         max_depth: Optional[int] = None
     ) -> List[str]:
         """
-        Recursively build a tree structure from hierarchical items with optional depth limiting.
+        Build a tree structure from hierarchical items with optional depth limiting.
 
         Args:
             items: List of items to display
@@ -54,75 +54,96 @@ class TreeFormatter:
                        Fix: Changed to "├── " (4 chars), "│   " (4 chars), "    " (4 spaces)
                        Result: Consistent 4-char widths, proper branch closure, aligned pipes
         """
-        lines = []
+        return list(TreeFormatter.iter_tree(
+            items,
+            format_fn,
+            get_children_fn,
+            prefix,
+            current_depth,
+            max_depth
+        ))
+
+    @staticmethod
+    def iter_tree(
+        items: Sequence[Dict[str, Any]],
+        format_fn: Callable[[Dict[str, Any]], str],
+        get_children_fn: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+        prefix: str = "",
+        current_depth: int = 0,
+        max_depth: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Yield the lines of a tree structure one at a time.
 
-        for i, item in enumerate(items):
-            is_last_item = (i == len(items) - 1)
+        Produces exactly the lines of ``build_tree`` but walks the tree with an
+        explicit stack instead of recursion, so arbitrarily deep hierarchies do
+        not hit the recursion limit, and each item is formatted only when its
+        lines are about to be consumed.
+
+        Args:
+            items: List of items to display
+            format_fn: Function to format each item into a string
+            get_children_fn: Function to get children of an item
+            prefix: Indentation prefix of the top level
+            current_depth: Depth of the top level (0 = root level)
+            max_depth: Maximum depth to display (None = unlimited)
+
+        Yields:
+            Formatted lines, in display order
+        """
+        # Each frame is [siblings, index of the next sibling, prefix, depth]
+        stack = [[items, 0, prefix, current_depth]]
+
+        while stack:
+            frame = stack[-1]
+            siblings, i, level_prefix, depth = frame
+            if i >= len(siblings):
+                stack.pop()
+                continue
+            frame[1] = i + 1
+
+            item = siblings[i]
+            is_last_item = (i == len(siblings) - 1)
 
             # Determine the branch character (with proper spacing: 2 dashes + space)
             branch = "└── " if is_last_item else "├── "
 
-            # Format the current item
-            formatted = format_fn(item)
-
-            # Handle multi-line formatted content
-            formatted_lines = formatted.split('\n')
+            # Format the current item, handling multi-line formatted content
+            formatted_lines = format_fn(item).split('\n')
 
-            # Add the first line with branch character
-            lines.append(f"{prefix}{branch}{formatted_lines[0]}")
+            # First line carries the branch character
+            yield f"{level_prefix}{branch}{formatted_lines[0]}"
 
             # Get children to determine if we need to continue vertical line
             children = get_children_fn(item)
 
             # Calculate the prefix for children (needed for continuation alignment)
-            # This determines where child tasks will appear
             if is_last_item:
-                child_prefix = prefix + "    "  # 4 spaces, no vertical line for last item's children
+                child_prefix = level_prefix + "    "  # 4 spaces, no vertical line for last item's children
             else:
-                child_prefix = prefix + "│   "  # Pipe + 3 spaces to continue vertical line
-
-            # Add remaining lines with proper indentation
-            if len(formatted_lines) > 1:
-                # Continuation lines (descriptions, dates, etc.) should be indented
-                # to align under the task content, not as tree nodes
-                # These are metadata lines, not tree structure
-                detail_lines = formatted_lines[1:]
-                for idx, line in enumerate(detail_lines):
-                    is_last_detail = (idx == len(detail_lines) - 1)
-                    # Last detail line should close with └─ ONLY if there are no children
-                    # If there are children, detail lines should continue with │
-                    if is_last_detail and not children:
-                        # Last detail line with no children - close with └─ (4 chars total)
-                        detail_prefix = child_prefix + "└─  "
-                    else:
-                        # Other detail lines, or last detail when children exist - continue with │
-                        detail_prefix = child_prefix + "│   "
-                    lines.append(f"{detail_prefix}{line}")
+                child_prefix = level_prefix + "│   "  # Pipe + 3 spaces to continue vertical line
+
+            # Continuation lines (descriptions, dates, etc.) are metadata aligned
+            # under the task content, not tree nodes
+            detail_lines = formatted_lines[1:]
+            for idx, line in enumerate(detail_lines):
+                is_last_detail = (idx == len(detail_lines) - 1)
+                # Last detail line closes with └─ ONLY if there are no children
+                if is_last_detail and not children:
+                    detail_prefix = child_prefix + "└─  "
+                else:
+                    detail_prefix = child_prefix + "│   "
+                yield f"{detail_prefix}{line}"
 
             if children:
-                # Check if we've reached max depth
-                if max_depth is not None and current_depth >= max_depth:
+                if max_depth is not None and depth >= max_depth:
                     # Show truncation message aligned with children
-                    # Use same pattern as continuation lines
-                    truncate_prefix = child_prefix + "│ "
-
                     hidden_count = len(children)
                     truncate_msg = f"... ({hidden_count} subtask{'s' if hidden_count != 1 else ''} hidden - max depth {max_depth} reached)"
-                    lines.append(f"{truncate_prefix}{truncate_msg}")
+                    yield f"{child_prefix}│ {truncate_msg}"
                 else:
-                    # Recursively format children
-                    child_lines = TreeFormatter.build_tree(
-                        children,
-                        format_fn,
-                        get_children_fn,
-                        child_prefix,
-                        False,
-                        current_depth + 1,
-                        max_depth
-                    )
-                    lines.extend(child_lines)
-
-        return lines
+                    # Children are emitted before this item's remaining siblings
+                    stack.append([children, 0, child_prefix, depth + 1])
 
     @staticmethod
     def render(
@@ -147,21 +168,40 @@ class TreeFormatter:
         Returns:
             Complete tree as a string
         """
-        lines = []
-
-        if header:
-            lines.append(header)
-            lines.append("")  # Always add blank line, no connector pipe
-
-        tree_lines = TreeFormatter.build_tree(
+        return "\n".join(TreeFormatter.iter_render(
             items,
             format_fn,
             get_children_fn,
+            header,
             max_depth=max_depth
-        )
-        lines.extend(tree_lines)
+        ))
+
+    @staticmethod
+    def iter_render(
+        items: Sequence[Dict[str, Any]],
+        format_fn: Callable[[Dict[str, Any]], str],
+        get_children_fn: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+        header: Optional[str] = None,
+        max_depth: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Yield the lines of ``render`` one at a time, for writing as they are produced.
+
+        Args:
+            items: List of root items
+            format_fn: Function to format each item
+            get_children_fn: Function to get children of an item
+            header: Optional header to display before the tree
+            max_depth: Maximum depth to display (None = unlimited)
+
+        Yields:
+            Output lines without trailing newlines
+        """
+        if header:
+            yield header
+            yield ""  # Always add blank line, no connector pipe
 
-        return "\n".join(lines)
+        yield from TreeFormatter.iter_tree(items, format_fn, get_children_fn, max_depth=max_depth)
 
     @staticmethod
     def format_container_tree(
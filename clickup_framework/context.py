@@ -21,7 +21,9 @@ import json
 import os
 from typing import Dict, Any, Optional
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
+
+from . import serialization
 
 
 class ContextManager:
@@ -35,39 +37,57 @@ class ContextManager:
     - Can optionally store API token for convenience
     - Stores resource IDs for convenience
     - File permissions are set to user-only (0600)
+
+    The file is rewritten only when a stored value changes. List metadata
+    lives in the separate MetadataCache.
     """
 
     DEFAULT_CONTEXT_PATH = os.path.expanduser("~/.clickup_context.json")
     DEFAULT_CACHE_TTL = 3600  # 1 hour in seconds
 
-    def __init__(self, context_path: Optional[str] = None, cache_ttl: int = DEFAULT_CACHE_TTL):
+    def __init__(self, context_path: Optional[str] = None, cache_ttl: int = DEFAULT_CACHE_TTL,
+                 metadata_cache=None):
         """
         Initialize ContextManager.
 
         Args:
             context_path: Path to context file (defaults to ~/.clickup_context.json)
             cache_ttl: Cache time-to-live in seconds (default: 3600 = 1 hour)
+            metadata_cache: MetadataCache holding list metadata (default: the shared one)
         """
         self.context_path = context_path or self.DEFAULT_CONTEXT_PATH
         self.cache_ttl = cache_ttl
+        self._metadata_cache = metadata_cache
         self._context: Dict[str, Any] = {}
         self._load()
 
+    @property
+    def metadata_cache(self):
+        """MetadataCache used by the list metadata methods, opened on first use."""
+        if self._metadata_cache is None:
+            from .metadata_cache import get_metadata_cache
+
+            self._metadata_cache = get_metadata_cache()
+        return self._metadata_cache
+
     def _load(self) -> None:
         """Load context from JSON file."""
         if os.path.exists(self.context_path):
             try:
-                with open(self.context_path, 'r') as f:
-                    self._context = json.load(f)
+                with open(self.context_path, 'r', encoding='utf-8') as f:
+                    self._context = serialization.load(f)
             except (json.JSONDecodeError, IOError) as e:
                 # If file is corrupted, start fresh
                 self._context = {}
                 print(f"Warning: Could not load context file: {e}")
         else:
             self._context = {}
+        # List metadata used to be cached here; it moved to MetadataCache and
+        # is dropped from the file on the next save
+        self._context.pop('list_cache', None)
 
     def _save(self) -> None:
-        """Save context to JSON file with secure permissions."""
+        """Save context to JSON file atomically with secure permissions."""
         # Ensure parent directory exists
         parent_dir = Path(self.context_path).parent
         try:
@@ -85,9 +105,20 @@ class ContextManager:
                 f"Cannot create config directory {parent_dir}: {e}"
             )
 
-        # Write context file
-        with open(self.context_path, 'w') as f:
-            json.dump(self._context, f, indent=2)
+        # Write a user-only (0600) temp file next to the context file and swap
+        # it in, so readers never see a partial file
+        tmp_path = f"{self.context_path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                serialization.dump(self._context, f, indent=True)
+            os.replace(tmp_path, self.context_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
         # Set file permissions to user-only (0600)
         try:
@@ -96,6 +127,22 @@ class ContextManager:
             # On Windows, chmod may not work as expected
             pass
 
+    def _set(self, key: str, value: Any) -> None:
+        """Store a preference, saving only if it changed."""
+        if key in self._context and self._context[key] == value:
+            return
+        self._context[key] = value
+        self._context['last_updated'] = datetime.now().isoformat()
+        self._save()
+
+    def _unset(self, key: str) -> None:
+        """Remove a preference, saving only if it was set."""
+        if key not in self._context:
+            return
+        del self._context[key]
+        self._context['last_updated'] = datetime.now().isoformat()
+        self._save()
+
     def set_current_task(self, task_id: str) -> None:
         """
         Set the current task ID.
@@ -103,9 +150,7 @@ class ContextManager:
         Args:
             task_id: Task ID to set as current
         """
-        self._context['current_task'] = task_id
-        self._context['last_updated'] = datetime.now().isoformat()
-        self._save()
+        self._set('current_task', task_id)
 
     def get_current_task(self) -> Optional[str]:
         """
@@ -123,9 +168,7 @@ class ContextManager:
         Args:
             list_id: List ID to set as current
         """
-        self._context['current_list'] = list_id
-        self._context['last_updated'] = datetime.now().isoformat()
-        self._save()
+        self._set('current_list', list_id)
 
     def get_current_list(self) -> Optional[str]:
         """
@@ -147,9 +190,7 @@ class ContextManager:
         Args:
             space_id: Space ID to set as current
         """
-        self._context['current_space'] = space_id
-        self._context['last_updated'] = datetime.now().isoformat()
-        self._save()
+        self._set('current_space', space_id)
 
     def get_current_space(self) -> Optional[str]:
         """
@@ -167,9 +208,7 @@ class ContextManager:
         Args:
             folder_id: Folder ID to set as current
         """
-        self._context['current_folder'] = folder_id
-        self._context['last_updated'] = datetime.now().isoformat()
-        self._save()
+        self._set('current_folder', folder_id)
 
     def get_current_folder(self) -> Optional[str]:
         """
@@ -187,9 +226,7 @@ class ContextManager:
         Args:
             workspace_id: Workspace/team ID to set as current
         """
-        self._context['current_workspace'] = workspace_id
-        self._context['last_updated'] = datetime.now().isoformat()
-        self._save()
+        self._set('current_workspace', workspace_id)
 
     def get_current_workspace(self) -> Optional[str]:
         """
@@ -206,38 +243,23 @@ class ContextManager:
 
     def clear_current_task(self) -> None:
         """Clear the current task ID."""
-        if 'current_task' in self._context:
-            del self._context['current_task']
-            self._context['last_updated'] = datetime.now().isoformat()
-            self._save()
+        self._unset('current_task')
 
     def clear_current_list(self) -> None:
         """Clear the current list ID."""
-        if 'current_list' in self._context:
-            del self._context['current_list']
-            self._context['last_updated'] = datetime.now().isoformat()
-            self._save()
+        self._unset('current_list')
 
     def clear_current_space(self) -> None:
         """Clear the current space ID."""
-        if 'current_space' in self._context:
-            del self._context['current_space']
-            self._context['last_updated'] = datetime.now().isoformat()
-            self._save()
+        self._unset('current_space')
 
     def clear_current_folder(self) -> None:
         """Clear the current folder ID."""
-        if 'current_folder' in self._context:
-            del self._context['current_folder']
-            self._context['last_updated'] = datetime.now().isoformat()
-            self._save()
+        self._unset('current_folder')
 
     def clear_current_workspace(self) -> None:
         """Clear the current workspace ID."""
-        if 'current_workspace' in self._context:
-            del self._context['current_workspace']
-            self._context['last_updated'] = datetime.now().isoformat()
-            self._save()
+        self._unset('current_workspace')
 
     def set_api_token(self, token: str, validate: bool = True) -> None:
         """
@@ -280,9 +302,7 @@ class ContextManager:
             except requests.exceptions.RequestException as e:
                 raise ValueError(f"Failed to validate token: {str(e)}")
 
-        self._context['api_token'] = token
-        self._context['last_updated'] = datetime.now().isoformat()
-        self._save()
+        self._set('api_token', token)
 
     def get_api_token(self) -> Optional[str]:
         """
@@ -295,10 +315,7 @@ class ContextManager:
 
     def clear_api_token(self) -> None:
         """Clear the stored API token."""
-        if 'api_token' in self._context:
-            del self._context['api_token']
-            self._context['last_updated'] = datetime.now().isoformat()
-            self._save()
+        self._unset('api_token')
 
     def set_default_assignee(self, user_id: int) -> None:
         """
@@ -307,9 +324,7 @@ class ContextManager:
         Args:
             user_id: User ID to set as default assignee
         """
-        self._context['default_assignee'] = user_id
-        self._context['last_updated'] = datetime.now().isoformat()
-        self._save()
+        self._set('default_assignee', user_id)
 
     def get_default_assignee(self) -> Optional[int]:
         """
@@ -332,10 +347,7 @@ class ContextManager:
 
     def clear_default_assignee(self) -> None:
         """Clear the default assignee."""
-        if 'default_assignee' in self._context:
-            del self._context['default_assignee']
-            self._context['last_updated'] = datetime.now().isoformat()
-            self._save()
+        self._unset('default_assignee')
 
     def set_ansi_output(self, enabled: bool) -> None:
         """
@@ -344,9 +356,7 @@ class ContextManager:
         Args:
             enabled: True to enable ANSI colors, False to disable
         """
-        self._context['ansi_output'] = enabled
-        self._context['last_updated'] = datetime.now().isoformat()
-        self._save()
+        self._set('ansi_output', enabled)
 
     def get_ansi_output(self) -> bool:
         """
@@ -368,6 +378,31 @@ class ContextManager:
         # Otherwise use context setting
         return self._context.get('ansi_output', False)
 
+    def set_http_settings(self, **settings: Any) -> None:
+        """
+        Store HTTP connection settings used by new clients.
+
+        Args:
+            **settings: HttpSettings fields (pool_connections, pool_maxsize,
+                pool_block, keepalive, http2); None removes a stored value
+        """
+        stored = dict(self._context.get('http_settings', {}))
+        for key, value in settings.items():
+            if value is None:
+                stored.pop(key, None)
+            else:
+                stored[key] = value
+        self._set('http_settings', stored)
+
+    def get_http_settings(self) -> Dict[str, Any]:
+        """
+        Get stored HTTP connection settings.
+
+        Returns:
+            Dictionary of HttpSettings fields (empty if none are stored)
+        """
+        return dict(self._context.get('http_settings', {}))
+
     def clear_all(self) -> None:
         """Clear all context."""
         self._context = {}
@@ -426,18 +461,15 @@ class ContextManager:
         """
         Cache list metadata including statuses.
 
+        Stored in the metadata cache, not the context file.
+
         Args:
             list_id: List ID
             metadata: List metadata from API (should include 'statuses' field)
         """
-        if 'list_cache' not in self._context:
-            self._context['list_cache'] = {}
+        from .metadata_cache import KIND_LIST
 
-        self._context['list_cache'][list_id] = {
-            'metadata': metadata,
-            'cached_at': datetime.now().isoformat()
-        }
-        self._save()
+        self.metadata_cache.set(KIND_LIST, list_id, metadata, ttl=self.cache_ttl)
 
     def get_cached_list_metadata(self, list_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -449,24 +481,9 @@ class ContextManager:
         Returns:
             Cached metadata dict or None if not cached or expired
         """
-        if 'list_cache' not in self._context:
-            return None
-
-        cached_data = self._context['list_cache'].get(list_id)
-        if not cached_data:
-            return None
+        from .metadata_cache import KIND_LIST
 
-        # Check if cache is still valid
-        cached_at = datetime.fromisoformat(cached_data['cached_at'])
-        age = datetime.now() - cached_at
-
-        if age.total_seconds() > self.cache_ttl:
-            # Cache expired, remove it
-            del self._context['list_cache'][list_id]
-            self._save()
-            return None
-
-        return cached_data['metadata']
+        return self.metadata_cache.get(KIND_LIST, list_id)
 
     def clear_list_cache(self, list_id: Optional[str] = None) -> None:
         """
@@ -475,16 +492,9 @@ class ContextManager:
         Args:
             list_id: Specific list ID to clear, or None to clear all
         """
-        if 'list_cache' not in self._context:
-            return
+        from .metadata_cache import KIND_LIST
 
-        if list_id:
-            if list_id in self._context['list_cache']:
-                del self._context['list_cache'][list_id]
-        else:
-            self._context['list_cache'] = {}
-
-        self._save()
+        self.metadata_cache.invalidate(KIND_LIST, list_id)
 
 
 def get_context_manager() -> ContextManager:
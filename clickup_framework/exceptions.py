@@ -59,3 +59,27 @@ class ClickUpTimeoutError(ClickUpError):
     """Raised when request times out."""
 
     pass
+
+
+class ClickUpCircuitOpenError(ClickUpAPIError):
+    """Raised without sending a request while an endpoint's circuit breaker is open."""
+
+    def __init__(self, route: str, retry_in: float = None):
+        self.route = route
+        self.retry_in = retry_in
+        message = f"Circuit open for {route} after repeated failures"
+        if retry_in:
+            message += f" (retry in {retry_in:.0f}s)"
+        super().__init__(503, message)
+
+
+class ClickUpCassetteError(ClickUpError):
+    """Raised when a replaying cassette has no recording for a request."""
+
+    pass
+
+
+class ClickUpOfflineError(ClickUpError):
+    """Raised in offline mode when a request cannot be answered from cached data."""
+
+    pass
@@ -0,0 +1,887 @@
+"""
+Fake ClickUp Server
+
+A local stand-in for the ClickUp v2/v3 API, for benchmarks and tests that
+must run offline and reproducibly. It serves a generated workspace (spaces,
+folders, lists, tasks with subtasks, comments, checklists, docs and time
+entries) from memory with ClickUp's response shapes, 100-task pagination,
+``X-RateLimit-*`` headers and 429s, gzip responses and optional injected
+latency. Writes (create/update/delete tasks, comments, checklists, tags,
+docs, time entries) change the in-memory workspace.
+
+Only the standard library is used. The server runs in a background thread:
+
+    with FakeClickUpServer(latency=0.05) as server:
+        client = ClickUpClient(api_token="pk_fake", api_root=server.api_root)
+        print(client.get_team_tasks(server.workspace.team_id))
+
+Or run it standalone and point the CLI at it:
+
+    python -m clickup_framework.fake_server --port 8765 --tasks-per-list 200
+    CLICKUP_API_ROOT=http://127.0.0.1:8765/api CLICKUP_API_TOKEN=pk_fake cum h --all
+"""
+
+import argparse
+import gzip
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from . import serialization
+
+PAGE_SIZE = 100
+
+STATUSES = [
+    {"status": "to do", "color": "#d3d3d3", "type": "open", "orderindex": 0},
+    {"status": "in progress", "color": "#4194f6", "type": "custom", "orderindex": 1},
+    {"status": "review", "color": "#a875ff", "type": "custom", "orderindex": 2},
+    {"status": "complete", "color": "#6bc950", "type": "closed", "orderindex": 3},
+]
+
+PRIORITIES = [
+    None,
+    {"id": "1", "priority": "urgent", "color": "#f50000", "orderindex": "1"},
+    {"id": "2", "priority": "high", "color": "#ffcc00", "orderindex": "2"},
+    {"id": "3", "priority": "normal", "color": "#6fddff", "orderindex": "3"},
+    {"id": "4", "priority": "low", "color": "#d8d8d8", "orderindex": "4"},
+]
+
+TAGS = ["backend", "frontend", "bug", "docs", "infra"]
+
+_WORDS = ("sync parser cache index render export import queue report webhook schema token "
+          "search filter mirror layout session upload checklist comment").split()
+
+
+class NotFound(Exception):
+    """A resource the request names does not exist."""
+
+
+class FakeWorkspace:
+    """
+    In-memory ClickUp workspace with the API's JSON shapes.
+
+    ``generate`` builds a deterministic workspace from a seed; the handler
+    methods below back the server's routes.
+    """
+
+    def __init__(self, seed: int = 0):
+        self._random = random.Random(seed)
+        self._ids = 90110000
+        self._lock = threading.RLock()
+        self.team_id = "9000"
+        self.users = [
+            {"id": 101 + i, "username": name, "email": f"{name.split()[0].lower()}@example.com",
+             "color": "#7b68ee", "initials": "".join(p[0] for p in name.split()), "profilePicture": None}
+            for i, name in enumerate(["Alex Example", "Sam Sample", "Robin Test"])
+        ]
+        self.spaces: Dict[str, Dict[str, Any]] = {}
+        self.folders: Dict[str, Dict[str, Any]] = {}
+        self.lists: Dict[str, Dict[str, Any]] = {}
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.comments: Dict[str, List[Dict[str, Any]]] = {}
+        self.docs: Dict[str, Dict[str, Any]] = {}
+        self.pages: Dict[str, List[Dict[str, Any]]] = {}
+        self.time_entries: List[Dict[str, Any]] = []
+        self.checklist_owner: Dict[str, str] = {}
+        self._frozen_ms: Optional[int] = None
+
+    @property
+    def user(self) -> Dict[str, Any]:
+        """The user the API token belongs to."""
+        return self.users[0]
+
+    def _now_ms(self) -> int:
+        """Current time in ms; fixed while generating so seeded workspaces are identical."""
+        return self._frozen_ms if self._frozen_ms is not None else int(time.time() * 1000)
+
+    def _next_id(self) -> str:
+        self._ids += 1
+        return str(self._ids)
+
+    def _task_id(self) -> str:
+        self._ids += 1
+        return f"86a{self._ids:x}"[-9:]
+
+    def _sentence(self, words: int) -> str:
+        return " ".join(self._random.choice(_WORDS) for _ in range(words)).capitalize()
+
+    @classmethod
+    def generate(
+        cls,
+        spaces: int = 2,
+        folders_per_space: int = 2,
+        lists_per_folder: int = 3,
+        tasks_per_list: int = 50,
+        subtask_ratio: float = 0.3,
+        comments_per_task: int = 2,
+        seed: int = 0,
+    ) -> "FakeWorkspace":
+        """
+        Build a deterministic workspace.
+
+        Each space also gets one folderless list, and every list ``tasks_per_list``
+        tasks of which ``subtask_ratio`` are subtasks of an earlier task.
+        """
+        workspace = cls(seed=seed)
+        workspace._frozen_ms = 1767225600000
+        for s in range(spaces):
+            space = workspace.create_space(f"Space {s + 1}")
+            for f in range(folders_per_space):
+                folder = workspace.create_folder(space["id"], f"Folder {s + 1}.{f + 1}")
+                for l_index in range(lists_per_folder):
+                    workspace._populate_list(
+                        workspace.create_list(folder["id"], f"List {s + 1}.{f + 1}.{l_index + 1}"),
+                        tasks_per_list, subtask_ratio, comments_per_task,
+                    )
+            workspace._populate_list(
+                workspace.create_list(None, f"Backlog {s + 1}", space_id=space["id"]),
+                tasks_per_list, subtask_ratio, comments_per_task,
+            )
+            doc = workspace.create_doc(f"Space {s + 1} handbook")
+            workspace.create_page(doc["id"], "Overview", workspace._sentence(40))
+        workspace._frozen_ms = None
+        return workspace
+
+    def _populate_list(self, list_obj, count: int, subtask_ratio: float, comments: int) -> None:
+        created: List[str] = []
+        for i in range(count):
+            parent = None
+            if created and self._random.random() < subtask_ratio:
+                parent = self._random.choice(created)
+            task = self.create_task(
+                list_obj["id"],
+                {
+                    "name": self._sentence(4),
+                    "description": self._sentence(30),
+                    "status": self._random.choice(STATUSES)["status"],
+                    "priority": self._random.randint(0, 4) or None,
+                    "assignees": self._random.sample([u["id"] for u in self.users], self._random.randint(0, 2)),
+                    "tags": self._random.sample(TAGS, self._random.randint(0, 2)),
+                    "parent": parent,
+                    "due_date": 1767225600000 + i * 86400000,
+                    "time_estimate": self._random.choice([None, 3600000, 7200000]),
+                },
+            )
+            created.append(task["id"])
+            for _ in range(comments):
+                self.add_comment(task["id"], self._sentence(12))
+
+    # Containers
+
+    def create_space(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            space = {
+                "id": self._next_id(), "name": name, "private": False, "archived": False,
+                "statuses": [dict(s) for s in STATUSES],
+                "multiple_assignees": True,
+                "features": {"due_dates": {"enabled": True}, "time_tracking": {"enabled": True},
+                             "tags": {"enabled": True}, "checklists": {"enabled": True}},
+            }
+            self.spaces[space["id"]] = space
+            return space
+
+    def create_folder(self, space_id: str, name: str) -> Dict[str, Any]:
+        with self._lock:
+            space = self._get(self.spaces, space_id, "Space")
+            folder = {
+                "id": self._next_id(), "name": name, "orderindex": len(self.folders), "hidden": False,
+                "space": {"id": space["id"], "name": space["name"]}, "task_count": "0", "archived": False,
+                "statuses": [], "lists": [],
+            }
+            self.folders[folder["id"]] = folder
+            return folder
+
+    def create_list(self, folder_id: Optional[str], name: str, space_id: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            folder = self._get(self.folders, folder_id, "Folder") if folder_id else None
+            space = self._get(self.spaces, folder["space"]["id"] if folder else space_id, "Space")
+            list_obj = {
+                "id": self._next_id(), "name": name, "orderindex": len(self.lists), "content": "",
+                "status": None, "priority": None, "assignee": None, "task_count": 0, "due_date": None,
+                "start_date": None, "archived": False, "override_statuses": False,
+                "statuses": [dict(s) for s in STATUSES],
+                "folder": {"id": folder["id"], "name": folder["name"], "hidden": False, "access": True}
+                if folder else {"id": "0", "name": "hidden", "hidden": True, "access": True},
+                "space": {"id": space["id"], "name": space["name"], "access": True},
+                "permission_level": "create",
+            }
+            self.lists[list_obj["id"]] = list_obj
+            return list_obj
+
+    def _folder_payload(self, folder: Dict[str, Any]) -> Dict[str, Any]:
+        lists = [self._list_payload(l) for l in self.lists.values() if l["folder"]["id"] == folder["id"]]
+        return {**folder, "lists": lists, "task_count": str(sum(l["task_count"] for l in lists))}
+
+    def _list_payload(self, list_obj: Dict[str, Any]) -> Dict[str, Any]:
+        count = sum(1 for t in self.tasks.values() if t["list"]["id"] == list_obj["id"])
+        return {**list_obj, "task_count": count}
+
+    @staticmethod
+    def _get(table: Dict[str, Any], key: Optional[str], kind: str) -> Dict[str, Any]:
+        if key not in table:
+            raise NotFound(f"{kind} not found")
+        return table[key]
+
+    # Tasks
+
+    def create_task(self, list_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            list_obj = self._get(self.lists, list_id, "List")
+            now = str(self._now_ms())
+            task_id = self._task_id()
+            task = {
+                "id": task_id, "custom_id": None, "custom_item_id": 0,
+                "name": data.get("name", "Untitled"),
+                "text_content": data.get("description", ""), "description": data.get("description", ""),
+                "status": dict(STATUSES[0]), "orderindex": f"{len(self.tasks)}.00000000000000000000000000000000",
+                "date_created": now, "date_updated": now, "date_closed": None, "date_done": None,
+                "archived": False, "creator": dict(self.user), "assignees": [], "group_assignees": [],
+                "watchers": [dict(self.user)], "checklists": [], "tags": [], "parent": None,
+                "top_level_parent": None, "priority": None, "due_date": None, "start_date": None,
+                "points": None, "time_estimate": None, "time_spent": 0, "custom_fields": [],
+                "dependencies": [], "linked_tasks": [], "locations": [], "team_id": self.team_id,
+                "url": f"https://app.clickup.com/t/{task_id}", "sharing": {"public": False},
+                "permission_level": "create",
+                "list": {"id": list_obj["id"], "name": list_obj["name"], "access": True},
+                "project": {"id": list_obj["folder"]["id"], "name": list_obj["folder"]["name"],
+                            "hidden": list_obj["folder"]["hidden"], "access": True},
+                "folder": {"id": list_obj["folder"]["id"], "name": list_obj["folder"]["name"],
+                           "hidden": list_obj["folder"]["hidden"], "access": True},
+                "space": {"id": list_obj["space"]["id"]},
+            }
+            self.tasks[task_id] = task
+            self.comments[task_id] = []
+            self._apply_update(task, {k: v for k, v in data.items() if k not in ("name", "description")},
+                               assignees_are_ids=True)
+            return task
+
+    def _apply_update(self, task: Dict[str, Any], data: Dict[str, Any], assignees_are_ids: bool = False) -> None:
+        for key in ("name", "description", "due_date", "start_date", "time_estimate", "points", "archived"):
+            if key in data:
+                task[key] = data[key]
+        if "description" in data:
+            task["text_content"] = data["description"]
+        if "status" in data and data["status"]:
+            status = next((s for s in STATUSES if s["status"] == str(data["status"]).lower()), None)
+            if status is None:
+                raise ValueError(f"Status not found: {data['status']}")
+            task["status"] = dict(status)
+            task["date_closed"] = str(self._now_ms()) if status["type"] == "closed" else None
+        if "priority" in data:
+            task["priority"] = PRIORITIES[int(data["priority"])] if data["priority"] else None
+        if "parent" in data:
+            parent = data["parent"]
+            if parent and parent not in self.tasks:
+                raise NotFound("Parent task not found")
+            task["parent"] = parent
+            task["top_level_parent"] = parent
+        if "tags" in data:
+            task["tags"] = [{"name": name, "tag_fg": "#ffffff", "tag_bg": "#7b68ee", "creator": self.user["id"]}
+                            for name in data["tags"]]
+        if "assignees" in data:
+            assignees = data["assignees"]
+            ids = [a["id"] for a in task["assignees"]]
+            if assignees_are_ids or isinstance(assignees, list):
+                ids = list(assignees)
+            else:
+                ids = [i for i in ids if i not in assignees.get("rem", [])] + list(assignees.get("add", []))
+            task["assignees"] = [dict(u) for u in self.users if u["id"] in ids]
+        task["date_updated"] = str(self._now_ms())
+
+    def get_task(self, task_id: str, include_subtasks: bool = False) -> Dict[str, Any]:
+        task = dict(self._get(self.tasks, task_id, "Task"))
+        if include_subtasks:
+            task["subtasks"] = [t for t in self.tasks.values() if t["parent"] == task_id]
+        return task
+
+    def update_task(self, task_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            task = self._get(self.tasks, task_id, "Task")
+            self._apply_update(task, data)
+            return task
+
+    def delete_task(self, task_id: str) -> None:
+        with self._lock:
+            self._get(self.tasks, task_id, "Task")
+            for child in [t["id"] for t in self.tasks.values() if t["parent"] == task_id]:
+                self.delete_task(child)
+            del self.tasks[task_id]
+            self.comments.pop(task_id, None)
+
+    def filter_tasks(self, params: Dict[str, List[str]], list_ids=None, space_ids=None) -> List[Dict[str, Any]]:
+        """Apply ClickUp's task query parameters."""
+        include_closed = _flag(params, "include_closed")
+        subtasks = _flag(params, "subtasks")
+        statuses = {s.lower() for s in _multi(params, "statuses")}
+        assignees = {int(a) for a in _multi(params, "assignees")}
+        tags = set(_multi(params, "tags"))
+        list_ids = set(list_ids or []) | set(_multi(params, "list_ids"))
+        space_ids = set(space_ids or []) | set(_multi(params, "space_ids"))
+        updated_gt = int((params.get("date_updated_gt") or ["0"])[-1])
+        result = []
+        for task in self.tasks.values():
+            if list_ids and task["list"]["id"] not in list_ids:
+                continue
+            if space_ids and task["space"]["id"] not in space_ids:
+                continue
+            if not subtasks and task["parent"]:
+                continue
+            if statuses:
+                if task["status"]["status"] not in statuses:
+                    continue
+            elif not include_closed and task["status"]["type"] == "closed":
+                continue
+            if assignees and not assignees & {a["id"] for a in task["assignees"]}:
+                continue
+            if tags and not tags & {t["name"] for t in task["tags"]}:
+                continue
+            if updated_gt and int(task["date_updated"]) <= updated_gt:
+                continue
+            result.append(task)
+        return result
+
+    # Comments, checklists, tags
+
+    def add_comment(self, task_id: str, text: str) -> Dict[str, Any]:
+        with self._lock:
+            self._get(self.tasks, task_id, "Task")
+            comment = {
+                "id": self._next_id(), "comment": [{"text": text}], "comment_text": text,
+                "user": dict(self.user), "resolved": False, "assignee": None, "assigned_by": None,
+                "reactions": [], "date": str(self._now_ms()), "reply_count": 0,
+            }
+            self.comments[task_id].append(comment)
+            return comment
+
+    def create_checklist(self, task_id: str, name: str) -> Dict[str, Any]:
+        with self._lock:
+            task = self._get(self.tasks, task_id, "Task")
+            checklist = {"id": f"cl-{self._next_id()}", "task_id": task_id, "name": name,
+                         "orderindex": len(task["checklists"]), "resolved": 0, "unresolved": 0, "items": []}
+            task["checklists"].append(checklist)
+            self.checklist_owner[checklist["id"]] = task_id
+            return checklist
+
+    def _checklist(self, checklist_id: str) -> Dict[str, Any]:
+        task = self._get(self.tasks, self.checklist_owner.get(checklist_id), "Checklist")
+        return next(c for c in task["checklists"] if c["id"] == checklist_id)
+
+    def add_checklist_item(self, checklist_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            checklist = self._checklist(checklist_id)
+            checklist["items"].append({
+                "id": f"cli-{self._next_id()}", "name": data.get("name", ""), "orderindex": len(checklist["items"]),
+                "assignee": data.get("assignee"), "resolved": False, "parent": None, "children": [],
+            })
+            checklist["unresolved"] += 1
+            return checklist
+
+    def update_checklist_item(self, checklist_id: str, item_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            checklist = self._checklist(checklist_id)
+            item = next((i for i in checklist["items"] if i["id"] == item_id), None)
+            if item is None:
+                raise NotFound("Checklist item not found")
+            item.update({k: v for k, v in data.items() if k in ("name", "assignee", "resolved")})
+            checklist["resolved"] = sum(1 for i in checklist["items"] if i["resolved"])
+            checklist["unresolved"] = len(checklist["items"]) - checklist["resolved"]
+            return checklist
+
+    def set_tag(self, task_id: str, name: str, present: bool) -> None:
+        with self._lock:
+            task = self._get(self.tasks, task_id, "Task")
+            names = [t["name"] for t in task["tags"] if t["name"] != name] + ([name] if present else [])
+            self._apply_update(task, {"tags": names})
+
+    # Docs and time
+
+    def create_doc(self, name: str) -> Dict[str, Any]:
+        with self._lock:
+            doc = {"id": f"doc-{self._next_id()}", "name": name, "workspace_id": int(self.team_id),
+                   "date_created": self._now_ms(), "creator": self.user["id"], "deleted": False,
+                   "parent": {"id": self.team_id, "type": 12}}
+            self.docs[doc["id"]] = doc
+            self.pages[doc["id"]] = []
+            return doc
+
+    def create_page(self, doc_id: str, name: str, content: str = "") -> Dict[str, Any]:
+        with self._lock:
+            self._get(self.docs, doc_id, "Doc")
+            page = {"id": f"page-{self._next_id()}", "doc_id": doc_id, "name": name, "content": content,
+                    "workspace_id": int(self.team_id), "pages": []}
+            self.pages[doc_id].append(page)
+            return page
+
+    def add_time_entry(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            task = self._get(self.tasks, data.get("tid"), "Task") if data.get("tid") else None
+            entry = {
+                "id": self._next_id(), "wid": self.team_id, "user": dict(self.user), "billable": False,
+                "start": str(data.get("start", self._now_ms())), "duration": str(data.get("duration", 0)),
+                "description": data.get("description", ""), "tags": [],
+                "task": {"id": task["id"], "name": task["name"], "status": task["status"]} if task else None,
+            }
+            self.time_entries.append(entry)
+            if task:
+                task["time_spent"] = (task["time_spent"] or 0) + int(entry["duration"])
+            return entry
+
+
+def _multi(params: Dict[str, List[str]], name: str) -> List[str]:
+    """Read a list parameter sent as ``name[]=a&name[]=b`` or ``name=a``."""
+    return params.get(f"{name}[]", []) + params.get(name, [])
+
+
+def _flag(params: Dict[str, List[str]], name: str) -> bool:
+    return (params.get(name) or ["false"])[-1].lower() == "true"
+
+
+def _page(items: List[Any], params: Dict[str, List[str]]) -> Tuple[List[Any], bool]:
+    page = int((params.get("page") or ["0"])[-1])
+    chunk = items[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+    return chunk, (page + 1) * PAGE_SIZE >= len(items)
+
+
+Handler = Callable[["FakeWorkspace", Dict[str, List[str]], Any, Tuple[str, ...]], Any]
+
+# (method, path regex, handler). Paths are relative to /api/v2 or /api (for v3).
+ROUTES: List[Tuple[str, "re.Pattern", Handler]] = []
+
+
+def route(method: str, pattern: str):
+    """Register a handler for ``method`` requests whose path matches ``pattern``."""
+    def register(handler: Handler) -> Handler:
+        ROUTES.append((method, re.compile(f"^{pattern}$"), handler))
+        return handler
+    return register
+
+
+@route("GET", r"v2/user")
+def _get_user(ws, params, body, args):
+    return {"user": ws.user}
+
+
+@route("GET", r"v2/team")
+def _get_teams(ws, params, body, args):
+    members = [{"user": dict(u, role=1 if i == 0 else 3)} for i, u in enumerate(ws.users)]
+    return {"teams": [{"id": ws.team_id, "name": "Fake Workspace", "color": "#7b68ee", "members": members}]}
+
+
+@route("GET", r"v2/team/([^/]+)/space")
+def _get_spaces(ws, params, body, args):
+    return {"spaces": list(ws.spaces.values())}
+
+
+@route("GET", r"v2/space/([^/]+)")
+def _get_space(ws, params, body, args):
+    return ws._get(ws.spaces, args[0], "Space")
+
+
+@route("GET", r"v2/space/([^/]+)/folder")
+def _get_folders(ws, params, body, args):
+    ws._get(ws.spaces, args[0], "Space")
+    return {"folders": [ws._folder_payload(f) for f in ws.folders.values() if f["space"]["id"] == args[0]]}
+
+
+@route("GET", r"v2/space/([^/]+)/list")
+def _get_folderless_lists(ws, params, body, args):
+    ws._get(ws.spaces, args[0], "Space")
+    return {"lists": [ws._list_payload(l) for l in ws.lists.values()
+                      if l["space"]["id"] == args[0] and l["folder"]["hidden"]]}
+
+
+@route("GET", r"v2/space/([^/]+)/tag")
+def _get_space_tags(ws, params, body, args):
+    return {"tags": [{"name": name, "tag_fg": "#ffffff", "tag_bg": "#7b68ee"} for name in TAGS]}
+
+
+@route("GET", r"v2/folder/([^/]+)")
+def _get_folder(ws, params, body, args):
+    return ws._folder_payload(ws._get(ws.folders, args[0], "Folder"))
+
+
+@route("GET", r"v2/folder/([^/]+)/list")
+def _get_folder_lists(ws, params, body, args):
+    return {"lists": ws._folder_payload(ws._get(ws.folders, args[0], "Folder"))["lists"]}
+
+
+@route("GET", r"v2/list/([^/]+)")
+def _get_list(ws, params, body, args):
+    return ws._list_payload(ws._get(ws.lists, args[0], "List"))
+
+
+@route("GET", r"v2/(?:list|folder|space|team)/([^/]+)/field")
+def _get_fields(ws, params, body, args):
+    return {"fields": []}
+
+
+@route("GET", r"v2/list/([^/]+)/member")
+def _get_list_members(ws, params, body, args):
+    ws._get(ws.lists, args[0], "List")
+    return {"members": ws.users}
+
+
+@route("GET", r"v2/list/([^/]+)/task")
+def _get_list_tasks(ws, params, body, args):
+    ws._get(ws.lists, args[0], "List")
+    tasks, last_page = _page(ws.filter_tasks(params, list_ids=[args[0]]), params)
+    return {"tasks": tasks, "last_page": last_page}
+
+
+@route("POST", r"v2/list/([^/]+)/task")
+def _create_task(ws, params, body, args):
+    return ws.create_task(args[0], body or {})
+
+
+@route("GET", r"v2/team/([^/]+)/task")
+def _get_team_tasks(ws, params, body, args):
+    tasks, last_page = _page(ws.filter_tasks(params), params)
+    return {"tasks": tasks, "last_page": last_page}
+
+
+@route("GET", r"v2/task/([^/]+)")
+def _get_task(ws, params, body, args):
+    return ws.get_task(args[0], include_subtasks=_flag(params, "include_subtasks"))
+
+
+@route("PUT", r"v2/task/([^/]+)")
+def _update_task(ws, params, body, args):
+    return ws.update_task(args[0], body or {})
+
+
+@route("DELETE", r"v2/task/([^/]+)")
+def _delete_task(ws, params, body, args):
+    ws.delete_task(args[0])
+    return None
+
+
+@route("GET", r"v2/task/([^/]+)/comment")
+def _get_comments(ws, params, body, args):
+    ws._get(ws.tasks, args[0], "Task")
+    return {"comments": list(reversed(ws.comments[args[0]]))}
+
+
+@route("POST", r"v2/task/([^/]+)/comment")
+def _add_comment(ws, params, body, args):
+    comment = ws.add_comment(args[0], (body or {}).get("comment_text", ""))
+    return {"id": comment["id"], "hist_id": comment["id"], "date": int(comment["date"])}
+
+
+@route("POST", r"v2/task/([^/]+)/checklist")
+def _create_checklist(ws, params, body, args):
+    return {"checklist": ws.create_checklist(args[0], (body or {}).get("name", "Checklist"))}
+
+
+@route("POST", r"v2/checklist/([^/]+)/checklist_item")
+def _add_checklist_item(ws, params, body, args):
+    return {"checklist": ws.add_checklist_item(args[0], body or {})}
+
+
+@route("PUT", r"v2/checklist/([^/]+)/checklist_item/([^/]+)")
+def _update_checklist_item(ws, params, body, args):
+    return {"checklist": ws.update_checklist_item(args[0], args[1], body or {})}
+
+
+@route("POST", r"v2/task/([^/]+)/tag/([^/]+)")
+def _add_tag(ws, params, body, args):
+    ws.set_tag(args[0], args[1], True)
+    return {}
+
+
+@route("DELETE", r"v2/task/([^/]+)/tag/([^/]+)")
+def _remove_tag(ws, params, body, args):
+    ws.set_tag(args[0], args[1], False)
+    return {}
+
+
+@route("GET", r"v2/task/([^/]+)/time")
+def _get_tracked_time(ws, params, body, args):
+    ws._get(ws.tasks, args[0], "Task")
+    entries = [e for e in ws.time_entries if e["task"] and e["task"]["id"] == args[0]]
+    return {"data": [{"user": ws.user, "time": sum(int(e["duration"]) for e in entries),
+                      "intervals": [{"id": e["id"], "start": e["start"], "time": e["duration"]} for e in entries]}]
+            if entries else []}
+
+
+@route("GET", r"v2/team/([^/]+)/time_entries")
+def _get_time_entries(ws, params, body, args):
+    return {"data": list(ws.time_entries)}
+
+
+@route("POST", r"v2/team/([^/]+)/time_entries")
+def _create_time_entry(ws, params, body, args):
+    return {"data": ws.add_time_entry(body or {})}
+
+
+@route("GET", r"v3/workspaces/([^/]+)/docs")
+def _get_docs(ws, params, body, args):
+    return {"docs": list(ws.docs.values()), "next_cursor": None}
+
+
+@route("POST", r"v3/workspaces/([^/]+)/docs")
+def _create_doc(ws, params, body, args):
+    return ws.create_doc((body or {}).get("name", "Untitled"))
+
+
+@route("GET", r"v3/workspaces/([^/]+)/docs/([^/]+)")
+def _get_doc(ws, params, body, args):
+    return ws._get(ws.docs, args[1], "Doc")
+
+
+@route("GET", r"v3/workspaces/([^/]+)/docs/([^/]+)/pages")
+def _get_pages(ws, params, body, args):
+    ws._get(ws.docs, args[1], "Doc")
+    return ws.pages[args[1]]
+
+
+@route("POST", r"v3/workspaces/([^/]+)/docs/([^/]+)/pages")
+def _create_page(ws, params, body, args):
+    body = body or {}
+    return ws.create_page(args[1], body.get("name", "Untitled"), body.get("content", ""))
+
+
+@route("GET", r"v3/workspaces/([^/]+)/docs/([^/]+)/pages/([^/]+)")
+def _get_page(ws, params, body, args):
+    ws._get(ws.docs, args[1], "Doc")
+    page = next((p for p in ws.pages[args[1]] if p["id"] == args[2]), None)
+    if page is None:
+        raise NotFound("Page not found")
+    return page
+
+
+class _RateLimitWindow:
+    """Fixed one-minute request window per token, reported like ClickUp does."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._windows: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, token: str) -> Tuple[bool, Dict[str, str]]:
+        now = time.time()
+        with self._lock:
+            start, used = self._windows.get(token, (now, 0))
+            if now - start >= 60:
+                start, used = now, 0
+            allowed = used < self.limit
+            if allowed:
+                used += 1
+            self._windows[token] = (start, used)
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(self.limit - used),
+            "X-RateLimit-Reset": str(int(start + 60)),
+        }
+        return allowed, headers
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Dispatches requests to ROUTES against the server's workspace."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY each response waits for a delayed ACK
+    disable_nagle_algorithm = True
+    server: "FakeClickUpServer._HTTPServer"
+
+    def setup(self):
+        super().setup()
+        owner: FakeClickUpServer = self.server.owner
+        with owner._lock:
+            owner.connections_opened += 1
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+        pass
+
+    def _dispatch(self, method: str) -> None:
+        owner: FakeClickUpServer = self.server.owner
+        parts = urlsplit(self.path)
+        params = parse_qs(parts.query, keep_blank_values=True)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+
+        if owner.latency or owner.jitter:
+            time.sleep(owner.latency + random.uniform(0, owner.jitter))
+
+        token = self.headers.get("Authorization")
+        if not token or (owner.tokens and token not in owner.tokens):
+            self._reply(401, {"err": "Token invalid", "ECODE": "OAUTH_025"})
+            return
+
+        allowed, headers = owner.rate_limit.hit(token)
+        if not allowed:
+            headers["Retry-After"] = str(max(1, int(float(headers["X-RateLimit-Reset"]) - time.time())))
+            self._reply(429, {"err": "Rate limit reached", "ECODE": "APP_002"}, headers)
+            return
+
+        path = unquote(parts.path)
+        if not path.startswith("/api/"):
+            self._reply(404, {"err": "Route not found", "ECODE": "APP_001"}, headers)
+            return
+        path = path[len("/api/"):].rstrip("/")
+
+        for route_method, pattern, handler in ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                break
+        else:
+            self._reply(404, {"err": "Route not found", "ECODE": "APP_001"}, headers)
+            return
+
+        try:
+            body = serialization.loads(raw) if raw else None
+            payload = handler(owner.workspace, params, body, match.groups())
+        except NotFound as e:
+            self._reply(404, {"err": str(e), "ECODE": "ITEM_013"}, headers)
+            return
+        except (ValueError, TypeError) as e:
+            self._reply(400, {"err": str(e), "ECODE": "INPUT_005"}, headers)
+            return
+        with owner._lock:
+            owner.request_log.append((method, path))
+        if payload is None:
+            self._reply(204, None, headers)
+        else:
+            self._reply(200, payload, headers)
+
+    def _reply(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        body = serialization.dumps_bytes(payload) if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if len(body) > 1024 and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=5)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+class FakeClickUpServer:
+    """
+    Local HTTP server answering ClickUp API requests from a FakeWorkspace.
+
+    Use as a context manager, or call ``start`` / ``stop``.
+    """
+
+    class _HTTPServer(ThreadingHTTPServer):
+        daemon_threads = True
+        owner: "FakeClickUpServer"
+
+    def __init__(
+        self,
+        workspace: Optional[FakeWorkspace] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: int = 10000,
+        tokens: Optional[List[str]] = None,
+    ):
+        """
+        Initialize server.
+
+        Args:
+            workspace: Data to serve (default: FakeWorkspace.generate())
+            host: Interface to bind (default: 127.0.0.1)
+            port: Port to bind; 0 picks a free one
+            latency: Seconds added to every response
+            jitter: Extra random latency, uniform in [0, jitter] seconds
+            rate_limit: Requests per minute per token before answering 429
+            tokens: Accepted API tokens (default: any non-empty token)
+        """
+        self.workspace = workspace or FakeWorkspace.generate()
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = _RateLimitWindow(rate_limit)
+        self.tokens = set(tokens or [])
+        self.request_log: List[Tuple[str, str]] = []
+        # TCP connections accepted; fewer than requests means keep-alive reuse
+        self.connections_opened = 0
+        self._lock = threading.Lock()
+        self._httpd = self._HTTPServer((host, port), _RequestHandler)
+        self._httpd.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_root(self) -> str:
+        """Value for ClickUpClient(api_root=...) or the CLICKUP_API_ROOT env var."""
+        return f"{self.url}/api"
+
+    def start(self) -> "FakeClickUpServer":
+        """Serve requests on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-clickup", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeClickUpServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    """Run the fake server in the foreground."""
+    parser = argparse.ArgumentParser(description="Serve a generated ClickUp workspace locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--spaces", type=int, default=2)
+    parser.add_argument("--folders-per-space", type=int, default=2)
+    parser.add_argument("--lists-per-folder", type=int, default=3)
+    parser.add_argument("--tasks-per-list", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency in seconds")
+    parser.add_argument("--rate-limit", type=int, default=10000, help="Requests per minute per token")
+    args = parser.parse_args()
+
+    workspace = FakeWorkspace.generate(
+        spaces=args.spaces, folders_per_space=args.folders_per_space,
+        lists_per_folder=args.lists_per_folder, tasks_per_list=args.tasks_per_list, seed=args.seed,
+    )
+    server = FakeClickUpServer(workspace, host=args.host, port=args.port, latency=args.latency,
+                               jitter=args.jitter, rate_limit=args.rate_limit)
+    print(f"Fake ClickUp API at {server.api_root} (workspace {workspace.team_id}, "
+          f"{len(workspace.tasks)} tasks)")
+    print(f"  export CLICKUP_API_ROOT={server.api_root} CLICKUP_API_TOKEN=pk_fake")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+ID Index
+
+Persistent map from ClickUp IDs to what they are (space, folder, list or
+task) and where they sit (team, space, folder, list and parent task), so
+``resolve_container_id`` can answer with a local lookup instead of probing
+the space, folder, list and task endpoints in turn.
+
+``observe`` is called by ClickUpClient with every successful response: a
+task payload teaches its own ID plus its list, folder and space, and the
+workspace hierarchy listings (``team/{id}/space``, ``space/{id}/folder``,
+``folder/{id}/list``, ...) fill in the containers. Deletes and 404s drop the
+ID.
+
+Recorded entries are buffered in memory and written in one transaction once
+``FLUSH_AT`` are pending, before any read, and on ``close``, so a command
+that fetches hundreds of tasks does not write SQLite per response.
+
+Clients use the index passed as ``id_index``, a default one when
+``CLICKUP_ID_INDEX=1``, or the one installed with ``install`` (the CLI
+installs one for every command).
+
+Usage:
+    index = IdIndex()
+    client = ClickUpClient(id_index=index)
+    client.get_task("abc123")
+    index.lookup("abc123")   # {"id": "abc123", "type": "task", "list_id": ..., ...}
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+TYPES = ("space", "folder", "list", "task")
+
+# Parent-path columns stored for every ID
+PATH_FIELDS = ("team_id", "space_id", "folder_id", "list_id", "parent")
+
+# Buffered entries written in one transaction once this many are pending
+FLUSH_AT = 500
+
+_SINGLE = re.compile(r"^(space|folder|list|task)/([^/]+)$")
+_CHILDREN = re.compile(r"^(team|space|folder|list)/([^/]+)/(space|folder|list|task)$")
+_RESOURCE = re.compile(r"^(space|folder|list|task)/([^/]+)")
+
+_default: Optional["IdIndex"] = None
+
+
+def install(index: Optional["IdIndex"]) -> Optional["IdIndex"]:
+    """Make ``index`` the default for clients created from now on (None to stop sharing)."""
+    global _default
+    _default = index
+    return index
+
+
+def get_default() -> Optional["IdIndex"]:
+    """Return the installed default index, if any."""
+    return _default
+
+
+def _ref(value: Any) -> Optional[str]:
+    if isinstance(value, dict):
+        if value.get("hidden"):
+            # Folderless lists report a hidden placeholder folder
+            return None
+        value = value.get("id")
+    return str(value) if value not in (None, "") else None
+
+
+def entries_for(kind: str, item: Dict[str, Any], parent_kind: Optional[str] = None,
+                parent_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Return index entries for one API object and the containers it references.
+
+    Args:
+        kind: 'space', 'folder', 'list' or 'task'
+        item: The object as returned by the API
+        parent_kind: Kind of the container it was listed under ('team', 'space', ...)
+        parent_id: ID of that container
+    """
+    if not isinstance(item, dict) or not _ref(item.get("id")):
+        return []
+    entry: Dict[str, Any] = {"id": str(item["id"]), "type": kind}
+    entry["team_id"] = _ref(item.get("team_id"))
+    entry["space_id"] = _ref(item.get("space"))
+    entry["folder_id"] = _ref(item.get("folder")) if kind in ("list", "task") else None
+    entry["list_id"] = _ref(item.get("list")) if kind == "task" else None
+    entry["parent"] = _ref(item.get("parent")) if kind == "task" else None
+    if parent_kind is not None and parent_id is not None:
+        field = f"{parent_kind}_id"
+        if field in entry and entry[field] is None:
+            entry[field] = str(parent_id)
+
+    entries = [entry]
+    if kind == "folder":
+        for child in item.get("lists") or []:
+            for list_entry in entries_for("list", child, "folder", entry["id"]):
+                list_entry["space_id"] = list_entry["space_id"] or entry["space_id"]
+                entries.append(list_entry)
+    elif kind == "task":
+        # A task names its whole path; remember the containers too
+        path = {"team_id": entry["team_id"], "space_id": entry["space_id"]}
+        if entry["space_id"]:
+            entries.append({"id": entry["space_id"], "type": "space", "team_id": entry["team_id"]})
+        if entry["folder_id"]:
+            entries.append({"id": entry["folder_id"], "type": "folder", **path})
+        if entry["list_id"]:
+            entries.append({"id": entry["list_id"], "type": "list", "folder_id": entry["folder_id"], **path})
+    return entries
+
+
+class IdIndex:
+    """
+    SQLite-backed ID → type and parent-path index.
+
+    Entries never expire; a lookup that turns out stale (the ID was deleted
+    or moved) is corrected by the next response mentioning it, removed by
+    the first 404 for it, or removed with ``forget``.
+    """
+
+    DEFAULT_PATH = Path.home() / ".clickup_framework" / "cache" / "ids.db"
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize the index.
+
+        Args:
+            path: SQLite database file (default: ~/.clickup_framework/cache/ids.db)
+        """
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = []
+        self._conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ids ("
+                " id TEXT PRIMARY KEY, type TEXT, team_id TEXT, space_id TEXT, folder_id TEXT,"
+                " list_id TEXT, parent TEXT, seen_at REAL)"
+            )
+        try:
+            self.path.chmod(0o600)
+        except OSError:
+            # On Windows, chmod may not work as expected
+            pass
+
+    def record(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store entries from ``entries_for``.
+
+        Known path fields are kept when a new entry leaves them out, so a list
+        seen inside a task payload does not lose the team found by a listing.
+        Entries are buffered until ``FLUSH_AT`` are pending or the index is read.
+
+        Returns:
+            Number of entries recorded
+        """
+        now = time.time()
+        rows = [
+            (str(e["id"]), e["type"], *(e.get(field) for field in PATH_FIELDS), now)
+            for e in entries if e.get("id") and e.get("type") in TYPES
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            self._pending.extend(rows)
+            if len(self._pending) >= FLUSH_AT:
+                self._flush()
+        return len(rows)
+
+    def flush(self) -> None:
+        """Write buffered entries now."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write buffered entries in one transaction. Caller holds the lock."""
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        updates = ", ".join(f"{field} = COALESCE(excluded.{field}, ids.{field})" for field in PATH_FIELDS)
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO ids (id, type, team_id, space_id, folder_id, list_id, parent, seen_at)"
+                f" VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET type = excluded.type, {updates},"
+                " seen_at = excluded.seen_at",
+                rows,
+            )
+
+    def lookup(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return what an ID is.
+
+        Returns:
+            Dict with ``id``, ``type``, the PATH_FIELDS and ``seen_at`` (when it
+            was last recorded), or None if unknown
+        """
+        with self._lock:
+            self._flush()
+            row = self._conn.execute(
+                "SELECT id, type, team_id, space_id, folder_id, list_id, parent, seen_at FROM ids WHERE id = ?",
+                (str(item_id),),
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("id", "type") + PATH_FIELDS + ("seen_at",), row))
+
+    def forget(self, item_id: str) -> None:
+        """Drop an ID, e.g. after it was deleted."""
+        with self._lock:
+            self._flush()
+            with self._conn:
+                self._conn.execute("DELETE FROM ids WHERE id = ?", (str(item_id),))
+
+    def observe_missing(self, endpoint: str) -> None:
+        """
+        Drop the ID a request answered with 404 for, e.g. ``list/{id}/task``.
+
+        Called by ClickUpClient so a stale entry is corrected by the first miss.
+        The entry is kept when it is indexed as another type: probing an ID as
+        every container type answers 404 for all but the right one.
+        """
+        resource = _RESOURCE.match(endpoint.strip("/"))
+        if resource is None:
+            return
+        kind, item_id = resource.groups()
+        with self._lock:
+            self._flush()
+            with self._conn:
+                self._conn.execute("DELETE FROM ids WHERE id = ? AND type = ?", (item_id, kind))
+
+    def observe(self, method: str, endpoint: str, data: Any) -> None:
+        """
+        Record whatever a successful API response says about IDs.
+
+        Called by ClickUpClient after every request when the index is enabled.
+        """
+        if not isinstance(data, dict):
+            return
+        method = method.upper()
+        path = endpoint.strip("/")
+        single = _SINGLE.match(path)
+        if single:
+            kind, item_id = single.groups()
+            if method == "DELETE":
+                self.forget(item_id)
+            elif method in ("GET", "PUT"):
+                self.record(entries_for(kind, data))
+            return
+        children = _CHILDREN.match(path)
+        if children and method in ("GET", "POST"):
+            parent_kind, parent_id, kind = children.groups()
+            # Listings wrap items ("folders": [...]); creates return the item itself
+            items = data.get(f"{kind}s") if f"{kind}s" in data else [data]
+            entries: List[Dict[str, Any]] = []
+            for item in items or []:
+                entries.extend(entries_for(kind, item, parent_kind, parent_id))
+            self.record(entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._flush()
+            return self._conn.execute("SELECT COUNT(*) FROM ids").fetchone()[0]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock, self._conn:
+            self._pending.clear()
+            self._conn.execute("DELETE FROM ids")
+
+    def close(self) -> None:
+        """Write buffered entries and close the database."""
+        with self._lock:
+            self._flush()
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"IdIndex(path={self.path})"
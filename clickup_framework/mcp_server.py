@@ -31,6 +31,7 @@ from clickup_framework.client import ClickUpClient
 from clickup_framework.resources.tasks import TasksAPI
 from clickup_framework.resources.comments import CommentsAPI
 from clickup_framework.components.display import DisplayManager
+from clickup_framework.components.options import FormatOptions
 from clickup_framework.formatters.task import TaskFormatter
 
 # Configure logging
@@ -378,28 +379,35 @@ async def handle_set_task_tags(client: ClickUpClient, arguments: dict) -> list[t
     operation = arguments["operation"]
     tags = arguments["tags"]
 
-    tasks_api = TasksAPI(client)
+    batch = client.batch()
 
     if operation == "add":
         for tag in tags:
-            tasks_api.add_tag(task_id, tag)
+            batch.add_tag(task_id, tag)
         result = f"✓ Added {len(tags)} tag(s) to task {task_id}"
     elif operation == "remove":
         for tag in tags:
-            tasks_api.remove_tag(task_id, tag)
+            batch.remove_tag(task_id, tag)
         result = f"✓ Removed {len(tags)} tag(s) from task {task_id}"
     elif operation == "set":
-        # Get current task, remove all tags, add new ones
-        task = tasks_api.get_task(task_id)
-        current_tags = task.get("tags", [])
+        # Only touch the tags that actually change
+        task = client.get_task(task_id)
+        current_tags = [tag["name"] for tag in task.get("tags", [])]
         for tag in current_tags:
-            tasks_api.remove_tag(task_id, tag["name"])
+            if tag not in tags:
+                batch.remove_tag(task_id, tag)
         for tag in tags:
-            tasks_api.add_tag(task_id, tag)
+            if tag not in current_tags:
+                batch.add_tag(task_id, tag)
         result = f"✓ Set task {task_id} tags to: {', '.join(tags)}"
     else:
         raise ValueError(f"Invalid operation: {operation}")
 
+    report = batch.execute()
+    if not report.ok:
+        failures = "\n".join(f"✗ {item.description}: {item.error}" for item in report.failed)
+        result = f"Tag update incomplete ({report.summary()}):\n{failures}"
+
     return [types.TextContent(type="text", text=result)]
 
 
@@ -409,16 +417,24 @@ async def handle_get_hierarchy(client: ClickUpClient, arguments: dict) -> list[t
     detail_level = arguments.get("detail_level", "summary")
     include_completed = arguments.get("include_completed", False)
 
-    # Use DisplayManager to get hierarchy view
+    presets = {
+        "minimal": FormatOptions.minimal,
+        "summary": FormatOptions.summary,
+        "detailed": FormatOptions.detailed,
+        "full": FormatOptions.full,
+    }
+    options = presets.get(detail_level, FormatOptions.summary)()
+    options.colorize_output = False  # Disable colors for MCP output
+    options.include_completed = include_completed
+
+    result = client.get_list_tasks(list_id)
+    tasks = result if isinstance(result, list) else result.get("tasks", [])
+
+    # Render lines on demand straight into the response text
     display = DisplayManager(client)
-    output = display.display_hierarchy(
-        list_id=list_id,
-        preset=detail_level,
-        include_completed=include_completed,
-        colorize=False  # Disable colors for MCP output
-    )
+    lines = display.hierarchy_view(tasks, options, stream=True)
 
-    return [types.TextContent(type="text", text=output)]
+    return [types.TextContent(type="text", text="\n".join(lines))]
 
 
 async def handle_get_flat_view(client: ClickUpClient, arguments: dict) -> list[types.TextContent]:
@@ -677,25 +693,28 @@ async def handle_bulk_create_tasks(client: ClickUpClient, arguments: dict) -> li
     list_id = resolve_resource_id(arguments["list_id"], "list")
     tasks_data = arguments["tasks"]
 
-    tasks_api = TasksAPI(client)
+    batch = client.batch()
+    for task_data in tasks_data:
+        batch.create_task(
+            list_id,
+            name=task_data["name"],
+            description=task_data.get("description"),
+            status=task_data.get("status"),
+            priority=task_data.get("priority"),
+            tags=task_data.get("tags"),
+            assignees=task_data.get("assignees"),
+            parent=task_data.get("parent")
+        )
+    report = batch.execute()
+
     created_tasks = []
     failed_tasks = []
-
-    for i, task_data in enumerate(tasks_data, 1):
-        try:
-            task = tasks_api.create_task(
-                list_id=list_id,
-                name=task_data["name"],
-                description=task_data.get("description"),
-                status=task_data.get("status"),
-                priority=task_data.get("priority"),
-                tags=task_data.get("tags"),
-                assignees=task_data.get("assignees"),
-                parent=task_data.get("parent")
-            )
+    for i, (task_data, item) in enumerate(zip(tasks_data, report.items), 1):
+        if item.success:
+            task = item.result
             created_tasks.append(f"✓ Task {i}: {task['name']} (ID: {task['id']})")
-        except Exception as e:
-            failed_tasks.append(f"✗ Task {i} ({task_data['name']}): {str(e)}")
+        else:
+            failed_tasks.append(f"✗ Task {i} ({task_data['name']}): {str(item.error)}")
 
     result = f"Bulk Create Results:\n"
     result += f"Created: {len(created_tasks)}/{len(tasks_data)}\n"
@@ -715,7 +734,6 @@ async def handle_bulk_update_tasks(client: ClickUpClient, arguments: dict) -> li
     task_ids = arguments["task_ids"]
     updates = arguments["updates"]
 
-    tasks_api = TasksAPI(client)
     updated_tasks = []
     failed_tasks = []
 
@@ -725,24 +743,24 @@ async def handle_bulk_update_tasks(client: ClickUpClient, arguments: dict) -> li
         pri = updates["priority"]
         updates["priority"] = priority_map.get(pri.lower(), int(pri) if pri.isdigit() else 3)
 
+    # Queue every write; tasks run in parallel, each task's writes in order
+    update_payload = {k: v for k, v in updates.items() if k not in ["add_tags", "remove_tags"]}
+    batch = client.batch()
     for task_id in task_ids:
-        try:
-            # Handle tag operations separately
-            if "add_tags" in updates:
-                for tag in updates["add_tags"]:
-                    tasks_api.add_tag(task_id, tag)
-            if "remove_tags" in updates:
-                for tag in updates["remove_tags"]:
-                    tasks_api.remove_tag(task_id, tag)
-
-            # Apply other updates
-            update_payload = {k: v for k, v in updates.items() if k not in ["add_tags", "remove_tags"]}
-            if update_payload:
-                tasks_api.update_task(task_id, **update_payload)
+        for tag in updates.get("add_tags", []):
+            batch.add_tag(task_id, tag)
+        for tag in updates.get("remove_tags", []):
+            batch.remove_tag(task_id, tag)
+        if update_payload:
+            batch.update_task(task_id, **update_payload)
+    results_by_task = batch.execute().by_key()
 
+    for task_id in task_ids:
+        errors = [item.error for item in results_by_task.get(task_id, []) if not item.success]
+        if errors:
+            failed_tasks.append(f"✗ Failed to update {task_id}: {'; '.join(str(e) for e in errors)}")
+        else:
             updated_tasks.append(f"✓ Updated task: {task_id}")
-        except Exception as e:
-            failed_tasks.append(f"✗ Failed to update {task_id}: {str(e)}")
 
     result = f"Bulk Update Results:\n"
     result += f"Updated: {len(updated_tasks)}/{len(task_ids)}\n"
@@ -771,8 +789,7 @@ async def handle_get_list_tasks(client: ClickUpClient, arguments: dict) -> list[
         "include_closed": include_closed
     }
 
-    result = client.get_list_tasks(list_id, **params)
-    tasks = result.get("tasks", [])
+    tasks = list(client.iter_list_tasks(list_id, **params))
 
     # Format tasks
     output = f"Tasks in list {list_id}:\n"
@@ -0,0 +1,239 @@
+"""
+Metadata Cache
+
+Small persistent cache for list metadata (statuses), custom field
+definitions and list members, kept out of ``~/.clickup_context.json`` so the
+file holding the API token is only rewritten when a preference changes.
+Hierarchy views keep task comments, keyed by task ID and checked against
+the task's ``date_updated``, in a second store (``get_comment_cache``) with
+its own file and size budget, so comments never evict list metadata.
+
+Entries live in one SQLite table keyed by (kind, key), each with its own
+expiry. Writes are single transactions, so a crashed or concurrent CLI run
+never leaves a half-written store, and the table is bounded in size with
+least-recently-used eviction. Lookups are answered from an in-process copy
+after the first read, touching the database once per entry per process.
+
+Usage:
+    cache = get_metadata_cache()
+    statuses = cache.list_metadata(client, list_id)["statuses"]
+    fields = cache.custom_fields(client, list_id)["fields"]
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import serialization
+
+# Entry kinds and the client call that fills them
+KIND_LIST = "list"
+KIND_FIELDS = "fields"
+KIND_MEMBERS = "members"
+KIND_COMMENTS = "comments"
+
+
+class MetadataCache:
+    """
+    SQLite-backed cache of slow-changing list metadata.
+
+    Entries are evicted least-recently-used once the stored values exceed
+    ``max_bytes``; expired entries are dropped when next read.
+    """
+
+    DEFAULT_PATH = Path.home() / ".clickup_framework" / "cache" / "metadata.db"
+    DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+    DEFAULT_TTL = 3600  # 1 hour in seconds
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES, ttl: int = DEFAULT_TTL):
+        """
+        Initialize the metadata cache.
+
+        Args:
+            path: SQLite database file (default: ~/.clickup_framework/cache/metadata.db)
+            max_bytes: Total size of cached values before LRU eviction (default: 5 MB)
+            ttl: Default entry time-to-live in seconds (default: 3600 = 1 hour)
+        """
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # (kind, key) -> (value, expires_at) for entries already read or written by this process
+        self._memo: Dict[Tuple[str, str], Tuple[Any, float]] = {}
+        self._conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                " kind TEXT, key TEXT, body TEXT, size INTEGER, expires_at REAL, accessed_at REAL,"
+                " PRIMARY KEY (kind, key))"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_metadata_accessed ON metadata(accessed_at)")
+        try:
+            self.path.chmod(0o600)
+        except OSError:
+            # On Windows, chmod may not work as expected
+            pass
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """
+        Return a cached value, or None if missing or expired.
+
+        Args:
+            kind: Entry kind, e.g. KIND_LIST
+            key: Entry key within the kind, usually a list ID
+        """
+        key = str(key)
+        now = time.time()
+        memo = self._memo.get((kind, key))
+        if memo is not None:
+            if memo[1] > now:
+                return memo[0]
+            self._memo.pop((kind, key), None)
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM metadata WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+            if row is None:
+                return None
+            body, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM metadata WHERE kind = ? AND key = ?", (kind, key))
+                return None
+            self._conn.execute(
+                "UPDATE metadata SET accessed_at = ? WHERE kind = ? AND key = ?", (now, kind, key)
+            )
+        try:
+            value = serialization.loads(body)
+        except ValueError:
+            return None
+        self._memo[(kind, key)] = (value, expires_at)
+        return value
+
+    def set(self, kind: str, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            kind: Entry kind, e.g. KIND_LIST
+            key: Entry key within the kind, usually a list ID
+            value: JSON-serializable value
+            ttl: Time-to-live in seconds (default: the cache's ttl)
+        """
+        key = str(key)
+        body = serialization.dumps(value)
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata (kind, key, body, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, key, body, len(body), expires_at, now),
+            )
+            self._evict()
+        self._memo[(kind, key)] = (value, expires_at)
+
+    def _evict(self) -> None:
+        """Delete expired entries, then least-recently-used ones until under max_bytes. Caller holds the lock."""
+        self._conn.execute("DELETE FROM metadata WHERE expires_at <= ?", (time.time(),))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM metadata").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for kind, key, size in self._conn.execute(
+            "SELECT kind, key, size FROM metadata ORDER BY accessed_at"
+        ).fetchall():
+            self._conn.execute("DELETE FROM metadata WHERE kind = ? AND key = ?", (kind, key))
+            self._memo.pop((kind, key), None)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def get_or_fetch(self, kind: str, key: str, fetch: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """
+        Return a cached value, calling ``fetch`` and storing its result on a miss.
+
+        Args:
+            kind: Entry kind, e.g. KIND_LIST
+            key: Entry key within the kind
+            fetch: Zero-argument callable returning the fresh value
+            ttl: Time-to-live in seconds for a fetched value
+        """
+        value = self.get(kind, key)
+        if value is None:
+            value = fetch()
+            self.set(kind, key, value, ttl)
+        return value
+
+    def list_metadata(self, client, list_id: str) -> Dict[str, Any]:
+        """Return ``client.get_list(list_id)`` through the cache."""
+        return self.get_or_fetch(KIND_LIST, list_id, lambda: client.get_list(list_id))
+
+    def custom_fields(self, client, list_id: str) -> Dict[str, Any]:
+        """Return ``client.get_accessible_custom_fields(list_id)`` through the cache."""
+        return self.get_or_fetch(KIND_FIELDS, list_id, lambda: client.get_accessible_custom_fields(list_id))
+
+    def list_members(self, client, list_id: str) -> Dict[str, Any]:
+        """Return ``client.get_list_members(list_id)`` through the cache."""
+        return self.get_or_fetch(KIND_MEMBERS, list_id, lambda: client.get_list_members(list_id))
+
+    def invalidate(self, kind: Optional[str] = None, key: Optional[str] = None) -> None:
+        """
+        Drop cached entries.
+
+        Args:
+            kind: Only drop entries of this kind (default: every kind)
+            key: Only drop entries with this key (default: every key)
+        """
+        clauses, params = [], []
+        if kind is not None:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if key is not None:
+            clauses.append("key = ?")
+            params.append(str(key))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM metadata{where}", params)
+        self._memo = {
+            memo_key: entry for memo_key, entry in self._memo.items()
+            if (kind is not None and memo_key[0] != kind) or (key is not None and memo_key[1] != str(key))
+        }
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.invalidate()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """
+    Get the shared MetadataCache instance (singleton pattern).
+
+    Returns:
+        MetadataCache instance at the default path
+    """
+    if not hasattr(get_metadata_cache, '_instance'):
+        get_metadata_cache._instance = MetadataCache()
+    return get_metadata_cache._instance
+
+
+# Comments are larger and more numerous than list metadata, so they get their own store
+COMMENT_CACHE_PATH = Path.home() / ".clickup_framework" / "cache" / "comments.db"
+COMMENT_CACHE_MAX_BYTES = 20 * 1024 * 1024
+
+
+def get_comment_cache() -> MetadataCache:
+    """
+    Get the shared cache of task comments (singleton pattern).
+
+    Returns:
+        MetadataCache instance at ~/.clickup_framework/cache/comments.db (20 MB budget)
+    """
+    if not hasattr(get_comment_cache, '_instance'):
+        get_comment_cache._instance = MetadataCache(path=COMMENT_CACHE_PATH, max_bytes=COMMENT_CACHE_MAX_BYTES)
+    return get_comment_cache._instance
@@ -0,0 +1,508 @@
+"""
+Workspace Mirror
+
+Local SQLite copy of a workspace's spaces, folders, lists, tasks, task tags
+and dependencies, so display commands can read large workspaces without
+paging through the API on every run.
+
+``sync`` refreshes the structure (a handful of requests) and then fetches
+only tasks updated since the previous sync using ``date_updated_gt`` on the
+team task endpoint. The incremental query cannot see deleted tasks, so a
+full sync replaces the task set; it runs on the first sync, when requested,
+and once ``FULL_SYNC_INTERVAL`` has passed. Tasks in lists that disappear
+from the structure are dropped on every sync.
+
+Usage:
+    mirror = WorkspaceMirror()
+    mirror.sync(ClickUpClient(), team_id)
+    tasks = mirror.get_tasks(list_ids=["901"], include_closed=True)
+
+Or from the CLI: ``cum sync``, then ``cum h --all --mirror`` (or set
+``CLICKUP_MIRROR=1``).
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from . import serialization
+from .pagination import DEFAULT_PREFETCH, iter_pages
+
+logger = logging.getLogger(__name__)
+
+# Re-fetch tasks updated this long before the previous high-water mark, so
+# updates that land while a sync is paging are not missed
+SYNC_OVERLAP_MS = 60_000
+
+# Incremental syncs cannot see deletions; replace the task set this often
+FULL_SYNC_INTERVAL = 24 * 3600
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS sync_state ("
+    " team_id TEXT PRIMARY KEY, synced_at REAL, full_synced_at REAL, high_water INTEGER)",
+    "CREATE TABLE IF NOT EXISTS spaces (id TEXT PRIMARY KEY, team_id TEXT, body TEXT)",
+    "CREATE TABLE IF NOT EXISTS space_tags (space_id TEXT, name TEXT, body TEXT, PRIMARY KEY (space_id, name))",
+    "CREATE TABLE IF NOT EXISTS folders (id TEXT PRIMARY KEY, team_id TEXT, space_id TEXT, body TEXT)",
+    "CREATE TABLE IF NOT EXISTS lists ("
+    " id TEXT PRIMARY KEY, team_id TEXT, space_id TEXT, folder_id TEXT, body TEXT)",
+    "CREATE TABLE IF NOT EXISTS tasks ("
+    " id TEXT PRIMARY KEY, team_id TEXT, space_id TEXT, folder_id TEXT, list_id TEXT, parent TEXT,"
+    " status_type TEXT, date_created INTEGER, date_updated INTEGER, body TEXT)",
+    "CREATE TABLE IF NOT EXISTS task_assignees (task_id TEXT, user_id TEXT, PRIMARY KEY (task_id, user_id))",
+    "CREATE TABLE IF NOT EXISTS task_tags (task_id TEXT, name TEXT, PRIMARY KEY (task_id, name))",
+    "CREATE TABLE IF NOT EXISTS dependencies ("
+    " task_id TEXT, depends_on TEXT, type INTEGER, PRIMARY KEY (task_id, depends_on))",
+    "CREATE INDEX IF NOT EXISTS idx_folders_space ON folders(space_id)",
+    "CREATE INDEX IF NOT EXISTS idx_lists_space ON lists(space_id)",
+    "CREATE INDEX IF NOT EXISTS idx_lists_folder ON lists(folder_id)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_team ON tasks(team_id)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_list ON tasks(list_id)",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_parent ON tasks(parent)",
+    "CREATE INDEX IF NOT EXISTS idx_task_assignees_user ON task_assignees(user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_task_tags_name ON task_tags(name)",
+    "CREATE INDEX IF NOT EXISTS idx_dependencies_depends_on ON dependencies(depends_on)",
+)
+
+
+def _ref_id(value: Any) -> Optional[str]:
+    """Return the ID of a ``{"id": ...}`` reference (or a bare ID)."""
+    if isinstance(value, dict):
+        value = value.get("id")
+    return str(value) if value not in (None, "") else None
+
+
+def _as_ms(value: Any) -> int:
+    """Parse a ClickUp millisecond timestamp string, treating junk as 0."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def format_age(seconds: float) -> str:
+    """Format an age in seconds as e.g. '45s', '12m' or '3h'."""
+    seconds = max(0, int(seconds))
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+
+class WorkspaceMirror:
+    """
+    SQLite-backed mirror of one or more workspaces.
+
+    Tasks are stored as their API payloads with the columns needed for
+    filtering (list, parent, status type, assignees, tags) alongside, so
+    reads return the same dicts the API would.
+    """
+
+    DEFAULT_PATH = Path.home() / ".clickup_framework" / "cache" / "mirror.db"
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open (or create) the mirror database.
+
+        Args:
+            path: SQLite database file (default: ~/.clickup_framework/cache/mirror.db)
+        """
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+        try:
+            self.path.chmod(0o600)
+        except OSError:
+            # On Windows, chmod may not work as expected
+            pass
+
+    @classmethod
+    def open_existing(cls, path: Optional[Path] = None) -> Optional["WorkspaceMirror"]:
+        """Open the mirror only if it has been synced before, else return None."""
+        path = Path(path or cls.DEFAULT_PATH)
+        return cls(path) if path.exists() else None
+
+    # ==================== Sync ====================
+
+    def sync(
+        self,
+        client,
+        team_id: str,
+        full: bool = False,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Dict[str, Any]:
+        """
+        Refresh the mirror of a workspace.
+
+        Args:
+            client: ClickUpClient used for the requests
+            team_id: Workspace (team) ID
+            full: Replace the whole task set instead of fetching changes only
+            prefetch: Task pages to keep in flight
+
+        Returns:
+            Dict with ``full``, ``spaces``, ``folders``, ``lists``, ``tasks``
+            (tasks fetched), ``removed`` (tasks dropped) and ``seconds``
+        """
+        team_id = str(team_id)
+        started = time.time()
+        state = self.sync_state(team_id)
+        full = (
+            full
+            or state is None
+            or not state["full_synced_at"]
+            or started - state["full_synced_at"] > FULL_SYNC_INTERVAL
+        )
+
+        spaces, folders, lists, tags = self._fetch_structure(client, team_id)
+
+        params: Dict[str, Any] = {"subtasks": True, "include_closed": True}
+        if not full and state["high_water"]:
+            params["date_updated_gt"] = max(0, state["high_water"] - SYNC_OVERLAP_MS)
+        fetched = 0
+        high_water = 0 if full else (state["high_water"] or 0)
+        seen = set()
+        rows: List[Dict[str, Any]] = []
+
+        for task in iter_pages(
+            lambda **p: client.get_team_tasks(team_id, stream=True, **p), prefetch=prefetch, **params
+        ):
+            task = dict(task)
+            rows.append(task)
+            seen.add(str(task["id"]))
+            high_water = max(high_water, _as_ms(task.get("date_updated")))
+            fetched += 1
+            if len(rows) >= 500:
+                self._store_tasks(team_id, rows)
+                rows = []
+
+        with self._lock, self._conn:
+            self._store_structure(team_id, spaces, folders, lists, tags)
+            if rows:
+                self._upsert_tasks(team_id, rows)
+            removed = self._prune_tasks(team_id, seen if full else None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)",
+                (team_id, started, started if full else state["full_synced_at"], high_water),
+            )
+
+        return {
+            "full": full,
+            "spaces": len(spaces),
+            "folders": len(folders),
+            "lists": len(lists),
+            "tasks": fetched,
+            "removed": removed,
+            "seconds": time.time() - started,
+        }
+
+    def _fetch_structure(self, client, team_id: str):
+        """Fetch spaces (with tags), folders and lists of a workspace."""
+        spaces = client.get_team_spaces(team_id).get("spaces", [])
+        folders: List[Dict[str, Any]] = []
+        lists: List[Dict[str, Any]] = []
+        tags: Dict[str, List[Dict[str, Any]]] = {}
+        for space in spaces:
+            space_id = str(space["id"])
+            for folder in client.get_space_folders(space_id).get("folders", []):
+                folder = dict(folder, space=folder.get("space") or {"id": space_id})
+                folders.append(folder)
+                for list_obj in folder.get("lists", []):
+                    lists.append(dict(list_obj, folder={"id": folder["id"], "name": folder.get("name")},
+                                      space={"id": space_id}))
+            for list_obj in client.get_space_lists(space_id).get("lists", []):
+                lists.append(dict(list_obj, space=list_obj.get("space") or {"id": space_id}))
+            try:
+                tags[space_id] = client.get_space_tags(space_id).get("tags", [])
+            except Exception as e:
+                # Tags are optional per space (feature can be disabled)
+                logger.debug(f"Skipping tags for space {space_id}: {e}")
+        return spaces, folders, lists, tags
+
+    def _store_structure(self, team_id, spaces, folders, lists, tags) -> None:
+        """Replace the structure tables of a workspace. Caller holds the lock."""
+        conn = self._conn
+        old_spaces = [r[0] for r in conn.execute("SELECT id FROM spaces WHERE team_id = ?", (team_id,))]
+        conn.executemany("DELETE FROM space_tags WHERE space_id = ?", [(s,) for s in old_spaces])
+        for table in ("spaces", "folders", "lists"):
+            conn.execute(f"DELETE FROM {table} WHERE team_id = ?", (team_id,))
+        conn.executemany(
+            "INSERT OR REPLACE INTO spaces VALUES (?, ?, ?)",
+            [(str(s["id"]), team_id, serialization.dumps(s)) for s in spaces],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO folders VALUES (?, ?, ?, ?)",
+            [(str(f["id"]), team_id, _ref_id(f.get("space")), serialization.dumps(f)) for f in folders],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO lists VALUES (?, ?, ?, ?, ?)",
+            [
+                (str(l["id"]), team_id, _ref_id(l.get("space")), _ref_id(l.get("folder")),
+                 serialization.dumps(l))
+                for l in lists
+            ],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO space_tags VALUES (?, ?, ?)",
+            [(space_id, t.get("name"), serialization.dumps(t)) for space_id, ts in tags.items() for t in ts],
+        )
+
+    def _store_tasks(self, team_id: str, tasks: Sequence[Dict[str, Any]]) -> None:
+        with self._lock, self._conn:
+            self._upsert_tasks(team_id, tasks)
+
+    def _upsert_tasks(self, team_id: str, tasks: Sequence[Dict[str, Any]]) -> None:
+        """Insert or replace tasks with their assignee, tag and dependency rows. Caller holds the lock."""
+        conn = self._conn
+        ids = [(str(t["id"]),) for t in tasks]
+        for table in ("task_assignees", "task_tags", "dependencies"):
+            conn.executemany(f"DELETE FROM {table} WHERE task_id = ?", ids)
+        conn.executemany(
+            "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    str(t["id"]), team_id, _ref_id(t.get("space")), _ref_id(t.get("folder")),
+                    _ref_id(t.get("list")), _ref_id(t.get("parent")),
+                    (t.get("status") or {}).get("type") if isinstance(t.get("status"), dict) else None,
+                    _as_ms(t.get("date_created")), _as_ms(t.get("date_updated")),
+                    serialization.dumps(t),
+                )
+                for t in tasks
+            ],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO task_assignees VALUES (?, ?)",
+            [(str(t["id"]), _ref_id(a)) for t in tasks for a in t.get("assignees") or [] if _ref_id(a)],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO task_tags VALUES (?, ?)",
+            [(str(t["id"]), tag.get("name")) for t in tasks for tag in t.get("tags") or [] if tag.get("name")],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO dependencies VALUES (?, ?, ?)",
+            [
+                (str(d["task_id"]), str(d["depends_on"]), d.get("type"))
+                for t in tasks
+                for d in t.get("dependencies") or []
+                if d.get("task_id") and d.get("depends_on")
+            ],
+        )
+
+    def _prune_tasks(self, team_id: str, keep: Optional[set]) -> int:
+        """
+        Drop tasks whose list is gone and, with ``keep``, tasks not in it. Caller holds the lock.
+
+        Returns:
+            Number of tasks removed
+        """
+        conn = self._conn
+        stale = {
+            row[0]
+            for row in conn.execute(
+                "SELECT id FROM tasks WHERE team_id = ? AND list_id NOT IN (SELECT id FROM lists)", (team_id,)
+            )
+        }
+        if keep is not None:
+            stale.update(
+                row[0] for row in conn.execute("SELECT id FROM tasks WHERE team_id = ?", (team_id,))
+                if row[0] not in keep
+            )
+        rows = [(task_id,) for task_id in stale]
+        for table in ("task_assignees", "task_tags", "dependencies"):
+            conn.executemany(f"DELETE FROM {table} WHERE task_id = ?", rows)
+        conn.executemany("DELETE FROM tasks WHERE id = ?", rows)
+        return len(rows)
+
+    # ==================== Single-task updates ====================
+
+    def upsert_task(self, task: Dict[str, Any], team_id: Optional[str] = None) -> bool:
+        """
+        Insert or replace one task outside a sync (e.g. from a webhook event).
+
+        Args:
+            task: Task payload as returned by the API
+            team_id: Workspace ID (default: the task's ``team_id``)
+
+        Returns:
+            True if stored; False when the workspace has never been synced
+        """
+        team_id = str(team_id or task.get("team_id") or "")
+        if not self.is_synced(team_id):
+            return False
+        with self._lock, self._conn:
+            self._upsert_tasks(team_id, [task])
+        return True
+
+    def remove_task(self, task_id: str) -> int:
+        """
+        Drop a task and its subtasks (ClickUp deletes them together).
+
+        Returns:
+            Number of tasks removed
+        """
+        with self._lock, self._conn:
+            ids = [str(task_id)]
+            pending = list(ids)
+            while pending:
+                placeholders = ", ".join("?" for _ in pending)
+                pending = [row[0] for row in self._conn.execute(
+                    f"SELECT id FROM tasks WHERE parent IN ({placeholders})", pending)]
+                ids.extend(pending)
+            rows = [(item,) for item in ids]
+            for table in ("task_assignees", "task_tags", "dependencies"):
+                self._conn.executemany(f"DELETE FROM {table} WHERE task_id = ?", rows)
+            return sum(self._conn.execute("DELETE FROM tasks WHERE id = ?", row).rowcount for row in rows)
+
+    # ==================== Reads ====================
+
+    def sync_state(self, team_id: str) -> Optional[Dict[str, Any]]:
+        """Return ``synced_at``, ``full_synced_at``, ``high_water`` and ``tasks`` for a workspace, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_at, full_synced_at, high_water FROM sync_state WHERE team_id = ?", (str(team_id),)
+            ).fetchone()
+            if row is None:
+                return None
+            count = self._conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE team_id = ?", (str(team_id),)
+            ).fetchone()[0]
+        return {"synced_at": row[0], "full_synced_at": row[1], "high_water": row[2], "tasks": count}
+
+    def is_synced(self, team_id: Optional[str]) -> bool:
+        """Whether a workspace has been synced into this mirror."""
+        return bool(team_id) and self.sync_state(team_id) is not None
+
+    def _rows(self, sql: str, params: Iterable[Any] = ()) -> List[Any]:
+        with self._lock:
+            return [serialization.loads(row[0]) for row in self._conn.execute(sql, tuple(params))]
+
+    def _one(self, table: str, item_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._rows(f"SELECT body FROM {table} WHERE id = ?", (str(item_id),))
+        return rows[0] if rows else None
+
+    def get_space(self, space_id: str) -> Optional[Dict[str, Any]]:
+        """Return a space with ``folders`` (each with ``lists``) and folderless ``lists`` filled in."""
+        space = self._one("spaces", space_id)
+        if space is None:
+            return None
+        space["folders"] = [
+            dict(folder, lists=self._rows("SELECT body FROM lists WHERE folder_id = ? ORDER BY rowid", (folder["id"],)))
+            for folder in self._rows("SELECT body FROM folders WHERE space_id = ? ORDER BY rowid", (str(space_id),))
+        ]
+        folder_ids = {str(f["id"]) for f in space["folders"]}
+        space["lists"] = [
+            l for l in self._rows("SELECT body FROM lists WHERE space_id = ? ORDER BY rowid", (str(space_id),))
+            if _ref_id(l.get("folder")) not in folder_ids
+        ]
+        return space
+
+    def get_folder(self, folder_id: str) -> Optional[Dict[str, Any]]:
+        """Return a folder with its ``lists``."""
+        folder = self._one("folders", folder_id)
+        if folder is not None:
+            folder["lists"] = self._rows("SELECT body FROM lists WHERE folder_id = ? ORDER BY rowid", (str(folder_id),))
+        return folder
+
+    def get_list(self, list_id: str) -> Optional[Dict[str, Any]]:
+        """Return a list as stored from its folder or space listing."""
+        return self._one("lists", list_id)
+
+    def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Return a mirrored task."""
+        return self._one("tasks", task_id)
+
+    def get_space_tags(self, space_id: str) -> List[Dict[str, Any]]:
+        """Return the tag definitions of a space."""
+        return self._rows("SELECT body FROM space_tags WHERE space_id = ? ORDER BY name", (str(space_id),))
+
+    def get_dependencies(self, task_id: str) -> List[Dict[str, Any]]:
+        """Return dependency rows (``task_id``, ``depends_on``, ``type``) involving a task."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_id, depends_on, type FROM dependencies WHERE task_id = ? OR depends_on = ?",
+                (str(task_id), str(task_id)),
+            ).fetchall()
+        return [{"task_id": r[0], "depends_on": r[1], "type": r[2]} for r in rows]
+
+    def get_tasks(
+        self,
+        team_id: Optional[str] = None,
+        list_ids: Optional[Sequence[str]] = None,
+        assignees: Optional[Sequence[Any]] = None,
+        tags: Optional[Sequence[str]] = None,
+        include_closed: bool = False,
+        subtasks: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query mirrored tasks with the team/list task endpoints' filters.
+
+        Args:
+            team_id: Restrict to one workspace
+            list_ids: Restrict to these lists
+            assignees: Tasks assigned to any of these user IDs
+            tags: Tasks carrying any of these tags
+            include_closed: Include tasks whose status type is "closed"
+            subtasks: Include subtasks (False = top-level tasks only)
+
+        Returns:
+            Task payloads, newest first
+        """
+        clauses, params = [], []
+        if team_id is not None:
+            clauses.append("team_id = ?")
+            params.append(str(team_id))
+        for column, values, sql in (
+            ("list_id", list_ids, "list_id IN ({})"),
+            ("user_id", assignees, "id IN (SELECT task_id FROM task_assignees WHERE user_id IN ({}))"),
+            ("name", tags, "id IN (SELECT task_id FROM task_tags WHERE name IN ({}))"),
+        ):
+            if values is not None:
+                values = [str(v) for v in values]
+                clauses.append(sql.format(", ".join("?" for _ in values) or "NULL"))
+                params.extend(values)
+        if not include_closed:
+            clauses.append("COALESCE(status_type, '') != 'closed'")
+        if not subtasks:
+            clauses.append("parent IS NULL")
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._rows(f"SELECT body FROM tasks{where} ORDER BY date_created DESC, id", params)
+
+    def resolve_container(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Identify a space, folder, list or task ID from the mirror.
+
+        Returns:
+            The same shape as commands.utils.resolve_container_id, or None if unknown
+        """
+        space = self.get_space(item_id)
+        if space is not None:
+            return {"type": "space", "id": item_id, "data": space}
+        folder = self.get_folder(item_id)
+        if folder is not None:
+            return {"type": "folder", "id": item_id, "data": folder}
+        if self.get_list(item_id) is not None:
+            return {"type": "list", "id": item_id}
+        task = self.get_task(item_id)
+        if task is not None and _ref_id(task.get("list")):
+            return {"type": "task", "id": item_id, "data": task, "list_id": _ref_id(task.get("list"))}
+        return None
+
+    def clear(self) -> None:
+        """Drop every mirrored workspace."""
+        with self._lock, self._conn:
+            for table in ("sync_state", "spaces", "space_tags", "folders", "lists",
+                          "tasks", "task_assignees", "task_tags", "dependencies"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"WorkspaceMirror(path={self.path})"
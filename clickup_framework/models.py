@@ -0,0 +1,319 @@
+"""
+Compact Task Model
+
+A workspace-wide task fetch holds tens of thousands of API dicts, each
+carrying its own copies of the same status, priority, user, tag and
+list objects plus long description and custom-field payloads that most
+views never read. ``Task`` stores one task in a ``__slots__`` object:
+
+- small flat objects (status, priority, users, tags, list/folder/space
+  references) are shared between the tasks of one batch
+- long strings and nested payloads (description, text_content,
+  custom_fields, checklists, ...) are kept as encoded JSON bytes until one
+  of them is first accessed, which decodes them all once
+- the fields components read most are plain attributes: ``task.status``,
+  ``task.priority``, ``task.assignee_names``, ``task.tag_names``, ...
+
+``Task`` is a read-mostly ``Mapping``, so existing code using
+``task["status"]["status"]`` or ``task.get("assignees", [])`` keeps
+working. Assigning a key stores an override on the task. Values are
+read-only: small list fields (assignees, tags, ...) are stored as tuples and
+each read returns a new list, so ``task["tags"].append(...)`` is lost, and
+shared nested objects must not be mutated in place. Assign a new value
+instead (``task["tags"] = tags + [tag]``).
+
+Usage:
+    tasks = TasksAPI(client).get_list_tasks("list_id", compact=True)["tasks"]
+    open_tasks = [t for t in tasks if t.status_type != "closed"]
+
+    compact = compact_tasks(raw_tasks)   # one batch shares its small objects
+    raw = compact[0].to_dict()
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import serialization
+
+# Strings up to this length stay inline; longer ones are stored encoded
+SHORT_STRING = 64
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class Interner:
+    """
+    Shares identical small objects between the tasks of one batch.
+
+    Only flat objects (no nested lists or objects) are shared. Keep one
+    interner per batch rather than per process, so unique values do not
+    accumulate in a long-running server.
+    """
+
+    __slots__ = ("_objects", "_layouts")
+
+    def __init__(self):
+        self._objects: Dict[tuple, Dict[str, Any]] = {}
+        self._layouts: Dict[tuple, Tuple[Dict[str, int], tuple]] = {}
+
+    def shared(self, obj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the batch's copy of a flat object, or None if the object is not flat."""
+        # API objects keep one type per field, so items alone identify an object
+        key = tuple(obj.items())
+        try:
+            return self._objects.setdefault(key, obj)
+        except TypeError:
+            # A nested list or object: not flat
+            return None
+
+    def layout(self, light_keys: tuple, heavy_keys: tuple) -> Tuple[Dict[str, int], tuple]:
+        """Return the shared (key -> position index, heavy keys) pair for a key layout."""
+        key = (light_keys, heavy_keys)
+        layout = self._layouts.get(key)
+        if layout is None:
+            index = {name: position for position, name in enumerate(light_keys)}
+            layout = self._layouts[key] = (index, heavy_keys)
+        return layout
+
+
+def _compact_value(value: Any, interner: Interner) -> Tuple[bool, Any]:
+    """Return (inline, stored value); lists become tuples, flat objects are shared."""
+    if isinstance(value, _SCALARS):
+        return not (type(value) is str and len(value) > SHORT_STRING), value
+    if type(value) is dict:
+        shared = interner.shared(value)
+        return shared is not None, shared
+    if type(value) is list:
+        items = []
+        for item in value:
+            if type(item) is dict:
+                item = interner.shared(item)
+                if item is None:
+                    return False, None
+            elif not isinstance(item, _SCALARS) or (type(item) is str and len(item) > SHORT_STRING):
+                return False, None
+            items.append(item)
+        return True, tuple(items)
+    return False, None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class Task(Mapping):
+    """
+    Compact, dict-compatible ClickUp task.
+
+    Attributes:
+        id, custom_id, name, parent: As in the API
+        status, status_type, status_color: Status name ("in progress"), type ("open"/"closed"/...) and color
+        priority: Priority name ("urgent", "high", ...) or None
+        assignee_ids, assignee_names: Tuples of assignee user IDs and usernames
+        tag_names: Tuple of tag names
+        list_id: ID of the task's home list
+        due_date, date_updated: Milliseconds since the epoch, or None
+    """
+
+    __slots__ = (
+        "id", "custom_id", "name", "parent",
+        "status", "status_type", "status_color", "priority",
+        "assignee_ids", "assignee_names", "tag_names", "list_id",
+        "due_date", "date_updated",
+        "_index", "_values", "_heavy_keys", "_heavy", "_extra",
+    )
+
+    def __init__(self, data: Dict[str, Any], interner: Optional[Interner] = None):
+        """
+        Build a compact task from an API task dict.
+
+        Args:
+            data: Task as returned by the API
+            interner: Shared objects for the batch (default: a new one for this task)
+        """
+        interner = interner or Interner()
+        light_keys: List[str] = []
+        values: List[Any] = []
+        heavy: Dict[str, Any] = {}
+        for key, value in data.items():
+            inline, stored = _compact_value(value, interner)
+            if inline:
+                light_keys.append(key)
+                values.append(stored)
+            else:
+                heavy[key] = value
+        self._index, self._heavy_keys = interner.layout(tuple(light_keys), tuple(heavy))
+        self._values = tuple(values)
+        self._heavy = serialization.dumps_bytes(heavy) if heavy else None
+        self._extra: Optional[Dict[str, Any]] = None
+        self._derive_all()
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any], interner: Optional[Interner] = None) -> "Task":
+        """Build a compact task from an API task dict (returns Task instances unchanged)."""
+        if isinstance(data, cls):
+            return data
+        return cls(data, interner)
+
+    def _derive_all(self) -> None:
+        get = self.get
+        self.id = get("id")
+        self.custom_id = get("custom_id")
+        self.name = get("name")
+        self.parent = get("parent")
+        self._derive_status(get("status"))
+        self._derive_priority(get("priority"))
+        self._derive_assignees(get("assignees"))
+        self._derive_tags(get("tags"))
+        self._derive_list(get("list"))
+        self.due_date = _as_int(get("due_date"))
+        self.date_updated = _as_int(get("date_updated"))
+
+    def _derive_status(self, status: Any) -> None:
+        if isinstance(status, Mapping):
+            self.status = _intern(status.get("status"))
+            self.status_type = _intern(status.get("type"))
+            self.status_color = _intern(status.get("color"))
+        else:
+            self.status = _intern(status)
+            self.status_type = self.status_color = None
+
+    def _derive_priority(self, priority: Any) -> None:
+        self.priority = _intern(priority.get("priority") if isinstance(priority, Mapping) else priority)
+
+    def _derive_assignees(self, assignees: Any) -> None:
+        users = [user for user in assignees or () if isinstance(user, Mapping)]
+        self.assignee_ids = tuple(user.get("id") for user in users)
+        self.assignee_names = tuple(_intern(user.get("username")) for user in users)
+
+    def _derive_tags(self, tags: Any) -> None:
+        self.tag_names = tuple(
+            _intern(tag.get("name") if isinstance(tag, Mapping) else tag) for tag in tags or ()
+        )
+
+    def _derive_list(self, list_ref: Any) -> None:
+        self.list_id = list_ref.get("id") if isinstance(list_ref, Mapping) else None
+
+    _DERIVED = {
+        "id": lambda self, value: setattr(self, "id", value),
+        "custom_id": lambda self, value: setattr(self, "custom_id", value),
+        "name": lambda self, value: setattr(self, "name", value),
+        "parent": lambda self, value: setattr(self, "parent", value),
+        "status": _derive_status,
+        "priority": _derive_priority,
+        "assignees": _derive_assignees,
+        "tags": _derive_tags,
+        "list": _derive_list,
+        "due_date": lambda self, value: setattr(self, "due_date", _as_int(value)),
+        "date_updated": lambda self, value: setattr(self, "date_updated", _as_int(value)),
+    }
+
+    def __getitem__(self, key: str) -> Any:
+        extra = self._extra
+        if extra is not None and key in extra:
+            return extra[key]
+        position = self._index.get(key)
+        if position is not None:
+            value = self._values[position]
+            return list(value) if type(value) is tuple else value
+        if key in self._heavy_keys:
+            return self._decode_heavy()[key]
+        raise KeyError(key)
+
+    def _decode_heavy(self) -> Dict[str, Any]:
+        """Decode the stored fields into overrides (once) and drop the encoded copy."""
+        if self._extra is None:
+            self._extra = {}
+        if self._heavy is not None:
+            for key, value in serialization.loads(self._heavy).items():
+                # Fields assigned before the first access keep their new value
+                self._extra.setdefault(key, value)
+            self._heavy = None
+        return self._extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
+        derive = self._DERIVED.get(key)
+        if derive is not None:
+            derive(self, value)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index or key in self._heavy_keys or (self._extra is not None and key in self._extra)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._index
+        yield from self._heavy_keys
+        if self._extra:
+            for key in self._extra:
+                if key not in self._index and key not in self._heavy_keys:
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the task as a plain API dict (decoding stored fields once)."""
+        result = {key: list(value) if type(value) is tuple else value
+                  for key, value in zip(self._index, self._values)}
+        if self._heavy is not None:
+            result.update(serialization.loads(self._heavy))
+        if self._extra:
+            result.update(self._extra)
+        return result
+
+    def copy(self) -> Dict[str, Any]:
+        """Return a plain dict copy, like dict.copy()."""
+        return self.to_dict()
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state)
+
+    def __repr__(self) -> str:
+        return f"Task(id={self.id!r}, name={self.name!r}, status={self.status!r})"
+
+
+def compact_tasks(tasks: Iterable[Dict[str, Any]]) -> List[Task]:
+    """Convert API task dicts to compact Tasks sharing one Interner."""
+    interner = Interner()
+    return [Task.from_api(task, interner) for task in tasks]
+
+
+def status_name(task: Mapping) -> Any:
+    """Status name of a Task or API task dict (None when unset)."""
+    if type(task) is Task:
+        return task.status
+    status = task.get("status")
+    return status.get("status") if isinstance(status, Mapping) else status
+
+
+def assignee_ids(task: Mapping) -> Tuple[Any, ...]:
+    """Assignee user IDs of a Task or API task dict."""
+    if type(task) is Task:
+        return task.assignee_ids
+    return tuple(user.get("id") for user in task.get("assignees") or ())
+
+
+def tag_names(task: Mapping) -> Tuple[Any, ...]:
+    """Tag names of a Task or API task dict."""
+    if type(task) is Task:
+        return task.tag_names
+    return tuple(tag.get("name") for tag in task.get("tags") or ())
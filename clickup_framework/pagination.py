@@ -0,0 +1,171 @@
+"""
+Pagination helpers
+
+Page-numbered ClickUp endpoints (list tasks, team tasks) return up to 100
+items per page plus a ``last_page`` flag. Walking them one page at a time
+costs one full round trip per page, so these helpers fetch a window of
+pages ahead in parallel while still yielding items strictly in page order.
+
+The first page is always fetched on its own: most lists fit in one page and
+speculative requests would only burn rate-limit budget.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH = 4
+
+
+def _is_last_page(result: Dict[str, Any], items: list) -> bool:
+    """A page is final when the API says so, omits the flag, or returns no items."""
+    return result.get("last_page", True) or not items
+
+
+def iter_pages(
+    fetch_page: Callable[..., Dict[str, Any]],
+    prefetch: int = DEFAULT_PREFETCH,
+    items_key: str = "tasks",
+    **params,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield items from every page of a paginated endpoint.
+
+    After the first page, up to ``prefetch`` pages are requested concurrently
+    on worker threads. Items are yielded in page order and speculative pages
+    beyond ``last_page`` are cancelled or discarded.
+
+    Args:
+        fetch_page: Callable accepting ``page=`` plus ``**params`` and returning the API payload
+        prefetch: Number of pages to keep in flight (1 = sequential)
+        items_key: Key of the item array in each payload (default: "tasks")
+        **params: Extra query parameters passed to every page request
+
+    Yields:
+        Items from each page, in order
+
+    Raises:
+        Any exception raised by fetch_page, after yielding all earlier pages
+    """
+    result = fetch_page(page=0, **params)
+    items = result.get(items_key, [])
+    yield from items
+    if _is_last_page(result, items):
+        return
+
+    if prefetch <= 1:
+        page = 1
+        while True:
+            result = fetch_page(page=page, **params)
+            items = result.get(items_key, [])
+            yield from items
+            if _is_last_page(result, items):
+                return
+            page += 1
+
+    pool = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="clickup-page")
+    pending = deque()
+    next_page = 1
+
+    def submit():
+        nonlocal next_page
+        pending.append(pool.submit(fetch_page, page=next_page, **params))
+        next_page += 1
+
+    try:
+        for _ in range(prefetch):
+            submit()
+        while pending:
+            result = pending.popleft().result()
+            items = result.get(items_key, [])
+            yield from items
+            if _is_last_page(result, items):
+                return
+            submit()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[..., Awaitable[Dict[str, Any]]],
+    prefetch: int = DEFAULT_PREFETCH,
+    items_key: str = "tasks",
+    **params,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async counterpart of iter_pages for coroutine fetchers.
+
+    Args:
+        fetch_page: Coroutine function accepting ``page=`` plus ``**params``
+        prefetch: Number of pages to keep in flight (1 = sequential)
+        items_key: Key of the item array in each payload (default: "tasks")
+        **params: Extra query parameters passed to every page request
+
+    Yields:
+        Items from each page, in order
+    """
+    import asyncio
+
+    result = await fetch_page(page=0, **params)
+    items = result.get(items_key, [])
+    for item in items:
+        yield item
+    if _is_last_page(result, items):
+        return
+
+    window = max(1, prefetch)
+    pending = deque()
+    next_page = 1
+
+    def submit():
+        nonlocal next_page
+        pending.append(asyncio.ensure_future(fetch_page(page=next_page, **params)))
+        next_page += 1
+
+    try:
+        for _ in range(window):
+            submit()
+        while pending:
+            result = await pending.popleft()
+            items = result.get(items_key, [])
+            for item in items:
+                yield item
+            if _is_last_page(result, items):
+                return
+            submit()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def collect_pages(
+    fetch_page: Callable[..., Dict[str, Any]],
+    prefetch: int = DEFAULT_PREFETCH,
+    items_key: str = "tasks",
+    **params,
+) -> list:
+    """
+    Collect every item from a paginated endpoint into a list.
+
+    Display commands prefer partial output over none, so a failing page stops
+    pagination with a warning and the items gathered so far are returned.
+
+    Args:
+        fetch_page: Callable accepting ``page=`` plus ``**params``
+        prefetch: Number of pages to keep in flight (1 = sequential)
+        items_key: Key of the item array in each payload (default: "tasks")
+        **params: Extra query parameters passed to every page request
+
+    Returns:
+        All items fetched before pagination finished or failed
+    """
+    items = []
+    try:
+        for item in iter_pages(fetch_page, prefetch=prefetch, items_key=items_key, **params):
+            items.append(item)
+    except Exception as e:
+        logger.warning(f"Pagination stopped after {len(items)} items: {e}")
+    return items
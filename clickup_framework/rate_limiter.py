@@ -3,11 +3,78 @@ Rate Limiter
 
 Implements token bucket algorithm for API rate limiting.
 Default: 100 requests per minute (ClickUp standard plan limit)
+
+ClickUp reports the real budget on every response through the
+``X-RateLimit-Limit``, ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset``
+headers. Feeding them to ``RateLimiter.update_from_headers`` replaces the
+guessed limit with the plan's actual one and spreads the remaining budget
+evenly until the window resets, so bulk jobs slow down before the server
+starts answering 429.
+
+``SharedRateLimiter`` keeps the same bucket in a lock-protected file under
+``~/.clickup_framework/rate_limit/`` so every local process using one API
+token draws from a single budget.
 """
 
+import hashlib
+import json
 import time
 import threading
-from typing import Optional
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+# fcntl is Unix-only, not available on Windows
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+LIMIT_HEADER = "X-RateLimit-Limit"
+REMAINING_HEADER = "X-RateLimit-Remaining"
+RESET_HEADER = "X-RateLimit-Reset"
+
+# Reset values above this are unix timestamps, smaller ones are seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+def _header_number(headers: Optional[Mapping[str, Any]], name: str) -> Optional[float]:
+    """Read a numeric header, tolerating missing, lower-cased or malformed values."""
+    if not headers:
+        return None
+    try:
+        value = headers.get(name)
+        if value is None:
+            value = headers.get(name.lower())
+    except AttributeError:
+        return None
+    if not isinstance(value, (str, bytes, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def rate_limit_reset_at(headers: Optional[Mapping[str, Any]], now: Optional[float] = None) -> Optional[float]:
+    """
+    Return the unix time at which the current rate-limit window resets.
+
+    Args:
+        headers: Response headers
+        now: Current time (defaults to time.time())
+
+    Returns:
+        Reset timestamp, or None if the response did not include one
+    """
+    reset = _header_number(headers, RESET_HEADER)
+    if reset is None:
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        return reset
+    return (time.time() if now is None else now) + reset
 
 
 class RateLimiter:
@@ -29,6 +96,78 @@ class RateLimiter:
         # Calculate token refill rate (tokens per second)
         self.refill_rate = requests_per_minute / 60.0
 
+        # Server-reported window, learned from response headers
+        self.window_remaining: Optional[int] = None
+        self.window_reset_at: Optional[float] = None
+        self.burst = self._burst_for(requests_per_minute)
+
+    @staticmethod
+    def _burst_for(requests_per_minute: int) -> int:
+        """Requests allowed back-to-back while pacing a server window (10% of the limit)."""
+        return max(1, requests_per_minute // 10)
+
+    def update_from_headers(self, headers: Optional[Mapping[str, Any]]) -> None:
+        """
+        Re-tune the bucket from ClickUp's rate-limit response headers.
+
+        Adopts the plan limit from ``X-RateLimit-Limit`` and, when remaining
+        budget and reset time are known, keeps at most ``burst`` tokens on hand
+        and refills the rest of the budget evenly until the window resets.
+        With no budget left, acquire() waits for the reset instead of letting
+        the request through to a 429.
+
+        Responses without rate-limit headers are ignored.
+
+        Args:
+            headers: Response headers (any mapping; lookup is case-tolerant)
+        """
+        limit = _header_number(headers, LIMIT_HEADER)
+        remaining = _header_number(headers, REMAINING_HEADER)
+
+        with self.lock:
+            now = time.time()
+            self._refill(now)
+
+            if limit is not None and limit >= 1 and int(limit) != self.max_tokens:
+                self.requests_per_minute = self.max_tokens = int(limit)
+                self.burst = self._burst_for(self.max_tokens)
+                if self.window_reset_at is None:
+                    self.refill_rate = self.max_tokens / 60.0
+                self.tokens = min(self.tokens, self.max_tokens)
+
+            reset_at = rate_limit_reset_at(headers, now)
+            if remaining is None or reset_at is None or reset_at <= now:
+                return
+
+            remaining = max(0, int(remaining))
+            if self.window_reset_at is not None and abs(reset_at - self.window_reset_at) < 1:
+                # Same window: responses can arrive out of order, trust the lowest count
+                remaining = min(remaining, self.window_remaining)
+
+            self.window_remaining = remaining
+            self.window_reset_at = reset_at
+            self.tokens = min(self.tokens, remaining, self.burst)
+            self.refill_rate = (remaining - self.tokens) / (reset_at - now)
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last update. Caller holds the lock."""
+        if self.window_reset_at is not None and now >= self.window_reset_at:
+            # Credit the old window up to its reset, then fall back to even pacing
+            self.tokens = min(
+                self.max_tokens,
+                self.tokens + max(0.0, self.window_reset_at - self.last_update) * self.refill_rate,
+            )
+            self.last_update = self.window_reset_at
+            self.window_reset_at = None
+            self.window_remaining = None
+            self.refill_rate = self.max_tokens / 60.0
+
+        elapsed = now - self.last_update
+        self.tokens = min(
+            self.max_tokens, self.tokens + elapsed * self.refill_rate
+        )
+        self.last_update = now
+
     def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
         """
         Acquire tokens for making requests.
@@ -53,19 +192,9 @@ class RateLimiter:
         start_time = time.time()
 
         while True:
-            with self.lock:
-                # Refill tokens based on time elapsed
-                now = time.time()
-                elapsed = now - self.last_update
-                self.tokens = min(
-                    self.max_tokens, self.tokens + elapsed * self.refill_rate
-                )
-                self.last_update = now
-
-                # Check if we have enough tokens
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
-                    return True
+            wait = self._try_acquire(tokens)
+            if wait == 0:
+                return True
 
             # Check timeout
             if timeout is not None:
@@ -73,25 +202,184 @@ class RateLimiter:
                     return False
 
             # Wait a bit before trying again
-            sleep_time = min(0.1, (tokens - self.tokens) / self.refill_rate)
-            time.sleep(sleep_time)
+            time.sleep(min(0.1, wait))
+
+    async def acquire_async(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire tokens without blocking the event loop.
+
+        Same semantics as acquire(), but waits with asyncio.sleep so many
+        coroutines can share one limiter.
+
+        Args:
+            tokens: Number of tokens to acquire (default: 1)
+            timeout: Maximum time to wait in seconds (None = wait forever)
+
+        Returns:
+            True if tokens acquired, False if timeout
+
+        Raises:
+            ValueError: If tokens requested exceeds max_tokens
+        """
+        if tokens > self.max_tokens:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens (max: {self.max_tokens})"
+            )
+
+        # Imported here so sync-only callers never pay for loading asyncio
+        import asyncio
+
+        start_time = time.time()
+
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait == 0:
+                return True
+
+            if timeout is not None:
+                if time.time() - start_time >= timeout:
+                    return False
+
+            await asyncio.sleep(min(0.1, wait))
+
+    def _try_acquire(self, tokens: int) -> float:
+        """
+        Refill the bucket and take tokens if enough are available.
+
+        Returns:
+            0 if the tokens were taken, otherwise the estimated seconds until they will be
+        """
+        with self.lock:
+            # Refill tokens based on time elapsed
+            now = time.time()
+            self._refill(now)
+
+            # Check if we have enough tokens
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                if self.window_remaining is not None:
+                    self.window_remaining = max(0, self.window_remaining - tokens)
+                return 0
+            if self.refill_rate <= 0:
+                # Window budget exhausted: nothing refills until the reset
+                return max(self.window_reset_at - now, 0.001)
+            return (tokens - self.tokens) / self.refill_rate
 
     def get_available_tokens(self) -> float:
         """Get current number of available tokens."""
         with self.lock:
-            now = time.time()
-            elapsed = now - self.last_update
-            tokens = min(self.max_tokens, self.tokens + elapsed * self.refill_rate)
-            return tokens
+            self._refill(time.time())
+            return self.tokens
 
     def reset(self):
         """Reset rate limiter to full capacity."""
         with self.lock:
             self.tokens = self.max_tokens
             self.last_update = time.time()
+            self.refill_rate = self.max_tokens / 60.0
+            self.window_remaining = None
+            self.window_reset_at = None
 
     def __repr__(self) -> str:
         return (
             f"RateLimiter(requests_per_minute={self.requests_per_minute}, "
             f"available_tokens={self.get_available_tokens():.2f})"
         )
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Token bucket shared across processes through a locked state file.
+
+    Each acquire or header update takes an exclusive lock on the file, loads
+    the bucket, applies the normal RateLimiter logic and writes it back, so
+    concurrent CLI runs, hooks and the MCP server respect one budget.
+    Without fcntl (Windows) the file is still shared but updates are not
+    serialized between processes.
+    """
+
+    STATE_DIR = Path.home() / ".clickup_framework" / "rate_limit"
+    _STATE_FIELDS = (
+        "requests_per_minute",
+        "max_tokens",
+        "tokens",
+        "last_update",
+        "refill_rate",
+        "burst",
+        "window_remaining",
+        "window_reset_at",
+    )
+
+    def __init__(self, requests_per_minute: int = 100, key: str = "default", state_dir: Optional[Path] = None):
+        """
+        Initialize shared rate limiter.
+
+        Args:
+            requests_per_minute: Limit used until the state file or response headers say otherwise
+            key: Name of the shared bucket (one per API token)
+            state_dir: Directory for state files (default: ~/.clickup_framework/rate_limit)
+        """
+        super().__init__(requests_per_minute)
+        # Re-entrant so the inherited methods can take it inside _shared_state
+        self.lock = threading.RLock()
+        self.state_file = Path(state_dir or self.STATE_DIR) / f"{key}.json"
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self.state_file.touch(mode=0o600, exist_ok=True)
+
+    @classmethod
+    def for_token(cls, api_token: str, requests_per_minute: int = 100, state_dir: Optional[Path] = None) -> "SharedRateLimiter":
+        """Create the shared limiter for an API token without writing the token to disk."""
+        key = hashlib.sha256(api_token.encode("utf-8")).hexdigest()[:16]
+        return cls(requests_per_minute, key=key, state_dir=state_dir)
+
+    @contextmanager
+    def _shared_state(self):
+        """Hold the file lock, load the shared bucket, and write it back on success."""
+        with self.lock, open(self.state_file, "a+") as f:
+            if HAS_FCNTL:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                self._load_state(f.read())
+                yield
+                f.seek(0)
+                f.truncate()
+                json.dump({name: getattr(self, name) for name in self._STATE_FIELDS}, f)
+                f.flush()
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _load_state(self, content: str) -> None:
+        """Adopt the bucket stored by other processes; keep local state if the file is empty or corrupt."""
+        try:
+            state = json.loads(content) if content else {}
+        except ValueError:
+            return
+        if not isinstance(state, dict):
+            return
+        for name in self._STATE_FIELDS:
+            if name in state:
+                setattr(self, name, state[name])
+
+    def _try_acquire(self, tokens: int) -> float:
+        with self._shared_state():
+            return super()._try_acquire(tokens)
+
+    def update_from_headers(self, headers: Optional[Mapping[str, Any]]) -> None:
+        with self._shared_state():
+            super().update_from_headers(headers)
+
+    def get_available_tokens(self) -> float:
+        with self._shared_state():
+            return super().get_available_tokens()
+
+    def reset(self):
+        with self._shared_state():
+            super().reset()
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedRateLimiter(requests_per_minute={self.requests_per_minute}, "
+            f"available_tokens={self.get_available_tokens():.2f}, state_file={self.state_file})"
+        )
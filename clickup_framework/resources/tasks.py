@@ -4,9 +4,11 @@ TasksAPI - High-level API for ClickUp task operations
 Provides convenient methods for task operations with automatic formatting support.
 """
 
-from typing import Dict, Any, Optional, List
+from collections.abc import Mapping
+from typing import Dict, Any, Optional, List, Iterator
 from difflib import SequenceMatcher
 from ..formatters import format_task, format_task_list
+from ..models import Interner, Task, compact_tasks
 
 
 class TasksAPI:
@@ -109,7 +111,7 @@ class TasksAPI:
 
         return None
 
-    def get(self, task_id: str, detail_level: Optional[str] = None, **params) -> Any:
+    def get(self, task_id: str, detail_level: Optional[str] = None, compact: bool = False, **params) -> Any:
         """
         Get task by ID.
 
@@ -117,21 +119,23 @@ class TasksAPI:
             task_id: Task ID
             detail_level: Format detail level (minimal|summary|detailed|full)
                          If None, returns raw JSON
+            compact: Return a compact models.Task instead of a dict
             **params: Additional query parameters
 
         Returns:
-            Formatted string if detail_level specified, otherwise raw dict
+            Formatted string if detail_level specified, otherwise raw dict (or Task)
         """
         task = self.client.get_task(task_id, **params)
 
         if detail_level:
             return format_task(task, detail_level)
-        return task
+        return Task.from_api(task) if compact else task
 
     def get_list_tasks(
         self,
         list_id: str,
         detail_level: Optional[str] = None,
+        compact: bool = False,
         **params
     ) -> Any:
         """
@@ -141,6 +145,7 @@ class TasksAPI:
             list_id: List ID
             detail_level: Format detail level (minimal|summary|detailed|full)
                          If None, returns raw JSON
+            compact: Return result['tasks'] as compact models.Task objects
             **params: Additional query parameters (archived, page, order_by, etc.)
 
         Returns:
@@ -150,12 +155,15 @@ class TasksAPI:
 
         if detail_level and 'tasks' in result:
             return format_task_list(result['tasks'], detail_level)
+        if compact and 'tasks' in result:
+            result['tasks'] = compact_tasks(result['tasks'])
         return result
 
     def get_team_tasks(
         self,
         team_id: str,
         detail_level: Optional[str] = None,
+        compact: bool = False,
         **params
     ) -> Any:
         """
@@ -165,6 +173,7 @@ class TasksAPI:
             team_id: Team/workspace ID
             detail_level: Format detail level (minimal|summary|detailed|full)
                          If None, returns raw JSON
+            compact: Return result['tasks'] as compact models.Task objects
             **params: Additional query parameters (page, order_by, reverse, etc.)
 
         Returns:
@@ -174,8 +183,42 @@ class TasksAPI:
 
         if detail_level and 'tasks' in result:
             return format_task_list(result['tasks'], detail_level)
+        if compact and 'tasks' in result:
+            result['tasks'] = compact_tasks(result['tasks'])
         return result
 
+    def iter_list_tasks(self, list_id: str, compact: bool = True, **params) -> Iterator[Any]:
+        """
+        Iterate over every task in a list, fetching pages as needed.
+
+        Args:
+            list_id: List ID
+            compact: Yield compact models.Task objects (default) instead of dicts
+            **params: Additional query parameters (subtasks, include_closed, etc.)
+        """
+        return self._compact_iter(self.client.iter_list_tasks(list_id, **params), compact)
+
+    def iter_team_tasks(self, team_id: str, compact: bool = True, **params) -> Iterator[Any]:
+        """
+        Iterate over every task in a team/workspace, fetching pages as needed.
+
+        Args:
+            team_id: Team/workspace ID
+            compact: Yield compact models.Task objects (default) instead of dicts
+            **params: Additional query parameters (assignees, statuses, etc.)
+        """
+        return self._compact_iter(self.client.iter_team_tasks(team_id, **params), compact)
+
+    @staticmethod
+    def _compact_iter(tasks: Iterator[Dict[str, Any]], compact: bool) -> Iterator[Any]:
+        if not compact:
+            yield from tasks
+            return
+        # One interner for all pages, so statuses and users are shared across the whole result
+        interner = Interner()
+        for task in tasks:
+            yield Task.from_api(task, interner)
+
     def create(
         self,
         list_id: str,
@@ -267,7 +310,7 @@ class TasksAPI:
             tasks.update("task_id", status="done")  # ❌ Wrong!
         """
         # Validate that task is a dict with an 'id' field
-        if not isinstance(task, dict) or 'id' not in task:
+        if not isinstance(task, Mapping) or 'id' not in task:
             raise ValueError(
                 "Task must be viewed/fetched before updating. "
                 "Use tasks.get(task_id) to fetch the task first, then pass the task object to update()."
@@ -369,7 +412,7 @@ class TasksAPI:
             tasks.delete("task_id")  # ❌ Wrong!
         """
         # Validate that task is a dict with an 'id' field
-        if not isinstance(task, dict) or 'id' not in task:
+        if not isinstance(task, Mapping) or 'id' not in task:
             raise ValueError(
                 "Task must be viewed/fetched before deleting. "
                 "Use tasks.get(task_id) to fetch the task first, then pass the task object to delete()."
@@ -0,0 +1,285 @@
+"""
+Response Cache
+
+Persistent cache for GET responses so repeated CLI runs don't re-download
+workspace structure (spaces, folders, lists, members, custom fields) that
+rarely changes.
+
+Entries are keyed by method, URL, normalized query parameters and a hash of
+the API token. Each endpoint gets its own TTL from ``DEFAULT_TTLS``; anything
+not listed there (tasks, comments, time entries, ...) is never cached. Writes
+through the client invalidate the cached entries of the resource they touch
+(a task write also drops cached list task pages, since any of them may hold
+the task), and the store is bounded in size with least-recently-used eviction.
+
+Expired entries are kept for ``STALE_RETENTION`` so clients created with
+``offline=True`` or ``max_staleness=...`` can still serve them; those clients
+also store responses of endpoints that are normally never cached.
+
+Usage:
+    client = ClickUpClient(response_cache=True)             # default disk cache
+    client = ClickUpClient(response_cache=DiskResponseCache(max_bytes=10_000_000))
+
+Or set ``CLICKUP_RESPONSE_CACHE=1`` to enable the default cache everywhere.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from . import serialization
+
+logger = logging.getLogger(__name__)
+
+# (endpoint pattern, TTL in seconds). First match wins; unmatched endpoints are not cached.
+DEFAULT_TTLS: Tuple[Tuple[str, int], ...] = (
+    (r"^(user|team|group)$", 3600),
+    (r"^team/[^/]+$", 3600),
+    (r"^team/[^/]+/(plan|seats|customroles|custom_item|taskTemplate)$", 3600),
+    (r"^(team|space|folder|list)/[^/]+/field$", 3600),
+    (r"^list/[^/]+/member$", 3600),
+    (r"^space/[^/]+/tag$", 3600),
+    (r"^team/[^/]+/user/[^/]+$", 3600),
+    (r"^team/[^/]+/space$", 300),
+    (r"^(space|folder|list|view)/[^/]+$", 300),
+    (r"^space/[^/]+/(folder|list)$", 300),
+    (r"^folder/[^/]+/list$", 300),
+    (r"^(team|space|folder|list)/[^/]+/view$", 300),
+)
+
+# Writes to these resources can change any workspace-structure listing
+CONTAINER_KINDS = ("team", "space", "folder", "list", "view")
+
+# Task listings a write to any task can change; the owning list is not known at write time
+TASK_LISTING_GLOB = "list/*/task"
+
+# Expired entries stay available to offline / max-staleness reads this long
+STALE_RETENTION = 7 * 24 * 3600
+
+
+def _endpoint_path(endpoint: str) -> str:
+    """Strip slashes so v2 ('list/1') and v3 ('/v3/workspaces/1') endpoints compare alike."""
+    return endpoint.strip("/")
+
+
+def resource_of(endpoint: str) -> str:
+    """Return the resource an endpoint belongs to, e.g. 'list/123' for 'list/123/field'."""
+    segments = _endpoint_path(endpoint).split("/")
+    if segments[0] == "v3":
+        segments = segments[1:]
+    return "/".join(segments[:2])
+
+
+class ResponseCache:
+    """
+    Interface for GET response caches.
+
+    Subclasses store decoded JSON payloads. The client calls ``ttl_for`` to
+    decide whether a GET is cacheable, ``make_key`` / ``get`` / ``set`` around
+    the request, and ``invalidate`` after every successful write.
+    """
+
+    def __init__(self, ttls: Optional[Sequence[Tuple[str, int]]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            ttls: (endpoint regex, seconds) rules overriding DEFAULT_TTLS
+        """
+        self.ttls = [(re.compile(pattern), ttl) for pattern, ttl in (ttls or DEFAULT_TTLS)]
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Return the TTL for an endpoint, or 0 if its responses must not be cached."""
+        path = _endpoint_path(endpoint)
+        for pattern, ttl in self.ttls:
+            if pattern.search(path):
+                return ttl
+        return 0
+
+    @staticmethod
+    def make_key(token: str, method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a stable cache key; the token is hashed so it never reaches the cache."""
+        normalized = sorted(
+            (key, [str(v) for v in value] if isinstance(value, (list, tuple)) else str(value))
+            for key, value in (params or {}).items()
+            if value is not None
+        )
+        token_hash = hashlib.sha256((token or "").encode("utf-8")).hexdigest()[:16]
+        raw = json.dumps([token_hash, method.upper(), url, normalized])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached payload, or None if missing or expired."""
+        raise NotImplementedError
+
+    def get_stale(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Return ``(payload, age in seconds)`` even if the entry has expired.
+
+        Caches that do not keep expired entries return None.
+        """
+        return None
+
+    def set(self, key: str, endpoint: str, value: Any, ttl: int) -> None:
+        """Store a payload for ``ttl`` seconds."""
+        raise NotImplementedError
+
+    def invalidate(self, endpoint: str) -> None:
+        """Drop entries made stale by a write to ``endpoint``."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        raise NotImplementedError
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    SQLite-backed response cache shared by every local process.
+
+    Entries are evicted least-recently-used once the stored bodies exceed
+    ``max_bytes``.
+    """
+
+    DEFAULT_PATH = Path.home() / ".clickup_framework" / "cache" / "responses.db"
+    DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[Sequence[Tuple[str, int]]] = None,
+    ):
+        """
+        Initialize the disk cache.
+
+        Args:
+            path: SQLite database file (default: ~/.clickup_framework/cache/responses.db)
+            max_bytes: Total size of cached bodies before LRU eviction (default: 50 MB)
+            ttls: (endpoint regex, seconds) rules overriding DEFAULT_TTLS
+        """
+        super().__init__(ttls)
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, kind TEXT, resource TEXT, body TEXT,"
+                " size INTEGER, expires_at REAL, accessed_at REAL)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            if "stored_at" not in columns:
+                # Caches created before stale reads existed
+                self._conn.execute("ALTER TABLE responses ADD COLUMN stored_at REAL")
+            if "path" not in columns:
+                # Caches created before task writes invalidated list task pages
+                self._conn.execute("ALTER TABLE responses ADD COLUMN path TEXT")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_resource ON responses(resource)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+        try:
+            self.path.chmod(0o600)
+        except OSError:
+            # On Windows, chmod may not work as expected
+            pass
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            body, expires_at = row
+            if expires_at <= now:
+                # Kept for stale reads until _evict drops it
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        try:
+            return serialization.loads(body)
+        except ValueError:
+            return None
+
+    def get_stale(self, key: str) -> Optional[Tuple[Any, float]]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] is None:
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        try:
+            return serialization.loads(row[0]), max(0.0, now - row[1])
+        except ValueError:
+            return None
+
+    def set(self, key: str, endpoint: str, value: Any, ttl: int) -> None:
+        body = serialization.dumps(value)
+        resource = resource_of(endpoint)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, kind, resource, path, body, size, expires_at, accessed_at, stored_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, resource.split("/")[0], resource, _endpoint_path(endpoint), body, len(body),
+                 now + ttl, now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete entries past STALE_RETENTION, then least-recently-used ones until under max_bytes. Caller holds the lock."""
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time() - STALE_RETENTION,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def invalidate(self, endpoint: str) -> None:
+        resource = resource_of(endpoint)
+        kind = resource.split("/")[0]
+        with self._lock, self._conn:
+            if kind in CONTAINER_KINDS:
+                # Renames, moves and deletes show up in parent listings too
+                placeholders = ", ".join("?" for _ in CONTAINER_KINDS)
+                self._conn.execute(
+                    f"DELETE FROM responses WHERE kind IN ({placeholders}) OR resource = ?",
+                    (*CONTAINER_KINDS, resource),
+                )
+            elif kind == "task":
+                # Any task change can show up in the task pages of its list; entries
+                # stored before the path column existed are dropped to be safe
+                self._conn.execute(
+                    "DELETE FROM responses WHERE resource = ?"
+                    " OR (kind = 'list' AND (path IS NULL OR path GLOB ?))",
+                    (resource, TASK_LISTING_GLOB),
+                )
+            else:
+                self._conn.execute("DELETE FROM responses WHERE resource = ?", (resource,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"DiskResponseCache(path={self.path}, max_bytes={self.max_bytes})"
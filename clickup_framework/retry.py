@@ -0,0 +1,277 @@
+"""
+Retry Policy
+
+Decides whether and when a failed request is retried. One ``RetryPolicy`` is
+shared by every request a client sends, sync or async; it only computes
+delays and never sleeps itself, so the sync client waits with ``time.sleep``
+and the async client with ``asyncio.sleep``.
+
+- Backoff is exponential with full jitter: the delay before retry ``n`` is
+  uniform in ``[0, min(max_delay, base_delay * 2**n)]``, so many workers
+  failing together do not retry in lockstep.
+- Each route (endpoint with IDs replaced, e.g. ``task/{id}/comment``) has a
+  retry budget. Retries spend from it and successful requests slowly refill
+  it, so a flaky endpoint cannot multiply the load of a bulk run.
+- A per-route circuit breaker opens after ``failure_threshold`` consecutive
+  5xx responses, timeouts or connection errors. While open, requests to the
+  route fail immediately with ClickUpCircuitOpenError; after ``reset_timeout``
+  one probe request is let through to decide whether to close it again.
+- ``request_deadline`` bounds the total time of every request made inside it,
+  retries and waits included. Per-attempt timeouts are shortened to fit, and
+  a wait that would overrun the deadline raises instead of sleeping.
+
+Usage:
+    client = ClickUpClient(retry_policy=RetryPolicy(max_attempts=5, failure_threshold=3))
+
+    with request_deadline(20):
+        client.get_task("abc123")
+"""
+
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from .exceptions import (
+    ClickUpAPIError,
+    ClickUpCircuitOpenError,
+    ClickUpRateLimitError,
+    ClickUpTimeoutError,
+)
+
+# Methods safe to resend after a 5xx, timeout or dropped connection; a failed POST may still have been applied
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Wait used for a 429 that carries no Retry-After or reset header
+DEFAULT_RATE_LIMIT_WAIT = 60
+
+_deadline: contextvars.ContextVar = contextvars.ContextVar("clickup_request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(seconds: float):
+    """
+    Bound every request made inside the block to ``seconds`` in total.
+
+    Nested deadlines keep the earlier one. The deadline follows the current
+    thread and asyncio task, and WriteBatch carries it into its workers.
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def deadline_remaining() -> Optional[float]:
+    """Seconds left before the active deadline (never negative), or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def route_of(endpoint: str) -> str:
+    """
+    Return the route an endpoint belongs to, with IDs replaced by ``{id}``.
+
+    ClickUp paths alternate resource names and IDs ('list/123/task'), so
+    every second segment is an ID.
+    """
+    segments = endpoint.strip("/").split("/")
+    prefix = []
+    if segments[0] == "v3":
+        prefix, segments = segments[:1], segments[1:]
+    return "/".join(prefix + [s if i % 2 == 0 else "{id}" for i, s in enumerate(segments)])
+
+
+def is_transient(error: Exception) -> bool:
+    """Timeouts, connection failures (status 0) and 5xx responses count against an endpoint's health."""
+    if isinstance(error, ClickUpCircuitOpenError):
+        return False
+    if isinstance(error, ClickUpTimeoutError):
+        return True
+    if isinstance(error, ClickUpAPIError):
+        return error.status_code == 0 or error.status_code >= 500
+    return False
+
+
+class _RouteState:
+    """Breaker and budget bookkeeping for one route."""
+
+    __slots__ = ("failures", "opened_at", "probing_since", "budget")
+
+    def __init__(self, budget: float):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing_since: Optional[float] = None
+        self.budget = budget
+
+
+class RetryPolicy:
+    """
+    Retry, backoff, retry budget and circuit breaker settings for a client.
+
+    Thread-safe; share one instance between clients to share breaker state.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        retry_budget: float = 10.0,
+        budget_refill: float = 0.2,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_rate_limit_wait: float = 120.0,
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts: Attempts per request, including the first (default: 3)
+            base_delay: Backoff ceiling in seconds for the first retry (default: 1)
+            max_delay: Largest backoff ceiling in seconds (default: 30)
+            retry_budget: Retries a route may spend before it must earn more (default: 10)
+            budget_refill: Budget earned by each successful request (default: 0.2)
+            failure_threshold: Consecutive transient failures that open a route's circuit (default: 5)
+            reset_timeout: Seconds an open circuit waits before letting a probe through (default: 30)
+            max_rate_limit_wait: Longest 429 wait to sit out; longer ones raise (default: 120)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget
+        self.budget_refill = budget_refill
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self._routes: Dict[str, _RouteState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, route: str) -> _RouteState:
+        """Return the state for a route. Caller holds the lock."""
+        state = self._routes.get(route)
+        if state is None:
+            state = self._routes[route] = _RouteState(self.retry_budget)
+        return state
+
+    def backoff(self, retry: int) -> float:
+        """Full-jitter delay before retry number ``retry`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry)))
+
+    def before_attempt(self, route: str) -> None:
+        """
+        Admit a request to ``route``.
+
+        Raises:
+            ClickUpCircuitOpenError: If the route's circuit is open
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(route)
+            if state.opened_at is None:
+                return
+            retry_in = state.opened_at + self.reset_timeout - now
+            if retry_in > 0:
+                raise ClickUpCircuitOpenError(route, retry_in)
+            # Half-open: one probe at a time; a probe that never reported back is replaced
+            if state.probing_since is not None and now - state.probing_since < self.reset_timeout:
+                raise ClickUpCircuitOpenError(route, self.reset_timeout - (now - state.probing_since))
+            state.probing_since = now
+
+    def record_success(self, route: str) -> None:
+        """Close the route's circuit and refill its retry budget a little."""
+        with self._lock:
+            state = self._state(route)
+            state.failures = 0
+            state.opened_at = None
+            state.probing_since = None
+            state.budget = min(self.retry_budget, state.budget + self.budget_refill)
+
+    def record_failure(self, route: str, error: Exception) -> None:
+        """Count a transient failure towards the route's circuit; other errors prove the route is up."""
+        if isinstance(error, ClickUpCircuitOpenError):
+            return
+        if not is_transient(error):
+            if not isinstance(error, ClickUpRateLimitError):
+                self.record_success(route)
+            return
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(route)
+            state.failures += 1
+            state.probing_since = None
+            if state.opened_at is not None or state.failures >= self.failure_threshold:
+                state.opened_at = now
+
+    def next_delay(self, route: str, method: str, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Decide whether to retry after ``error`` on the 0-based ``attempt``.
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up and raise
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        if isinstance(error, ClickUpRateLimitError):
+            # The limit is per token, not per route, so this spends no route budget
+            delay = float(error.retry_after or DEFAULT_RATE_LIMIT_WAIT)
+            if delay > self.max_rate_limit_wait:
+                return None
+        elif isinstance(error, ClickUpCircuitOpenError):
+            return None
+        elif is_transient(error):
+            # Checked before the budget: an unretried POST should not spend it
+            if method.upper() not in IDEMPOTENT_METHODS:
+                return None
+            with self._lock:
+                state = self._state(route)
+                if state.opened_at is not None or state.budget < 1:
+                    return None
+                state.budget -= 1
+            delay = self.backoff(attempt)
+        else:
+            return None
+
+        remaining = deadline_remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        return delay
+
+    def attempt_timeout(self, timeout: float) -> float:
+        """
+        Return the timeout for the next attempt, shortened to fit the active deadline.
+
+        Raises:
+            ClickUpTimeoutError: If the deadline has already passed
+        """
+        remaining = deadline_remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise ClickUpTimeoutError("Request deadline exceeded")
+        return min(timeout, remaining)
+
+    def circuit_state(self, route: str) -> str:
+        """Return 'closed', 'open' or 'half-open' for a route."""
+        with self._lock:
+            state = self._routes.get(route)
+            if state is None or state.opened_at is None:
+                return "closed"
+            if time.monotonic() - state.opened_at < self.reset_timeout:
+                return "open"
+            return "half-open"
+
+    def reset(self) -> None:
+        """Forget every route's breaker and budget state."""
+        with self._lock:
+            self._routes.clear()
@@ -0,0 +1,413 @@
+"""
+Search Index
+
+Persistent SQLite FTS5 index over task names, descriptions, comments, tags
+and list paths, so ``cum search`` answers from disk in milliseconds instead
+of rendering the whole workspace hierarchy and regex-filtering it.
+
+The index is fed from two places:
+
+- ``observe`` is called by ClickUpClient (``search_index=True`` or
+  ``CLICKUP_SEARCH_INDEX=1``) with every successful response, so tasks and
+  comments any command fetches are indexed as a side effect, and deleted
+  tasks are dropped.
+- ``refresh`` pages through tasks updated since the previous refresh using
+  ``date_updated_gt`` on the team task endpoint.
+
+Each API token gets its own database (``SearchIndex.for_token``), so tasks
+indexed for one account are never returned to another.
+
+Usage:
+    index = SearchIndex.for_token(client.api_token)
+    index.refresh(client, team_id)
+    for hit in index.search("login bug", fields=["name", "tags"]):
+        print(hit["id"], hit["name"], hit["snippet"])
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .pagination import DEFAULT_PREFETCH
+
+logger = logging.getLogger(__name__)
+
+# Indexed text columns, in FTS5 column order
+FIELDS = ("name", "description", "comments", "tags", "path")
+
+# bm25 weights per column: a hit in the name outranks one in a comment
+FIELD_WEIGHTS = (10.0, 2.0, 1.0, 5.0, 3.0)
+
+# Re-fetch tasks updated this long before the previous high-water mark
+REFRESH_OVERLAP_MS = 60_000
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS tasks ("
+    " rowid INTEGER PRIMARY KEY, id TEXT UNIQUE, team_id TEXT, space_id TEXT, folder_id TEXT,"
+    " list_id TEXT, parent TEXT, status TEXT, status_type TEXT, date_updated INTEGER, url TEXT,"
+    " name TEXT, description TEXT, comments TEXT, tags TEXT, path TEXT)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS task_text USING fts5("
+    " name, description, comments, tags, path, tokenize = 'unicode61 remove_diacritics 2')",
+    "CREATE TABLE IF NOT EXISTS index_state (team_id TEXT PRIMARY KEY, refreshed_at REAL, high_water INTEGER)",
+    "CREATE INDEX IF NOT EXISTS idx_search_tasks_team ON tasks(team_id)",
+)
+
+_TASK = re.compile(r"^task/([^/]+)$")
+_TASK_PAGE = re.compile(r"^(list|team)/[^/]+/task$")
+_TASK_COMMENTS = re.compile(r"^task/([^/]+)/comment$")
+
+_TERM = re.compile(r'(?:(\w+):)?("[^"]*"|\S+)')
+
+
+def _ref(value: Any, key: str = "id") -> Optional[str]:
+    if isinstance(value, dict):
+        value = value.get(key)
+    return str(value) if value not in (None, "") else None
+
+
+def _as_ms(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def task_path(task: Dict[str, Any]) -> str:
+    """Return the 'Folder / List' path of a task from its own payload."""
+    folder = task.get("folder") or {}
+    parts = [] if folder.get("hidden") else [_ref(folder, "name")]
+    parts.append(_ref(task.get("list"), "name"))
+    return " / ".join(part for part in parts if part)
+
+
+def build_match(query: str, fields: Optional[Sequence[str]] = None) -> str:
+    """
+    Translate a user query into an FTS5 MATCH expression.
+
+    Words are ANDed and prefix-matched; ``"quoted phrases"`` match exactly
+    and ``field:word`` limits one term to a column. ``fields`` limits every
+    other term to those columns.
+
+    Raises:
+        ValueError: Unknown field, or nothing to search for
+    """
+    for field in fields or ():
+        if field not in FIELDS:
+            raise ValueError(f"Unknown search field '{field}' (choose from {', '.join(FIELDS)})")
+    default_scope = "{%s} : " % " ".join(fields) if fields else ""
+
+    terms = []
+    for field, text in _TERM.findall(query):
+        if field and field not in FIELDS:
+            # Not a field filter (e.g. a URL); search the whole token
+            text, field = f"{field}:{text}", ""
+        if text.startswith('"'):
+            words = re.findall(r"\w+", text)
+            if not words:
+                continue
+            expr = '"%s"' % " ".join(words)
+        else:
+            words = re.findall(r"\w+", text)
+            if not words:
+                continue
+            expr = " ".join(f'"{word}"' for word in words[:-1])
+            expr = f'{expr} "{words[-1]}"*'.strip()
+            if len(words) > 1:
+                expr = f"({expr})"
+        terms.append(f"{field} : {expr}" if field else f"{default_scope}{expr}")
+    if not terms:
+        raise ValueError("Search query has no words to match")
+    return " AND ".join(terms)
+
+
+class SearchIndex:
+    """
+    SQLite FTS5 full-text index of tasks.
+
+    Task metadata and the indexed text live in ``tasks``; ``task_text`` is
+    the FTS5 table sharing its rowids. Safe to share between threads.
+    """
+
+    DEFAULT_PATH = Path.home() / ".clickup_framework" / "cache" / "search.db"
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Open (or create) the index.
+
+        Args:
+            path: SQLite database file (default: ~/.clickup_framework/cache/search.db)
+        """
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=5, check_same_thread=False)
+        with self._lock, self._conn:
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+        try:
+            self.path.chmod(0o600)
+        except OSError:
+            # On Windows, chmod may not work as expected
+            pass
+
+    @classmethod
+    def for_token(cls, api_token: str, directory: Optional[Path] = None) -> "SearchIndex":
+        """Open the index for an API token; the file is named after a hash, never the token."""
+        key = hashlib.sha256((api_token or "").encode("utf-8")).hexdigest()[:16]
+        return cls(Path(directory or cls.DEFAULT_PATH.parent) / f"search-{key}.db")
+
+    # ==================== Updates ====================
+
+    def index_tasks(self, tasks: Iterable[Dict[str, Any]], team_id: Optional[str] = None) -> int:
+        """
+        Add or update tasks, keeping already-indexed comments.
+
+        Tasks whose ``date_updated`` matches the indexed copy are skipped.
+
+        Returns:
+            Number of tasks written
+        """
+        written = 0
+        with self._lock, self._conn:
+            for task in tasks:
+                if isinstance(task, dict) and task.get("id") and task.get("name") is not None:
+                    written += self._index_task(task, team_id)
+        return written
+
+    def _index_task(self, task: Dict[str, Any], team_id: Optional[str]) -> int:
+        """Write one task. Caller holds the lock."""
+        conn = self._conn
+        task_id = str(task["id"])
+        row = conn.execute(
+            "SELECT rowid, date_updated, description, comments FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+        date_updated = _as_ms(task.get("date_updated"))
+        if row is not None and date_updated and row[1] == date_updated:
+            return 0
+
+        if "text_content" in task or "description" in task:
+            description = task.get("text_content") or task.get("description") or ""
+        else:
+            description = row[2] if row else ""
+        comments = row[3] if row else ""
+        status = task.get("status") if isinstance(task.get("status"), dict) else {}
+        tags = " ".join(tag.get("name", "") for tag in task.get("tags") or [] if isinstance(tag, dict))
+        values = (
+            task_id, str(team_id or task.get("team_id") or ""), _ref(task.get("space")),
+            _ref(task.get("folder")), _ref(task.get("list")), _ref(task.get("parent")),
+            status.get("status"), status.get("type"), date_updated, task.get("url"),
+            task.get("name") or "", description, comments, tags, task_path(task),
+        )
+        if row is None:
+            rowid = conn.execute(
+                "INSERT INTO tasks (id, team_id, space_id, folder_id, list_id, parent, status, status_type,"
+                " date_updated, url, name, description, comments, tags, path)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                values,
+            ).lastrowid
+        else:
+            rowid = row[0]
+            conn.execute(
+                "UPDATE tasks SET id = ?, team_id = ?, space_id = ?, folder_id = ?, list_id = ?, parent = ?,"
+                " status = ?, status_type = ?, date_updated = ?, url = ?, name = ?, description = ?,"
+                " comments = ?, tags = ?, path = ? WHERE rowid = ?",
+                (*values, rowid),
+            )
+            conn.execute("DELETE FROM task_text WHERE rowid = ?", (rowid,))
+        conn.execute(
+            "INSERT INTO task_text (rowid, name, description, comments, tags, path) VALUES (?, ?, ?, ?, ?, ?)",
+            (rowid, *values[-5:]),
+        )
+        return 1
+
+    def index_comments(self, task_id: str, comments: Sequence[Dict[str, Any]]) -> bool:
+        """
+        Replace the indexed comment text of a task.
+
+        Returns:
+            False if the task itself has not been indexed yet
+        """
+        text = "\n".join(c.get("comment_text") or "" for c in comments if isinstance(c, dict))
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT rowid, name, description, tags, path FROM tasks WHERE id = ?", (str(task_id),)
+            ).fetchone()
+            if row is None:
+                return False
+            rowid, name, description, tags, path = row
+            self._conn.execute("UPDATE tasks SET comments = ? WHERE rowid = ?", (text, rowid))
+            self._conn.execute("DELETE FROM task_text WHERE rowid = ?", (rowid,))
+            self._conn.execute(
+                "INSERT INTO task_text (rowid, name, description, comments, tags, path) VALUES (?, ?, ?, ?, ?, ?)",
+                (rowid, name, description, text, tags, path),
+            )
+        return True
+
+    def remove_task(self, task_id: str) -> bool:
+        """Drop a task from the index."""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT rowid FROM tasks WHERE id = ?", (str(task_id),)).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM task_text WHERE rowid = ?", row)
+            self._conn.execute("DELETE FROM tasks WHERE rowid = ?", row)
+        return True
+
+    def observe(self, method: str, endpoint: str, data: Any) -> None:
+        """
+        Index whatever a successful API response says about tasks.
+
+        Called by ClickUpClient after every request when the index is enabled.
+        """
+        if not isinstance(data, dict):
+            return
+        method = method.upper()
+        path = endpoint.strip("/")
+        task_match = _TASK.match(path)
+        if task_match and method == "DELETE":
+            self.remove_task(task_match.group(1))
+        elif task_match and method in ("GET", "PUT"):
+            self.index_tasks([data])
+        elif _TASK_PAGE.match(path):
+            if method == "GET":
+                self.index_tasks(data.get("tasks") or [])
+            elif method == "POST":
+                self.index_tasks([data])
+        elif method == "GET":
+            comments_match = _TASK_COMMENTS.match(path)
+            if comments_match and "comments" in data:
+                self.index_comments(comments_match.group(1), data["comments"])
+
+    def refresh(self, client, team_id: str, full: bool = False, prefetch: int = DEFAULT_PREFETCH) -> int:
+        """
+        Index tasks updated since the previous refresh of a workspace.
+
+        Args:
+            client: ClickUpClient used for the requests
+            team_id: Workspace (team) ID
+            full: Re-read every task instead of changes only, dropping tasks
+                that no longer exist
+            prefetch: Task pages to keep in flight
+
+        Returns:
+            Number of tasks fetched
+        """
+        team_id = str(team_id)
+        state = self.state(team_id)
+        params: Dict[str, Any] = {"subtasks": "true", "include_closed": "true"}
+        if state and state["high_water"] and not full:
+            params["date_updated_gt"] = max(0, state["high_water"] - REFRESH_OVERLAP_MS)
+
+        fetched = 0
+        high_water = state["high_water"] if state else 0
+        seen = set()
+        batch: List[Dict[str, Any]] = []
+        for task in client.iter_team_tasks(team_id, prefetch=prefetch, **params):
+            fetched += 1
+            seen.add(str(task.get("id")))
+            high_water = max(high_water or 0, _as_ms(task.get("date_updated")))
+            batch.append(task)
+            if len(batch) >= 500:
+                self.index_tasks(batch, team_id)
+                batch = []
+        self.index_tasks(batch, team_id)
+
+        if "date_updated_gt" not in params:
+            with self._lock:
+                indexed = [row[0] for row in self._conn.execute("SELECT id FROM tasks WHERE team_id = ?", (team_id,))]
+            for task_id in indexed:
+                if task_id not in seen:
+                    self.remove_task(task_id)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO index_state VALUES (?, ?, ?)", (team_id, time.time(), high_water)
+            )
+        return fetched
+
+    # ==================== Reads ====================
+
+    def state(self, team_id: str) -> Optional[Dict[str, Any]]:
+        """Return ``refreshed_at``, ``high_water`` and ``tasks`` for a workspace, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at, high_water FROM index_state WHERE team_id = ?", (str(team_id),)
+            ).fetchone()
+            if row is None:
+                return None
+            count = self._conn.execute("SELECT COUNT(*) FROM tasks WHERE team_id = ?", (str(team_id),)).fetchone()
+        return {"refreshed_at": row[0], "high_water": row[1], "tasks": count[0]}
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[Sequence[str]] = None,
+        team_id: Optional[str] = None,
+        container_id: Optional[str] = None,
+        include_closed: bool = False,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search indexed tasks, best match first.
+
+        Args:
+            query: Words, "quoted phrases" and field:word terms (see build_match)
+            fields: Restrict unqualified terms to these columns (see FIELDS)
+            team_id: Only tasks of this workspace
+            container_id: Only tasks in this space, folder or list
+            include_closed: Include tasks with a closed status
+            limit: Maximum results
+
+        Returns:
+            Dicts with ``id``, ``name``, ``status``, ``list_id``, ``parent``,
+            ``path``, ``url``, ``score`` (higher is better) and ``snippet``
+
+        Raises:
+            ValueError: Invalid field or empty query
+        """
+        sql = [
+            "SELECT t.id, t.name, t.status, t.list_id, t.parent, t.path, t.url,"
+            f" bm25(task_text, {', '.join(str(w) for w in FIELD_WEIGHTS)}) AS rank,"
+            " snippet(task_text, -1, '[', ']', '…', 12)"
+            " FROM task_text JOIN tasks t ON t.rowid = task_text.rowid"
+            " WHERE task_text MATCH ?"
+        ]
+        params: List[Any] = [build_match(query, fields)]
+        if team_id:
+            sql.append("AND t.team_id = ?")
+            params.append(str(team_id))
+        if container_id:
+            sql.append("AND ? IN (t.list_id, t.folder_id, t.space_id)")
+            params.append(str(container_id))
+        if not include_closed:
+            sql.append("AND COALESCE(t.status_type, '') NOT IN ('closed', 'done')")
+        sql.append("ORDER BY rank LIMIT ?")
+        params.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(" ".join(sql), params).fetchall()
+        return [
+            {
+                "id": row[0], "name": row[1], "status": row[2], "list_id": row[3], "parent": row[4],
+                "path": row[5], "url": row[6], "score": round(-row[7], 3), "snippet": row[8],
+            }
+            for row in rows
+        ]
+
+    def clear(self) -> None:
+        """Drop every indexed task."""
+        with self._lock, self._conn:
+            for table in ("task_text", "tasks", "index_state"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __repr__(self) -> str:
+        return f"SearchIndex(path={self.path})"
@@ -0,0 +1,84 @@
+"""
+JSON serialization backend
+
+Request/response bodies and the framework's state files all go through
+these helpers. When ``orjson`` is installed it is used for encoding and
+decoding (several times faster on large task pages); otherwise the standard
+library ``json`` module is used. Output is equivalent either way, except
+that orjson writes non-ASCII characters as UTF-8 instead of ``\\uXXXX``
+escapes, so files must be opened with ``encoding="utf-8"``.
+
+Install the fast backend with:
+    pip install "clickup-framework[fast]"
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any, IO, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+BACKEND = "orjson" if ORJSON_AVAILABLE else "json"
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode mappings that are not dicts (e.g. compact models.Task) as objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Decode a JSON document.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode ``obj`` as UTF-8 JSON bytes.
+
+    Args:
+        obj: Value to encode
+        indent: Pretty-print with two-space indentation
+
+    Raises:
+        TypeError: If ``obj`` contains values JSON cannot represent
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) may still encode with json
+            pass
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Encode ``obj`` as a JSON string."""
+    return dumps_bytes(obj, indent=indent).decode("utf-8")
+
+
+def load(fp: IO) -> Any:
+    """Decode JSON from a file object opened in text or binary mode."""
+    return loads(fp.read())
+
+
+def dump(obj: Any, fp: IO, indent: bool = False) -> None:
+    """Encode ``obj`` into a file object opened in text mode."""
+    fp.write(dumps(obj, indent=indent))
@@ -0,0 +1,243 @@
+"""
+Streaming JSON decoding
+
+Task pages requested with ``subtasks=true`` and full custom fields can be
+megabytes each. ``response.json()`` holds the raw body and the decoded page
+in memory at once and decodes nothing until the download is complete.
+``iter_json_array`` instead decodes the item array of a top-level JSON object
+incrementally from the byte stream, yielding each item as soon as it has
+fully arrived, so only one chunk plus one item is buffered at a time.
+
+``StreamedPage`` wraps a streaming HTTP response in the same shape as a
+regular page payload: ``page["tasks"]`` is an iterator, and the other
+top-level keys (``last_page``, ...) can be read once the items have been consumed.
+
+Only the standard library is used. ``json.JSONDecoder.raw_decode`` decodes
+each item, so parsing stays in C.
+"""
+
+import codecs
+import json
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+# Sentinel for an exhausted item iterator
+_END = object()
+
+
+class _JsonStreamReader:
+    """Cursor over a JSON document arriving as byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk (dropping consumed text); False once the stream is exhausted."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            text = self._utf8.decode(b"", final=True)
+            self.eof = True
+        else:
+            text = self._utf8.decode(chunk)
+        self.buffer = self.buffer[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def take(self) -> str:
+        """Consume and return the next non-whitespace character."""
+        char = self.peek()
+        self.pos += 1
+        return char
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` or raise ValueError."""
+        found = self.take()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found!r}")
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._json.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def iter_json_array(
+    chunks: Iterable[bytes],
+    items_key: str = "tasks",
+    meta: Optional[Dict[str, Any]] = None,
+) -> Iterator[Any]:
+    """
+    Yield the items of ``document[items_key]`` while the document is still arriving.
+
+    Args:
+        chunks: Raw response body chunks (e.g. ``response.iter_content(65536)``)
+        items_key: Top-level key holding the array to stream (default: "tasks")
+        meta: Optional dict that receives every other top-level key/value
+
+    Yields:
+        Decoded array items, in order
+
+    Raises:
+        ValueError: If the body is not a JSON object or is truncated
+    """
+    reader = _JsonStreamReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == items_key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.take()
+            else:
+                while True:
+                    yield reader.value()
+                    separator = reader.take()
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise ValueError(f"Expected ',' or ']' in JSON array, found {separator!r}")
+        else:
+            value = reader.value()
+            if meta is not None:
+                meta[key] = value
+
+        separator = reader.take()
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or '}}' in JSON object, found {separator!r}")
+
+
+class StreamedPage(Mapping):
+    """
+    Page payload whose item array is decoded from the live response.
+
+    ``page[items_key]`` returns a one-shot iterator of items. Reading any other
+    key first finishes decoding, buffering unread items so none are lost.
+    An empty item array is reported as the last page.
+    """
+
+    def __init__(
+        self,
+        response,
+        items_key: str = "tasks",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_item: Optional[Callable[[Any], None]] = None,
+        on_done: Optional[Callable[[Optional[Dict[str, Any]], int], None]] = None,
+    ):
+        """
+        Initialize streamed page.
+
+        Args:
+            response: requests.Response opened with ``stream=True``
+            items_key: Top-level key holding the item array
+            chunk_size: Bytes read per chunk
+            on_item: Called with each item as it is decoded
+            on_done: Called once the response is released, with the other
+                top-level keys (None if the body was not fully decoded) and
+                the number of body bytes read
+        """
+        self.items_key = items_key
+        self.bytes_read = 0
+        self._response = response
+        self._meta: Dict[str, Any] = {}
+        self._buffered: deque = deque()
+        self._count = 0
+        self._done = False
+        self._on_item = on_item
+        self._on_done = on_done
+        self._source = self._decode(chunk_size)
+        self._items = self._iter_items()
+
+    def _chunks(self, chunk_size: int) -> Iterator[bytes]:
+        for chunk in self._response.iter_content(chunk_size):
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    def _decode(self, chunk_size: int) -> Iterator[Any]:
+        complete = False
+        try:
+            for item in iter_json_array(self._chunks(chunk_size), self.items_key, self._meta):
+                self._count += 1
+                if self._on_item is not None:
+                    self._on_item(item)
+                yield item
+            complete = True
+        finally:
+            self._done = True
+            self._response.close()
+            if self._on_done is not None:
+                self._on_done(self._meta if complete else None, self.bytes_read)
+
+    def _iter_items(self) -> Iterator[Any]:
+        while True:
+            if self._buffered:
+                yield self._buffered.popleft()
+                continue
+            item = next(self._source, _END)
+            if item is _END:
+                return
+            yield item
+
+    def _finish(self) -> None:
+        """Decode the rest of the body so trailing keys are available."""
+        if not self._done:
+            self._buffered.extend(self._source)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == self.items_key:
+            return self._items
+        self._finish()
+        if key == "last_page" and self._count == 0:
+            return True
+        return self._meta[key]
+
+    def __iter__(self) -> Iterator[str]:
+        self._finish()
+        return iter([self.items_key, *self._meta])
+
+    def __len__(self) -> int:
+        self._finish()
+        return 1 + len(self._meta)
+
+    def close(self) -> None:
+        """Release the connection without reading the rest of the body."""
+        self._source.close()
+        self._response.close()
+
@@ -0,0 +1,275 @@
+"""
+API Telemetry
+
+Per-endpoint instrumentation for ClickUpClient: request counts, latency
+histograms, bytes sent and received, retries, 429 responses and the time
+spent blocked in the rate limiter. Endpoints are grouped by route (IDs
+replaced, e.g. ``task/{id}/comment``).
+
+Every client records into an ``ApiTelemetry`` instance, available as
+``client.stats()``. ``install`` makes one instance the default for clients
+created afterwards, which is how ``cum --api-stats`` sees every request a
+command makes. With ``trace_path`` set, each attempt is also appended to a
+JSON-lines file for offline analysis.
+
+Usage:
+    client = ClickUpClient()
+    client.get_task("abc123")
+    print(client.stats()["endpoints"]["task/{id}"]["count"])
+
+    telemetry = install(ApiTelemetry(trace_path="api-trace.jsonl"))
+    ...
+    print(telemetry.format_table())
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from . import serialization
+
+# Latency histogram bucket upper bounds, in milliseconds
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_default: Optional["ApiTelemetry"] = None
+
+
+def install(telemetry: Optional["ApiTelemetry"]) -> Optional["ApiTelemetry"]:
+    """Make ``telemetry`` the default for clients created from now on (None to stop sharing)."""
+    global _default
+    _default = telemetry
+    return telemetry
+
+
+def get_default() -> Optional["ApiTelemetry"]:
+    """Return the installed default telemetry, if any."""
+    return _default
+
+
+def _percentile(histogram: list, count: int, fraction: float) -> Optional[float]:
+    """Estimate a percentile as the upper bound of the bucket that contains it."""
+    if not count:
+        return None
+    target = fraction * count
+    seen = 0
+    for bound, bucket in zip(LATENCY_BUCKETS_MS, histogram):
+        seen += bucket
+        if seen >= target:
+            return float(bound)
+    return float("inf")
+
+
+class _EndpointStats:
+    """Counters for one route."""
+
+    __slots__ = ("count", "errors", "retries", "rate_limited", "bytes_in", "bytes_out",
+                 "total_ms", "max_ms", "histogram", "statuses")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.statuses: Dict[int, int] = {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "statuses": dict(self.statuses),
+            "latency_ms": {
+                "mean": self.total_ms / self.count if self.count else None,
+                "p50": _percentile(self.histogram, self.count, 0.5),
+                "p95": _percentile(self.histogram, self.count, 0.95),
+                "max": self.max_ms,
+                "histogram": {
+                    **{f"<={bound}": n for bound, n in zip(LATENCY_BUCKETS_MS, self.histogram)},
+                    f">{LATENCY_BUCKETS_MS[-1]}": self.histogram[-1],
+                },
+            },
+        }
+
+
+class ApiTelemetry:
+    """
+    Thread-safe request statistics, optionally traced to a JSON-lines file.
+    """
+
+    def __init__(self, trace_path: Union[str, Path, None] = None):
+        """
+        Initialize telemetry.
+
+        Args:
+            trace_path: Append one JSON object per request attempt to this file
+        """
+        self.trace_path = Path(trace_path) if trace_path else None
+        self.started_at = time.time()
+        self.rate_limit_wait = 0.0
+        self.cache_hits = 0
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+        self._trace = None
+
+    def _endpoint(self, route: str) -> _EndpointStats:
+        """Return the counters for a route. Caller holds the lock."""
+        stats = self._endpoints.get(route)
+        if stats is None:
+            stats = self._endpoints[route] = _EndpointStats()
+        return stats
+
+    def record_request(
+        self,
+        method: str,
+        route: str,
+        status: Optional[int],
+        elapsed: float,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        attempt: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record one request attempt.
+
+        Args:
+            method: HTTP method
+            route: Endpoint route (see retry.route_of)
+            status: HTTP status, or None if no response arrived
+            elapsed: Seconds from send to response
+            bytes_in: Response body size
+            bytes_out: Request body size
+            attempt: 0-based attempt number
+            error: Error description for failed attempts
+        """
+        elapsed_ms = elapsed * 1000
+        bucket = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                bucket = i
+                break
+        with self._lock:
+            stats = self._endpoint(route)
+            stats.count += 1
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.histogram[bucket] += 1
+            if status is not None:
+                stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if status == 429:
+                stats.rate_limited += 1
+            if error is not None or (status is not None and status >= 400):
+                stats.errors += 1
+            if self.trace_path is not None:
+                self._write_trace({
+                    "ts": round(time.time(), 3),
+                    "method": method,
+                    "route": route,
+                    "status": status,
+                    "ms": round(elapsed_ms, 1),
+                    "bytes_in": bytes_in,
+                    "bytes_out": bytes_out,
+                    "attempt": attempt,
+                    "error": error,
+                })
+
+    def record_bytes_in(self, route: str, bytes_in: int) -> None:
+        """Add body bytes read after the request was recorded (streamed responses)."""
+        with self._lock:
+            self._endpoint(route).bytes_in += bytes_in
+
+    def record_retry(self, route: str) -> None:
+        """Count a retry scheduled for a route."""
+        with self._lock:
+            self._endpoint(route).retries += 1
+
+    def record_rate_limit_wait(self, seconds: float) -> None:
+        """Add time spent blocked in RateLimiter.acquire."""
+        with self._lock:
+            self.rate_limit_wait += seconds
+
+    def record_cache_hit(self) -> None:
+        """Count a GET answered from the response cache."""
+        with self._lock:
+            self.cache_hits += 1
+
+    def _write_trace(self, event: Dict[str, Any]) -> None:
+        """Append one trace line. Caller holds the lock."""
+        if self._trace is None:
+            self.trace_path.parent.mkdir(parents=True, exist_ok=True)
+            self._trace = open(self.trace_path, "a", encoding="utf-8")
+        self._trace.write(serialization.dumps(event) + "\n")
+        self._trace.flush()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return all statistics as plain data."""
+        with self._lock:
+            endpoints = {route: stats.to_dict() for route, stats in self._endpoints.items()}
+            return {
+                "elapsed": time.time() - self.started_at,
+                "requests": sum(e["count"] for e in endpoints.values()),
+                "errors": sum(e["errors"] for e in endpoints.values()),
+                "retries": sum(e["retries"] for e in endpoints.values()),
+                "rate_limited": sum(e["rate_limited"] for e in endpoints.values()),
+                "bytes_in": sum(e["bytes_in"] for e in endpoints.values()),
+                "bytes_out": sum(e["bytes_out"] for e in endpoints.values()),
+                "rate_limit_wait": self.rate_limit_wait,
+                "cache_hits": self.cache_hits,
+                "endpoints": endpoints,
+            }
+
+    def format_table(self) -> str:
+        """Render a per-endpoint summary table, slowest total time first."""
+        snapshot = self.snapshot()
+        rows = sorted(
+            snapshot["endpoints"].items(),
+            key=lambda item: item[1]["count"] * (item[1]["latency_ms"]["mean"] or 0),
+            reverse=True,
+        )
+        width = max([len("Endpoint")] + [len(route) for route, _ in rows])
+        header = (f"{'Endpoint':<{width}}  {'Calls':>5}  {'Err':>4}  {'Retry':>5}  {'429':>4}"
+                  f"  {'Mean ms':>8}  {'p95 ms':>7}  {'Max ms':>7}  {'KB in':>8}  {'KB out':>7}")
+        lines = [header, "-" * len(header)]
+        for route, stats in rows:
+            latency = stats["latency_ms"]
+            p95 = latency["p95"] or 0
+            p95_text = f">{LATENCY_BUCKETS_MS[-1]}" if p95 == float("inf") else f"{p95:.0f}"
+            lines.append(
+                f"{route:<{width}}  {stats['count']:>5}  {stats['errors']:>4}  {stats['retries']:>5}"
+                f"  {stats['rate_limited']:>4}  {latency['mean'] or 0:>8.0f}  {p95_text:>7}"
+                f"  {latency['max']:>7.0f}  {stats['bytes_in'] / 1024:>8.1f}  {stats['bytes_out'] / 1024:>7.1f}"
+            )
+        lines.append("-" * len(header))
+        lines.append(
+            f"{snapshot['requests']} requests, {snapshot['errors']} errors, {snapshot['retries']} retries, "
+            f"{snapshot['rate_limited']} rate-limited, {snapshot['cache_hits']} cache hits; "
+            f"{snapshot['rate_limit_wait']:.2f}s waiting on the rate limiter, "
+            f"{snapshot['elapsed']:.2f}s elapsed"
+        )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Clear every counter."""
+        with self._lock:
+            self._endpoints.clear()
+            self.rate_limit_wait = 0.0
+            self.cache_hits = 0
+            self.started_at = time.time()
+
+    def close(self) -> None:
+        """Close the trace file."""
+        with self._lock:
+            if self._trace is not None:
+                self._trace.close()
+                self._trace = None
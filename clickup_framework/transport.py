@@ -0,0 +1,298 @@
+"""
+HTTP Transport Settings
+
+Connection pooling for ClickUpClient's requests session. The stock session
+keeps at most 10 connections per host, so threaded fan-out (WriteBatch,
+pagination prefetch, parallel detail fetches) beyond that opens and drops a
+fresh TLS connection per request. HttpSettings sizes the pool, optionally
+caps connections per host, and turns on TCP keep-alive so idle pooled
+connections survive NAT and load-balancer timeouts.
+
+With ``httpx`` and ``h2`` installed (``pip install "clickup-framework[http2]"``),
+``http2=True`` sends every request over a multiplexed HTTP/2 connection
+instead; without them the setting is ignored with a warning.
+
+Settings resolve in order: explicit HttpSettings, environment variables,
+the context file (``ContextManager.set_http_settings``), then defaults.
+
+Environment variables:
+    CLICKUP_HTTP_POOL_CONNECTIONS  - host pools kept open (default: 10)
+    CLICKUP_HTTP_POOL_MAXSIZE      - connections per host (default: 64)
+    CLICKUP_HTTP_POOL_BLOCK        - wait for a free connection instead of opening extra ones (default: off)
+    CLICKUP_HTTP_KEEPALIVE         - idle seconds before TCP keep-alive probes, 0 = off (default: 60)
+    CLICKUP_HTTP2                  - use HTTP/2 when available (default: off)
+"""
+
+import io
+import logging
+import os
+import socket
+import threading
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import select_proxy
+from urllib3.connection import HTTPConnection
+
+try:
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+_TRUE = ("1", "true", "yes", "on")
+
+# (field, environment variable, parser)
+_ENV_SETTINGS = (
+    ("pool_connections", "CLICKUP_HTTP_POOL_CONNECTIONS", int),
+    ("pool_maxsize", "CLICKUP_HTTP_POOL_MAXSIZE", int),
+    ("pool_block", "CLICKUP_HTTP_POOL_BLOCK", lambda value: value.lower() in _TRUE),
+    ("keepalive", "CLICKUP_HTTP_KEEPALIVE", int),
+    ("http2", "CLICKUP_HTTP2", lambda value: value.lower() in _TRUE),
+)
+
+
+class HttpSettings:
+    """
+    Connection pool, keep-alive and protocol settings for a client.
+
+    Usage:
+        client = ClickUpClient(http_settings=HttpSettings(pool_maxsize=128, http2=True))
+    """
+
+    FIELDS = ("pool_connections", "pool_maxsize", "pool_block", "keepalive", "http2")
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 64,
+        pool_block: bool = False,
+        keepalive: int = 60,
+        http2: bool = False,
+    ):
+        """
+        Initialize HTTP settings.
+
+        Args:
+            pool_connections: Number of per-host pools to keep (default: 10)
+            pool_maxsize: Connections kept open per host (default: 64)
+            pool_block: Wait for a pooled connection when all pool_maxsize are busy,
+                making pool_maxsize a hard per-host limit (default: False)
+            keepalive: Idle seconds before TCP keep-alive probes start, 0 to disable (default: 60)
+            http2: Send requests over HTTP/2 when httpx and h2 are installed (default: False)
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keepalive = max(0, keepalive)
+        self.http2 = http2
+
+    @classmethod
+    def from_environment(cls, context_settings: Optional[Mapping[str, Any]] = None) -> "HttpSettings":
+        """
+        Build settings from environment variables over stored context settings.
+
+        Args:
+            context_settings: Settings saved in the context file (unknown keys are ignored)
+        """
+        values = {key: value for key, value in (context_settings or {}).items() if key in cls.FIELDS}
+        for field, variable, parse in _ENV_SETTINGS:
+            raw = os.environ.get(variable, "").strip()
+            if not raw:
+                continue
+            try:
+                values[field] = parse(raw)
+            except ValueError:
+                logger.warning(f"Ignoring invalid {variable}={raw!r}")
+        return cls(**values)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def socket_options(self) -> List[Tuple[int, int, int]]:
+        """urllib3 socket options: its defaults (TCP_NODELAY) plus TCP keep-alive when enabled."""
+        options = list(HTTPConnection.default_socket_options)
+        if self.keepalive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # Probe timing is platform specific; Linux names these, macOS only has TCP_KEEPALIVE
+            idle = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+            if idle is not None:
+                options.append((socket.IPPROTO_TCP, idle, self.keepalive))
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, self.keepalive // 4)))
+            if hasattr(socket, "TCP_KEEPCNT"):
+                options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4))
+        return options
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.FIELDS)
+        return f"HttpSettings({fields})"
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter sized by HttpSettings, with TCP keep-alive on every pooled socket."""
+
+    def __init__(self, settings: Optional[HttpSettings] = None, **kwargs):
+        self.settings = settings or HttpSettings()
+        super().__init__(
+            pool_connections=self.settings.pool_connections,
+            pool_maxsize=self.settings.pool_maxsize,
+            pool_block=self.settings.pool_block,
+            **kwargs,
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", self.settings.socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs.setdefault("socket_options", self.settings.socket_options())
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
+def build_response(request, status: int, headers: Mapping[str, str], body: bytes, reason: str = "") -> requests.Response:
+    """Build a fully read requests.Response from an already decoded body."""
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body
+    response._content_consumed = True
+    response.raw = io.BytesIO(body)
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    response.reason = reason
+    return response
+
+
+class _HttpxBody(io.RawIOBase):
+    """File-like view of a streaming httpx response, used as ``response.raw``."""
+
+    def __init__(self, response, request):
+        super().__init__()
+        self._response = response
+        self._request = request
+        self._chunks = response.iter_bytes()
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        try:
+            while not self._pending:
+                self._pending = next(self._chunks, b"")
+                if not self._pending:
+                    # Hand the connection back as soon as the body is done
+                    self._response.close()
+                    return 0
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e), request=self._request)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def release_conn(self) -> None:
+        """Called by requests.Response.close() once the body has been consumed."""
+        self._response.close()
+
+    def close(self) -> None:
+        self._response.close()
+        super().close()
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    requests transport adapter that sends over HTTP/2 with httpx.
+
+    Requests to one host share a multiplexed connection. ``verify``, ``cert``
+    and the proxy requests selects for the URL are honoured, with one httpx
+    client per combination. A ``stream=True`` body is read from the
+    connection as the caller iterates it; other bodies are read in full.
+    httpx errors are raised as the matching requests exceptions so retries
+    behave as with the default adapter.
+    """
+
+    def __init__(self, settings: Optional[HttpSettings] = None):
+        if not HTTPX_AVAILABLE:
+            raise ImportError('HTTP/2 needs httpx and h2: pip install "clickup-framework[http2]"')
+        super().__init__()
+        self.settings = settings or HttpSettings(http2=True)
+        self._clients: Dict[Tuple[Any, Any, Optional[str]], "httpx.Client"] = {}
+        self._lock = threading.Lock()
+
+    def _get_client(self, verify: Any, cert: Any, proxy: Optional[str]) -> "httpx.Client":
+        key = (verify, cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                limits = httpx.Limits(
+                    max_connections=self.settings.pool_maxsize if self.settings.pool_block else None,
+                    max_keepalive_connections=self.settings.pool_maxsize,
+                )
+                transport = httpx.HTTPTransport(http2=True, verify=verify, cert=cert, limits=limits, proxy=proxy)
+                client = self._clients[key] = httpx.Client(transport=transport)
+            return client
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        proxy = select_proxy(request.url, proxies) if proxies else None
+        client = self._get_client(verify, tuple(cert) if isinstance(cert, list) else cert, proxy)
+        try:
+            response = client.send(
+                client.build_request(
+                    request.method,
+                    request.url,
+                    headers=dict(request.headers),
+                    content=request.body,
+                    timeout=timeout,
+                ),
+                stream=stream,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e), request=request)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e), request=request)
+
+        # httpx decodes the body, so its encoding and length no longer apply
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in ("content-encoding", "content-length")
+        }
+        if stream:
+            result = build_response(request, response.status_code, headers, b"", response.reason_phrase)
+            result._content = False
+            result._content_consumed = False
+            result.raw = _HttpxBody(response, request)
+        else:
+            result = build_response(request, response.status_code, headers, response.content, response.reason_phrase)
+        result.connection = self
+        return result
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+
+def mount_adapters(session: requests.Session, settings: HttpSettings) -> None:
+    """Mount the pooled (or HTTP/2) adapter for http:// and https:// on a session."""
+    adapter: BaseAdapter
+    if settings.http2 and HTTPX_AVAILABLE:
+        adapter = Http2Adapter(settings)
+    else:
+        if settings.http2:
+            logger.warning('HTTP/2 requested but httpx/h2 are not installed; using HTTP/1.1')
+        adapter = PooledHTTPAdapter(settings)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
@@ -27,6 +27,8 @@ import time
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
+from clickup_framework import serialization
+
 # fcntl is Unix-only, not available on Windows
 try:
     import fcntl
@@ -68,13 +70,13 @@ class ChecklistMappingManager:
             return
 
         try:
-            with open(self.mapping_file, 'r') as f:
+            with open(self.mapping_file, 'r', encoding='utf-8') as f:
                 # Acquire shared lock for reading (Unix only)
                 if HAS_FCNTL:
                     fcntl.flock(f.fileno(), fcntl.LOCK_SH)
                 try:
                     content = f.read()
-                    self._mappings = json.loads(content) if content else {}
+                    self._mappings = serialization.loads(content) if content else {}
 
                     # Validate structure
                     if not isinstance(self._mappings, dict):
@@ -101,12 +103,12 @@ class ChecklistMappingManager:
             while not lock_acquired and (time.time() - start_time) < self.LOCK_TIMEOUT:
                 try:
                     # Open in write mode, create if doesn't exist
-                    with open(self.mapping_file, 'w') as f:
+                    with open(self.mapping_file, 'w', encoding='utf-8') as f:
                         # Acquire exclusive lock for writing
                         fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
                         lock_acquired = True
                         try:
-                            json.dump(self._mappings, f, indent=2)
+                            serialization.dump(self._mappings, f, indent=True)
                         finally:
                             fcntl.flock(f.fileno(), fcntl.LOCK_UN)
                 except BlockingIOError:
@@ -117,8 +119,8 @@ class ChecklistMappingManager:
                 raise RuntimeError(f"Could not acquire lock on {self.mapping_file} after {self.LOCK_TIMEOUT}s")
         else:
             # Windows: No file locking, just write directly
-            with open(self.mapping_file, 'w') as f:
-                json.dump(self._mappings, f, indent=2)
+            with open(self.mapping_file, 'w', encoding='utf-8') as f:
+                serialization.dump(self._mappings, f, indent=True)
 
         # Set file permissions to user-only (0600)
         try:
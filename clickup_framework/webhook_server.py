@@ -0,0 +1,309 @@
+"""
+Webhook Receiver
+
+Local HTTP endpoint for ClickUp webhooks that keeps the workspace mirror and
+response cache fresh without polling, and runs parent task automation as
+soon as a subtask changes status.
+
+ClickUp signs each delivery with the webhook's secret: the ``X-Signature``
+header is the hex HMAC-SHA256 of the raw request body. Deliveries with a
+missing or wrong signature are rejected with 401.
+
+Handled events:
+    taskCreated, taskUpdated  re-fetch the task into the mirror
+    taskStatusUpdated         same, then run ParentTaskAutomationEngine
+    taskDeleted               drop the task and its subtasks from the mirror
+    taskCommentPosted         invalidate the task's cached responses
+
+Every task event invalidates the task's cached responses; all but comments
+also invalidate its list (and, for a move, the list it came from), so cached
+task pages of that list are re-fetched.
+
+The search index, when given (or enabled on the client), follows the same
+events; comment events re-fetch the task's comments into it.
+
+Usage:
+    processor = WebhookProcessor(ClickUpClient(memo_ttl=0), mirror=WorkspaceMirror())
+    with WebhookServer(processor, secret="...", port=8787):
+        ...
+
+Or from the CLI: ``cum webhook serve --secret ... --port 8787``.
+"""
+
+import hashlib
+import hmac
+import logging
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from . import serialization
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = "X-Signature"
+
+TASK_EVENTS = ("taskCreated", "taskUpdated", "taskStatusUpdated", "taskDeleted", "taskCommentPosted")
+
+# Deliveries remembered for de-duplicating ClickUp's retries
+_SEEN_LIMIT = 1000
+
+
+def sign(body: bytes, secret: str) -> str:
+    """Return the signature ClickUp sends for ``body``."""
+    return hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """Check an ``X-Signature`` header value in constant time."""
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(body, secret), signature.strip().lower())
+
+
+def _status_change(payload: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """Return (old, new) status names from a taskStatusUpdated payload's history items."""
+    for item in payload.get("history_items") or []:
+        if item.get("field") == "status":
+            before = item.get("before") or {}
+            after = item.get("after") or {}
+            return before.get("status"), after.get("status")
+    return None, None
+
+
+def _list_id(task: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Return the ID of the list a task (as fetched or mirrored) belongs to."""
+    ref = (task or {}).get("list")
+    if isinstance(ref, dict):
+        ref = ref.get("id")
+    return str(ref) if ref else None
+
+
+class WebhookProcessor:
+    """
+    Applies webhook events to local caches.
+
+    The client should be created with ``memo_ttl=0`` so re-fetches after an
+    event are never answered from the in-process memo.
+    """
+
+    def __init__(self, client, mirror=None, response_cache=None, automation=None, search_index=None):
+        """
+        Initialize processor.
+
+        Args:
+            client: ClickUpClient used to re-fetch changed tasks
+            mirror: WorkspaceMirror to keep current (optional)
+            response_cache: ResponseCache to invalidate (default: the client's)
+            automation: ParentTaskAutomationEngine to run on status changes (optional)
+            search_index: SearchIndex to keep current (default: the client's)
+        """
+        self.client = client
+        self.mirror = mirror
+        self.response_cache = response_cache if response_cache is not None else client.response_cache
+        self.automation = automation
+        self.search_index = search_index if search_index is not None else getattr(client, "search_index", None)
+        self._seen: "OrderedDict[Tuple, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_duplicate(self, payload: Dict[str, Any]) -> bool:
+        history = tuple(str(item.get("id")) for item in payload.get("history_items") or [] if item.get("id"))
+        if not history:
+            return False
+        key = (payload.get("webhook_id"), payload.get("event"), payload.get("task_id"), history)
+        with self._lock:
+            if key in self._seen:
+                return True
+            self._seen[key] = None
+            if len(self._seen) > _SEEN_LIMIT:
+                self._seen.popitem(last=False)
+        return False
+
+    def handle(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply one webhook delivery.
+
+        Args:
+            payload: Decoded request body
+
+        Returns:
+            Dict with ``event``, ``task_id`` and ``applied``, plus ``mirrored``,
+            ``removed`` or ``automation`` depending on the event
+        """
+        event = payload.get("event")
+        task_id = payload.get("task_id")
+        result: Dict[str, Any] = {"event": event, "task_id": task_id, "applied": False}
+        if event not in TASK_EVENTS or not task_id:
+            return result
+        if self._is_duplicate(payload):
+            result["duplicate"] = True
+            return result
+
+        task_id = str(task_id)
+        if self.response_cache is not None:
+            self.response_cache.invalidate(f"task/{task_id}")
+        result["applied"] = True
+
+        # The mirror still holds the task as it was: its list before a delete or move
+        previous_list_id = None
+        if self.mirror is not None and event != "taskCommentPosted":
+            previous_list_id = _list_id(self.mirror.get_task(task_id))
+
+        if event == "taskDeleted":
+            self._invalidate_lists(previous_list_id)
+            if self.mirror is not None:
+                result["removed"] = self.mirror.remove_task(task_id)
+            if self.search_index is not None:
+                self.search_index.remove_task(task_id)
+            return result
+        if event == "taskCommentPosted":
+            # Comments are not mirrored; only the search index keeps their text
+            if self.search_index is not None:
+                comments = self.client.get_task_comments(task_id).get("comments") or []
+                self.search_index.index_comments(task_id, comments)
+            return result
+
+        task = self.client.get_task(task_id)
+        self._invalidate_lists(previous_list_id, _list_id(task))
+        if self.mirror is not None:
+            result["mirrored"] = self.mirror.upsert_task(task)
+        if self.search_index is not None:
+            self.search_index.index_tasks([task])
+
+        if event == "taskStatusUpdated" and self.automation is not None and task.get("parent"):
+            old_status, new_status = _status_change(payload)
+            new_status = new_status or (task.get("status") or {}).get("status")
+            if new_status:
+                update = self.automation.handle_status_update(task_id, old_status or "", new_status)
+                result["automation"] = bool(update.automation_triggered)
+        return result
+
+    def _invalidate_lists(self, *list_ids: Optional[str]) -> None:
+        """Drop cached responses of the given lists, including their task pages."""
+        if self.response_cache is None:
+            return
+        for list_id in dict.fromkeys(list_id for list_id in list_ids if list_id):
+            self.response_cache.invalidate(f"list/{list_id}")
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Verifies and dispatches webhook deliveries."""
+
+    server: "WebhookServer._HTTPServer"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_POST(self):
+        owner: WebhookServer = self.server.owner
+        if self.path.split("?", 1)[0].rstrip("/") != owner.path.rstrip("/"):
+            self._reply(404, {"err": "Not found"})
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        if owner.secret and not verify_signature(body, self.headers.get(SIGNATURE_HEADER), owner.secret):
+            self._reply(401, {"err": "Invalid signature"})
+            return
+        try:
+            payload = serialization.loads(body)
+        except ValueError:
+            self._reply(400, {"err": "Invalid JSON"})
+            return
+        if not isinstance(payload, dict):
+            self._reply(400, {"err": "Expected a JSON object"})
+            return
+
+        try:
+            result = owner.processor.handle(payload)
+        except Exception as e:
+            # A non-2xx reply makes ClickUp retry the delivery later
+            logger.warning("Failed to apply %s for task %s: %s", payload.get("event"), payload.get("task_id"), e)
+            self._reply(500, {"err": str(e)})
+            return
+        if owner.on_event is not None:
+            owner.on_event(result)
+        self._reply(200, result)
+
+    def _reply(self, status: int, payload: Any) -> None:
+        body = serialization.dumps_bytes(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class WebhookServer:
+    """
+    HTTP server feeding signed webhook deliveries to a WebhookProcessor.
+
+    Use as a context manager, call ``start`` / ``stop``, or
+    ``serve_forever`` to run in the foreground.
+    """
+
+    class _HTTPServer(ThreadingHTTPServer):
+        daemon_threads = True
+        owner: "WebhookServer"
+
+    def __init__(
+        self,
+        processor: WebhookProcessor,
+        secret: Optional[str],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/",
+        on_event=None,
+    ):
+        """
+        Initialize server.
+
+        Args:
+            processor: Applies verified events
+            secret: Webhook secret from create_webhook; None accepts unsigned deliveries
+            host: Interface to bind (default: 127.0.0.1)
+            port: Port to bind; 0 picks a free one
+            path: URL path deliveries are posted to
+            on_event: Optional callback receiving each ``WebhookProcessor.handle`` result
+        """
+        self.processor = processor
+        self.secret = secret
+        self.path = path if path.startswith("/") else f"/{path}"
+        self.on_event = on_event
+        self._httpd = self._HTTPServer((host, port), _WebhookHandler)
+        self._httpd.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def start(self) -> "WebhookServer":
+        """Serve deliveries on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, name="clickup-webhooks", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve deliveries in the foreground until interrupted."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "WebhookServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Client Construction Benchmark
+
+Measures what a short-lived caller (one MCP tool call, one CLI command) pays
+before its first request:
+
+- ``import clickup_framework`` in a fresh interpreter
+- ``ClickUpClient(api_token=...)`` construction
+- first access of an API namespace (``client.tasks``)
+
+With ``--max-init-us`` or ``--max-import-ms`` the script exits non-zero when
+construction or the package import is slower than the budget, so it can
+guard against regressions in CI.
+
+Usage:
+    python scripts/benchmark_client_init.py
+    python scripts/benchmark_client_init.py --repeat 20000 --max-init-us 100 --max-import-ms 150
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+ROOT = Path(__file__).parent.parent
+
+
+def import_time_ms(runs: int) -> float:
+    """Median wall time of importing the package in a fresh interpreter, minus interpreter startup."""
+    def run(code):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        return time.perf_counter() - start
+
+    baseline = statistics.median(run("pass") for _ in range(runs))
+    package = statistics.median(run("import clickup_framework") for _ in range(runs))
+    return (package - baseline) * 1000
+
+
+def per_call_us(func, repeat: int) -> float:
+    """Best of five timings of func, in microseconds per call."""
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ClickUpClient import and construction cost")
+    parser.add_argument("--repeat", type=int, default=5000, help="Constructions per timing (default: 5000)")
+    parser.add_argument("--import-runs", type=int, default=5, help="Fresh interpreters per import timing (default: 5)")
+    parser.add_argument("--max-init-us", type=float, help="Fail if construction takes longer than this")
+    parser.add_argument("--max-import-ms", type=float, help="Fail if importing the package takes longer than this")
+    args = parser.parse_args()
+
+    from clickup_framework.client import ClickUpClient
+
+    init_us = per_call_us(lambda: ClickUpClient(api_token="pk_benchmark"), args.repeat)
+    first_api_us = per_call_us(lambda: ClickUpClient(api_token="pk_benchmark").tasks, args.repeat) - init_us
+
+    import_ms = import_time_ms(args.import_runs)
+    print(f"import clickup_framework   {import_ms:8.1f} ms")
+    print(f"ClickUpClient()            {init_us:8.1f} us")
+    print(f"first client.tasks access  {first_api_us:8.1f} us")
+
+    failed = False
+    if args.max_init_us is not None and init_us > args.max_init_us:
+        print(f"FAIL: construction {init_us:.1f} us exceeds budget {args.max_init_us:.1f} us")
+        failed = True
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"FAIL: import {import_ms:.1f} ms exceeds budget {args.max_import_ms:.1f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
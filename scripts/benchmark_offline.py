@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Offline CLI Benchmark
+
+Runs hierarchy, dump, assigned and MCP workloads against the bundled fake
+ClickUp server (clickup_framework.fake_server), so timings need no live
+workspace or token and are reproducible in CI. Each scenario runs as a
+separate `cum` process with an isolated HOME and reports wall time and the
+number of API requests it made.
+
+Usage:
+    python scripts/benchmark_offline.py
+    python scripts/benchmark_offline.py --latency 0.08 --tasks-per-list 200 --repeat 5
+    python scripts/benchmark_offline.py --only hierarchy dump
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from clickup_framework.fake_server import FakeClickUpServer, FakeWorkspace
+
+MCP_SNIPPET = """
+import asyncio, sys
+from clickup_framework import mcp_server
+from clickup_framework.client import ClickUpClient
+from clickup_framework.telemetry import ApiTelemetry
+client = ClickUpClient(telemetry=ApiTelemetry(trace_path=sys.argv[3]))
+asyncio.run(mcp_server.handle_get_workspace_hierarchy(client, {"workspace_id": sys.argv[1]}))
+asyncio.run(mcp_server.handle_get_list_tasks(client, {"list_id": sys.argv[2], "detail_level": "detailed"}))
+"""
+
+
+def scenarios(workspace: FakeWorkspace, output_dir: Path):
+    """Return (name, argv) pairs for every benchmark scenario."""
+    cum = [sys.executable, "-m", "clickup_framework"]
+    space_id = next(iter(workspace.spaces))
+    list_id = next(iter(workspace.lists))
+    return [
+        ("hierarchy", cum + ["h", list_id]),
+        ("hierarchy-space", cum + ["h", space_id]),
+        ("dump", cum + ["dump", "list", list_id, "--format", "json", "-o", str(output_dir)]),
+        ("assigned", cum + ["a", "--user-id", str(workspace.user["id"]), "--team-id", workspace.team_id]),
+        ("mcp", [sys.executable, "-c", MCP_SNIPPET, workspace.team_id, list_id]),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark CLI workloads against the fake ClickUp server")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency in seconds (default: 0)")
+    parser.add_argument("--tasks-per-list", type=int, default=50, help="Tasks per generated list (default: 50)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario (default: 3)")
+    parser.add_argument("--only", nargs="+", metavar="SCENARIO", help="Run only these scenarios")
+    parser.add_argument("--verbose", action="store_true", help="Show command output")
+    args = parser.parse_args()
+
+    workspace = FakeWorkspace.generate(tasks_per_list=args.tasks_per_list)
+    with FakeClickUpServer(workspace, latency=args.latency, jitter=args.jitter) as server, \
+            tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        env = {
+            **os.environ,
+            "HOME": str(tmp_path),
+            "USERPROFILE": str(tmp_path),
+            "CLICKUP_API_ROOT": server.api_root,
+            "CLICKUP_API_TOKEN": "pk_fake",
+            "PYTHONPATH": str(Path(__file__).parent.parent),
+        }
+        print(f"Fake server {server.api_root}: {len(workspace.tasks)} tasks, "
+              f"latency {args.latency * 1000:.0f}ms (+{args.jitter * 1000:.0f}ms jitter)")
+        print()
+        print(f"{'Scenario':<16} {'Requests':>8} {'Min s':>8} {'Median s':>9} {'Status':>7}")
+
+        for name, argv in scenarios(workspace, tmp_path / "dump"):
+            if args.only and name not in args.only:
+                continue
+            durations = []
+            requests_made = 0
+            returncode = 0
+            for run in range(args.repeat):
+                trace = tmp_path / f"{name}-{run}.jsonl"
+                command = list(argv)
+                if command[1:3] == ["-m", "clickup_framework"]:
+                    command[3:3] = ["--api-trace", str(trace)]
+                else:
+                    command.append(str(trace))
+                start = time.perf_counter()
+                result = subprocess.run(command, env=env, capture_output=not args.verbose, text=True)
+                durations.append(time.perf_counter() - start)
+                returncode = returncode or result.returncode
+                if trace.exists():
+                    requests_made = sum(1 for _ in trace.open(encoding="utf-8"))
+            status = "ok" if returncode == 0 else f"exit {returncode}"
+            print(f"{name:<16} {requests_made or '-':>8} {min(durations):>8.2f} "
+                  f"{statistics.median(durations):>9.2f} {status:>7}")
+
+
+if __name__ == "__main__":
+    main()
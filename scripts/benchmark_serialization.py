@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+JSON Backend and Compression Benchmark
+
+Builds a synthetic task page shaped like a ClickUp ``GET /team/{id}/task``
+response and reports:
+
+- decode/encode time for the standard library ``json`` module and orjson
+- wire size with identity, gzip and brotli content encoding
+
+Usage:
+    python scripts/benchmark_serialization.py
+    python scripts/benchmark_serialization.py --tasks 5000 --repeat 20
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from clickup_framework import serialization
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+
+def make_task(i: int) -> dict:
+    """Build one task with the fields a real task page carries."""
+    return {
+        "id": f"86a{i:05x}",
+        "custom_id": None,
+        "name": f"Task {i}: implement feature for module {i % 37}",
+        "text_content": "Acceptance criteria:\n- works\n- is tested\n" * 3,
+        "description": "Acceptance criteria:\n- works\n- is tested\n" * 3,
+        "status": {"status": "in progress", "color": "#4194f6", "type": "custom", "orderindex": 2},
+        "orderindex": f"{i}.00000000000000000000000000000000",
+        "date_created": str(1700000000000 + i * 1000),
+        "date_updated": str(1700000500000 + i * 1000),
+        "date_closed": None,
+        "creator": {"id": 1001, "username": "Alex Example", "color": "#7b68ee", "email": "alex@example.com"},
+        "assignees": [{"id": 1002 + i % 5, "username": f"User {i % 5}", "color": "#ff5733", "initials": "U"}],
+        "tags": [{"name": "backend", "tag_fg": "#fff", "tag_bg": "#000"}],
+        "parent": f"86a{i // 10:05x}" if i % 10 else None,
+        "priority": {"id": "3", "priority": "normal", "color": "#6fddff"},
+        "due_date": str(1710000000000 + i * 86400),
+        "points": i % 8,
+        "time_estimate": 3600000,
+        "custom_fields": [
+            {"id": "f1e2d3c4-0000-4000-8000-000000000001", "name": "Sprint", "type": "drop_down",
+             "value": i % 4, "type_config": {"options": [{"id": str(n), "name": f"Sprint {n}"} for n in range(4)]}},
+            {"id": "f1e2d3c4-0000-4000-8000-000000000002", "name": "Estimate", "type": "number", "value": str(i % 13)},
+        ],
+        "dependencies": [],
+        "linked_tasks": [],
+        "list": {"id": "901100000001", "name": "Backlog", "access": True},
+        "folder": {"id": "901100000002", "name": "Engineering", "hidden": False, "access": True},
+        "space": {"id": "901100000003"},
+        "url": f"https://app.clickup.com/t/86a{i:05x}",
+    }
+
+
+def best_of(repeat: int, fn) -> float:
+    """Return the fastest of ``repeat`` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON backends and response compression")
+    parser.add_argument("--tasks", type=int, default=2000, help="Tasks in the synthetic page (default: 2000)")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per measurement (default: 10)")
+    args = parser.parse_args()
+
+    page = {"tasks": [make_task(i) for i in range(args.tasks)], "last_page": False}
+    body = json.dumps(page).encode("utf-8")
+
+    print(f"Synthetic page: {args.tasks} tasks, {len(body) / 1024:.0f} KiB")
+    print()
+    print("Decode / encode (best of %d):" % args.repeat)
+    print(f"  json     decode {best_of(args.repeat, lambda: json.loads(body)):8.1f} ms"
+          f"   encode {best_of(args.repeat, lambda: json.dumps(page).encode('utf-8')):8.1f} ms")
+    if serialization.ORJSON_AVAILABLE:
+        import orjson
+        print(f"  orjson   decode {best_of(args.repeat, lambda: orjson.loads(body)):8.1f} ms"
+              f"   encode {best_of(args.repeat, lambda: orjson.dumps(page)):8.1f} ms")
+    else:
+        print("  orjson   not installed (pip install \"clickup-framework[fast]\")")
+
+    print()
+    print("Wire size:")
+    print(f"  identity {len(body) / 1024:8.0f} KiB")
+    print(f"  gzip     {len(gzip.compress(body, compresslevel=6)) / 1024:8.0f} KiB")
+    if BROTLI_AVAILABLE:
+        print(f"  br       {len(brotli.compress(body, quality=5)) / 1024:8.0f} KiB")
+    else:
+        print("  br       brotli not installed (pip install \"clickup-framework[fast]\")")
+
+
+if __name__ == "__main__":
+    main()
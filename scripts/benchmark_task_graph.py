@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Task Graph Benchmark
+
+Builds synthetic task lists of growing size (wide trees, deep chains and a
+parent cycle) and times the hierarchy and container organizers plus the
+descendant filter used by ``cum hierarchy <task_id>``. Times should grow
+linearly with the task count.
+
+Usage:
+    python scripts/benchmark_task_graph.py
+    python scripts/benchmark_task_graph.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from clickup_framework.commands.hierarchy import _filter_task_and_descendants
+from clickup_framework.components.container import ContainerHierarchyFormatter
+from clickup_framework.components.hierarchy import TaskHierarchyFormatter
+from clickup_framework.components.task_graph import TaskGraph
+
+
+def synthetic_tasks(count):
+    """Tasks under 10 roots with fan-out 8, one 1,000-deep chain and a 3-task cycle."""
+    tasks = []
+    for i in range(count):
+        if i < 10:
+            parent = None
+        elif i < count - 1003:
+            parent = str((i - 10) // 8)
+        elif i < count - 3:
+            parent = str(i - 1)
+        else:
+            parent = str(count - 3 + (i - count + 2) % 3)
+        tasks.append({'id': str(i), 'name': f'Task {i}', 'parent': parent, 'status': {'status': 'to do'}})
+    return tasks
+
+
+def timed_ms(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time TaskGraph-based hierarchy building")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Task counts to benchmark (default: 1000 10000 100000)")
+    args = parser.parse_args()
+    # The synthetic cycle is reported on every organize call
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'Tasks':>8} {'Graph ms':>9} {'Cycles ms':>10} {'Hierarchy ms':>13} {'Container ms':>13} {'Subtree ms':>11}")
+    for size in args.sizes:
+        tasks = synthetic_tasks(max(size, 1100))
+        graph_ms = timed_ms(lambda: TaskGraph(tasks))
+        cycles_ms = timed_ms(lambda: TaskGraph(tasks).find_cycles())
+        hierarchy_ms = timed_ms(lambda: TaskHierarchyFormatter().organize_by_parent_child(tasks))
+        container_ms = timed_ms(lambda: ContainerHierarchyFormatter()._organize_tasks_by_parent(tasks))
+        subtree_ms = timed_ms(lambda: _filter_task_and_descendants(tasks, '0'))
+        print(f"{len(tasks):>8,} {graph_ms:>9.1f} {cycles_ms:>10.1f} {hierarchy_ms:>13.1f} "
+              f"{container_ms:>13.1f} {subtree_ms:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compact Task Model Benchmark
+
+Generates a synthetic workspace with the fake server's data model, then
+compares API dicts against compact ``models.Task`` objects for:
+
+- retained memory of the decoded task list (tracemalloc)
+- conversion time (dicts -> Tasks)
+- reading status, priority and assignee names for every task
+
+Usage:
+    python scripts/benchmark_task_model.py
+    python scripts/benchmark_task_model.py --tasks-per-list 2000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directories to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from clickup_framework import serialization
+from clickup_framework.fake_server import FakeWorkspace
+from clickup_framework.models import compact_tasks
+
+
+def retained_mb(build):
+    """Memory still allocated after build() returns, in MB, plus the built value."""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / 1e6, value
+
+
+def read_dicts(tasks):
+    for task in tasks:
+        (task.get("status") or {}).get("status")
+        (task.get("priority") or {}).get("priority")
+        [user.get("username") for user in task.get("assignees", [])]
+
+
+def read_compact(tasks):
+    for task in tasks:
+        task.status
+        task.priority
+        task.assignee_names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare API task dicts with compact Task objects")
+    parser.add_argument("--tasks-per-list", type=int, default=1000, help="Tasks per generated list (default: 1000)")
+    args = parser.parse_args()
+
+    workspace = FakeWorkspace.generate(spaces=2, folders_per_space=5, lists_per_folder=5,
+                                       tasks_per_list=args.tasks_per_list, comments_per_task=0)
+    page = serialization.dumps_bytes(list(workspace.tasks.values()))
+    del workspace
+
+    dict_mb, raw = retained_mb(lambda: serialization.loads(page))
+    start = time.perf_counter()
+    compact = compact_tasks(raw)
+    convert_s = time.perf_counter() - start
+    del compact
+    compact_mb, compact = retained_mb(lambda: compact_tasks(serialization.loads(page)))
+
+    start = time.perf_counter()
+    read_dicts(raw)
+    dict_read_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    read_compact(compact)
+    compact_read_ms = (time.perf_counter() - start) * 1000
+
+    print(f"{len(raw):,} tasks")
+    print(f"{'':<14} {'Memory MB':>10} {'Read ms':>9}")
+    print(f"{'dicts':<14} {dict_mb:>10.1f} {dict_read_ms:>9.1f}")
+    print(f"{'compact Task':<14} {compact_mb:>10.1f} {compact_read_ms:>9.1f}")
+    print(f"conversion: {convert_s:.2f}s ({convert_s / len(raw) * 1e6:.0f} us/task)")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,6 @@ Usage:
 import argparse
 import json
 import sys
-import time
 from pathlib import Path
 
 # Add parent directories to path for imports
@@ -31,67 +30,73 @@ def load_config(config_file: str) -> dict:
         return json.load(f)
 
 
-def update_tasks(config: dict, dry_run: bool = False):
+def update_tasks(config: dict, dry_run: bool = False, max_workers: int = 4):
     """
     Update tasks based on configuration.
 
     Args:
         config: Configuration dict with task updates
         dry_run: If True, only print what would be done without making changes
+        max_workers: Number of tasks updated in parallel
     """
     client = ClickUpClient()
+    batch = client.batch(max_workers=max_workers)
 
     print(f"\n{'='*80}")
     print(f"Task Update Script - {'DRY RUN' if dry_run else 'LIVE MODE'}")
     print(f"{'='*80}\n")
 
-    total_tasks = len(config.get('tasks', []))
-    successful = 0
-    failed = 0
+    task_configs = config.get('tasks', [])
+    total_tasks = len(task_configs)
 
-    for i, task_config in enumerate(config.get('tasks', []), 1):
+    for i, task_config in enumerate(task_configs, 1):
         task_id = task_config.get('id')
-        print(f"\n[{i}/{total_tasks}] Processing: {task_id}")
+        print(f"\n[{i}/{total_tasks}] Queueing: {task_id}")
         print(f"  Name: {task_config.get('name', 'Unknown')}")
 
-        try:
-            # Update status if specified
-            if 'status' in task_config and task_config['status']:
-                new_status = task_config['status']
+        # Update status if specified
+        if 'status' in task_config and task_config['status']:
+            new_status = task_config['status']
+            if dry_run:
+                print(f"  [DRY RUN] Would update status to: '{new_status}'")
+            else:
+                batch.update_task(task_id, status=new_status)
+
+        # Add comment if specified
+        if 'comment' in task_config and task_config['comment']:
+            comment = task_config['comment']
+            if dry_run:
+                print(f"  [DRY RUN] Would add comment ({len(comment)} chars)")
+            else:
+                batch.add_comment(task_id, comment)
+
+        # Add tags if specified
+        if 'add_tags' in task_config:
+            for tag in task_config['add_tags']:
                 if dry_run:
-                    print(f"  [DRY RUN] Would update status to: '{new_status}'")
+                    print(f"  [DRY RUN] Would add tag: '{tag}'")
                 else:
-                    client.update_task(task_id, status=new_status)
-                    print(f"  ✓ Status updated to: '{new_status}'")
-
-            # Add comment if specified
-            if 'comment' in task_config and task_config['comment']:
-                comment = task_config['comment']
-                if dry_run:
-                    print(f"  [DRY RUN] Would add comment ({len(comment)} chars)")
+                    batch.add_tag(task_id, tag)
+
+    if dry_run:
+        successful, failed = total_tasks, 0
+    else:
+        # Writes run in parallel under the client's rate limiter, retrying transient errors
+        results_by_task = batch.execute().by_key()
+        successful = failed = 0
+        for task_config in task_configs:
+            task_id = task_config.get('id')
+            results = results_by_task.get(task_id, [])
+            print(f"\n{task_id}:")
+            for item in results:
+                if item.success:
+                    print(f"  ✓ {item.description}")
                 else:
-                    client.create_task_comment(task_id, comment)
-                    print(f"  ✓ Comment added ({len(comment)} chars)")
-
-            # Add tags if specified
-            if 'add_tags' in task_config:
-                for tag in task_config['add_tags']:
-                    if dry_run:
-                        print(f"  [DRY RUN] Would add tag: '{tag}'")
-                    else:
-                        client.add_tag_to_task(task_id, tag)
-                        print(f"  ✓ Tag added: '{tag}'")
-
-            successful += 1
-
-            # Rate limiting - small delay between requests
-            if not dry_run:
-                time.sleep(0.3)
-
-        except Exception as e:
-            failed += 1
-            print(f"  ✗ Error: {str(e)}")
-            continue
+                    print(f"  ✗ {item.description}: {item.error}")
+            if all(item.success for item in results):
+                successful += 1
+            else:
+                failed += 1
 
     # Summary
     print(f"\n{'='*80}")
@@ -107,6 +112,8 @@ def main():
     parser.add_argument('config', help='Path to JSON configuration file')
     parser.add_argument('--dry-run', action='store_true',
                        help='Print what would be done without making changes')
+    parser.add_argument('--workers', type=int, default=4,
+                       help='Number of tasks to update in parallel (default: 4)')
 
     args = parser.parse_args()
 
@@ -126,7 +133,7 @@ def main():
         sys.exit(1)
 
     # Run updates
-    update_tasks(config, dry_run=args.dry_run)
+    update_tasks(config, dry_run=args.dry_run, max_workers=args.workers)
 
 
 if __name__ == '__main__':
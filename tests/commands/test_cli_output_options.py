@@ -106,3 +106,46 @@ def test_handle_output_writes_markdown_to_common_output_file(capsys):
         assert "Output written:" in captured.err
     finally:
         output_file.unlink(missing_ok=True)
+
+
+def test_handle_output_streams_console_lines_to_common_output_file(capsys):
+    output_file = _cache_output_path(".txt")
+    command = DummyCommand(
+        argparse.Namespace(output="console", common_output_file=str(output_file))
+    )
+    written = []
+
+    def lines():
+        for line in ("Tasks", "", "└── one"):
+            written.append(line)
+            yield line
+
+    try:
+        command.handle_output({"id": "task-1"}, console_output=lines())
+
+        assert output_file.read_text(encoding="utf-8") == "Tasks\n\n└── one"
+        assert written == ["Tasks", "", "└── one"]
+        assert "Output written:" in capsys.readouterr().err
+    finally:
+        output_file.unlink(missing_ok=True)
+
+
+def test_data_age_is_printed_after_streamed_output(capsys):
+    client = SimpleNamespace(cached_data_age=None, set_read_policy=lambda **kwargs: None)
+
+    class OfflineCommand(DummyCommand):
+        def _create_client(self):
+            return client
+
+    def lines():
+        yield "Tasks"
+        # Streamed views fetch (and age) while they render
+        client.cached_data_age = 7200
+        yield "└── one"
+
+    command = OfflineCommand(argparse.Namespace(output="console", offline=True))
+    command.handle_output({"id": "task-1"}, console_output=lines())
+
+    captured = capsys.readouterr()
+    assert "└── one" in captured.out
+    assert "Showing cached data up to" in captured.err
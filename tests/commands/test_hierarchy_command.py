@@ -43,19 +43,19 @@ class TestFetchAllPages:
 
     def test_multiple_pages(self):
         """Test fetching across multiple pages."""
-        # Simulate 3 pages of results
-        mock_func = Mock(side_effect=[
+        # Simulate 3 pages of results, keyed by page since later pages are prefetched in parallel
+        pages = [
             {'tasks': [{'id': '1'}, {'id': '2'}], 'last_page': False},
             {'tasks': [{'id': '3'}, {'id': '4'}], 'last_page': False},
             {'tasks': [{'id': '5'}], 'last_page': True}
-        ])
+        ]
+        mock_func = Mock(side_effect=lambda page, **kw: pages[page] if page < len(pages) else {'tasks': [], 'last_page': True})
 
         result = _fetch_all_pages(mock_func, subtasks=True)
 
-        assert len(result) == 5
-        assert result[0]['id'] == '1'
-        assert result[4]['id'] == '5'
-        assert mock_func.call_count == 3
+        assert [t['id'] for t in result] == ['1', '2', '3', '4', '5']
+        requested = {c.kwargs['page'] for c in mock_func.call_args_list}
+        assert {0, 1, 2} <= requested
 
     def test_empty_response(self):
         """Test fetching when no results returned."""
@@ -576,8 +576,9 @@ class TestIntegration:
 
         sys.stdout = sys.__stdout__
 
-        # Verify all pages were fetched
-        assert mock_client_inst.get_team_tasks.call_count == 3
+        # Verify all pages were fetched (pages past the last one may be prefetched speculatively)
+        requested = {c.kwargs['page'] for c in mock_client_inst.get_team_tasks.call_args_list}
+        assert {0, 1, 2} <= requested
 
         # Verify all 250 tasks were passed to display
         display_call = mock_display_inst.hierarchy_view.call_args
@@ -1,11 +1,14 @@
 """Regression tests for the internal search command execution path."""
 
 import io
+import tempfile
 import unittest
 from argparse import Namespace
+from pathlib import Path
 from unittest.mock import patch
 
 from clickup_framework.commands.search_command import SearchCommand
+from clickup_framework.search_index import SearchIndex
 
 
 class TestSearchCommand(unittest.TestCase):
@@ -32,7 +35,7 @@ class TestSearchCommand(unittest.TestCase):
             pattern="stash",
             container_id="901517404274",
             case_sensitive=False,
-            regex=False,
+            regex=True,
         )
 
         command = SearchCommand(args, command_name="search")
@@ -48,35 +51,117 @@ class TestSearchCommand(unittest.TestCase):
     @patch("clickup_framework.commands.base_command.ClickUpClient")
     @patch("clickup_framework.commands.base_command.get_context_manager")
     @patch("clickup_framework.commands.search_command.hierarchy_command")
-    def test_search_no_regex_treats_pattern_as_literal(
+    def test_search_queries_the_index_without_rendering(
         self,
         mock_hierarchy_command,
         mock_get_context_manager,
         _mock_client,
     ):
         mock_get_context_manager.return_value.get_ansi_output.return_value = False
+        mock_get_context_manager.return_value.resolve_id.side_effect = ValueError("no workspace")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index = SearchIndex(path=Path(tmp) / "search.db")
+            index.index_tasks([
+                {"id": "86ghi", "name": "Fix bug in stash cleanup", "status": {"status": "to do", "type": "open"},
+                 "list": {"id": "1", "name": "Backlog"}},
+                {"id": "86jkl", "name": "Release prep", "status": {"status": "to do", "type": "open"},
+                 "list": {"id": "1", "name": "Backlog"}},
+            ])
+            args = Namespace(
+                pattern="stash",
+                container_id=None,
+                case_sensitive=False,
+                regex=False,
+                no_refresh=True,
+            )
+
+            command = SearchCommand(args, command_name="search")
+            stdout = io.StringIO()
+            with patch.object(SearchCommand, "_open_index", return_value=index), patch("sys.stdout", stdout):
+                command.execute()
 
-        def fake_hierarchy(_args):
-            print("Task bug.*fix literal [86ghi]")
-            print("Task bug123fix regex-style [86jkl]")
+        output = stdout.getvalue()
+        mock_hierarchy_command.assert_not_called()
+        self.assertIn('Found 1 result(s) matching "stash"', output)
+        self.assertIn("Fix bug in stash cleanup [86ghi]", output)
+        self.assertNotIn("86jkl", output)
 
-        mock_hierarchy_command.side_effect = fake_hierarchy
+    @patch("clickup_framework.commands.base_command.ClickUpClient")
+    @patch("clickup_framework.commands.base_command.get_context_manager")
+    @patch("clickup_framework.commands.search_command.resolve_container_id")
+    def test_index_search_resolves_the_container(
+        self,
+        mock_resolve_container_id,
+        mock_get_context_manager,
+        _mock_client,
+    ):
+        mock_get_context_manager.return_value.get_ansi_output.return_value = False
+        mock_get_context_manager.return_value.resolve_id.side_effect = ValueError("no workspace")
+        mock_resolve_container_id.return_value = {"type": "task", "id": "86ghi", "data": {}, "list_id": "1"}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index = SearchIndex(path=Path(tmp) / "search.db")
+            index.index_tasks([
+                {"id": "86ghi", "name": "Stash in backlog", "status": {"status": "to do", "type": "open"},
+                 "list": {"id": "1", "name": "Backlog"}},
+                {"id": "86jkl", "name": "Stash elsewhere", "status": {"status": "to do", "type": "open"},
+                 "list": {"id": "2", "name": "Other"}},
+            ])
+            args = Namespace(
+                pattern="stash",
+                container_id="current",
+                case_sensitive=False,
+                regex=False,
+                no_refresh=True,
+            )
+
+            command = SearchCommand(args, command_name="search")
+            stdout = io.StringIO()
+            with patch.object(SearchCommand, "_open_index", return_value=index), patch("sys.stdout", stdout):
+                command.execute()
 
-        args = Namespace(
-            pattern="bug.*fix",
-            container_id=None,
-            case_sensitive=False,
-            regex=False,
-        )
+        output = stdout.getvalue()
+        self.assertEqual(mock_resolve_container_id.call_args.args[1], "current")
+        self.assertIn("86ghi", output)
+        self.assertNotIn("86jkl", output)
 
-        command = SearchCommand(args, command_name="search")
-        stdout = io.StringIO()
-        with patch("sys.stdout", stdout):
-            command.execute()
+    @patch("clickup_framework.commands.base_command.ClickUpClient")
+    @patch("clickup_framework.commands.base_command.get_context_manager")
+    def test_failed_refresh_falls_back_to_the_stale_index(self, mock_get_context_manager, _mock_client):
+        mock_get_context_manager.return_value.get_ansi_output.return_value = False
+        mock_get_context_manager.return_value.resolve_id.return_value = "9"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            index = SearchIndex(path=Path(tmp) / "search.db")
+            index.index_tasks([
+                {"id": "86ghi", "team_id": "9", "name": "Stash cleanup", "status": {"status": "to do", "type": "open"},
+                 "list": {"id": "1", "name": "Backlog"}},
+            ])
+            index._conn.execute("INSERT INTO index_state VALUES ('9', 0, 0)")
+            args = Namespace(pattern="stash", container_id=None, case_sensitive=False, regex=False)
+
+            command = SearchCommand(args, command_name="search")
+            stdout = io.StringIO()
+            with patch.object(SearchCommand, "_open_index", return_value=index), \
+                    patch.object(index, "refresh", side_effect=ConnectionError("offline")), \
+                    patch("sys.stdout", stdout):
+                command.execute()
 
         output = stdout.getvalue()
-        self.assertIn("Task bug.*fix literal [86ghi]", output)
-        self.assertNotIn("Task bug123fix regex-style [86jkl]", output)
+        self.assertIn("Could not refresh the search index (offline)", output)
+        self.assertIn("86ghi", output)
+
+    def test_indexes_are_kept_per_token(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            first = SearchIndex.for_token("pk_one", directory=tmp)
+            second = SearchIndex.for_token("pk_two", directory=tmp)
+            try:
+                self.assertNotEqual(first.path, second.path)
+                self.assertNotIn("pk_one", str(first.path))
+            finally:
+                first.close()
+                second.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,116 @@
+"""
+Tests for the detail view prefetch plan.
+"""
+
+import threading
+import time
+
+from clickup_framework.components.detail_prefetch import prefetch_detail
+from clickup_framework.components.detail_view import TaskDetailFormatter
+from clickup_framework.components.options import FormatOptions
+
+
+class StubClient:
+    """Client stub serving a small list; every call takes ``delay`` seconds."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+        self.tasks = {
+            'root': {'id': 'root', 'name': 'Epic', 'parent': 'outside'},
+            'main': {'id': 'main', 'name': 'Main', 'parent': 'root'},
+            'sub': {'id': 'sub', 'name': 'Sub', 'parent': 'main', 'status': {'status': 'to do'}},
+        }
+        self.remote = {
+            'outside': {'id': 'outside', 'name': 'Initiative'},
+            'blocker': {'id': 'blocker', 'name': 'Blocker'},
+            'other': {'id': 'other', 'name': 'Linked one', 'custom_type': 'bug'},
+        }
+
+    def _call(self, *call):
+        with self._lock:
+            self.calls.append(call)
+        time.sleep(self.delay)
+
+    def get_list_tasks(self, list_id, **params):
+        self._call('list', params.get('subtasks'))
+        if params.get('subtasks'):
+            return {'tasks': list(self.tasks.values()), 'last_page': True}
+        return {'tasks': [self.tasks['root']], 'last_page': True}
+
+    def get_task(self, task_id, **params):
+        self._call('task', task_id)
+        return dict(self.remote[task_id])
+
+    def get_task_comments(self, task_id):
+        self._call('comments', task_id)
+        return {'comments': [{'id': f'{task_id}-c', 'comment_text': f'note on {task_id}', 'reply_count': 1,
+                              'user': {'username': 'ada'}}]}
+
+    def get_threaded_comments(self, comment_id):
+        self._call('replies', comment_id)
+        return {'comments': [{'id': f'{comment_id}-r', 'comment_text': 'agreed', 'user': {'username': 'bob'}}]}
+
+    def get_doc_pages(self, workspace_id, doc_id):
+        self._call('doc', doc_id)
+        return {'pages': [{'id': 'p1', 'name': 'Design notes'}]}
+
+
+def _main_task():
+    return {
+        'id': 'main', 'name': 'Main', 'parent': 'root', 'team_id': 'T1',
+        'dependencies': [{'task_id': 'main', 'depends_on': 'blocker'}],
+        'linked_tasks': [{'task_id': 'main', 'link_id': 'other'}],
+        'linked_docs': [{'doc_id': 'D1', 'name': 'Spec'}],
+    }
+
+
+class TestPrefetchDetail:
+    """Test what the plan fetches and attaches."""
+
+    def test_attaches_every_resource(self):
+        client = StubClient()
+        task = _main_task()
+        all_tasks = prefetch_detail(client, task, 'L1')
+
+        assert {t['id'] for t in all_tasks} == {'root', 'main', 'sub', 'blocker', 'outside'}
+        assert task['comments'][0]['_replies'][0]['comment_text'] == 'agreed'
+        assert task['_doc_pages'] == {'D1': [{'id': 'p1', 'name': 'Design notes'}]}
+        assert task['linked_tasks'][0]['name'] == 'Linked one'
+        assert ('comments', 'sub') not in client.calls
+
+    def test_independent_requests_run_concurrently(self):
+        client = StubClient(delay=0.1)
+        start = time.perf_counter()
+        prefetch_detail(client, _main_task(), 'L1')
+        elapsed = time.perf_counter() - start
+
+        # 8 requests one after another would take 0.8s: two concurrent rounds plus one ancestor fetch
+        assert len(client.calls) == 8
+        assert elapsed < 0.6
+
+    def test_without_list_only_task_resources_are_fetched(self):
+        client = StubClient()
+        task = _main_task()
+        assert prefetch_detail(client, task, None) is None
+        assert {call[0] for call in client.calls} == {'comments', 'replies', 'doc', 'task'}
+        assert ('task', 'blocker') not in client.calls
+
+
+class TestRenderingIsOffline:
+    """Test that prefetched data renders without a client."""
+
+    def test_detail_views_render_prefetched_data(self):
+        task = _main_task()
+        all_tasks = prefetch_detail(StubClient(), task, 'L1')
+        formatter = TaskDetailFormatter()
+        options = FormatOptions(colorize_output=False)
+
+        detail = formatter.format_detail(task, options)
+        assert 'Design notes' in detail
+        assert 'Linked one' in detail
+        assert 'agreed' in detail
+
+        context = formatter.format_with_context(task, all_tasks, options)
+        assert 'Epic' in context
@@ -2,9 +2,13 @@
 Tests for TaskHierarchyFormatter.
 """
 
+import threading
+import time
+
 import pytest
 from clickup_framework.components.hierarchy import TaskHierarchyFormatter
 from clickup_framework.components.options import FormatOptions
+from clickup_framework.metadata_cache import MetadataCache
 
 
 class TestTaskHierarchyFormatter:
@@ -130,3 +134,97 @@ class TestTaskHierarchyFormatter:
         # With show_ids, task IDs should be visible
         assert "parent_1" in result
         assert isinstance(result, str)
+
+
+class SlowCommentsClient:
+    """Client stub whose comment calls take a fixed time and record concurrency."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _call(self, name, item_id):
+        with self._lock:
+            self.calls.append((name, item_id))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+
+    def get_task_comments(self, task_id):
+        self._call('comments', task_id)
+        return {'comments': [{'id': f'{task_id}-c', 'comment_text': f'on {task_id}', 'reply_count': 1}]}
+
+    def get_threaded_comments(self, comment_id):
+        self._call('replies', comment_id)
+        return {'comments': [{'id': f'{comment_id}-r', 'comment_text': 'reply'}]}
+
+
+class TestCommentEnrichment:
+    """Tests for concurrent comment enrichment."""
+
+    @staticmethod
+    def _tree():
+        roots = [{'id': f'p{i}', 'date_updated': '1', '_children': [
+            {'id': f'p{i}c{j}', 'date_updated': '1', '_children': []} for j in range(3)
+        ]} for i in range(5)]
+        return roots, [roots[i]['_children'][j]['id'] for i in range(5) for j in range(3)]
+
+    def test_fetches_concurrently_with_bounded_parallelism(self, tmp_path):
+        client = SlowCommentsClient()
+        formatter = TaskHierarchyFormatter(client=client, comment_cache=MetadataCache(path=tmp_path / 'm.db'))
+        roots, child_ids = self._tree()
+
+        start = time.perf_counter()
+        formatter._enrich_tasks_with_comments(roots, 5, max_workers=4)
+        elapsed = time.perf_counter() - start
+
+        # 20 comment + 20 reply requests at 50ms each would take 2s one at a time
+        assert elapsed < 1.5
+        assert client.max_in_flight == 4
+        assert [t['id'] for t in roots] == [f'p{i}' for i in range(5)]
+        assert [c['id'] for t in roots for c in t['_children']] == child_ids
+        child = roots[2]['_children'][1]
+        assert child['comments'][0]['comment_text'] == f"on {child['id']}"
+        assert child['comments'][0]['_replies'][0]['id'] == f"{child['id']}-c-r"
+
+    def test_reuses_comments_until_task_is_updated(self, tmp_path):
+        cache = MetadataCache(path=tmp_path / 'm.db')
+        roots, _ = self._tree()
+        TaskHierarchyFormatter(client=SlowCommentsClient(0), comment_cache=cache)._enrich_tasks_with_comments(roots, 5)
+
+        client = SlowCommentsClient(0)
+        roots, _ = self._tree()
+        roots[0]['date_updated'] = '2'
+        TaskHierarchyFormatter(client=client, comment_cache=cache)._enrich_tasks_with_comments(roots, 5)
+
+        assert client.calls == [('comments', 'p0'), ('replies', 'p0-c')]
+        assert roots[1]['comments'][0]['_replies'][0]['comment_text'] == 'reply'
+
+    def test_default_cache_is_separate_from_list_metadata(self, tmp_path, monkeypatch):
+        from clickup_framework import metadata_cache
+
+        monkeypatch.setattr(metadata_cache, 'COMMENT_CACHE_PATH', tmp_path / 'comments.db')
+        monkeypatch.delattr(metadata_cache.get_comment_cache, '_instance', raising=False)
+        try:
+            cache = TaskHierarchyFormatter(client=SlowCommentsClient(0)).comment_cache
+            assert cache.path == tmp_path / 'comments.db'
+            assert cache.max_bytes == metadata_cache.COMMENT_CACHE_MAX_BYTES
+        finally:
+            metadata_cache.get_comment_cache._instance.close()
+            del metadata_cache.get_comment_cache._instance
+
+    def test_stops_at_time_cap(self):
+        client = SlowCommentsClient(delay=0.5)
+        formatter = TaskHierarchyFormatter(client=client, comment_cache=False)
+        roots, _ = self._tree()
+
+        start = time.perf_counter()
+        formatter._enrich_tasks_with_comments(roots, 5, max_workers=2, timeout=0.2)
+
+        assert time.perf_counter() - start < 0.5
+        assert all(task['comments'] == [] for task in roots)
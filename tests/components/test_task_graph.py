@@ -0,0 +1,90 @@
+"""
+Tests for the TaskGraph parent/child index.
+"""
+
+import time
+
+from clickup_framework.components.container import ContainerHierarchyFormatter
+from clickup_framework.components.hierarchy import TaskHierarchyFormatter
+from clickup_framework.components.task_graph import TaskGraph, parent_id_of
+
+
+def _task(task_id, parent=None):
+    return {'id': task_id, 'name': f'Task {task_id}', 'parent': parent, 'status': {'status': 'to do'}}
+
+
+def _chain(length):
+    return [_task(str(i), str(i - 1) if i else None) for i in range(length)]
+
+
+class TestTaskGraph:
+    """Test lookups and walks."""
+
+    def test_parent_id_accepts_references(self):
+        assert parent_id_of({'parent': {'id': 'p'}}) == 'p'
+        assert parent_id_of({'parent': ''}) is None
+        assert parent_id_of({}) is None
+
+    def test_children_siblings_and_roots(self):
+        graph = TaskGraph([_task('a'), _task('b', 'a'), _task('c', 'a'), _task('d', 'missing')])
+        assert [t['id'] for t in graph.children('a')] == ['b', 'c']
+        assert [t['id'] for t in graph.siblings('b')] == ['c']
+        assert [t['id'] for t in graph.roots()] == ['a', 'd']
+        assert [t['id'] for t in graph.roots(include_orphaned=False)] == ['a']
+        assert [t['id'] for t in graph.orphans()] == ['d']
+        assert graph.parent('b')['id'] == 'a'
+
+    def test_descendants_are_preorder(self):
+        graph = TaskGraph([_task('a'), _task('b', 'a'), _task('c', 'b'), _task('d', 'a')])
+        assert [t['id'] for t in graph.descendants('a')] == ['a', 'b', 'c', 'd']
+        assert [t['id'] for t in graph.descendants('a', include_self=False)] == ['b', 'c', 'd']
+        assert graph.descendants('nope') == []
+
+    def test_readding_a_task_moves_it(self):
+        graph = TaskGraph([_task('a'), _task('b'), _task('c', 'a')])
+        graph.add(_task('c', 'b'))
+        assert graph.children('a') == []
+        assert [t['id'] for t in graph.children('b')] == ['c']
+
+    def test_deep_chains_do_not_recurse(self):
+        graph = TaskGraph(_chain(20000))
+        assert len(graph.descendants('0')) == 20000
+        assert len(graph.ancestors('19999')) == 19999
+        assert graph.find_cycles() == []
+
+
+class TestCycles:
+    """Test cycle detection."""
+
+    def test_each_cycle_is_reported_once(self):
+        tasks = [_task('a', 'c'), _task('b', 'a'), _task('c', 'b'), _task('x', 'a'), _task('s', 's')]
+        graph = TaskGraph(tasks)
+        cycles = graph.find_cycles()
+        assert sorted(sorted(cycle) for cycle in cycles) == [['a', 'b', 'c'], ['s']]
+        assert graph.cycle_ids() == {'a', 'b', 'c', 's'}
+
+    def test_walks_stop_at_cycles(self):
+        graph = TaskGraph([_task('a', 'b'), _task('b', 'a')])
+        assert [t['id'] for t in graph.descendants('a')] == ['a', 'b']
+        assert [t['id'] for t in graph.ancestors('a')] == ['b']
+
+
+class TestFormatters:
+    """Test the formatters built on the graph."""
+
+    def test_hierarchy_and_container_views_handle_wide_trees(self):
+        tasks = [_task('root')] + [_task(f'c{i}', 'root') for i in range(5000)]
+        start = time.perf_counter()
+        roots = TaskHierarchyFormatter().organize_by_parent_child(tasks)
+        organized = ContainerHierarchyFormatter()._organize_tasks_by_parent(tasks)
+        assert time.perf_counter() - start < 5
+        assert [t['id'] for t in roots] == ['root']
+        assert len(roots[0]['_children']) == 5000
+        assert len(organized[0]['_children']) == 5000
+
+    def test_container_view_breaks_cycles(self):
+        organized = ContainerHierarchyFormatter()._organize_tasks_by_parent(
+            [_task('a', 'b'), _task('b', 'a'), _task('c', 'a')]
+        )
+        ids = {t['id'] for t in organized}
+        assert {'a', 'b'} <= ids
@@ -172,3 +172,35 @@ class TestTreeFormatter:
         # Should use box-drawing characters
         tree_str = "\n".join(result)
         assert "├─" in tree_str or "└─" in tree_str
+
+    def test_iter_tree_is_lazy_and_matches_build_tree(self):
+        """Test that lines are produced on demand and match build_tree."""
+        items = [
+            {'name': 'A\ndetail', 'children': [{'name': 'A1', 'children': []}]},
+            {'name': 'B', 'children': [{'name': 'B1', 'children': [{'name': 'B2', 'children': []}]}]},
+        ]
+        formatted = []
+
+        def format_fn(item):
+            formatted.append(item['name'])
+            return item['name']
+
+        lines = TreeFormatter.iter_tree(items, format_fn, lambda item: item['children'], max_depth=1)
+        assert next(lines) == "├── A"
+        assert formatted == ['A\ndetail']
+        assert list(lines) == TreeFormatter.build_tree(items, lambda i: i['name'], lambda i: i['children'],
+                                                       max_depth=1)[1:]
+
+    def test_iter_render_handles_very_deep_trees(self):
+        """Test that deep chains render without recursion."""
+        root = node = {'name': 'n0', 'children': []}
+        for i in range(1, 5000):
+            child = {'name': f'n{i}', 'children': []}
+            node['children'].append(child)
+            node = child
+
+        lines = list(TreeFormatter.iter_render([root], lambda i: i['name'], lambda i: i['children'], header="Deep"))
+
+        assert lines[:2] == ["Deep", ""]
+        assert len(lines) == 5002
+        assert lines[-1] == " " * (4 * 4999) + "└── n4999"
@@ -0,0 +1,127 @@
+"""
+Tests for AsyncClickUpClient
+
+Exercises request handling, error mapping, token fallback and the awaiting
+API overrides without network access by stubbing the transport.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from clickup_framework.async_client import AsyncClickUpClient, _query_pairs
+from clickup_framework.exceptions import ClickUpNotFoundError, ClickUpAPIError
+
+
+def _response(status, payload=None, headers=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    return status, headers or {}, body
+
+
+def _make_client(responses, **kwargs):
+    """Build a client whose _send pops canned responses and records calls."""
+    client = AsyncClickUpClient(api_token="pk_test", **kwargs)
+    client.calls = []
+
+    async def fake_send(method, url, params=None, **send_kwargs):
+        client.calls.append((method, url, params, send_kwargs, client.api_token))
+        return responses.pop(0)
+
+    client._send = fake_send
+    return client
+
+
+class TestAsyncRequest:
+    """Test the async request loop."""
+
+    def test_get_task_returns_payload(self):
+        client = _make_client([_response(200, {"id": "t1", "name": "Task"})])
+        task = asyncio.run(client.get_task("t1"))
+        assert task == {"id": "t1", "name": "Task"}
+        method, url, _, _, _ = client.calls[0]
+        assert method == "GET"
+        assert url.endswith("/task/t1")
+
+    def test_v3_endpoint_uses_v3_base(self):
+        client = _make_client([_response(200, {"docs": []})])
+        asyncio.run(client.get_workspace_docs("ws1"))
+        assert "/api/v3/workspaces/ws1/docs" in client.calls[0][1]
+
+    def test_204_and_empty_body_return_empty_dict(self):
+        client = _make_client([_response(204), _response(200)])
+        assert asyncio.run(client.delete_task("t1")) == {}
+        assert asyncio.run(client.update_task("t1", name="x")) == {}
+
+    def test_not_found_is_not_retried(self):
+        client = _make_client([_response(404, {"err": "nope"})])
+        with pytest.raises(ClickUpNotFoundError):
+            asyncio.run(client.get_task("missing"))
+        assert len(client.calls) == 1
+
+    def test_rate_limit_waits_retry_after_then_succeeds(self):
+        client = _make_client([
+            _response(429, {"err": "slow down"}, {"Retry-After": "3"}),
+            _response(200, {"id": "t1"}),
+        ])
+        waits = []
+
+        async def fake_sleep(seconds):
+            waits.append(seconds)
+
+        with patch("clickup_framework.async_client.asyncio.sleep", side_effect=fake_sleep):
+            result = asyncio.run(client.get_task("t1"))
+        assert result == {"id": "t1"}
+        assert waits == [3]
+
+    def test_server_error_raises_api_error(self):
+        client = _make_client([_response(500, {"err": "boom"})], max_retries=1)
+        with pytest.raises(ClickUpAPIError) as exc_info:
+            asyncio.run(client.get_task("t1"))
+        assert exc_info.value.status_code == 500
+        assert exc_info.value.message == "boom"
+
+    def test_401_switches_to_fallback_token(self):
+        with patch.dict("os.environ", {"CLICKUP_API_TOKEN": "pk_env"}):
+            client = _make_client([_response(401, {"err": "bad"}), _response(200, {"id": "t1"})])
+        assert asyncio.run(client.get_task("t1")) == {"id": "t1"}
+        assert client.calls[0][4] == "pk_test"
+        assert client.calls[1][4] == "pk_env"
+
+    def test_concurrent_requests_share_one_loop(self):
+        client = _make_client([_response(200, {"id": f"t{i}"}) for i in range(20)])
+
+        async def run():
+            return await asyncio.gather(*(client.get_task(f"t{i}") for i in range(20)))
+
+        results = asyncio.run(run())
+        assert len(results) == 20
+        assert len(client.calls) == 20
+
+
+class TestAsyncAPIOverrides:
+    """Test API classes that post-process responses."""
+
+    def test_create_checklist_unwraps_response(self):
+        client = _make_client([_response(200, {"checklist": {"id": "c1"}})])
+        assert asyncio.run(client.create_checklist("t1", "Todo")) == {"id": "c1"}
+
+    def test_update_checklist_item_extracts_item(self):
+        payload = {"checklist": {"items": [{"id": "i1"}, {"id": "i2", "resolved": True}]}}
+        client = _make_client([_response(200, payload)])
+        item = asyncio.run(client.update_checklist_item("c1", "i2", resolved=True))
+        assert item == {"id": "i2", "resolved": True}
+
+    def test_create_task_comment_adds_comment_text(self):
+        client = _make_client([_response(200, {"id": "cm1"})])
+        comment = asyncio.run(client.create_task_comment("t1", "hello"))
+        assert comment == {"id": "cm1", "comment_text": "hello"}
+        assert client.calls[0][3]["json"] == {"comment_text": "hello"}
+
+
+def test_query_pairs_matches_requests_encoding():
+    pairs = _query_pairs({"assignees[]": [1, 2], "archived": False, "page": 0, "skip": None})
+    assert pairs == [("assignees[]", "1"), ("assignees[]", "2"), ("archived", "False"), ("page", "0")]
@@ -0,0 +1,131 @@
+"""
+Tests for WriteBatch
+
+Covers ordering per task, per-item retry of idempotent writes, failure reporting and parallelism.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+from clickup_framework.batch import WriteBatch
+from clickup_framework.client import ClickUpClient
+from clickup_framework.exceptions import (
+    ClickUpAPIError,
+    ClickUpNotFoundError,
+    ClickUpRateLimitError,
+    ClickUpTimeoutError,
+)
+from clickup_framework.retry import RetryPolicy
+
+
+def _client():
+    client = Mock()
+    client.calls = []
+    lock = threading.Lock()
+
+    def record(name):
+        def call(*args, **kwargs):
+            with lock:
+                client.calls.append((name, args, kwargs))
+            return {"id": args[0] if args else None}
+        return call
+
+    for name in ("update_task", "add_task_tag", "remove_task_tag", "set_custom_field_value",
+                 "create_task_comment", "create_task", "delete_task"):
+        setattr(client, name, Mock(side_effect=record(name)))
+    return client
+
+
+class TestWriteBatch:
+    """Test queueing and execution."""
+
+    def test_report_has_one_result_per_item(self):
+        client = _client()
+        with WriteBatch(client, retry_backoff=0) as batch:
+            batch.update_task("t1", status="done").add_tag("t1", "x").add_comment("t2", "hi")
+        assert batch.report.ok
+        assert [item.operation for item in batch.report.items] == ["update_task", "add_tag", "add_comment"]
+        assert batch.report.summary() == "3/3 succeeded, 0 failed"
+
+    def test_same_task_operations_keep_queue_order(self):
+        client = _client()
+        batch = WriteBatch(client, max_workers=8, retry_backoff=0)
+        for i in range(5):
+            batch.add_tag("t1", f"tag{i}")
+            batch.add_tag("t2", f"tag{i}")
+        batch.execute()
+        t1_tags = [args[1] for name, args, _ in client.calls if args[0] == "t1"]
+        assert t1_tags == [f"tag{i}" for i in range(5)]
+
+    def test_idempotent_writes_are_retried_per_item(self):
+        client = _client()
+        client.update_task.side_effect = [ClickUpAPIError(502, "bad gateway"), {"id": "t1"}]
+        report = WriteBatch(client, retry_backoff=0).update_task("t1", name="x").delete_task("t2").execute()
+        assert report.ok
+        assert report.items[0].attempts == 2
+        assert report.items[1].attempts == 1
+
+    def test_creates_and_comments_are_never_retried(self):
+        client = _client()
+        client.create_task.side_effect = ClickUpTimeoutError("timed out")
+        client.create_task_comment.side_effect = ClickUpAPIError(502, "bad gateway")
+        report = WriteBatch(client, retry_backoff=0).create_task("l1", "New").add_comment("t1", "hi").execute()
+        assert [item.operation for item in report.failed] == ["create_task", "add_comment"]
+        assert [item.attempts for item in report.items] == [1, 1]
+        assert client.create_task.call_count == 1
+        assert client.create_task_comment.call_count == 1
+
+    def test_rate_limit_waits_retry_after(self, monkeypatch):
+        client = _client()
+        client.update_task.side_effect = [ClickUpRateLimitError(2), {"id": "t1"}]
+        sleeps = []
+        monkeypatch.setattr("clickup_framework.batch.time.sleep", sleeps.append)
+        WriteBatch(client, retry_backoff=0.1).update_task("t1", name="x").execute()
+        assert sleeps == [2]
+
+    def test_permanent_errors_are_reported_not_raised(self):
+        client = _client()
+        client.delete_task.side_effect = ClickUpNotFoundError("task", "t9")
+        report = WriteBatch(client, retry_backoff=0).delete_task("t9").add_tag("t1", "x").execute()
+        assert not report.ok
+        assert [item.key for item in report.failed] == ["t9"]
+        assert report.failed[0].attempts == 1
+        assert report.to_dict()["failed"] == 1
+
+    def test_creates_are_not_resent_after_server_errors(self):
+        client = ClickUpClient(api_token="pk_test", retry_policy=RetryPolicy(max_attempts=3, base_delay=0, failure_threshold=10))
+        response = Mock(status_code=502, headers={}, content=b"{}", text="bad gateway")
+        client.session.request = Mock(return_value=response)
+        batch = WriteBatch(client, max_attempts=2, retry_backoff=0)
+        report = batch.create_task("l1", "New").update_task("t1", name="x").execute()
+        assert not report.ok
+        methods = [call.kwargs["method"] for call in client.session.request.call_args_list]
+        assert methods.count("POST") == 1
+        assert methods.count("PUT") == 6
+
+    def test_different_tasks_run_in_parallel(self):
+        client = _client()
+
+        def slow_update(task_id, **updates):
+            time.sleep(0.1)
+            return {"id": task_id}
+
+        client.update_task.side_effect = slow_update
+        batch = WriteBatch(client, max_workers=4)
+        for i in range(4):
+            batch.update_task(f"t{i}", name="x")
+        start = time.time()
+        batch.execute()
+        assert time.time() - start < 0.3
+
+    def test_block_that_raises_discards_batch(self):
+        client = _client()
+        try:
+            with WriteBatch(client) as batch:
+                batch.delete_task("t1")
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        assert batch.report is None
+        client.delete_task.assert_not_called()
@@ -0,0 +1,79 @@
+"""
+Tests for lazy ClickUpClient construction
+
+Construction must not build API namespaces, the HTTP session or read the
+context file when a token is supplied; each is created on first use.
+"""
+
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+from clickup_framework.apis import CommentsAPI, TasksAPI
+from clickup_framework.client import ClickUpClient
+
+
+class TestLazyConstruction:
+    """Test what construction defers."""
+
+    def test_api_namespaces_are_built_on_first_access(self):
+        client = ClickUpClient(api_token="pk_test")
+        assert "tasks" not in vars(client)
+        tasks = client.tasks
+        assert isinstance(tasks, TasksAPI)
+        assert tasks.client is client
+        assert client.tasks is tasks
+
+    def test_namespaces_are_per_client(self):
+        first = ClickUpClient(api_token="pk_a")
+        second = ClickUpClient(api_token="pk_b")
+        assert first.comments is not second.comments
+        assert isinstance(first.comments, CommentsAPI)
+
+    def test_namespace_can_be_replaced(self):
+        client = ClickUpClient(api_token="pk_test")
+        client.tasks = Mock(get_task=Mock(return_value={"id": "t1"}))
+        assert client.get_task("t1") == {"id": "t1"}
+
+    def test_session_is_created_on_first_use(self):
+        client = ClickUpClient(api_token="pk_test")
+        assert "session" not in vars(client)
+        assert client.session.headers["Authorization"] == "pk_test"
+        assert client.session is client.session
+
+    def test_context_file_not_read_when_token_given(self):
+        with patch("clickup_framework.client.get_context_manager") as get_context:
+            client = ClickUpClient(api_token="pk_test")
+            get_context.assert_not_called()
+            get_context.return_value.get_api_token.return_value = "pk_stored"
+            assert client.context_token == "pk_stored"
+            assert client.context_token == "pk_stored"
+            get_context.assert_called_once()
+
+    def test_context_token_used_without_parameter_or_env(self, monkeypatch):
+        monkeypatch.delenv("CLICKUP_API_TOKEN", raising=False)
+        with patch("clickup_framework.client.get_context_manager") as get_context:
+            get_context.return_value.get_api_token.return_value = "pk_stored"
+            client = ClickUpClient()
+        assert client.api_token == "pk_stored"
+        assert client.token_source == "context"
+
+    def test_package_import_defers_aiohttp(self):
+        code = "import sys, clickup_framework; print('aiohttp' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_package_import_defers_asyncio_and_http_server(self):
+        code = (
+            "import sys, clickup_framework; "
+            "print(sorted(m for m in ('asyncio', 'http.server', 'clickup_framework.mirror') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "[]"
+
+    def test_lazy_exports_resolve(self):
+        import clickup_framework
+        from clickup_framework.webhook_server import WebhookServer
+
+        assert clickup_framework.WebhookServer is WebhookServer
+        assert all(hasattr(clickup_framework, name) for name in clickup_framework.__all__)
@@ -0,0 +1,176 @@
+"""
+Tests for request coalescing
+
+Covers single-flight sharing, memoization, copy isolation and the client hook.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.coalescing import RequestCoalescer
+
+
+def _response(payload):
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+class TestRequestCoalescer:
+    """Test the coalescer on its own."""
+
+    def test_concurrent_callers_share_one_fetch(self):
+        coalescer = RequestCoalescer()
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(2)
+            return {"id": "t1"}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(coalescer.run("k", fetch))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"id": "t1"}] * 5
+
+    def test_results_are_memoized_and_copied(self):
+        coalescer = RequestCoalescer(memo_ttl=60)
+        fetch = Mock(return_value={"tags": []})
+        first = coalescer.run("k", fetch)
+        first["tags"].append("mutated")
+        second = coalescer.run("k", fetch)
+        assert fetch.call_count == 1
+        assert second == {"tags": []}
+
+    def test_memo_disabled_only_coalesces(self):
+        coalescer = RequestCoalescer(memo_ttl=0)
+        fetch = Mock(return_value={})
+        coalescer.run("k", fetch)
+        coalescer.run("k", fetch)
+        assert fetch.call_count == 2
+
+    def test_clear_forgets_memo(self):
+        coalescer = RequestCoalescer(memo_ttl=60)
+        fetch = Mock(return_value={})
+        coalescer.run("k", fetch)
+        coalescer.clear()
+        coalescer.run("k", fetch)
+        assert fetch.call_count == 2
+
+    def test_clear_during_fetch_skips_memo(self):
+        coalescer = RequestCoalescer(memo_ttl=60)
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            if len(calls) == 1:
+                coalescer.clear()
+            return {"id": "t1"}
+
+        coalescer.run("k", fetch)
+        coalescer.run("k", fetch)
+        assert len(calls) == 2
+
+    def test_unshared_result_is_not_copied(self):
+        coalescer = RequestCoalescer(memo_ttl=0)
+        result = {"id": "t1"}
+        assert coalescer.run("k", lambda: result) is result
+
+    def test_errors_are_not_memoized(self):
+        coalescer = RequestCoalescer()
+        fetch = Mock(side_effect=[ValueError("boom"), {"ok": True}])
+        with pytest.raises(ValueError):
+            coalescer.run("k", fetch)
+        assert coalescer.run("k", fetch) == {"ok": True}
+
+    def test_async_callers_share_one_fetch(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": "t1"}
+
+        async def run():
+            return await asyncio.gather(*(coalescer.run_async("k", fetch) for _ in range(5)))
+
+        results = asyncio.run(run())
+        assert len(calls) == 1
+        assert results == [{"id": "t1"}] * 5
+        assert len({id(result) for result in results}) == 5
+
+
+class TestClientCoalescing:
+    """Test the hook in ClickUpClient._request."""
+
+    def test_duplicate_get_costs_one_request(self):
+        client = ClickUpClient(api_token="pk_test", memo_ttl=30)
+        client.session.request = Mock(return_value=_response({"id": "t1"}))
+        client.get_task("t1")
+        client.get_task("t1")
+        assert client.session.request.call_count == 1
+
+    def test_library_clients_do_not_memoize(self):
+        client = ClickUpClient(api_token="pk_test")
+        client.session.request = Mock(return_value=_response({"id": "t1"}))
+        client.get_task("t1")
+        client.get_task("t1")
+        assert client.session.request.call_count == 2
+
+    def test_write_clears_memo(self):
+        client = ClickUpClient(api_token="pk_test", memo_ttl=30)
+        client.session.request = Mock(return_value=_response({"id": "t1"}))
+        client.get_task("t1")
+        client.update_task("t1", name="renamed")
+        client.get_task("t1")
+        assert client.session.request.call_count == 3
+
+    def test_different_params_are_not_coalesced(self):
+        client = ClickUpClient(api_token="pk_test")
+        client.session.request = Mock(return_value=_response({"tasks": []}))
+        client.get_list_tasks("l1", page=0)
+        client.get_list_tasks("l1", page=1)
+        assert client.session.request.call_count == 2
+
+    def test_attachment_upload_clears_memo(self, tmp_path):
+        from requests.adapters import BaseAdapter
+
+        from clickup_framework.transport import build_response
+
+        sent = []
+
+        class Recorder(BaseAdapter):
+            def send(self, request, **kwargs):
+                sent.append(request)
+                return build_response(request, 200, {}, b'{"id": "a1"}')
+
+            def close(self):
+                pass
+
+        upload = tmp_path / "notes.txt"
+        upload.write_text("hello")
+        client = ClickUpClient(api_token="pk_test", memo_ttl=30)
+        client.session.mount("https://", Recorder())
+        client.get_task("t1")
+        assert client.attachments.create_task_attachment("t1", str(upload)) == {"id": "a1"}
+        client.get_task("t1")
+        assert [request.method for request in sent] == ["GET", "POST", "GET"]
+        assert sent[1].headers["Content-Type"].startswith("multipart/form-data")
+        assert b"hello" in sent[1].body
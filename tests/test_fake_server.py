@@ -0,0 +1,143 @@
+"""
+Tests for the fake ClickUp server and record/replay cassettes
+
+Runs real HTTP requests against a local FakeClickUpServer.
+"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+import requests
+import requests.adapters
+
+from clickup_framework.cassette import Cassette
+from clickup_framework.client import ClickUpClient
+from clickup_framework.exceptions import ClickUpCassetteError, ClickUpNotFoundError
+from clickup_framework.fake_server import PAGE_SIZE, FakeClickUpServer, FakeWorkspace
+
+
+@pytest.fixture(scope="module")
+def server():
+    workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=1, tasks_per_list=150,
+                                       comments_per_task=1)
+    with FakeClickUpServer(workspace) as server:
+        yield server
+
+
+def _client(server, **kwargs):
+    return ClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0, **kwargs)
+
+
+class TestFakeWorkspace:
+    """Test workspace generation."""
+
+    def test_generation_is_deterministic(self):
+        first = FakeWorkspace.generate(tasks_per_list=5, seed=3)
+        second = FakeWorkspace.generate(tasks_per_list=5, seed=3)
+        assert first.tasks == second.tasks
+
+    def test_every_list_gets_its_tasks(self):
+        workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=2, tasks_per_list=4)
+        # Two folder lists plus the folderless backlog
+        assert len(workspace.lists) == 3
+        assert len(workspace.tasks) == 12
+
+
+class TestFakeServer:
+    """Test the served endpoints through ClickUpClient."""
+
+    def test_task_pages_follow_clickup_pagination(self, server):
+        client = _client(server)
+        list_id = next(iter(server.workspace.lists))
+        first = client.get_list_tasks(list_id, page=0, subtasks=True, include_closed=True)
+        assert len(first["tasks"]) == PAGE_SIZE
+        assert first["last_page"] is False
+        every = list(client.iter_list_tasks(list_id, subtasks=True, include_closed=True))
+        assert len(every) == 150
+
+    def test_containers_and_v3_docs(self, server):
+        client = _client(server)
+        workspace = server.workspace
+        space_id = next(iter(workspace.spaces))
+        assert client.get_space(space_id)["id"] == space_id
+        assert len(client.get_space_folders(space_id)["folders"]) == 1
+        assert client.get_workspace_docs(workspace.team_id)["docs"]
+
+    def test_writes_change_the_workspace(self, server):
+        client = _client(server)
+        list_id = next(iter(server.workspace.lists))
+        task = client.create_task(list_id, name="Offline task")
+        client.update_task(task["id"], status="in progress")
+        client.create_task_comment(task["id"], "hello")
+        assert client.get_task(task["id"])["status"]["status"] == "in progress"
+        assert client.get_task_comments(task["id"])["comments"][0]["comment_text"] == "hello"
+        client.delete_task(task["id"])
+        with pytest.raises(ClickUpNotFoundError):
+            client.get_task(task["id"])
+
+    def test_rate_limit_headers_and_429(self):
+        with FakeClickUpServer(FakeWorkspace.generate(tasks_per_list=1), rate_limit=2) as server:
+            client = _client(server)
+            client.get_authorized_workspaces()
+            assert client.rate_limiter.window_remaining == 1
+
+            headers = {"Authorization": "pk_fake"}
+            assert requests.get(f"{server.api_root}/v2/team", headers=headers).status_code == 200
+            limited = requests.get(f"{server.api_root}/v2/team", headers=headers)
+            assert limited.status_code == 429
+            assert limited.headers["X-RateLimit-Remaining"] == "0"
+
+    def test_missing_token_is_rejected(self, server):
+        assert requests.get(f"{server.api_root}/v2/team").status_code == 401
+
+    def test_injected_latency(self):
+        with FakeClickUpServer(FakeWorkspace.generate(tasks_per_list=1), latency=0.05) as server:
+            client = _client(server)
+            client.get_authorized_workspaces()
+            assert client.stats()["endpoints"]["team"]["latency_ms"]["max"] >= 50
+
+
+class TestCassette:
+    """Test record and replay."""
+
+    def test_replay_without_network(self, server, tmp_path, monkeypatch):
+        path = tmp_path / "session.jsonl"
+        list_id = next(iter(server.workspace.lists))
+
+        recorder = _client(server, cassette=Cassette(path, mode="record"))
+        recorded = list(recorder.iter_list_tasks(list_id))
+        assert "pk_fake" not in path.read_text(encoding="utf-8")
+
+        # Every answer must come from the cassette
+        monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", Mock(side_effect=AssertionError("network used")))
+        player = ClickUpClient(api_token="pk_other", api_root=server.api_root, memo_ttl=0,
+                               cassette=Cassette(path, mode="replay"))
+        assert list(player.iter_list_tasks(list_id)) == recorded
+
+    def test_unrecorded_request_raises(self, server, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_text("", encoding="utf-8")
+        client = _client(server, cassette=Cassette(path, mode="replay"))
+        with pytest.raises(ClickUpCassetteError):
+            client.get_authorized_workspaces()
+
+    def test_auto_mode_records_then_replays(self, server, tmp_path):
+        path = tmp_path / "auto.jsonl"
+        assert Cassette(path).mode == "record"
+        assert Cassette(path).mode == "replay"
+
+    def test_async_client_replays_sync_recording(self, server, tmp_path):
+        pytest.importorskip("aiohttp")
+        from clickup_framework.async_client import AsyncClickUpClient
+
+        path = tmp_path / "async.jsonl"
+        task_id = next(iter(server.workspace.tasks))
+        expected = _client(server, cassette=Cassette(path, mode="record")).get_task(task_id)
+
+        async def replay():
+            async with AsyncClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0,
+                                          cassette=Cassette(path, mode="replay")) as client:
+                return await client.get_task(task_id)
+
+        assert asyncio.run(replay()) == expected
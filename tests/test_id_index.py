@@ -0,0 +1,132 @@
+"""
+Tests for the ID index
+
+Feeds an IdIndex from FakeClickUpServer responses and checks that
+resolve_container_id answers known IDs without probing.
+"""
+
+import pytest
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.commands import utils as command_utils
+from clickup_framework.commands.utils import resolve_container_id
+from clickup_framework.fake_server import FakeClickUpServer, FakeWorkspace
+from clickup_framework.id_index import IdIndex, entries_for
+
+
+@pytest.fixture
+def server():
+    workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=2, tasks_per_list=3,
+                                       comments_per_task=0)
+    with FakeClickUpServer(workspace) as server:
+        yield server
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = IdIndex(path=tmp_path / "ids.db")
+    yield index
+    index.close()
+
+
+def _client(server, index):
+    return ClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0, id_index=index)
+
+
+def test_entries_for_a_task_cover_its_containers():
+    task = {"id": "t1", "team_id": "9", "space": {"id": "s1"}, "folder": {"id": "f1"},
+            "list": {"id": "l1"}, "parent": "t0"}
+    entries = {e["id"]: e for e in entries_for("task", task)}
+    assert entries["t1"]["list_id"] == "l1" and entries["t1"]["parent"] == "t0"
+    assert entries["l1"] == {"id": "l1", "type": "list", "folder_id": "f1", "team_id": "9", "space_id": "s1"}
+    hidden = dict(task, folder={"id": "f0", "hidden": True})
+    assert "f0" not in {e["id"] for e in entries_for("task", hidden)}
+
+
+class TestObserve:
+    """Test indexing as a side effect of API calls."""
+
+    def test_hierarchy_listings_and_tasks_are_indexed(self, server, index):
+        ws = server.workspace
+        client = _client(server, index)
+        space_id = client.get_team_spaces(ws.team_id)["spaces"][0]["id"]
+        client.get_space_folders(space_id)
+        client.get_space_lists(space_id)
+        assert index.lookup(space_id)["team_id"] == ws.team_id
+        for list_id, list_data in ws.lists.items():
+            entry = index.lookup(list_id)
+            assert entry["type"] == "list"
+            assert entry["folder_id"] == (None if list_data["folder"].get("hidden") else list_data["folder"]["id"])
+            assert entry["space_id"] == space_id
+
+        task_id = next(iter(ws.tasks))
+        client.get_task(task_id)
+        assert index.lookup(task_id)["list_id"] == ws.tasks[task_id]["list"]["id"]
+        client.delete_task(task_id)
+        assert index.lookup(task_id) is None
+
+    def test_not_found_drops_the_id(self, server, index):
+        client = _client(server, index)
+        index.record([{"id": "gone", "type": "list"}])
+        with pytest.raises(Exception):
+            client.get_list_tasks("gone")
+        assert index.lookup("gone") is None
+
+    def test_entries_are_written_in_batches(self, server, index):
+        client = _client(server, index)
+        client.get_team_spaces(server.workspace.team_id)
+        assert index._pending
+        assert len(index) == 1 and not index._pending
+
+
+class TestResolveContainer:
+    """Test resolve_container_id with an index."""
+
+    def test_recently_indexed_list_needs_no_request(self, server, index):
+        client = _client(server, index)
+        list_id = next(iter(server.workspace.lists))
+        assert resolve_container_id(client, list_id) == {"type": "list", "id": list_id}
+        sent = len(server.request_log)
+        assert resolve_container_id(client, list_id) == {"type": "list", "id": list_id}
+        assert server.request_log[sent:] == []
+
+    def test_known_list_fetches_only_the_list_once_untrusted(self, server, index, monkeypatch):
+        monkeypatch.setattr(command_utils, "INDEX_TRUST_SECONDS", 0)
+        client = _client(server, index)
+        list_id = next(iter(server.workspace.lists))
+        resolve_container_id(client, list_id)
+        sent = len(server.request_log)
+        assert resolve_container_id(client, list_id) == {"type": "list", "id": list_id}
+        assert server.request_log[sent:] == [("GET", f"v2/list/{list_id}")]
+
+    def test_recently_indexed_space_without_data_needs_no_request(self, server, index):
+        client = _client(server, index)
+        space_id = next(iter(server.workspace.spaces))
+        assert resolve_container_id(client, space_id)["type"] == "space"
+        sent = len(server.request_log)
+        assert resolve_container_id(client, space_id, need_data=False) == {"type": "space", "id": space_id}
+        assert server.request_log[sent:] == []
+
+    def test_deleted_list_is_forgotten(self, server, index, monkeypatch):
+        monkeypatch.setattr(command_utils, "INDEX_TRUST_SECONDS", 0)
+        client = _client(server, index)
+        index.record([{"id": "gone", "type": "list"}])
+        with pytest.raises(ValueError):
+            resolve_container_id(client, "gone")
+        assert index.lookup("gone") is None
+
+    def test_known_task_fetches_only_the_task(self, server, index):
+        client = _client(server, index)
+        task_id = next(iter(server.workspace.tasks))
+        assert resolve_container_id(client, task_id)["type"] == "task"
+        sent = len(server.request_log)
+        assert resolve_container_id(client, task_id)["list_id"] == server.workspace.tasks[task_id]["list"]["id"]
+        assert server.request_log[sent:] == [("GET", f"v2/task/{task_id}")]
+
+    def test_stale_entries_fall_back_to_probing(self, server, index):
+        client = _client(server, index)
+        folder_id = next(iter(server.workspace.folders))
+        index.record([{"id": folder_id, "type": "task"}])
+        container = resolve_container_id(client, folder_id)
+        assert container["type"] == "folder"
+        assert index.lookup(folder_id)["type"] == "folder"
@@ -0,0 +1,106 @@
+"""
+Tests for the metadata cache
+
+Checks TTL expiry, LRU eviction and invalidation of MetadataCache, and that
+ContextManager keeps list metadata out of the context file and skips saves
+that change nothing.
+"""
+
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from clickup_framework.context import ContextManager
+from clickup_framework.metadata_cache import KIND_FIELDS, KIND_LIST, MetadataCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = MetadataCache(path=tmp_path / "metadata.db")
+    yield cache
+    cache.close()
+
+
+class TestMetadataCache:
+    """Test the store itself."""
+
+    def test_values_survive_a_new_instance(self, cache):
+        cache.set(KIND_LIST, "L1", {"statuses": [{"status": "to do"}]})
+        reopened = MetadataCache(path=cache.path)
+        try:
+            assert reopened.get(KIND_LIST, "L1") == {"statuses": [{"status": "to do"}]}
+            assert reopened.get(KIND_FIELDS, "L1") is None
+        finally:
+            reopened.close()
+
+    def test_expired_entries_are_misses(self, cache):
+        cache.set(KIND_LIST, "L1", {"id": "L1"}, ttl=-1)
+        assert cache.get(KIND_LIST, "L1") is None
+        cache._memo.clear()
+        assert cache.get(KIND_LIST, "L1") is None
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = MetadataCache(path=tmp_path / "small.db", max_bytes=250)
+        try:
+            for list_id in ("a", "b", "c"):
+                cache.set(KIND_LIST, list_id, {"id": list_id, "pad": "x" * 80})
+                cache._conn.execute("UPDATE metadata SET accessed_at = accessed_at - 10 WHERE key != ?", (list_id,))
+            cache._memo.clear()
+            assert cache.get(KIND_LIST, "a") is None
+            assert cache.get(KIND_LIST, "c") is not None
+        finally:
+            cache.close()
+
+    def test_get_or_fetch_calls_the_client_once(self, cache):
+        client = Mock()
+        client.get_accessible_custom_fields.return_value = {"fields": [{"id": "f1"}]}
+        assert cache.custom_fields(client, "L1") == {"fields": [{"id": "f1"}]}
+        assert cache.custom_fields(client, "L1") == {"fields": [{"id": "f1"}]}
+        client.get_accessible_custom_fields.assert_called_once_with("L1")
+
+    def test_invalidate_by_kind_and_key(self, cache):
+        cache.set(KIND_LIST, "L1", 1)
+        cache.set(KIND_LIST, "L2", 2)
+        cache.set(KIND_FIELDS, "L1", 3)
+        cache.invalidate(KIND_LIST, "L1")
+        assert cache.get(KIND_LIST, "L1") is None
+        assert cache.get(KIND_LIST, "L2") == 2
+        cache.invalidate(KIND_FIELDS)
+        assert cache.get(KIND_FIELDS, "L1") is None
+        cache.clear()
+        assert cache.get(KIND_LIST, "L2") is None
+
+
+class TestContextSaves:
+    """Test that the context file only holds preferences."""
+
+    def test_list_metadata_stays_out_of_the_context_file(self, tmp_path, cache):
+        path = tmp_path / "context.json"
+        context = ContextManager(context_path=str(path), metadata_cache=cache)
+        context.cache_list_metadata("L1", {"statuses": []})
+        assert not path.exists()
+        assert context.get_cached_list_metadata("L1") == {"statuses": []}
+        context.clear_list_cache("L1")
+        assert context.get_cached_list_metadata("L1") is None
+
+    def test_unchanged_preferences_are_not_rewritten(self, tmp_path, cache):
+        path = tmp_path / "context.json"
+        context = ContextManager(context_path=str(path), metadata_cache=cache)
+        context.set_current_list("L1")
+        os.utime(path, (0, 0))
+        context.set_current_list("L1")
+        context.clear_current_task()
+        assert os.stat(path).st_mtime == 0
+        context.set_current_list("L2")
+        assert os.stat(path).st_mtime > 0
+
+    def test_legacy_list_cache_is_dropped_on_next_save(self, tmp_path, cache):
+        path = tmp_path / "context.json"
+        path.write_text(json.dumps({"current_list": "L1", "list_cache": {"L1": {"metadata": {}}}}))
+        context = ContextManager(context_path=str(path), metadata_cache=cache)
+        assert "list_cache" not in context.get_all()
+        context.set_current_task("t1")
+        assert "list_cache" not in json.loads(path.read_text())
+        assert not list(tmp_path.glob("*.tmp"))
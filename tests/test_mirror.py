@@ -0,0 +1,156 @@
+"""
+Tests for the SQLite workspace mirror
+
+Syncs a FakeClickUpServer workspace, then checks incremental refreshes,
+deletion handling, queries and the --mirror command path.
+"""
+
+import argparse
+from unittest.mock import Mock, patch
+
+import pytest
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.fake_server import FakeClickUpServer, FakeWorkspace
+from clickup_framework.mirror import WorkspaceMirror, format_age
+
+
+@pytest.fixture
+def server():
+    workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=2, tasks_per_list=40,
+                                       comments_per_task=0)
+    with FakeClickUpServer(workspace) as server:
+        yield server
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = WorkspaceMirror(path=tmp_path / "mirror.db")
+    yield mirror
+    mirror.close()
+
+
+def _client(server):
+    return ClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0)
+
+
+class TestSync:
+    """Test full and incremental syncs."""
+
+    def test_first_sync_is_full(self, server, mirror):
+        ws = server.workspace
+        report = mirror.sync(_client(server), ws.team_id)
+        assert report["full"] is True
+        assert report["tasks"] == len(ws.tasks)
+        assert report["lists"] == len(ws.lists)
+        assert mirror.sync_state(ws.team_id)["tasks"] == len(ws.tasks)
+
+    def test_incremental_sync_fetches_only_changes(self, server, mirror):
+        ws = server.workspace
+        client = _client(server)
+        mirror.sync(client, ws.team_id)
+        task_id = next(iter(ws.tasks))
+        ws.update_task(task_id, {"name": "Renamed"})
+        # Move everything else outside the overlap window
+        for other in ws.tasks.values():
+            if other["id"] != task_id:
+                other["date_updated"] = "1"
+        mirror._conn.execute("UPDATE sync_state SET high_water = ?", (int(ws.tasks[task_id]["date_updated"]) - 1,))
+
+        report = mirror.sync(client, ws.team_id)
+        assert report["full"] is False
+        assert report["tasks"] < len(ws.tasks)
+        assert mirror.get_task(task_id)["name"] == "Renamed"
+
+    def test_full_sync_drops_deleted_tasks(self, server, mirror):
+        ws = server.workspace
+        client = _client(server)
+        mirror.sync(client, ws.team_id)
+        task_id = next(t["id"] for t in ws.tasks.values() if not t["parent"]
+                       and not any(c["parent"] == t["id"] for c in ws.tasks.values()))
+        ws.delete_task(task_id)
+
+        mirror.sync(client, ws.team_id)
+        assert mirror.get_task(task_id) is not None
+        report = mirror.sync(client, ws.team_id, full=True)
+        assert report["removed"] == 1
+        assert mirror.get_task(task_id) is None
+
+
+class TestQueries:
+    """Test reads against a synced mirror."""
+
+    @pytest.fixture(autouse=True)
+    def synced(self, server, mirror):
+        mirror.sync(_client(server), server.workspace.team_id)
+
+    def test_list_tasks_match_the_api_filters(self, server, mirror):
+        ws = server.workspace
+        list_id = next(iter(ws.lists))
+        expected = ws.filter_tasks({"subtasks": ["true"]}, list_ids=[list_id])
+        tasks = mirror.get_tasks(list_ids=[list_id])
+        assert {t["id"] for t in tasks} == {t["id"] for t in expected}
+        top_level = mirror.get_tasks(list_ids=[list_id], subtasks=False, include_closed=True)
+        assert all(t["parent"] is None for t in top_level)
+
+    def test_assignee_and_tag_filters(self, server, mirror):
+        ws = server.workspace
+        user_id = ws.users[0]["id"]
+        tasks = mirror.get_tasks(assignees=[user_id], include_closed=True)
+        assert tasks
+        assert all(user_id in {a["id"] for a in t["assignees"]} for t in tasks)
+        tag = next(tag["name"] for t in ws.tasks.values() for tag in t["tags"])
+        assert all(tag in {x["name"] for x in t["tags"]} for t in mirror.get_tasks(tags=[tag], include_closed=True))
+
+    def test_resolve_container(self, server, mirror):
+        ws = server.workspace
+        space_id = next(iter(ws.spaces))
+        space = mirror.resolve_container(space_id)
+        assert space["type"] == "space"
+        assert len(space["data"]["folders"]) == 1
+        assert len(space["data"]["folders"][0]["lists"]) == 2
+        assert len(space["data"]["lists"]) == 1
+        task_id = next(iter(ws.tasks))
+        assert mirror.resolve_container(task_id)["list_id"] == ws.tasks[task_id]["list"]["id"]
+        assert mirror.resolve_container("missing") is None
+
+
+class TestMirrorCommands:
+    """Test the --mirror read path of display commands."""
+
+    def test_stats_reads_from_the_mirror(self, server, mirror, capsys):
+        from clickup_framework.commands.stats import StatsCommand
+
+        ws = server.workspace
+        mirror.sync(_client(server), ws.team_id)
+        list_id = next(iter(ws.lists))
+        args = argparse.Namespace(list_id=list_id, include_closed=True, type=None, by_type=True,
+                                  use_mirror=True, output="console")
+        with patch.object(WorkspaceMirror, "open_existing", return_value=mirror), \
+                patch.object(StatsCommand, "_create_client", return_value=None):
+            StatsCommand(args, command_name="stats").execute()
+        out = capsys.readouterr().out
+        expected = len(ws.filter_tasks({"include_closed": ["true"]}, list_ids=[list_id]))
+        assert f"TOTAL                     {expected}" in out
+
+    def test_hierarchy_reads_space_from_the_mirror(self, server, mirror):
+        from clickup_framework.commands.hierarchy import _hierarchy_impl
+
+        ws = server.workspace
+        mirror.sync(_client(server), ws.team_id)
+        client = Mock(spec=[])  # any API call would raise AttributeError
+        args = argparse.Namespace(list_id=next(iter(ws.spaces)), show_all=False, space_id=None, header=None,
+                                  include_completed=True, show_closed_only=False, colorize=False, preset="minimal")
+        context = Mock()
+        context.get_ansi_output.return_value = False
+        with patch("clickup_framework.commands.utils.get_context_manager", return_value=context):
+            tasks, output = _hierarchy_impl(args, context, client, False, mirror=mirror)
+        assert "Backlog 1" in output
+        assert len(tasks) == 2  # the folder and the folderless list
+
+
+def test_format_age():
+    assert format_age(5) == "5s"
+    assert format_age(125) == "2m"
+    assert format_age(7300) == "2h"
+    assert format_age(90000) == "1d"
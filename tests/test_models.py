@@ -0,0 +1,109 @@
+"""
+Tests for the compact Task model
+
+Covers dict compatibility, shared objects, lazily decoded fields and the
+resource-layer ``compact`` option.
+"""
+
+import pickle
+from unittest.mock import Mock
+
+from clickup_framework import serialization
+from clickup_framework.components.filters import TaskFilter
+from clickup_framework.fake_server import FakeWorkspace
+from clickup_framework.models import Task, compact_tasks, status_name
+from clickup_framework.resources import TasksAPI
+
+
+def _raw_tasks(count=6):
+    workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=1, tasks_per_list=count)
+    return list(workspace.tasks.values())
+
+
+class TestTask:
+    """Test the compact representation."""
+
+    def test_round_trips_to_the_api_dict(self):
+        raw = _raw_tasks()
+        for task, original in zip(compact_tasks(raw), raw):
+            assert task.to_dict() == original
+            assert task == original
+            assert dict(task) == original
+
+    def test_typed_attributes(self):
+        original = _raw_tasks(1)[0]
+        task = Task.from_api(original)
+        assert task.id == original["id"]
+        assert task.status == original["status"]["status"]
+        assert task.status_type == original["status"]["type"]
+        assert task.priority == (original["priority"] or {}).get("priority")
+        assert task.assignee_names == tuple(user["username"] for user in original["assignees"])
+        assert task.tag_names == tuple(tag["name"] for tag in original["tags"])
+        assert task.list_id == original["list"]["id"]
+        assert task.due_date == original["due_date"]
+
+    def test_batch_shares_small_objects(self):
+        tasks = compact_tasks(_raw_tasks(20))
+        statuses = {}
+        for task in tasks:
+            statuses.setdefault(task.status, task["status"])
+            assert task["status"] is statuses[task.status]
+        assert tasks[0]["list"] is tasks[1]["list"]
+
+    def test_heavy_fields_decoded_on_access(self):
+        original = _raw_tasks(1)[0]
+        task = Task.from_api(original)
+        assert "description" in task
+        assert task["description"] == original["description"]
+        assert task.get("custom_fields") == original["custom_fields"]
+        assert task.get("missing", "default") == "default"
+
+    def test_heavy_fields_are_decoded_once(self, monkeypatch):
+        task = Task.from_api({"id": "t1", "description": "x" * 100, "custom_fields": [{"value": {"a": 1}}]})
+        task["description"] = "edited"
+        loads = Mock(side_effect=serialization.loads)
+        monkeypatch.setattr("clickup_framework.models.serialization.loads", loads)
+        task["custom_fields"][0]["seen"] = True
+        assert task["custom_fields"][0]["seen"] is True
+        assert task["description"] == "edited"
+        assert task.to_dict()["custom_fields"] == task["custom_fields"]
+        assert loads.call_count == 1
+
+    def test_assignment_overrides_and_updates_attributes(self):
+        task = Task.from_api(_raw_tasks(1)[0])
+        task["_children"] = []
+        task["_children"].append("child")
+        task["status"] = {"status": "blocked", "type": "custom"}
+        assert task["_children"] == ["child"]
+        assert task.status == "blocked"
+        assert "_children" in list(task)
+        assert task.to_dict()["status"]["status"] == "blocked"
+
+    def test_serializes_and_pickles(self):
+        original = _raw_tasks(1)[0]
+        task = Task.from_api(original)
+        assert serialization.loads(serialization.dumps_bytes([task])) == [original]
+        assert pickle.loads(pickle.dumps(task)) == original
+
+
+class TestCompactConsumers:
+    """Test existing components and the resource layer with compact tasks."""
+
+    def test_filters_accept_compact_tasks(self):
+        raw = _raw_tasks(30)
+        tasks = compact_tasks(raw)
+        status = status_name(raw[0])
+        assert [t["id"] for t in TaskFilter.filter_by_status(tasks, status)] == \
+            [t["id"] for t in TaskFilter.filter_by_status(raw, status)]
+        assert len(TaskFilter.filter_completed(tasks)) == len(TaskFilter.filter_completed(raw))
+        assert len(TaskFilter.filter_by_tags(tasks, ["backend"])) == len(TaskFilter.filter_by_tags(raw, ["backend"]))
+
+    def test_resource_layer_compact_option(self):
+        raw = _raw_tasks(3)
+        client = Mock()
+        client.get_list_tasks.return_value = {"tasks": raw, "last_page": True}
+        client.iter_list_tasks.return_value = iter(raw)
+        tasks_api = TasksAPI(client)
+        result = tasks_api.get_list_tasks("list1", compact=True)
+        assert all(isinstance(task, Task) for task in result["tasks"])
+        assert [task.id for task in tasks_api.iter_list_tasks("list1")] == [task["id"] for task in raw]
@@ -0,0 +1,114 @@
+"""
+Tests for offline and max-staleness reads
+
+Primes a DiskResponseCache from a FakeClickUpServer, then checks which
+requests reach the server in --offline and --max-staleness mode.
+"""
+
+import argparse
+from unittest.mock import patch
+
+import pytest
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.exceptions import ClickUpOfflineError
+from clickup_framework.fake_server import FakeClickUpServer, FakeWorkspace
+from clickup_framework.response_cache import DiskResponseCache
+
+
+@pytest.fixture
+def server():
+    workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=1, tasks_per_list=10,
+                                       comments_per_task=0)
+    with FakeClickUpServer(workspace) as server:
+        yield server
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskResponseCache(path=tmp_path / "responses.db")
+    yield cache
+    cache.close()
+
+
+def _client(server, cache, **kwargs):
+    return ClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0, response_cache=cache, **kwargs)
+
+
+def _age_entries(cache, seconds):
+    cache._conn.execute("UPDATE responses SET stored_at = stored_at - ?, expires_at = expires_at - ?",
+                        (seconds, seconds))
+
+
+class TestMaxStaleness:
+    """Test serving cached reads within the staleness bound."""
+
+    def test_uncacheable_gets_are_served_within_the_bound(self, server, cache):
+        task_id = next(iter(server.workspace.tasks))
+        client = _client(server, cache, max_staleness=600)
+        client.get_task(task_id)
+        sent = len(server.request_log)
+        assert client.get_task(task_id)["id"] == task_id
+        assert len(server.request_log) == sent
+        assert client.cached_data_age is not None and client.cached_data_age < 5
+
+    def test_entries_older_than_the_bound_are_refetched(self, server, cache):
+        task_id = next(iter(server.workspace.tasks))
+        client = _client(server, cache, max_staleness=600)
+        client.get_task(task_id)
+        _age_entries(cache, 900)
+        sent = len(server.request_log)
+        client.get_task(task_id)
+        assert len(server.request_log) == sent + 1
+
+    def test_streamed_pages_are_cached_whole(self, server, cache):
+        list_id = next(iter(server.workspace.lists))
+        client = _client(server, cache, max_staleness=600)
+        first = client.get_list_tasks(list_id, stream=True)
+        sent = len(server.request_log)
+        second = client.get_list_tasks(list_id, stream=True)
+        assert len(server.request_log) == sent
+        assert [t["id"] for t in second["tasks"]] == [t["id"] for t in first["tasks"]]
+
+
+class TestOffline:
+    """Test reads without any requests."""
+
+    def test_serves_cached_data_of_any_age(self, server, cache):
+        task_id = next(iter(server.workspace.tasks))
+        _client(server, cache, max_staleness=60).get_task(task_id)
+        _age_entries(cache, 3 * 24 * 3600)
+
+        offline = _client(server, cache, offline=True)
+        sent = len(server.request_log)
+        assert offline.get_task(task_id)["id"] == task_id
+        assert len(server.request_log) == sent
+        assert offline.cached_data_age >= 3 * 24 * 3600
+
+    def test_misses_and_writes_raise(self, server, cache):
+        offline = _client(server, cache, offline=True)
+        with pytest.raises(ClickUpOfflineError):
+            offline.get_task("never-fetched")
+        with pytest.raises(ClickUpOfflineError):
+            offline.update_task(next(iter(server.workspace.tasks)), name="x")
+        assert server.request_log == []
+
+    def test_env_var_enables_offline(self, server, cache, monkeypatch):
+        monkeypatch.setenv("CLICKUP_OFFLINE", "1")
+        assert _client(server, cache).offline is True
+
+
+def test_stats_command_offline_annotates_data_age(server, cache, capsys):
+    from clickup_framework.commands.stats import StatsCommand
+
+    list_id = next(iter(server.workspace.lists))
+    args = argparse.Namespace(list_id=list_id, include_closed=False, type=None, by_type=False,
+                              output="console", offline=False, max_staleness="10m")
+    with patch.object(StatsCommand, "_create_client", lambda self: _client(server, cache)), \
+            patch("clickup_framework.mirror.WorkspaceMirror.open_existing", return_value=None):
+        StatsCommand(args, command_name="stats").execute()
+        args.offline, args.max_staleness = True, None
+        sent = len(server.request_log)
+        StatsCommand(args, command_name="stats").execute()
+    assert len(server.request_log) == sent
+    assert "Showing cached data up to" in capsys.readouterr().err
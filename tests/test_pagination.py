@@ -0,0 +1,104 @@
+"""
+Tests for the concurrent pagination helpers.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from clickup_framework.pagination import aiter_pages, collect_pages, iter_pages
+
+
+def _paged_fetcher(page_count, page_size=2, delay=0.0):
+    """Build a fetcher serving page_count pages and recording requested pages."""
+    requested = []
+    lock = threading.Lock()
+
+    def fetch(page, **params):
+        with lock:
+            requested.append(page)
+        if delay:
+            time.sleep(delay)
+        if page >= page_count:
+            return {"tasks": [], "last_page": True}
+        start = page * page_size
+        return {
+            "tasks": [{"id": str(i)} for i in range(start, start + page_size)],
+            "last_page": page == page_count - 1,
+        }
+
+    return fetch, requested
+
+
+class TestIterPages:
+    """Test the threaded page iterator."""
+
+    def test_yields_items_in_page_order(self):
+        fetch, _ = _paged_fetcher(page_count=7)
+        ids = [t["id"] for t in iter_pages(fetch, prefetch=3)]
+        assert ids == [str(i) for i in range(14)]
+
+    def test_single_page_makes_one_request(self):
+        fetch, requested = _paged_fetcher(page_count=1)
+        assert len(list(iter_pages(fetch, prefetch=4))) == 2
+        assert requested == [0]
+
+    def test_prefetch_one_is_sequential(self):
+        fetch, requested = _paged_fetcher(page_count=3)
+        list(iter_pages(fetch, prefetch=1))
+        assert requested == [0, 1, 2]
+
+    def test_missing_last_page_flag_stops(self):
+        fetch = Mock(return_value={"tasks": [{"id": "1"}]})
+        assert len(list(iter_pages(fetch))) == 1
+        fetch.assert_called_once_with(page=0)
+
+    def test_params_are_forwarded(self):
+        fetch = Mock(return_value={"tasks": [], "last_page": True})
+        list(iter_pages(fetch, subtasks=True, include_closed=False))
+        fetch.assert_called_once_with(page=0, subtasks=True, include_closed=False)
+
+    def test_pages_overlap_in_time(self):
+        fetch, _ = _paged_fetcher(page_count=9, delay=0.05)
+        start = time.monotonic()
+        assert len(list(iter_pages(fetch, prefetch=8))) == 18
+        # 1 sequential first page + 8 parallel pages, well under 9 sequential round trips
+        assert time.monotonic() - start < 0.3
+
+    def test_error_raised_after_earlier_pages(self):
+        def fetch(page, **params):
+            if page == 1:
+                raise RuntimeError("boom")
+            return {"tasks": [{"id": str(page)}], "last_page": False}
+
+        seen = []
+        with pytest.raises(RuntimeError):
+            for task in iter_pages(fetch, prefetch=2):
+                seen.append(task["id"])
+        assert seen == ["0"]
+
+
+def test_collect_pages_returns_partial_results_on_error():
+    def fetch(page, **params):
+        if page == 2:
+            raise RuntimeError("boom")
+        return {"tasks": [{"id": str(page)}], "last_page": False}
+
+    assert [t["id"] for t in collect_pages(fetch, prefetch=2)] == ["0", "1"]
+
+
+def test_aiter_pages_yields_items_in_order():
+    sync_fetch, requested = _paged_fetcher(page_count=5)
+
+    async def fetch(page, **params):
+        await asyncio.sleep(0)
+        return sync_fetch(page, **params)
+
+    async def run():
+        return [t["id"] async for t in aiter_pages(fetch, prefetch=3)]
+
+    assert asyncio.run(run()) == [str(i) for i in range(10)]
+    assert requested[0] == 0
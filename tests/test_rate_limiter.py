@@ -0,0 +1,158 @@
+"""
+Tests for RateLimiter
+
+Covers the token bucket and its adaptation to ClickUp's X-RateLimit-* headers.
+"""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.exceptions import ClickUpRateLimitError
+from clickup_framework.rate_limiter import RateLimiter, SharedRateLimiter, rate_limit_reset_at
+
+
+def _headers(limit, remaining, reset_in):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+    }
+
+
+class TestTokenBucket:
+    """Test the default fixed-rate behaviour."""
+
+    def test_starts_full(self):
+        limiter = RateLimiter(requests_per_minute=100)
+        assert limiter._try_acquire(1) == 0
+        assert 98 <= limiter.get_available_tokens() <= 100
+
+    def test_reports_wait_when_empty(self):
+        limiter = RateLimiter(requests_per_minute=60)
+        limiter.tokens = 0
+        wait = limiter._try_acquire(1)
+        assert 0 < wait <= 1.0
+
+    def test_acquire_times_out(self):
+        limiter = RateLimiter(requests_per_minute=1)
+        limiter.tokens = 0
+        assert limiter.acquire(timeout=0.05) is False
+
+
+class TestHeaderAdaptation:
+    """Test learning limit and budget from response headers."""
+
+    def test_learns_plan_limit(self):
+        limiter = RateLimiter(requests_per_minute=100)
+        limiter.update_from_headers({"X-RateLimit-Limit": "1000"})
+        assert limiter.max_tokens == 1000
+        assert limiter.requests_per_minute == 1000
+        assert limiter.burst == 100
+
+    def test_paces_remaining_budget_until_reset(self):
+        limiter = RateLimiter(requests_per_minute=100)
+        limiter.update_from_headers(_headers(100, 60, reset_in=30))
+        assert limiter.tokens == limiter.burst
+        # Remaining budget minus the burst spread over the rest of the window
+        assert abs(limiter.refill_rate - (60 - limiter.burst) / 30) < 0.1
+
+    def test_exhausted_window_waits_for_reset(self):
+        limiter = RateLimiter(requests_per_minute=100)
+        limiter.update_from_headers(_headers(100, 0, reset_in=5))
+        wait = limiter._try_acquire(1)
+        assert 3 < wait <= 5
+
+    def test_window_reset_restores_even_pacing(self):
+        limiter = RateLimiter(requests_per_minute=100)
+        limiter.update_from_headers(_headers(100, 0, reset_in=5))
+        limiter.window_reset_at = time.time() - 1
+        limiter.get_available_tokens()
+        assert limiter.window_reset_at is None
+        assert limiter.refill_rate == 100 / 60.0
+
+    def test_out_of_order_responses_keep_lowest_remaining(self):
+        limiter = RateLimiter(requests_per_minute=100)
+        reset = str(int(time.time() + 30))
+        limiter.update_from_headers({"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": reset})
+        limiter.update_from_headers({"X-RateLimit-Remaining": "40", "X-RateLimit-Reset": reset})
+        assert limiter.window_remaining == 10
+
+    def test_lowercase_headers_are_read(self):
+        limiter = RateLimiter(requests_per_minute=100)
+        limiter.update_from_headers({"x-ratelimit-limit": "300"})
+        assert limiter.max_tokens == 300
+
+    def test_missing_or_mock_headers_are_ignored(self):
+        limiter = RateLimiter(requests_per_minute=100)
+        limiter.update_from_headers({})
+        limiter.update_from_headers(None)
+        limiter.update_from_headers(MagicMock())
+        assert limiter.max_tokens == 100
+        assert limiter.window_reset_at is None
+
+    def test_reset_accepts_relative_seconds(self):
+        now = time.time()
+        assert rate_limit_reset_at({"X-RateLimit-Reset": "12"}, now) == now + 12
+
+
+class TestRateLimitError:
+    """Test the 429 wait derived from response headers."""
+
+    def test_retry_after_header_wins(self):
+        error = ClickUpClient._error_for_response(429, "task/1", None, "", {"Retry-After": "7"})
+        assert isinstance(error, ClickUpRateLimitError)
+        assert error.retry_after == 7
+
+    def test_falls_back_to_window_reset(self):
+        headers = {"X-RateLimit-Reset": str(int(time.time() + 5))}
+        error = ClickUpClient._error_for_response(429, "task/1", None, "", headers)
+        assert 1 <= error.retry_after <= 6
+
+    def test_defaults_to_sixty_seconds(self):
+        error = ClickUpClient._error_for_response(429, "task/1", None, "", {})
+        assert error.retry_after == 60
+
+
+class TestSharedRateLimiter:
+    """Test the cross-process bucket stored on disk."""
+
+    def test_instances_share_one_budget(self, tmp_path):
+        first = SharedRateLimiter(requests_per_minute=2, key="tok", state_dir=tmp_path)
+        second = SharedRateLimiter(requests_per_minute=2, key="tok", state_dir=tmp_path)
+        assert first._try_acquire(1) == 0
+        assert second._try_acquire(1) == 0
+        assert first._try_acquire(1) > 0
+        assert second._try_acquire(1) > 0
+
+    def test_learned_headers_reach_other_processes(self, tmp_path):
+        first = SharedRateLimiter(key="tok", state_dir=tmp_path)
+        second = SharedRateLimiter(key="tok", state_dir=tmp_path)
+        first.update_from_headers({"X-RateLimit-Limit": "1000"})
+        second.get_available_tokens()
+        assert second.max_tokens == 1000
+
+    def test_different_tokens_use_different_files(self, tmp_path):
+        first = SharedRateLimiter.for_token("pk_one", state_dir=tmp_path)
+        second = SharedRateLimiter.for_token("pk_two", state_dir=tmp_path)
+        assert first.state_file != second.state_file
+        assert "pk_one" not in first.state_file.name
+
+    def test_corrupt_state_file_is_ignored(self, tmp_path):
+        limiter = SharedRateLimiter(key="tok", state_dir=tmp_path)
+        limiter.state_file.write_text("not json")
+        assert limiter._try_acquire(1) == 0
+
+    def test_client_opts_in_from_environment(self, tmp_path):
+        with patch.dict("os.environ", {"CLICKUP_SHARED_RATE_LIMIT": "1"}), \
+                patch.object(SharedRateLimiter, "STATE_DIR", tmp_path):
+            client = ClickUpClient(api_token="pk_test")
+        assert isinstance(client.rate_limiter, SharedRateLimiter)
+        assert client.rate_limiter.state_file.parent == tmp_path
+
+    def test_client_defaults_to_private_limiter(self):
+        with patch.dict("os.environ", {}, clear=False):
+            os.environ.pop("CLICKUP_SHARED_RATE_LIMIT", None)
+            client = ClickUpClient(api_token="pk_test")
+        assert not isinstance(client.rate_limiter, SharedRateLimiter)
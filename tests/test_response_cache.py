@@ -0,0 +1,125 @@
+"""
+Tests for the persistent GET response cache
+
+Covers TTL rules, LRU eviction, write invalidation and the client integration.
+"""
+
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.response_cache import DiskResponseCache, resource_of
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskResponseCache(path=tmp_path / "responses.db")
+    yield cache
+    cache.close()
+
+
+def _response(payload, status=200):
+    response = Mock()
+    response.status_code = status
+    response.headers = {}
+    response.content = json.dumps(payload).encode("utf-8")
+    return response
+
+
+class TestDiskResponseCache:
+    """Test the SQLite store."""
+
+    def test_round_trip(self, cache):
+        cache.set("k", "space/1", {"id": "1"}, ttl=60)
+        assert cache.get("k") == {"id": "1"}
+
+    def test_expired_entries_are_dropped(self, cache):
+        cache.set("k", "space/1", {"id": "1"}, ttl=60)
+        cache._conn.execute("UPDATE responses SET expires_at = ?", (time.time() - 1,))
+        assert cache.get("k") is None
+
+    def test_ttl_rules(self, cache):
+        assert cache.ttl_for("team/1/space") == 300
+        assert cache.ttl_for("list/1/field") == 3600
+        assert cache.ttl_for("list/1/member") == 3600
+        assert cache.ttl_for("list/1/task") == 0
+        assert cache.ttl_for("task/abc") == 0
+
+    def test_key_ignores_param_order_and_hides_token(self, cache):
+        first = cache.make_key("pk_secret", "GET", "u", {"a": 1, "b": [2, 3]})
+        second = cache.make_key("pk_secret", "GET", "u", {"b": [2, 3], "a": 1})
+        assert first == second
+        assert first != cache.make_key("pk_other", "GET", "u", {"a": 1, "b": [2, 3]})
+        assert "pk_secret" not in first
+
+    def test_lru_eviction(self, tmp_path):
+        cache = DiskResponseCache(path=tmp_path / "small.db", max_bytes=120)
+        cache.set("old", "space/1", {"pad": "x" * 40}, ttl=60)
+        cache.set("new", "space/2", {"pad": "y" * 40}, ttl=60)
+        cache.get("old")
+        cache.set("newest", "space/3", {"pad": "z" * 40}, ttl=60)
+        assert cache.get("old") is not None
+        assert cache.get("new") is None
+        assert cache.get("newest") is not None
+        cache.close()
+
+    def test_container_write_invalidates_structure(self, cache):
+        cache.set("space", "space/1/list", {"lists": []}, ttl=60)
+        cache.set("user", "user", {"user": {}}, ttl=60)
+        cache.invalidate("list/9")
+        assert cache.get("space") is None
+        assert cache.get("user") is not None
+
+    def test_other_writes_invalidate_own_resource(self, cache):
+        cache.set("space", "space/1", {"id": "1"}, ttl=60)
+        cache.set("goal", "goal/1", {"id": "1"}, ttl=60)
+        cache.invalidate("goal/1/key_result")
+        assert cache.get("goal") is None
+        assert cache.get("space") is not None
+
+    def test_task_write_invalidates_list_task_pages(self, cache):
+        cache.set("page", "list/9/task", {"tasks": []}, ttl=60)
+        cache.set("fields", "list/9/field", {"fields": []}, ttl=60)
+        cache.set("task", "task/1", {"id": "1"}, ttl=60)
+        cache.invalidate("task/1/tag/urgent")
+        assert cache.get("page") is None
+        assert cache.get("task") is None
+        assert cache.get("fields") is not None
+
+    def test_resource_of_strips_v3_prefix(self):
+        assert resource_of("/v3/workspaces/1/docs") == "workspaces/1"
+        assert resource_of("list/123/field") == "list/123"
+
+
+class TestClientCaching:
+    """Test ClickUpClient with a response cache."""
+
+    def test_repeated_get_is_served_from_cache(self, cache):
+        client = ClickUpClient(api_token="pk_test", response_cache=cache)
+        client.session.request = Mock(return_value=_response({"lists": [{"id": "1"}]}))
+        assert client._request("GET", "folder/9/list") == {"lists": [{"id": "1"}]}
+        assert client._request("GET", "folder/9/list") == {"lists": [{"id": "1"}]}
+        assert client.session.request.call_count == 1
+
+    def test_uncacheable_get_always_hits_network(self, cache):
+        client = ClickUpClient(api_token="pk_test", response_cache=cache, memo_ttl=0)
+        client.session.request = Mock(return_value=_response({"id": "t1"}))
+        client._request("GET", "task/t1")
+        client._request("GET", "task/t1")
+        assert client.session.request.call_count == 2
+
+    def test_write_invalidates_cached_get(self, cache):
+        client = ClickUpClient(api_token="pk_test", response_cache=cache)
+        client.session.request = Mock(return_value=_response({"id": "9"}))
+        client._request("GET", "folder/9")
+        client._request("PUT", "folder/9", json={"name": "renamed"})
+        client._request("GET", "folder/9")
+        assert client.session.request.call_count == 3
+
+    def test_cache_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("CLICKUP_RESPONSE_CACHE", raising=False)
+        client = ClickUpClient(api_token="pk_test")
+        assert client.response_cache is None
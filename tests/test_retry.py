@@ -0,0 +1,184 @@
+"""
+Tests for the retry policy
+
+Covers jittered backoff, retry budgets, the circuit breaker, deadlines and
+the client retry loop.
+"""
+
+import json
+import time
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from clickup_framework.batch import WriteBatch
+from clickup_framework.client import ClickUpClient
+from clickup_framework.exceptions import (
+    ClickUpAPIError,
+    ClickUpCircuitOpenError,
+    ClickUpNotFoundError,
+    ClickUpRateLimitError,
+    ClickUpTimeoutError,
+)
+from clickup_framework.retry import RetryPolicy, deadline_remaining, request_deadline, route_of
+
+
+def _response(status, payload=None, headers=None):
+    response = Mock(status_code=status, headers=headers or {}, text="")
+    response.content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    return response
+
+
+def _client(responses, **kwargs):
+    client = ClickUpClient(api_token="pk_test", memo_ttl=0, **kwargs)
+    client.session.request = Mock(side_effect=responses)
+    return client
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waits = []
+    monkeypatch.setattr("clickup_framework.client.time.sleep", waits.append)
+    return waits
+
+
+class TestRetryPolicy:
+    """Test delay, budget and breaker decisions."""
+
+    def test_route_replaces_ids(self):
+        assert route_of("task/abc123/comment") == "task/{id}/comment"
+        assert route_of("/v3/workspaces/9/docs/d1/pages") == "v3/workspaces/{id}/docs/{id}/pages"
+        assert route_of("user") == "user"
+
+    def test_backoff_is_full_jitter_capped(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+        delays = [policy.backoff(10) for _ in range(200)]
+        assert all(0 <= d <= 5 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_post_is_not_retried_on_server_error(self):
+        policy = RetryPolicy()
+        error = ClickUpAPIError(502, "bad gateway")
+        assert policy.next_delay("task/{id}", "POST", error, 0) is None
+        assert policy.next_delay("task/{id}", "GET", error, 0) is not None
+
+    def test_post_is_not_retried_on_timeout_or_connection_error(self):
+        policy = RetryPolicy(retry_budget=1)
+        assert policy.next_delay("task/{id}", "POST", ClickUpTimeoutError("timed out"), 0) is None
+        assert policy.next_delay("task/{id}", "POST", ClickUpAPIError(0, "reset"), 0) is None
+        assert policy.next_delay("task/{id}", "GET", ClickUpTimeoutError("timed out"), 0) is not None
+
+    def test_permanent_errors_are_not_retried(self):
+        policy = RetryPolicy()
+        assert policy.next_delay("task/{id}", "GET", ClickUpNotFoundError("Task"), 0) is None
+
+    def test_retry_budget_is_spent_and_refilled(self):
+        policy = RetryPolicy(max_attempts=10, retry_budget=2, budget_refill=0.5, failure_threshold=100)
+        error = ClickUpTimeoutError("slow")
+        assert policy.next_delay("r", "GET", error, 0) is not None
+        assert policy.next_delay("r", "GET", error, 0) is not None
+        assert policy.next_delay("r", "GET", error, 0) is None
+        policy.record_success("r")
+        policy.record_success("r")
+        assert policy.next_delay("r", "GET", error, 0) is not None
+
+    def test_circuit_opens_after_threshold_and_probes_after_reset(self):
+        policy = RetryPolicy(failure_threshold=2, reset_timeout=0.05)
+        for _ in range(2):
+            policy.before_attempt("r")
+            policy.record_failure("r", ClickUpAPIError(503, "down"))
+        assert policy.circuit_state("r") == "open"
+        with pytest.raises(ClickUpCircuitOpenError):
+            policy.before_attempt("r")
+
+        time.sleep(0.06)
+        policy.before_attempt("r")  # the probe
+        with pytest.raises(ClickUpCircuitOpenError):
+            policy.before_attempt("r")
+        policy.record_success("r")
+        assert policy.circuit_state("r") == "closed"
+
+    def test_client_errors_do_not_open_circuit(self):
+        policy = RetryPolicy(failure_threshold=1)
+        policy.record_failure("r", ClickUpNotFoundError("Task"))
+        assert policy.circuit_state("r") == "closed"
+
+    def test_rate_limit_wait_beyond_limit_is_not_retried(self):
+        policy = RetryPolicy(max_rate_limit_wait=10)
+        assert policy.next_delay("r", "GET", ClickUpRateLimitError(5), 0) == 5
+        assert policy.next_delay("r", "GET", ClickUpRateLimitError(30), 0) is None
+
+
+class TestRequestDeadline:
+    """Test deadline propagation."""
+
+    def test_nested_deadline_keeps_earliest(self):
+        assert deadline_remaining() is None
+        with request_deadline(1):
+            with request_deadline(100):
+                assert deadline_remaining() <= 1
+        assert deadline_remaining() is None
+
+    def test_attempt_timeout_is_shortened(self):
+        policy = RetryPolicy()
+        with request_deadline(2):
+            assert policy.attempt_timeout(30) <= 2
+        assert policy.attempt_timeout(30) == 30
+
+    def test_wait_longer_than_deadline_raises(self):
+        policy = RetryPolicy()
+        with request_deadline(1):
+            assert policy.next_delay("r", "GET", ClickUpRateLimitError(5), 0) is None
+
+
+class TestClientRetries:
+    """Test the client retry loop."""
+
+    def test_server_error_on_get_is_retried(self, sleeps):
+        client = _client([_response(503), _response(200, {"id": "t1"})])
+        assert client.get_task("t1") == {"id": "t1"}
+        assert client.session.request.call_count == 2
+        assert len(sleeps) == 1
+
+    def test_last_error_is_raised_after_max_attempts(self, sleeps):
+        client = _client([_response(500, {"err": "boom"})] * 3)
+        with pytest.raises(ClickUpAPIError) as exc_info:
+            client.get_task("t1")
+        assert exc_info.value.status_code == 500
+        assert client.session.request.call_count == 3
+
+    def test_timeout_raises_timeout_error(self, sleeps):
+        client = _client(requests.exceptions.Timeout())
+        with pytest.raises(ClickUpTimeoutError):
+            client.get_task("t1")
+
+    def test_post_timeout_is_not_resent(self, sleeps):
+        client = _client(requests.exceptions.Timeout())
+        with pytest.raises(ClickUpTimeoutError):
+            client.create_task("l1", name="Task")
+        assert client.session.request.call_count == 1
+        assert sleeps == []
+
+    def test_open_circuit_fails_fast_without_request(self, sleeps):
+        policy = RetryPolicy(max_attempts=1, failure_threshold=2, reset_timeout=60)
+        client = _client([_response(502)] * 2, retry_policy=policy)
+        for task_id in ("t1", "t2"):
+            with pytest.raises(ClickUpAPIError):
+                client.get_task(task_id)
+        with pytest.raises(ClickUpCircuitOpenError):
+            client.get_task("t3")
+        assert client.session.request.call_count == 2
+
+    def test_deadline_caps_request_timeout(self, sleeps):
+        client = _client([_response(200, {"id": "t1"})])
+        with request_deadline(5):
+            client.get_task("t1")
+        assert client.session.request.call_args.kwargs["timeout"] <= 5
+
+    def test_batch_does_not_retry_open_circuit(self):
+        client = Mock()
+        client.delete_task.side_effect = ClickUpCircuitOpenError("task/{id}", 30)
+        report = WriteBatch(client).delete_task("t1").execute()
+        assert isinstance(report.failed[0].error, ClickUpCircuitOpenError)
+        assert client.delete_task.call_count == 1
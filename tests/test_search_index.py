@@ -0,0 +1,127 @@
+"""
+Tests for the full-text search index
+
+Feeds a SearchIndex from FakeClickUpServer responses, through the client
+hook and through refresh, and checks ranking, field filters and deletions.
+"""
+
+import pytest
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.fake_server import FakeClickUpServer, FakeWorkspace
+from clickup_framework.search_index import SearchIndex, build_match
+
+
+@pytest.fixture
+def server():
+    workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=2, tasks_per_list=20,
+                                       comments_per_task=0)
+    with FakeClickUpServer(workspace) as server:
+        yield server
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex(path=tmp_path / "search.db")
+    yield index
+    index.close()
+
+
+def _client(server, index):
+    return ClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0, search_index=index)
+
+
+def _task(task_id, name, description="", tags=(), status_type="open", updated="1"):
+    return {
+        "id": task_id, "name": name, "description": description, "date_updated": updated,
+        "status": {"status": "to do", "type": status_type}, "tags": [{"name": t} for t in tags],
+        "list": {"id": "L1", "name": "Backlog"}, "folder": {"id": "F1", "name": "Platform"},
+        "space": {"id": "S1"}, "team_id": "T1",
+    }
+
+
+class TestBuildMatch:
+    """Test query translation."""
+
+    def test_words_are_anded_prefix_terms(self):
+        assert build_match("login time") == '"login"* AND "time"*'
+        assert build_match("e-mail") == '("e" "mail"*)'
+
+    def test_phrases_and_field_terms(self):
+        assert build_match('"release notes" tags:docs') == '"release notes" AND tags : "docs"*'
+        assert build_match("crash", fields=["name", "tags"]) == '{name tags} : "crash"*'
+
+    def test_rejects_unknown_fields_and_empty_queries(self):
+        with pytest.raises(ValueError):
+            build_match("x", fields=["owner"])
+        with pytest.raises(ValueError):
+            build_match("*** ???")
+
+
+class TestSearch:
+    """Test ranking and filters."""
+
+    def test_name_matches_rank_above_description_matches(self, index):
+        index.index_tasks([
+            _task("a", "Fix flaky build", description="the checkout step fails"),
+            _task("b", "Update docs", description="checkout page copy"),
+            _task("c", "Checkout redesign"),
+            *(_task(f"x{i}", f"Unrelated {i}") for i in range(5)),
+        ])
+        hits = index.search("checkout")
+        assert [hit["id"] for hit in hits][0] == "c"
+        assert {hit["id"] for hit in hits} == {"a", "b", "c"}
+        assert hits[0]["score"] > hits[1]["score"]
+
+    def test_field_filter_and_closed_tasks(self, index):
+        index.index_tasks([
+            _task("a", "Payments", tags=["billing"]),
+            _task("b", "Billing export"),
+            _task("c", "Old billing job", status_type="closed"),
+        ])
+        assert [hit["id"] for hit in index.search("billing", fields=["tags"])] == ["a"]
+        assert {hit["id"] for hit in index.search("billing")} == {"a", "b"}
+        assert {hit["id"] for hit in index.search("billing", include_closed=True)} == {"a", "b", "c"}
+
+    def test_paths_and_containers(self, index):
+        index.index_tasks([_task("a", "Anything")])
+        assert [hit["id"] for hit in index.search("path:platform")] == ["a"]
+        assert index.search("anything", container_id="F1")
+        assert not index.search("anything", container_id="F2")
+
+    def test_comments_survive_task_updates(self, index):
+        index.index_tasks([_task("a", "Task")])
+        index.index_comments("a", [{"comment_text": "blocked on vendor"}])
+        index.index_tasks([_task("a", "Task renamed", updated="2")])
+        assert [hit["id"] for hit in index.search("vendor", fields=["comments"])] == ["a"]
+
+
+class TestClientHook:
+    """Test indexing as a side effect of API calls."""
+
+    def test_fetches_feed_the_index_and_deletes_drop_it(self, server, index):
+        ws = server.workspace
+        client = _client(server, index)
+        list_id = next(iter(ws.lists))
+        tasks = client.get_list_tasks(list_id)["tasks"]
+        target = tasks[0]
+        hits = index.search(f'"{target["name"]}"', fields=["name"], include_closed=True)
+        assert target["id"] in {hit["id"] for hit in hits}
+
+        client.delete_task(target["id"])
+        hits = index.search(f'"{target["name"]}"', fields=["name"], include_closed=True)
+        assert target["id"] not in {hit["id"] for hit in hits}
+
+    def test_refresh_fetches_only_changes(self, server, index):
+        ws = server.workspace
+        client = ClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0, search_index=False)
+        assert index.refresh(client, ws.team_id) == len(ws.tasks)
+        assert index.state(ws.team_id)["tasks"] == len(ws.tasks)
+
+        task_id = next(iter(ws.tasks))
+        ws.update_task(task_id, {"name": "Quarterly zebra audit"})
+        for other in ws.tasks.values():
+            if other["id"] != task_id:
+                other["date_updated"] = "1"
+        assert index.refresh(client, ws.team_id) < len(ws.tasks)
+        assert [hit["id"] for hit in index.search("zebra", include_closed=True)] == [task_id]
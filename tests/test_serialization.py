@@ -0,0 +1,74 @@
+"""
+Tests for the JSON serialization backend
+
+Covers round-tripping, error types, stdlib fallback and client wire format.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from clickup_framework import serialization
+from clickup_framework.client import ClickUpClient
+
+
+PAYLOAD = {"id": "t1", "name": "Ünïcödé ✓", "points": 1.5, "tags": [], "parent": None, 7: "int key"}
+
+
+class TestSerialization:
+    """Test the encode/decode helpers."""
+
+    def test_round_trip(self):
+        decoded = serialization.loads(serialization.dumps(PAYLOAD))
+        assert decoded == json.loads(json.dumps(PAYLOAD))
+
+    def test_accepts_bytes_and_str(self):
+        assert serialization.loads(b'{"a": 1}') == serialization.loads('{"a": 1}') == {"a": 1}
+
+    def test_invalid_json_raises_stdlib_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads(b"{not json")
+
+    def test_indent_matches_stdlib(self):
+        data = {"a": [1, {"b": None}]}
+        assert serialization.dumps(data, indent=True) == json.dumps(data, indent=2)
+
+    def test_non_ascii_written_as_utf8(self, tmp_path):
+        path = tmp_path / "state.json"
+        with open(path, "w", encoding="utf-8") as f:
+            serialization.dump({"name": "✓"}, f, indent=True)
+        assert "✓" in path.read_text(encoding="utf-8")
+        with open(path, "r", encoding="utf-8") as f:
+            assert serialization.load(f) == {"name": "✓"}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+        assert serialization.loads(serialization.dumps_bytes(PAYLOAD)) == json.loads(json.dumps(PAYLOAD))
+
+    def test_unencodable_value_raises_type_error(self):
+        with pytest.raises(TypeError):
+            serialization.dumps({"when": object()})
+
+
+class TestClientWireFormat:
+    """Test that the client sends and decodes bodies through the backend."""
+
+    def test_request_body_is_encoded_json(self):
+        response = Mock(status_code=200, headers={}, content=b'{"id": "t1"}')
+        client = ClickUpClient(api_token="pk_test")
+        client.session.request = Mock(return_value=response)
+
+        assert client.update_task("t1", name="✓") == {"id": "t1"}
+        kwargs = client.session.request.call_args.kwargs
+        assert json.loads(kwargs["data"]) == {"name": "✓"}
+        assert "json" not in kwargs
+
+    def test_session_advertises_compression(self):
+        client = ClickUpClient(api_token="pk_test")
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+
+    def test_session_adds_installed_codecs(self, monkeypatch):
+        monkeypatch.setattr("clickup_framework.client.ACCEPT_ENCODING", "gzip,deflate,br")
+        client = ClickUpClient(api_token="pk_test")
+        assert client.session.headers["Accept-Encoding"] == "gzip,deflate,br"
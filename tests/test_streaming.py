@@ -0,0 +1,139 @@
+"""
+Tests for streaming JSON decoding
+
+Covers the incremental array decoder, StreamedPage and the client's stream mode.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.response_cache import DiskResponseCache
+from clickup_framework.pagination import iter_pages
+from clickup_framework.streaming import StreamedPage, iter_json_array
+
+
+def _chunks(document, size):
+    raw = json.dumps(document).encode("utf-8")
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+def _streaming_response(document, size=7):
+    response = Mock()
+    response.status_code = 200
+    response.headers = {}
+    response.iter_content.return_value = iter(_chunks(document, size))
+    return response
+
+
+TASKS = [
+    {"id": "t1", "name": "Brackets ] and } in \"strings\"", "points": 12345},
+    {"id": "t2", "name": "Ünïcödé ✓", "custom_fields": [{"value": [1, 2, {"a": None}]}]},
+    {"id": "t3", "name": "", "points": -1.5e3},
+]
+
+
+class TestIterJsonArray:
+    """Test incremental decoding of the item array."""
+
+    @pytest.mark.parametrize("size", [1, 3, 16, 4096])
+    def test_items_match_regardless_of_chunking(self, size):
+        document = {"tasks": TASKS, "last_page": False}
+        assert list(iter_json_array(_chunks(document, size))) == TASKS
+
+    def test_other_keys_are_collected_into_meta(self):
+        meta = {}
+        document = {"total": 3, "tasks": TASKS, "last_page": True}
+        list(iter_json_array(_chunks(document, 5), meta=meta))
+        assert meta == {"total": 3, "last_page": True}
+
+    def test_items_are_yielded_before_the_body_ends(self):
+        consumed = []
+
+        def chunks():
+            for chunk in _chunks({"tasks": TASKS}, 8):
+                consumed.append(chunk)
+                yield chunk
+
+        first = next(iter_json_array(chunks()))
+        assert first == TASKS[0]
+        assert len(consumed) < len(_chunks({"tasks": TASKS}, 8))
+
+    def test_empty_array_and_object(self):
+        assert list(iter_json_array([b'{"tasks": []}'])) == []
+        assert list(iter_json_array([b"{}"])) == []
+
+    def test_truncated_body_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(_chunks({"tasks": TASKS}, 10)[:-2]))
+
+    def test_non_object_body_raises(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array([b"[1, 2]"]))
+
+
+class TestStreamedPage:
+    """Test the page wrapper."""
+
+    def test_behaves_like_page_payload(self):
+        response = _streaming_response({"tasks": TASKS, "last_page": False})
+        page = StreamedPage(response)
+        assert list(page["tasks"]) == TASKS
+        assert page.get("last_page") is False
+        response.close.assert_called()
+
+    def test_reading_meta_first_keeps_items(self):
+        page = StreamedPage(_streaming_response({"tasks": TASKS, "last_page": True}))
+        assert page["last_page"] is True
+        assert list(page["tasks"]) == TASKS
+
+    def test_empty_page_is_last(self):
+        page = StreamedPage(_streaming_response({"tasks": [], "last_page": False}))
+        assert list(page["tasks"]) == []
+        assert page.get("last_page") is True
+
+    def test_iter_pages_accepts_streamed_pages(self):
+        pages = {
+            0: {"tasks": TASKS[:2], "last_page": False},
+            1: {"tasks": TASKS[2:], "last_page": True},
+        }
+        fetch = lambda page, **params: StreamedPage(_streaming_response(pages[page]))
+        assert list(iter_pages(fetch, prefetch=2)) == TASKS
+
+
+class TestClientStreaming:
+    """Test stream=True on the task listing endpoints."""
+
+    def test_get_team_tasks_stream_returns_streamed_page(self):
+        client = ClickUpClient(api_token="pk_test")
+        client.session.request = Mock(return_value=_streaming_response({"tasks": TASKS, "last_page": True}))
+        page = client.get_team_tasks("team1", stream=True, page=0)
+        assert isinstance(page, StreamedPage)
+        assert list(page["tasks"]) == TASKS
+        assert client.session.request.call_args.kwargs["stream"] is True
+
+    def test_streamed_items_feed_indexes_telemetry_and_cache(self, tmp_path):
+        cache = DiskResponseCache(path=tmp_path / "responses.db", ttls=[(r"^team/[^/]+/task$", 60)])
+        index = Mock()
+        client = ClickUpClient(api_token="pk_test", response_cache=cache, search_index=index)
+        client.session.request = Mock(return_value=_streaming_response({"tasks": TASKS, "last_page": True}))
+        page = client.get_team_tasks("team1", stream=True, page=0)
+        assert list(page["tasks"]) == TASKS
+
+        observed = [task for call in index.observe.call_args_list for task in call.args[2]["tasks"]]
+        assert observed == TASKS
+        raw = json.dumps({"tasks": TASKS, "last_page": True}).encode("utf-8")
+        assert client.stats()["endpoints"]["team/{id}/task"]["bytes_in"] == len(raw)
+        assert client.get_team_tasks("team1", stream=True, page=0)["tasks"] == TASKS
+        assert client.session.request.call_count == 1
+
+    def test_stream_errors_use_normal_error_mapping(self):
+        from clickup_framework.exceptions import ClickUpNotFoundError
+
+        response = Mock(status_code=404, headers={}, text="", content=b'{"err": "not found"}')
+        client = ClickUpClient(api_token="pk_test")
+        client.session.request = Mock(return_value=response)
+        with pytest.raises(ClickUpNotFoundError):
+            client.get_list_tasks("missing", stream=True)
@@ -0,0 +1,116 @@
+"""
+Tests for API telemetry
+
+Covers the counters, histogram, trace file, client integration and the
+--api-stats CLI flag.
+"""
+
+import json
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from clickup_framework import telemetry
+from clickup_framework.client import ClickUpClient
+from clickup_framework.telemetry import ApiTelemetry
+
+
+def _response(status, payload=None, headers=None):
+    response = Mock(status_code=status, headers=headers or {}, text="")
+    response.content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    return response
+
+
+@pytest.fixture(autouse=True)
+def no_default_telemetry():
+    yield
+    telemetry.install(None)
+
+
+class TestApiTelemetry:
+    """Test recording and reporting."""
+
+    def test_counts_and_bytes_per_route(self):
+        stats = ApiTelemetry()
+        stats.record_request("GET", "task/{id}", 200, 0.04, bytes_in=100, bytes_out=0)
+        stats.record_request("GET", "task/{id}", 429, 0.3, bytes_in=10)
+        stats.record_retry("task/{id}")
+        snapshot = stats.snapshot()
+        task = snapshot["endpoints"]["task/{id}"]
+        assert task["count"] == 2
+        assert task["rate_limited"] == 1
+        assert task["errors"] == 1
+        assert task["retries"] == 1
+        assert task["bytes_in"] == 110
+        assert task["statuses"] == {200: 1, 429: 1}
+        assert snapshot["requests"] == 2
+
+    def test_latency_histogram_and_percentiles(self):
+        stats = ApiTelemetry()
+        for seconds in (0.01, 0.02, 0.03, 0.2, 20):
+            stats.record_request("GET", "r", 200, seconds)
+        latency = stats.snapshot()["endpoints"]["r"]["latency_ms"]
+        assert latency["histogram"]["<=50"] == 3
+        assert latency["histogram"][">10000"] == 1
+        assert latency["p50"] == 50
+        assert latency["max"] == pytest.approx(20000)
+
+    def test_trace_file_has_one_line_per_attempt(self, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        stats = ApiTelemetry(trace_path=path)
+        stats.record_request("GET", "list/{id}", 200, 0.1, bytes_in=5)
+        stats.record_request("PUT", "task/{id}", None, 1.0, error="timed out")
+        stats.close()
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [line["route"] for line in lines] == ["list/{id}", "task/{id}"]
+        assert lines[1]["error"] == "timed out"
+
+    def test_format_table_lists_routes(self):
+        stats = ApiTelemetry()
+        stats.record_request("GET", "team/{id}/task", 200, 0.5)
+        table = stats.format_table()
+        assert "team/{id}/task" in table
+        assert "1 requests" in table
+
+
+class TestClientTelemetry:
+    """Test that the client feeds its telemetry."""
+
+    def test_stats_reflect_requests_and_retries(self, monkeypatch):
+        monkeypatch.setattr("clickup_framework.client.time.sleep", lambda s: None)
+        client = ClickUpClient(api_token="pk_test", memo_ttl=0)
+        client.session.request = Mock(side_effect=[_response(503), _response(200, {"id": "t1"})])
+        client.get_task("t1")
+        task = client.stats()["endpoints"]["task/{id}"]
+        assert task["count"] == 2
+        assert task["retries"] == 1
+        assert task["statuses"] == {503: 1, 200: 1}
+        assert task["bytes_in"] == len(b'{"id": "t1"}')
+
+    def test_installed_default_is_shared_by_new_clients(self):
+        shared = telemetry.install(ApiTelemetry())
+        assert ClickUpClient(api_token="pk_a").telemetry is shared
+        assert ClickUpClient(api_token="pk_b").telemetry is shared
+
+
+class TestApiStatsFlag:
+    """Test the global CLI flag."""
+
+    def test_api_stats_prints_table_at_exit(self, capsys):
+        from clickup_framework import cli
+
+        def command(args):
+            client = ClickUpClient(api_token="pk_test")
+            client.session.request = Mock(return_value=_response(200, {"id": "t1"}))
+            client.get_task("t1")
+
+        parser = cli.build_parser()
+        args = parser.parse_args(["--api-stats", "demo"])
+        args.func = command
+        with patch.object(cli, "build_parser") as build, patch.object(sys, "argv", ["cum", "--api-stats", "demo"]):
+            build.return_value.parse_args.return_value = args
+            cli.main()
+        err = capsys.readouterr().err
+        assert "API statistics" in err
+        assert "task/{id}" in err
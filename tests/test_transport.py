@@ -0,0 +1,111 @@
+"""
+Tests for HTTP transport settings
+
+Covers settings resolution, the pooled adapter mounted on the client
+session, and connection reuse under threaded fan-out.
+"""
+
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.context import ContextManager
+from clickup_framework.fake_server import FakeClickUpServer, FakeWorkspace
+from clickup_framework.transport import (
+    HTTPX_AVAILABLE,
+    Http2Adapter,
+    HttpSettings,
+    PooledHTTPAdapter,
+    _HttpxBody,
+    build_response,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for variable in ("CLICKUP_HTTP_POOL_CONNECTIONS", "CLICKUP_HTTP_POOL_MAXSIZE", "CLICKUP_HTTP_POOL_BLOCK",
+                     "CLICKUP_HTTP_KEEPALIVE", "CLICKUP_HTTP2"):
+        monkeypatch.delenv(variable, raising=False)
+
+
+class TestHttpSettings:
+    """Test settings resolution."""
+
+    def test_environment_overrides_context(self, monkeypatch):
+        monkeypatch.setenv("CLICKUP_HTTP_POOL_MAXSIZE", "8")
+        monkeypatch.setenv("CLICKUP_HTTP2", "yes")
+        settings = HttpSettings.from_environment({"pool_maxsize": 128, "pool_block": True, "unknown": 1})
+        assert settings.pool_maxsize == 8
+        assert settings.pool_block is True
+        assert settings.http2 is True
+
+    def test_invalid_environment_value_is_ignored(self, monkeypatch):
+        monkeypatch.setenv("CLICKUP_HTTP_POOL_MAXSIZE", "lots")
+        assert HttpSettings.from_environment().pool_maxsize == HttpSettings().pool_maxsize
+
+    def test_context_round_trip(self, tmp_path):
+        context = ContextManager(context_path=str(tmp_path / "context.json"))
+        context.set_http_settings(pool_maxsize=32, keepalive=30)
+        context.set_http_settings(keepalive=None)
+        assert ContextManager(context_path=str(tmp_path / "context.json")).get_http_settings() == {"pool_maxsize": 32}
+
+    def test_keepalive_socket_options(self):
+        options = HttpSettings(keepalive=40).socket_options()
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in HttpSettings(keepalive=0).socket_options()
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            HttpSettings(pool_maxsize=0)
+
+
+class TestClientTransport:
+    """Test the adapter mounted on the client session."""
+
+    def test_session_uses_pooled_adapter(self):
+        client = ClickUpClient(api_token="pk_test", http_settings=HttpSettings(pool_maxsize=12, pool_block=True))
+        adapter = client.session.get_adapter("https://api.clickup.com/api/v2/task/1")
+        assert isinstance(adapter, PooledHTTPAdapter)
+        assert adapter._pool_maxsize == 12
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+        assert "socket_options" in adapter.poolmanager.connection_pool_kw
+
+    @pytest.mark.skipif(HTTPX_AVAILABLE, reason="falls back only without httpx/h2")
+    def test_http2_falls_back_without_httpx(self):
+        client = ClickUpClient(api_token="pk_test", http_settings=HttpSettings(http2=True))
+        assert isinstance(client.session.get_adapter("https://api.clickup.com"), PooledHTTPAdapter)
+
+    def test_http2_stream_body_is_read_lazily(self):
+        upstream = Mock()
+        upstream.iter_bytes.return_value = iter([b'{"tasks": ', b"[]}"])
+        request = requests.Request("GET", "https://api.clickup.com/api/v2/team/1/task").prepare()
+        response = build_response(request, 200, {}, b"")
+        response._content, response._content_consumed = False, False
+        response.raw = _HttpxBody(upstream, request)
+        assert b"".join(response.iter_content(4)) == b'{"tasks": []}'
+        response.close()
+        upstream.close.assert_called()
+
+    @pytest.mark.skipif(not HTTPX_AVAILABLE, reason="needs httpx/h2")
+    def test_http2_clients_follow_verify_and_proxy(self):
+        adapter = Http2Adapter()
+        assert adapter._get_client(True, None, None) is adapter._get_client(True, None, None)
+        assert adapter._get_client(False, None, None) is not adapter._get_client(True, None, None)
+        assert adapter._get_client(True, None, "http://proxy:8080") is not adapter._get_client(True, None, None)
+        adapter.close()
+
+    def test_threaded_fan_out_reuses_connections(self):
+        workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=1, tasks_per_list=64)
+        with FakeClickUpServer(workspace) as server:
+            client = ClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0,
+                                   http_settings=HttpSettings(pool_maxsize=16))
+            task_ids = list(workspace.tasks)
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                for _ in range(2):
+                    list(pool.map(client.get_task, task_ids))
+            assert len(server.request_log) == 2 * len(task_ids)
+            assert server.connections_opened <= 16
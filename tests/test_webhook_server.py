@@ -0,0 +1,143 @@
+"""
+Tests for the webhook receiver
+
+Posts signed deliveries to a WebhookServer backed by a FakeClickUpServer
+workspace and checks the mirror, response cache and automation effects.
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from clickup_framework.client import ClickUpClient
+from clickup_framework.fake_server import FakeClickUpServer, FakeWorkspace
+from clickup_framework.mirror import WorkspaceMirror
+from clickup_framework.webhook_server import WebhookProcessor, WebhookServer, sign, verify_signature
+
+SECRET = "whsec_test"
+
+
+@pytest.fixture
+def server():
+    workspace = FakeWorkspace.generate(spaces=1, folders_per_space=1, lists_per_folder=1, tasks_per_list=20,
+                                       comments_per_task=0)
+    with FakeClickUpServer(workspace) as server:
+        yield server
+
+
+@pytest.fixture
+def mirror(tmp_path, server):
+    mirror = WorkspaceMirror(path=tmp_path / "mirror.db")
+    mirror.sync(_client(server), server.workspace.team_id)
+    yield mirror
+    mirror.close()
+
+
+def _client(server):
+    return ClickUpClient(api_token="pk_fake", api_root=server.api_root, memo_ttl=0)
+
+
+def _post(receiver, payload, secret=SECRET):
+    body = json.dumps(payload).encode()
+    headers = {"Content-Type": "application/json"}
+    if secret:
+        headers["X-Signature"] = sign(body, secret)
+    return requests.post(receiver.url, data=body, headers=headers, timeout=5)
+
+
+def test_verify_signature():
+    body = b'{"event": "taskUpdated"}'
+    assert verify_signature(body, sign(body, SECRET), SECRET)
+    assert not verify_signature(body, sign(body, "other"), SECRET)
+    assert not verify_signature(body, None, SECRET)
+
+
+class TestWebhookServer:
+    """Test deliveries over HTTP."""
+
+    def test_rejects_bad_signatures(self, server, mirror):
+        processor = WebhookProcessor(_client(server), mirror=mirror)
+        with WebhookServer(processor, SECRET) as receiver:
+            assert _post(receiver, {"event": "taskUpdated", "task_id": "x"}, secret="wrong").status_code == 401
+            assert _post(receiver, {"event": "taskUpdated", "task_id": "x"}, secret=None).status_code == 401
+
+    def test_task_updated_refreshes_the_mirror(self, server, mirror):
+        ws = server.workspace
+        task_id = next(iter(ws.tasks))
+        ws.update_task(task_id, {"name": "Changed upstream"})
+        processor = WebhookProcessor(_client(server), mirror=mirror)
+        with WebhookServer(processor, SECRET) as receiver:
+            response = _post(receiver, {"event": "taskUpdated", "task_id": task_id, "webhook_id": "w1"})
+        assert response.status_code == 200
+        assert response.json()["mirrored"] is True
+        assert mirror.get_task(task_id)["name"] == "Changed upstream"
+
+    def test_task_deleted_removes_subtasks_too(self, server, mirror):
+        ws = server.workspace
+        parent_id = next(t["parent"] for t in ws.tasks.values() if t["parent"])
+        children = [t["id"] for t in ws.tasks.values() if t["parent"] == parent_id]
+        processor = WebhookProcessor(_client(server), mirror=mirror)
+        with WebhookServer(processor, SECRET) as receiver:
+            response = _post(receiver, {"event": "taskDeleted", "task_id": parent_id})
+        assert response.json()["removed"] >= 1 + len(children)
+        assert mirror.get_task(parent_id) is None
+        assert all(mirror.get_task(child) is None for child in children)
+
+    def test_unknown_events_are_acknowledged_but_ignored(self, server, mirror):
+        processor = WebhookProcessor(_client(server), mirror=mirror)
+        with WebhookServer(processor, SECRET) as receiver:
+            response = _post(receiver, {"event": "listCreated", "list_id": "1"})
+        assert response.status_code == 200
+        assert response.json()["applied"] is False
+
+
+class TestWebhookProcessor:
+    """Test event handling without HTTP."""
+
+    def test_comment_posted_invalidates_the_task_resource(self):
+        cache = Mock()
+        client = Mock()
+        processor = WebhookProcessor(client, response_cache=cache)
+        result = processor.handle({"event": "taskCommentPosted", "task_id": "abc"})
+        assert result["applied"] is True
+        cache.invalidate.assert_called_once_with("task/abc")
+        client.get_task.assert_not_called()
+
+    def test_task_updated_invalidates_old_and_new_list(self):
+        cache = Mock()
+        client = Mock()
+        client.get_task.return_value = {"id": "abc", "list": {"id": "L2"}}
+        mirror = Mock()
+        mirror.get_task.return_value = {"id": "abc", "list": {"id": "L1"}}
+        processor = WebhookProcessor(client, mirror=mirror, response_cache=cache)
+        processor.handle({"event": "taskUpdated", "task_id": "abc"})
+        assert [c.args[0] for c in cache.invalidate.call_args_list] == ["task/abc", "list/L1", "list/L2"]
+
+    def test_task_deleted_invalidates_the_mirrored_list(self):
+        cache = Mock()
+        mirror = Mock()
+        mirror.get_task.return_value = {"id": "abc", "list": {"id": "L1"}}
+        mirror.remove_task.side_effect = lambda task_id: mirror.get_task.assert_called_once_with(task_id) or 1
+        processor = WebhookProcessor(Mock(), mirror=mirror, response_cache=cache)
+        processor.handle({"event": "taskDeleted", "task_id": "abc"})
+        assert [c.args[0] for c in cache.invalidate.call_args_list] == ["task/abc", "list/L1"]
+
+    def test_status_update_runs_parent_automation(self):
+        client = Mock()
+        client.get_task.return_value = {"id": "sub", "parent": "par", "status": {"status": "in progress"}}
+        automation = Mock()
+        automation.handle_status_update.return_value = Mock(automation_triggered=True)
+        processor = WebhookProcessor(client, response_cache=Mock(), automation=automation)
+        payload = {
+            "event": "taskStatusUpdated", "task_id": "sub", "webhook_id": "w1",
+            "history_items": [{"id": "h1", "field": "status", "before": {"status": "to do"},
+                               "after": {"status": "in progress"}}],
+        }
+        assert processor.handle(payload)["automation"] is True
+        automation.handle_status_update.assert_called_once_with("sub", "to do", "in progress")
+
+        # ClickUp redelivers on timeouts; the same history item is applied once
+        assert processor.handle(payload).get("duplicate") is True
+        assert automation.handle_status_update.call_count == 1